@@ -20,7 +20,7 @@ Updated with enhanced engine and all new capabilities
 
 
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 
 from flask_cors import CORS
 
@@ -40,13 +40,13 @@ from datetime import datetime, timezone
 
 from functools import wraps
 
-from collections import defaultdict
 
 
 
 # UPDATED IMPORT: Use the new enhanced engine
 
 from horary_engine.engine import HoraryEngine, serialize_planet_with_solar
+from horary_engine.result_fields import parse_fields
 from horary_engine.serialization import (
     serialize_lunar_aspect,
     deserialize_chart_for_evaluation,
@@ -54,6 +54,12 @@ from horary_engine.serialization import (
 from horary_engine.services.geolocation import LocationError
 from evaluate_chart import evaluate_chart
 from horary_engine.utils import token_to_string
+from horary_engine.calculation.event_calendar import get_event_calendar
+from horary_engine.chart_cache import get_chart_cache
+from horary_engine.worker_pool import get_judgment_pool, worker_pool_enabled
+from horary_engine.metrics import get_metrics_registry
+from horary_engine.replay import record_request
+from horary_engine.services.location_cache import location_cache_stats, start_location_cache_warmup
 
 
 
@@ -85,6 +91,27 @@ logger = logging.getLogger(__name__)
 def make_reason(rule: str, stage: str = "error", weight: float = 0) -> dict:
     """Helper to build structured reasoning entries for error responses."""
     return {"stage": stage, "rule": rule, "weight": weight}
+
+
+def _attach_evaluation(result: dict) -> None:
+    """Attach the structured ledger and rationale to a judgment result."""
+    try:
+        chart_data = result.get('chart_data')
+        if chart_data:
+            chart_obj = deserialize_chart_for_evaluation(chart_data)
+            evaluation = evaluate_chart(chart_obj, use_dsl=False)
+            ledger = evaluation.get('ledger', [])
+            for entry in ledger:
+                entry['key'] = token_to_string(entry.get('key'))
+                if 'polarity' in entry and hasattr(entry['polarity'], 'name'):
+                    entry['polarity'] = entry['polarity'].name
+            result['ledger'] = ledger
+            result['rationale'] = evaluation.get('rationale', [])
+        else:
+            result['rationale'] = result.get('reasoning', [])
+    except Exception as eval_error:
+        logger.warning(f"evaluate_chart failed: {eval_error}")
+        result['rationale'] = result.get('reasoning', [])
 
 
 
@@ -98,127 +125,93 @@ CORS(app)  # Enable CORS for all routes
 # UPDATED: Initialize the enhanced horary engine
 
 horary_engine = HoraryEngine()
+
+# Memory-map the precomputed station/ingress calendar (if configured) at startup
+get_event_calendar()
+
+# Resolve the configured seed cities into the geocode/timezone caches
+start_location_cache_warmup()
+
+# Start the judgment worker processes up front so the first requests are warm
+if worker_pool_enabled():
+    get_judgment_pool().warm()
+
+
+def _judge(question: str, settings: dict) -> dict:
+    """Run ``HoraryEngine.judge`` in the worker pool when enabled, else in-process.
+
+    Stage timings are folded into the ``/api/metrics`` histograms and only
+    left in the response under ``_performance`` when ``settings["trace"]``
+    asked for them.
+    """
+    if worker_pool_enabled():
+        result = get_judgment_pool().judge(question, settings)
+    else:
+        result = horary_engine.judge(question, settings)
+    metrics.record_trace(result.get('_performance'))
+    if not settings.get('trace'):
+        result.pop('_performance', None)
+    return result
+
+
+def _judge_fast(question: str, settings: dict) -> dict:
+    """``HoraryEngine.judge_fast``, in the worker pool when enabled (metrics as ``_judge``)."""
+    if worker_pool_enabled():
+        result = get_judgment_pool().judge_fast(question, settings)
+    else:
+        result = horary_engine.judge_fast(question, settings)
+    metrics.record_trace(result.get('_performance'))
+    if not settings.get('trace'):
+        result.pop('_performance', None)
+    return result
+
+
+def _fast_error_status(result: dict) -> int:
+    """HTTP status for a failed fast judgment: unresolvable locations are the client's fault."""
+    return 400 if result.get('error_type') == 'LocationError' else 500
+
+
+def _judge_batch(records: list) -> list:
+    """``HoraryEngine.judge_batch``, spread across the worker pool when enabled (metrics as ``_judge``)."""
+    if worker_pool_enabled():
+        results = get_judgment_pool().judge_batch(records)
+    else:
+        results = horary_engine.judge_batch(records)
+    for record, result in zip(records, results):
+        metrics.record_trace(result.get('_performance'))
+        if not record['settings'].get('trace'):
+            result.pop('_performance', None)
+    return results
 
 
 
-# Simple metrics collection
-
-class SimpleMetrics:
-
-    def __init__(self):
-
-        self.request_count = defaultdict(int)
-
-        self.error_count = defaultdict(int)
-
-        self.response_times = defaultdict(list)
-
-    
-
-    def record_request(self, endpoint):
-
-        self.request_count[endpoint] += 1
-
-    
-
-    def record_error(self, endpoint, error_type):
-
-        self.error_count[f"{endpoint}_{error_type}"] += 1
-
-    
-
-    def record_response_time(self, endpoint, duration):
-
-        self.response_times[endpoint].append(duration)
-
-        # Keep only last 100 response times per endpoint
-
-        if len(self.response_times[endpoint]) > 100:
-
-            self.response_times[endpoint] = self.response_times[endpoint][-100:]
-
-    
-
-    def get_stats(self):
-
-        stats = {
-
-            'requests': dict(self.request_count),
-
-            'errors': dict(self.error_count),
-
-            'avg_response_times': {}
-
-        }
-
-        
-
-        for endpoint, times in self.response_times.items():
-
-            if times:
-
-                stats['avg_response_times'][endpoint] = sum(times) / len(times)
-
-        
-
-        return stats
-
-
+# Request and judgment-stage metrics (sharded histograms, see horary_engine/metrics.py)
 
-metrics = SimpleMetrics()
+metrics = get_metrics_registry()
 
 
 
 def timing_decorator(endpoint_name):
-
-    """Decorator to time API endpoints"""
-
+    """Decorator to time API endpoints and count their errors and in-flight requests"""
     def decorator(func):
-
         @wraps(func)
-
         def wrapper(*args, **kwargs):
-
-            metrics.record_request(endpoint_name)
-
             start_time = time.time()
-
-            
-
             try:
-
-                result = func(*args, **kwargs)
-
-                duration = time.time() - start_time
-
-                metrics.record_response_time(endpoint_name, duration)
-
-                
-
-                logger.info(f"{endpoint_name} completed in {duration:.2f}s")
-
-                return result
-
-                
-
+                with metrics.track_request(endpoint_name) as outcome:
+                    result = func(*args, **kwargs)
+                    if isinstance(result, tuple) and len(result) > 1 and isinstance(result[1], int):
+                        outcome['status'] = result[1]
+                    else:
+                        outcome['status'] = getattr(result, 'status_code', 200)
             except Exception as e:
-
                 duration = time.time() - start_time
-
-                metrics.record_response_time(endpoint_name, duration)
-
-                metrics.record_error(endpoint_name, type(e).__name__)
-
-                
-
                 logger.error(f"{endpoint_name} failed after {duration:.2f}s: {str(e)}")
-
                 raise
-
-        
-
+            duration = time.time() - start_time
+            logger.info(f"{endpoint_name} completed in {duration:.2f}s")
+            return result
         return wrapper
-
     return decorator
 
 
@@ -246,7 +239,7 @@ def health_check():
 
         'services': {},
 
-        'metrics': metrics.get_stats(),
+        'metrics': metrics.endpoint_stats(),
 
         'enhanced_features': {  # NEW: Show enhanced capabilities
 
@@ -729,6 +722,35 @@ def get_current_time():
 
 
 
+def _chart_calculation_metadata(calculation_time: float, settings: dict) -> dict:
+    """``calculation_metadata`` attached to a successful chart calculation."""
+    return {
+        'calculation_time_seconds': calculation_time,
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'api_version': '2.0.0',  # Enhanced version
+        'engine_version': 'Enhanced Traditional Horary 2.0',
+        'enhanced_features_used': {
+            'future_retrograde_checks': True,
+            'directional_motion_awareness': True,
+            'sequence_enforcement': True,
+            'enhanced_denial_conditions': True,
+            'reception_weighting_nuance': True,
+            'solar_condition_enhancements': True,
+            'variable_moon_timing': True,
+            'fail_fast_geocoding': True
+        },
+        'override_flags_applied': {
+            'ignore_radicality': settings.get('ignore_radicality', False),
+            'ignore_void_moon': settings.get('ignore_void_moon', False),
+            'ignore_combustion': settings.get('ignore_combustion', False),
+            'ignore_saturn_7th': settings.get('ignore_saturn_7th', False)
+        },
+        'enhanced_parameters': {
+            'exaltation_confidence_boost': settings.get('exaltation_confidence_boost')
+        }
+    }
+
+
 @app.route('/api/calculate-chart', methods=['POST'])
 
 @timing_decorator('calculate_chart')
@@ -765,6 +787,8 @@ def calculate_chart():
 
         
 
+        record_request(data)
+
         # Extract basic parameters
 
         question = data.get('question', '').strip()
@@ -919,6 +943,17 @@ def calculate_chart():
 
         
 
+        # Optional subset of result sections, e.g. "verdict,timing"
+        try:
+            fields = _requested_fields(data.get('fields', request.args.get('fields')))
+        except ValueError as e:
+            return jsonify({
+                'error': str(e),
+                'judgment': 'ERROR',
+                'confidence': 0,
+                'reasoning': [make_reason('Invalid fields selection')]
+            }), 400
+
         # ENHANCED: Calculate chart using new enhanced engine with all features
 
         start_time = time.time()
@@ -951,14 +986,18 @@ def calculate_chart():
 
                 "ignore_saturn_7th": ignore_saturn_7th,
 
-                "exaltation_confidence_boost": exaltation_confidence_boost
+                "exaltation_confidence_boost": exaltation_confidence_boost,
+
+                "trace": bool(data.get('trace')),
+
+                "fields": fields
 
             }
 
             
             logger.info("About to call horary_engine.judge()...")
             try:
-                result = horary_engine.judge(question, settings)
+                result = _judge(question, settings)
                 logger.info(f"horary_engine.judge() completed successfully, got result type: {type(result)}")
             except Exception as judge_error:
                 logger.error(f"ERROR in horary_engine.judge(): {str(judge_error)}")
@@ -1009,57 +1048,7 @@ def calculate_chart():
 
         # ENHANCED: Add enhanced calculation metadata
 
-        result['calculation_metadata'] = {
-
-            'calculation_time_seconds': calculation_time,
-
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-
-            'api_version': '2.0.0',  # Enhanced version
-
-            'engine_version': 'Enhanced Traditional Horary 2.0',
-
-            'enhanced_features_used': {
-
-                'future_retrograde_checks': True,
-
-                'directional_motion_awareness': True,
-
-                'sequence_enforcement': True,
-
-                'enhanced_denial_conditions': True,
-
-                'reception_weighting_nuance': True,
-
-                'solar_condition_enhancements': True,
-
-                'variable_moon_timing': True,
-
-                'fail_fast_geocoding': True
-
-            },
-
-            'override_flags_applied': {
-
-                'ignore_radicality': ignore_radicality,
-
-                'ignore_void_moon': ignore_void_moon,
-
-                'ignore_combustion': ignore_combustion,
-
-                'ignore_saturn_7th': ignore_saturn_7th
-
-            },
-
-            'enhanced_parameters': {
-
-                'exaltation_confidence_boost': exaltation_confidence_boost
-
-            }
-
-        }
-
-        
+        result['calculation_metadata'] = _chart_calculation_metadata(calculation_time, settings)
 
         logger.info(f"ENHANCED chart calculation successful - Judgment: {result.get('judgment')} (Confidence: {result.get('confidence')}%)")
 
@@ -1092,23 +1081,7 @@ def calculate_chart():
             logger.info(f"Perfection type: {traditional_factors['perfection_type']}")
 
         # Attach structured evaluation results
-        try:
-            chart_data = result.get('chart_data')
-            if chart_data:
-                chart_obj = deserialize_chart_for_evaluation(chart_data)
-                evaluation = evaluate_chart(chart_obj, use_dsl=False)
-                ledger = evaluation.get('ledger', [])
-                for entry in ledger:
-                    entry['key'] = token_to_string(entry.get('key'))
-                    if 'polarity' in entry and hasattr(entry['polarity'], 'name'):
-                        entry['polarity'] = entry['polarity'].name
-                result['ledger'] = ledger
-                result['rationale'] = evaluation.get('rationale', [])
-            else:
-                result['rationale'] = result.get('reasoning', [])
-        except Exception as eval_error:
-            logger.warning(f"evaluate_chart failed: {eval_error}")
-            result['rationale'] = result.get('reasoning', [])
+        _attach_evaluation(result)
 
         return jsonify(result)
 
@@ -1146,6 +1119,175 @@ def calculate_chart():
 
 
 
+# Upper bound on records accepted by /api/calculate-charts in one request
+MAX_BATCH_RECORDS = int(os.getenv("HORARY_MAX_BATCH_RECORDS", "1000"))
+
+
+def _requested_fields(value):
+    """Validated ``fields`` option as a sorted list, or ``None`` for everything.
+
+    Raises ``ValueError`` naming any unknown section.
+    """
+    fields = parse_fields(value)
+    return sorted(fields) if fields is not None else None
+
+
+def _batch_settings(record: dict) -> dict:
+    """Translate one camelCase batch record into ``judge`` settings.
+
+    Raises ``ValueError`` with a user-facing message for invalid records.
+    """
+    if not isinstance(record, dict):
+        raise ValueError('Each record must be a JSON object')
+    if not str(record.get('question') or '').strip():
+        raise ValueError('Question is required')
+    location = str(record.get('location') or 'London, UK').strip()
+    use_current_time = record.get('useCurrentTime', True)
+    if not use_current_time and (not record.get('date') or not record.get('time')):
+        raise ValueError('Date and time are required when not using current time')
+
+    houses_list = None
+    manual_houses = record.get('manualHouses')
+    if manual_houses:
+        try:
+            houses_list = [int(h.strip()) for h in str(manual_houses).split(',') if h.strip()]
+        except ValueError:
+            raise ValueError('Manual houses must be numbers separated by commas (e.g., "1,7")')
+        if len(houses_list) < 2:
+            raise ValueError('Manual houses must include at least querent and quesited houses (e.g., "1,7")')
+
+    return {
+        "location": location,
+        "date": record.get('date'),
+        "time": record.get('time'),
+        "timezone": record.get('timezone'),
+        "use_current_time": use_current_time,
+        "manual_houses": houses_list,
+        "ignore_radicality": record.get('ignoreRadicality', False),
+        "ignore_void_moon": record.get('ignoreVoidMoon', False),
+        "ignore_combustion": record.get('ignoreCombustion', False),
+        "ignore_saturn_7th": record.get('ignoreSaturn7th', False),
+        "exaltation_confidence_boost": record.get('exaltationConfidenceBoost', 15.0),
+        "trace": bool(record.get('trace')),
+        "fields": _requested_fields(record.get('fields')),
+    }
+
+
+@app.route('/api/calculate-charts', methods=['POST'])
+@timing_decorator('calculate_charts')
+def calculate_charts():
+    """Judge a batch of horary questions in one request.
+
+    Accepts ``{"records": [...]}`` (or a bare list) where each record uses
+    the same fields as ``/api/calculate-chart``. Results are returned in
+    input order; a failing record carries its own error payload and does
+    not fail the batch.
+    """
+    try:
+        data = request.get_json(silent=True)
+        records = data.get('records') if isinstance(data, dict) else data
+        if not isinstance(records, list):
+            return jsonify({
+                'error': 'Expected a JSON list of records or {"records": [...]}',
+                'judgment': 'ERROR',
+                'confidence': 0,
+                'reasoning': [make_reason('No batch records provided')]
+            }), 400
+        if len(records) > MAX_BATCH_RECORDS:
+            return jsonify({
+                'error': f'Batch too large: {len(records)} records (maximum {MAX_BATCH_RECORDS})',
+                'judgment': 'ERROR',
+                'confidence': 0,
+                'reasoning': [make_reason('Batch exceeds maximum size')]
+            }), 413
+
+        logger.info(f"Batch chart calculation request: {len(records)} records")
+        start_time = time.time()
+
+        results = [None] * len(records)
+        valid_indices = []
+        valid_records = []
+        for index, record in enumerate(records):
+            try:
+                settings = _batch_settings(record)
+            except ValueError as e:
+                results[index] = {
+                    'error': str(e),
+                    'judgment': 'ERROR',
+                    'confidence': 0,
+                    'reasoning': [make_reason(str(e))]
+                }
+                continue
+            valid_indices.append(index)
+            valid_records.append({"question": record['question'].strip(), "settings": settings})
+
+        for index, result in zip(valid_indices, _judge_batch(valid_records)):
+            if not result.get('error'):
+                _attach_evaluation(result)
+            results[index] = result
+
+        calculation_time = time.time() - start_time
+        error_count = sum(1 for result in results if result.get('error'))
+        logger.info(f"Batch chart calculation completed in {calculation_time:.2f} seconds ({error_count} errors)")
+
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'error_count': error_count,
+            'calculation_metadata': {
+                'calculation_time_seconds': calculation_time,
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'api_version': '2.0.0'
+            }
+        })
+
+    except Exception as e:
+        error_msg = f"Error calculating chart batch: {str(e)}"
+        logger.error(error_msg)
+        logger.error(traceback.format_exc())
+        return jsonify({
+            'error': error_msg,
+            'judgment': 'ERROR',
+            'confidence': 0,
+            'reasoning': [make_reason(f'Batch calculation error: {str(e)}')]
+        }), 500
+
+
+@app.route('/api/judge-fast', methods=['POST'])
+@timing_decorator('judge_fast')
+def judge_fast():
+    """Verdict-only judgment for high-volume scoring clients.
+
+    Accepts the same fields as ``/api/calculate-chart`` and answers with only
+    ``question``, ``judgment``, ``confidence`` and ``timing``; the chart,
+    reasoning, Moon story, summaries and evaluation ledger are not built.
+    """
+    try:
+        data = request.get_json(silent=True)
+        try:
+            settings = _batch_settings(data)
+        except ValueError as e:
+            return jsonify({
+                'error': str(e),
+                'judgment': 'ERROR',
+                'confidence': 0
+            }), 400
+
+        result = _judge_fast(data['question'].strip(), settings)
+        if result.get('error'):
+            return jsonify(result), _fast_error_status(result)
+        return jsonify(result)
+
+    except Exception as e:
+        logger.error(f"Error in fast judgment: {str(e)}")
+        logger.error(traceback.format_exc())
+        return jsonify({
+            'error': f"Error in fast judgment: {str(e)}",
+            'judgment': 'ERROR',
+            'confidence': 0
+        }), 500
+
+
 @app.route('/api/moon-debug', methods=['POST'])
 
 @timing_decorator('moon_debug')
@@ -1228,7 +1370,13 @@ def get_metrics():
 
             'status': 'success',
 
-            'metrics': metrics.get_stats(),
+            'metrics': metrics.endpoint_stats(),
+
+            'chart_cache': get_chart_cache().stats(),
+
+            'location_cache': location_cache_stats(),
+
+            'stage_timings': metrics.stage_stats(),
 
             'enhanced_engine_stats': {
 
@@ -1252,6 +1400,12 @@ def get_metrics():
 
 
 
+@app.route('/api/metrics/prometheus', methods=['GET'])
+def get_prometheus_metrics():
+    """Request and judgment-stage metrics in the Prometheus text format"""
+    return Response(metrics.prometheus_text(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route('/api/version', methods=['GET'])
 
 def get_version():
@@ -1580,6 +1734,10 @@ def not_found(error):
 
             '/api/calculate-chart',
 
+            '/api/calculate-charts',
+
+            '/api/judge-fast',
+
             '/api/get-timezone',
 
             '/api/current-time',
@@ -1588,6 +1746,8 @@ def not_found(error):
 
             '/api/metrics',
 
+            '/api/metrics/prometheus',
+
             '/api/version'
 
         ],
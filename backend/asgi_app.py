@@ -0,0 +1,376 @@
+"""ASGI entry point for the chart, timezone and current-time endpoints.
+
+The Flask app in ``app.py`` holds a worker thread for the whole of a request,
+including a slow geocoder round trip. This module serves the four
+latency-sensitive endpoints from a single event loop instead:
+
+* ``POST /api/calculate-chart``
+* ``POST /api/judge-fast``
+* ``POST /api/get-timezone``
+* ``POST /api/current-time``
+
+Geocoding and timezone lookups run on a small I/O thread pool and are awaited
+with a timeout, while chart calculation and judgment run on a separate pool
+sized to the CPU count. Hundreds of requests can therefore be in flight while
+only ``asgi.io_workers + asgi.cpu_workers`` threads exist. Beyond
+``asgi.max_in_flight`` concurrent requests the app answers ``503`` with a
+``Retry-After`` header, and a request running longer than
+``asgi.request_timeout_seconds`` gets ``504``.
+
+A timeout cannot stop a job a pool thread has already started: it runs to
+completion and keeps its thread. Until it finishes such an abandoned job
+counts against ``asgi.max_in_flight`` like a request, so repeated timeouts
+shed load instead of queueing ever more work behind the stuck jobs.
+
+The ASGI layer itself is plain standard library (no framework), but the
+handlers reuse request validation, evaluation and the judgment path from
+``app.py``, so importing this module also builds the Flask app and its
+engine. Run it under any ASGI server, for example::
+
+    uvicorn asgi_app:application --host 127.0.0.1 --port 5000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from horary_config import cfg
+from horary_engine.services.geolocation import LocationError, TimezoneManager, safe_geocode
+from horary_engine.metrics import get_metrics_registry
+from horary_engine.replay import record_request
+from horary_engine.services.location_cache import location_cache_enabled
+from app import (
+    _attach_evaluation,
+    _batch_settings,
+    _chart_calculation_metadata,
+    _fast_error_status,
+    _judge,
+    _judge_fast,
+    _timezone_cache,
+    make_reason,
+)
+
+
+logger = logging.getLogger(__name__)
+
+Response = Tuple[int, Dict[str, Any]]
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-headers", b"Content-Type"),
+    (b"access-control-allow-methods", b"POST, OPTIONS"),
+]
+
+
+def _chart_error(message: str, reason: str, judgment: str = "ERROR") -> Dict[str, Any]:
+    return {
+        "error": message,
+        "judgment": judgment,
+        "confidence": 0,
+        "reasoning": [make_reason(reason)],
+    }
+
+
+class AsyncHoraryApp:
+    """ASGI application offloading blocking work to bounded thread pools.
+
+    Parameters
+    ----------
+    engine:
+        Object with ``judge(question, settings)`` and
+        ``judge_fast(question, settings)``; defaults to the Flask app's
+        judgment path (shared :class:`HoraryEngine` or the worker pool).
+    timezone_manager:
+        Defaults to a :class:`TimezoneManager` created on first use.
+    max_in_flight, cpu_workers, io_workers, request_timeout, geocode_timeout, max_body_bytes:
+        Override the matching ``asgi`` configuration values.
+    """
+
+    def __init__(
+        self,
+        engine: Any = None,
+        timezone_manager: Optional[TimezoneManager] = None,
+        max_in_flight: Optional[int] = None,
+        cpu_workers: Optional[int] = None,
+        io_workers: Optional[int] = None,
+        request_timeout: Optional[float] = None,
+        geocode_timeout: Optional[float] = None,
+        max_body_bytes: Optional[int] = None,
+    ) -> None:
+        config = cfg().asgi
+        self.engine = engine
+        self._timezone_manager = timezone_manager
+        self.max_in_flight = int(max_in_flight or config.max_in_flight)
+        self.request_timeout = float(request_timeout or config.request_timeout_seconds)
+        self.geocode_timeout = float(geocode_timeout or config.geocode_timeout_seconds)
+        self.max_body_bytes = int(max_body_bytes or config.max_body_bytes)
+        cpu_workers = cpu_workers or config.cpu_workers or os.cpu_count() or 1
+        io_workers = io_workers or config.io_workers
+        self._cpu_pool = ThreadPoolExecutor(int(cpu_workers), thread_name_prefix="horary-cpu")
+        self._io_pool = ThreadPoolExecutor(int(io_workers), thread_name_prefix="horary-io")
+        # path -> (metrics endpoint name, handler); names match the Flask app's
+        self._routes: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Awaitable[Response]]]] = {
+            "/api/calculate-chart": ("calculate_chart", self.calculate_chart),
+            "/api/judge-fast": ("judge_fast", self.judge_fast),
+            "/api/get-timezone": ("get_timezone", self.get_timezone),
+            "/api/current-time": ("current_time", self.current_time),
+        }
+        self.in_flight = 0
+        self.rejected = 0
+        self.timeouts = 0
+        # Pool jobs still running for requests that already timed out
+        self.abandoned = 0
+        self._abandoned_lock = threading.Lock()
+
+    @property
+    def timezone_manager(self) -> TimezoneManager:
+        if self._timezone_manager is None:
+            self._timezone_manager = TimezoneManager()
+        return self._timezone_manager
+
+    def close(self) -> None:
+        """Shut down the worker pools (queued work is abandoned)."""
+
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------ ASGI
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        method = scope.get("method", "GET")
+        route = self._routes.get(scope.get("path", ""))
+        if route is None:
+            await self._send(send, 404, {"error": "Endpoint not found", "success": False})
+            return
+        if method == "OPTIONS":
+            await self._send(send, 204, None)
+            return
+        if method != "POST":
+            await self._send(send, 405, {"error": "Method not allowed", "success": False})
+            return
+        if self.in_flight + self.abandoned >= self.max_in_flight:
+            # Shed load before reading the body so a burst cannot queue unbounded work
+            self.rejected += 1
+            await self._send(send, 503, {"error": "Server busy, retry shortly", "success": False},
+                             [(b"retry-after", b"1")])
+            return
+
+        endpoint, handler = route
+        self.in_flight += 1
+        try:
+            with get_metrics_registry().track_request(endpoint) as outcome:
+                status, payload = await self._dispatch(handler, receive)
+                outcome["status"] = status
+        finally:
+            self.in_flight -= 1
+        await self._send(send, status, payload)
+
+    async def _dispatch(self, handler: Callable[[Dict[str, Any]], Awaitable[Response]], receive: Callable) -> Response:
+        body = await self._read_body(receive)
+        if body is None:
+            return 413, {"error": "Request body too large", "success": False}
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        if not isinstance(data, dict) or not data:
+            return 400, {"error": "No JSON data provided", "success": False}
+        try:
+            return await asyncio.wait_for(handler(data), self.request_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            return 504, {"error": f"Request timed out after {self.request_timeout:g} seconds", "success": False}
+        except Exception as e:
+            logger.exception("Unhandled error in ASGI handler")
+            return 500, {"error": f"Internal server error: {e}", "success": False}
+
+    async def _read_body(self, receive: Callable) -> Optional[bytes]:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send: Callable, status: int, payload: Optional[Dict[str, Any]], extra_headers=()) -> None:
+        body = b"" if payload is None else json.dumps(payload, default=str).encode("utf-8")
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        await send({"type": "http.response.start", "status": status,
+                    "headers": headers + CORS_HEADERS + list(extra_headers)})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # ------------------------------------------------------------- offloading
+
+    async def _offload(self, pool: ThreadPoolExecutor, func: Callable, *args: Any) -> Any:
+        future = pool.submit(func, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A queued job is cancelled with the request; a started one is not
+            if not future.cancelled():
+                with self._abandoned_lock:
+                    self.abandoned += 1
+                future.add_done_callback(self._release_abandoned)
+            raise
+
+    def _release_abandoned(self, future: Future) -> None:
+        with self._abandoned_lock:
+            self.abandoned -= 1
+
+    async def _io(self, func: Callable, *args: Any) -> Any:
+        return await self._offload(self._io_pool, func, *args)
+
+    async def _cpu(self, func: Callable, *args: Any) -> Any:
+        return await self._offload(self._cpu_pool, func, *args)
+
+    async def _geocode(self, location: str) -> Tuple[float, float, str]:
+        try:
+            return await asyncio.wait_for(self._io(safe_geocode, location), self.geocode_timeout)
+        except asyncio.TimeoutError:
+            raise LocationError(f"Geocoding timed out for '{location}'")
+
+    # --------------------------------------------------------------- handlers
+
+    async def _judge_settings(self, data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Response]]:
+        """Validate a chart request and geocode its location off the CPU pool.
+
+        Returns ``(settings, None)``, or ``(None, error_response)``.
+        """
+
+        try:
+            settings = _batch_settings(data)
+        except ValueError as e:
+            return None, (400, _chart_error(str(e), str(e)))
+
+        try:
+            settings["resolved_location"] = await self._geocode(settings["location"])
+        except LocationError as e:
+            payload = _chart_error(str(e), f"Location error: {e}", judgment="LOCATION_ERROR")
+            payload["error_type"] = "LocationError"
+            return None, (400, payload)
+        if location_cache_enabled():
+            # Resolve the timezone off the CPU pool; the judgment then hits the cache
+            lat, lon, _ = settings["resolved_location"]
+            await asyncio.wait_for(self._io(self.timezone_manager.get_timezone_for_location, lat, lon),
+                                   self.geocode_timeout)
+        return settings, None
+
+    async def calculate_chart(self, data: Dict[str, Any]) -> Response:
+        """Async twin of ``app.calculate_chart``."""
+
+        record_request(data)
+        settings, error = await self._judge_settings(data)
+        if error is not None:
+            return error
+        question = str(data["question"]).strip()
+
+        def judge() -> Dict[str, Any]:
+            result = (self.engine.judge if self.engine is not None else _judge)(question, settings)
+            if not result.get("error"):
+                _attach_evaluation(result)
+            return result
+
+        start_time = time.time()
+        result = await self._cpu(judge)
+        if result.get("error"):
+            return 500, result
+        result["calculation_metadata"] = _chart_calculation_metadata(time.time() - start_time, settings)
+        return 200, result
+
+    async def judge_fast(self, data: Dict[str, Any]) -> Response:
+        """Async twin of ``app.judge_fast``."""
+
+        settings, error = await self._judge_settings(data)
+        if error is not None:
+            return error
+        question = str(data["question"]).strip()
+        judge = self.engine.judge_fast if self.engine is not None else _judge_fast
+        result = await self._cpu(judge, question, settings)
+        if result.get("error"):
+            return _fast_error_status(result), result
+        return 200, result
+
+    async def get_timezone(self, data: Dict[str, Any]) -> Response:
+        """Async twin of ``app.get_timezone`` (shares its result cache)."""
+
+        location = str(data.get("location") or "").strip()
+        if not location:
+            return 400, {"error": "Location is required", "success": False}
+        cache_key = location.lower()
+        if cache_key in _timezone_cache:
+            return 200, _timezone_cache[cache_key]
+        try:
+            lat, lon, full_location = await self._geocode(location)
+            timezone_str = await asyncio.wait_for(
+                self._io(self.timezone_manager.get_timezone_for_location, lat, lon), self.geocode_timeout)
+        except LocationError as e:
+            return 404, {"error": str(e), "success": False, "error_type": "LocationError"}
+        result = {
+            "location": full_location,
+            "latitude": lat,
+            "longitude": lon,
+            "timezone": timezone_str,
+            "success": True,
+            "enhanced_geocoding": True,
+        }
+        _timezone_cache[cache_key] = result
+        return 200, result
+
+    async def current_time(self, data: Dict[str, Any]) -> Response:
+        """Async twin of ``app.get_current_time``."""
+
+        location = str(data.get("location") or "").strip()
+        if not location:
+            return 400, {"error": "Location is required", "success": False}
+        try:
+            lat, lon, full_location = await self._geocode(location)
+            dt_local, dt_utc, timezone_used = await asyncio.wait_for(
+                self._io(self.timezone_manager.get_current_time_for_location, lat, lon), self.geocode_timeout)
+        except LocationError as e:
+            return 404, {"error": str(e), "success": False, "error_type": "LocationError"}
+        return 200, {
+            "location": full_location,
+            "latitude": lat,
+            "longitude": lon,
+            "local_time": dt_local.isoformat(),
+            "utc_time": dt_utc.isoformat(),
+            "timezone": timezone_used,
+            "utc_offset": dt_local.strftime("%z"),
+            "success": True,
+            "enhanced_processing": True,
+        }
+
+
+application = AsyncHoraryApp()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Benchmark the chart and judgment pipeline.
+
+Every stage is timed over a fixed corpus of charts covering the main question
+categories and some awkward skies (void Moon, a Mercury station, a Mercury
+cazimi). Geocoding is stubbed out with fixed coordinates and the chart cache
+is switched off, so the numbers only reflect calculation work.
+
+    python benchmark.py run --out bench.json
+    python benchmark.py run --out new.json --compare bench.json --threshold 0.15
+    python benchmark.py compare bench.json new.json
+    python benchmark.py run --perfection-mode refined --out refined.json
+    python benchmark.py batch --questions-per-chart 10
+
+``compare`` (and ``run --compare``) exits with status 1 when a benchmark's
+median time grew by more than ``--threshold`` (a fraction, default 0.10).
+
+``batch`` measures replay throughput: a workload where every corpus chart is
+asked several corpus questions is judged once with ``judge_batch`` and once
+by looping ``judge``, and the two rates are reported side by side.
+"""
+
+import argparse
+import copy
+import dataclasses
+import datetime
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pytz
+
+from horary_config import cfg
+from category_router import get_contract
+from evaluate_chart import evaluate_chart
+from horary_engine import aggregator, solar_aggregator
+from horary_engine.aspects import calculate_enhanced_aspects, calculate_moon_next_aspect
+from horary_engine.engine import HoraryEngine, extract_testimonies
+from horary_engine.serialization import serialize_chart_for_frontend
+
+
+LONDON = (51.5074, -0.1278, "London, England")
+NEW_YORK = (40.7128, -74.0060, "New York, USA")
+SYDNEY = (-33.8688, 151.2093, "Sydney, Australia")
+
+# name, question, local date, local time, timezone, (lat, lon, label)
+CORPUS = [
+    ("career", "Will I get the job I interviewed for?", "2024-03-05", "10:30", "Europe/London", LONDON),
+    ("relationship", "Will my partner come back to me?", "2024-06-14", "21:15", "America/New_York", NEW_YORK),
+    ("lost_item", "Where is my lost wallet?", "2024-09-02", "08:05", "Australia/Sydney", SYDNEY),
+    ("health", "Will I recover from this illness soon?", "2024-01-20", "16:45", "Europe/London", LONDON),
+    ("education", "Will I pass my final exam?", "2024-05-09", "12:00", "America/New_York", NEW_YORK),
+    ("money", "Will I get paid the money I am owed?", "2024-11-28", "19:30", "Europe/London", LONDON),
+    ("travel", "Will the trip to Spain go ahead?", "2024-07-22", "07:10", "Australia/Sydney", SYDNEY),
+    # Moon makes no further aspect before leaving its sign
+    ("void_moon", "Will I sell my house this year?", "2024-03-01", "03:00", "UTC", LONDON),
+    # Mercury turning retrograde
+    ("mercury_station", "Will the contract be signed?", "2024-04-01", "23:00", "UTC", LONDON),
+    # Mercury within 17' of the Sun
+    ("mercury_cazimi", "Will I win the lawsuit?", "2024-04-11", "23:00", "UTC", LONDON),
+]
+
+
+class Case:
+    """One corpus entry with its chart and question analysis precomputed."""
+
+    def __init__(self, engine: HoraryEngine, name: str, question: str, date: str, time_str: str,
+                 timezone: str, location) -> None:
+        self.name = name
+        self.question = question
+        self.settings = {
+            "location": location[2],
+            "resolved_location": location,
+            "date": date,
+            "time": time_str,
+            "timezone": timezone,
+            "use_current_time": False,
+        }
+        tz = pytz.timezone(timezone)
+        self.dt_local = tz.localize(datetime.datetime.strptime(f"{date} {time_str}", "%Y-%m-%d %H:%M"))
+        self.dt_utc = self.dt_local.astimezone(pytz.UTC)
+        self.timezone = timezone
+        self.location = location
+        judgment_engine = engine.engine
+        self.chart = self.calculate_chart(judgment_engine)
+        self.analysis = judgment_engine.question_analyzer.analyze_question(question)
+        self.contract = get_contract(self.analysis.get("question_type") or "")
+        self.testimonies = extract_testimonies(self.chart, self.contract)
+
+    def fresh_chart(self):
+        """The case chart without the per-chart caches a judgment fills in."""
+        return dataclasses.replace(self.chart, reception_matrix=None, analysis_context=None)
+
+    def calculate_chart(self, judgment_engine):
+        lat, lon, label = self.location
+        return judgment_engine.calculator.calculate_chart(
+            self.dt_local, self.dt_utc, self.timezone, lat, lon, label, use_cache=False)
+
+
+def _benchmarks(engine: HoraryEngine) -> Dict[str, Callable[[Case], Any]]:
+    judgment_engine = engine.engine
+    calculator = judgment_engine.calculator
+    return {
+        "calculate_chart": lambda case: case.calculate_chart(judgment_engine),
+        "calculate_enhanced_aspects": lambda case: calculate_enhanced_aspects(
+            case.chart.planets, case.chart.julian_day),
+        "calculate_moon_next_aspect": lambda case: calculate_moon_next_aspect(
+            case.chart.planets, case.chart.julian_day, calculator.get_real_moon_speed),
+        "apply_enhanced_judgment": lambda case: judgment_engine._apply_enhanced_judgment(
+            case.fresh_chart(), copy.deepcopy(case.analysis)),
+        "extract_testimonies": lambda case: extract_testimonies(case.fresh_chart(), case.contract),
+        "aggregator": lambda case: aggregator.aggregate(case.testimonies),
+        "solar_aggregator": lambda case: solar_aggregator.aggregate(case.testimonies, case.contract),
+        "evaluate_chart": lambda case: evaluate_chart(case.fresh_chart(), use_dsl=False),
+        "serialize_chart_for_frontend": lambda case: serialize_chart_for_frontend(
+            case.chart, case.chart.solar_analyses),
+        "judge": lambda case: engine.judge(case.question, dict(case.settings)),
+        "judge_fast": lambda case: engine.judge_fast(case.question, dict(case.settings)),
+    }
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_benchmarks(repeat: int = 5, only: Optional[Iterable[str]] = None,
+                   cases: Optional[Iterable[str]] = None,
+                   perfection_mode: Optional[str] = None) -> Dict[str, Any]:
+    """Time every benchmark over the corpus and return the results document.
+
+    Each benchmark runs once per case to warm up, then ``repeat`` timed
+    rounds. Times are reported in milliseconds per call. ``perfection_mode``
+    overrides ``timing.perfection_mode`` for the run.
+    """
+    config = cfg()
+    chart_cache_enabled = config.chart_cache.enabled
+    config.chart_cache.enabled = False
+    configured_mode = getattr(config.timing, "perfection_mode", "linear")
+    if perfection_mode:
+        config.timing.perfection_mode = perfection_mode
+    try:
+        engine = HoraryEngine()
+        corpus = [Case(engine, *entry) for entry in CORPUS if not cases or entry[0] in cases]
+        benchmarks = _benchmarks(engine)
+        if only:
+            benchmarks = {name: fn for name, fn in benchmarks.items() if name in set(only)}
+
+        results = {}
+        for name, fn in benchmarks.items():
+            samples: List[float] = []
+            per_case: Dict[str, float] = {}
+            for case in corpus:
+                fn(case)
+                case_samples = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    fn(case)
+                    case_samples.append((time.perf_counter() - start) * 1000.0)
+                per_case[case.name] = round(statistics.median(case_samples), 4)
+                samples.extend(case_samples)
+            results[name] = {
+                "median_ms": round(statistics.median(samples), 4),
+                "mean_ms": round(statistics.fmean(samples), 4),
+                "min_ms": round(min(samples), 4),
+                "p90_ms": round(_percentile(samples, 0.9), 4),
+                "samples": len(samples),
+                "cases": per_case,
+            }
+    finally:
+        config.chart_cache.enabled = chart_cache_enabled
+        config.timing.perfection_mode = configured_mode
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "perfection_mode": perfection_mode or configured_mode,
+            "cases": [case.name for case in corpus],
+        },
+        "benchmarks": results,
+    }
+
+
+def batch_records(corpus: List[Case], questions_per_chart: int) -> List[Dict[str, Any]]:
+    """Replay-style workload: each case's chart asked ``questions_per_chart`` corpus questions."""
+    questions = [entry[1] for entry in CORPUS]
+    return [
+        {"question": questions[(offset + i) % len(questions)], "settings": dict(case.settings)}
+        for offset, case in enumerate(corpus)
+        for i in range(questions_per_chart)
+    ]
+
+
+def run_batch_benchmark(repeat: int = 3, questions_per_chart: int = len(CORPUS),
+                        cases: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Time ``judge_batch`` against a ``judge`` loop over the same records.
+
+    Both paths run once to warm up, then ``repeat`` timed rounds; the median
+    round is reported. The chart cache is off, as in :func:`run_benchmarks`.
+    """
+    config = cfg()
+    chart_cache_enabled = config.chart_cache.enabled
+    config.chart_cache.enabled = False
+    try:
+        engine = HoraryEngine()
+        corpus = [Case(engine, *entry) for entry in CORPUS if not cases or entry[0] in cases]
+        records = batch_records(corpus, questions_per_chart)
+
+        def loop():
+            return [engine.judge(record["question"], dict(record["settings"])) for record in records]
+
+        def batch():
+            return engine.judge_batch(records)
+
+        timings = {}
+        for name, fn in (("loop", loop), ("batch", batch)):
+            fn()
+            rounds = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                rounds.append(time.perf_counter() - start)
+            timings[name] = statistics.median(rounds)
+    finally:
+        config.chart_cache.enabled = chart_cache_enabled
+
+    return {
+        "records": len(records),
+        "charts": len(corpus),
+        "loop_ms": round(timings["loop"] * 1000.0, 3),
+        "batch_ms": round(timings["batch"] * 1000.0, 3),
+        "loop_records_per_second": round(len(records) / timings["loop"], 1),
+        "batch_records_per_second": round(len(records) / timings["batch"], 1),
+        "speedup": round(timings["loop"] / timings["batch"], 2),
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Compare median times benchmark by benchmark.
+
+    Returns one row per benchmark present in both documents, with the
+    relative change and a ``regression`` flag when it exceeds ``threshold``.
+    """
+    rows = []
+    for name, result in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if not before:
+            continue
+        change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] if before["median_ms"] else 0.0
+        rows.append({
+            "benchmark": name,
+            "baseline_ms": before["median_ms"],
+            "current_ms": result["median_ms"],
+            "change": change,
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def _print_results(document: Dict[str, Any]) -> None:
+    print(f"{'benchmark':32} {'median ms':>11} {'p90 ms':>11} {'min ms':>11}")
+    for name, result in document["benchmarks"].items():
+        print(f"{name:32} {result['median_ms']:11.3f} {result['p90_ms']:11.3f} {result['min_ms']:11.3f}")
+
+
+def _print_comparison(rows: List[Dict[str, Any]], threshold: float) -> bool:
+    print(f"{'benchmark':32} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['benchmark']:32} {row['baseline_ms']:12.3f} {row['current_ms']:12.3f} "
+              f"{row['change']:+9.1%}{flag}")
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than baseline by more than {threshold:.0%}")
+    return not regressions
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the horary chart and judgment pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks")
+    run.add_argument("--out", help="Write results JSON here")
+    run.add_argument("--repeat", type=int, default=5, help="Timed rounds per case")
+    run.add_argument("--only", nargs="*", help="Benchmark names to run")
+    run.add_argument("--cases", nargs="*", help="Corpus case names to use")
+    run.add_argument("--compare", help="Baseline results JSON to compare against")
+    run.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown fraction")
+    run.add_argument("--perfection-mode", choices=("linear", "refined"),
+                     help="Override timing.perfection_mode")
+
+    batch = commands.add_parser("batch", help="Compare judge_batch with a judge loop")
+    batch.add_argument("--repeat", type=int, default=3, help="Timed rounds")
+    batch.add_argument("--questions-per-chart", type=int, default=len(CORPUS),
+                       help="Records sharing each corpus chart")
+    batch.add_argument("--cases", nargs="*", help="Corpus case names to use")
+
+    compare = commands.add_parser("compare", help="Compare two results files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown fraction")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.command == "batch":
+        result = run_batch_benchmark(args.repeat, args.questions_per_chart, args.cases)
+        print(f"{result['records']} records over {result['charts']} charts")
+        print(f"judge loop   {result['loop_ms']:11.1f} ms  {result['loop_records_per_second']:9.1f} records/s")
+        print(f"judge_batch  {result['batch_ms']:11.1f} ms  {result['batch_records_per_second']:9.1f} records/s")
+        print(f"speedup      {result['speedup']:.2f}x")
+        return 0
+
+    if args.command == "run":
+        document = run_benchmarks(args.repeat, args.only, args.cases, args.perfection_mode)
+        _print_results(document)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+            print(f"Results written to {args.out}")
+        if not args.compare:
+            return 0
+        baseline, current = _load(args.compare), document
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    ok = _print_comparison(compare_results(baseline, current, args.threshold), args.threshold)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Build the precomputed station/ingress event calendar.
+
+The output directory can then be set as ``event_calendar.path`` in
+horary_constants.yaml so stations are looked up instead of searched for.
+"""
+
+import argparse
+import logging
+
+from horary_config import cfg
+from horary_engine.calculation.event_calendar import build_event_calendar
+
+
+def main():
+    config = cfg().event_calendar
+    parser = argparse.ArgumentParser(description="Build the station/ingress event calendar")
+    parser.add_argument("--start", type=int, default=config.start_year, help="First year (inclusive)")
+    parser.add_argument("--end", type=int, default=config.end_year, help="Last year (exclusive)")
+    parser.add_argument("--out", required=True, help="Output directory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    out = build_event_calendar(args.start, args.end, args.out)
+    print(f"Event calendar for {args.start}-{args.end} written to {out}")
+
+
+if __name__ == "__main__":
+    main()
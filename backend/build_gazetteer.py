@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Build the offline gazetteer used by the local geocoder.
+
+Download a GeoNames cities dump (e.g. cities15000.txt) and, optionally,
+admin1CodesASCII.txt from https://download.geonames.org/export/dump/, then
+set the output directory as ``geocoding.gazetteer_path`` and
+``geocoding.provider: local`` in horary_constants.yaml.
+"""
+
+import argparse
+
+from horary_engine.services.gazetteer import build_gazetteer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline gazetteer")
+    parser.add_argument("--cities", required=True, help="GeoNames cities*.txt file")
+    parser.add_argument("--admin1", default=None, help="GeoNames admin1CodesASCII.txt file")
+    parser.add_argument("--min-population", type=int, default=0, help="Skip smaller places")
+    parser.add_argument("--out", required=True, help="Output directory")
+    args = parser.parse_args()
+
+    out = build_gazetteer(args.cities, args.out, args.admin1, args.min_population)
+    print(f"Gazetteer written to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 from horary_config import cfg
 
 from category_router import get_contract
+from horary_engine.config_snapshot import ConfigSnapshot, config_snapshot
 from horary_engine.engine import extract_testimonies
 from horary_engine.rationale import build_rationale
 from horary_engine.utils import token_to_string
@@ -24,7 +25,9 @@ logger = logging.getLogger(__name__)
 
 
 def evaluate_chart(
-    chart: Union[Dict[str, Any], HoraryChart], use_dsl: Optional[bool] = None
+    chart: Union[Dict[str, Any], HoraryChart],
+    use_dsl: Optional[bool] = None,
+    config: Optional[ConfigSnapshot] = None,
 ) -> Dict[str, Any]:
     """Evaluate a horary chart and return verdict with diagnostics.
 
@@ -41,6 +44,8 @@ def evaluate_chart(
             value is sourced from the ``HORARY_USE_DSL`` environment variable or
             ``aggregator.use_dsl`` setting. This makes it easy for API callers to
             supply a query or header flag without editing config files.
+        config: Configuration snapshot supplying ``aggregator.use_dsl`` and
+            the role importances; defaults to a snapshot of ``cfg()``.
     """
     if isinstance(chart, dict):
         contract = get_contract(chart.get("category", ""))
@@ -54,24 +59,16 @@ def evaluate_chart(
 
     testimonies = extract_testimonies(chart_obj, contract)
 
-    config_obj = cfg()
-
-    def _cfg_get(path: str, default: Any = None):
-        if hasattr(config_obj, "get"):
-            return config_obj.get(path, default)
-        current = config_obj
-        for part in path.split("."):
-            current = getattr(current, part, None)
-            if current is None:
-                return default
-        return current
+    if config is None:
+        config = config_snapshot(cfg())
+    aggregator_settings = config.aggregator
 
     if use_dsl is None:
         env_override = os.getenv("HORARY_USE_DSL")
         if env_override is not None:
             use_dsl = env_override.lower() in {"1", "true", "yes"}
         else:
-            use_dsl = _cfg_get("aggregator.use_dsl", False)
+            use_dsl = aggregator_settings.use_dsl
 
     if use_dsl:
         from horary_engine.dsl import (
@@ -84,12 +81,13 @@ def evaluate_chart(
         )
         from horary_engine.solar_aggregator import aggregate as aggregator_fn
 
+        importance = aggregator_settings.role_importance
         testimonies = [
-            role_importance(L1, _cfg_get("aggregator.role_importance.L1", 1.0)),
-            role_importance(LQ, _cfg_get("aggregator.role_importance.LQ", 1.0)),
-            role_importance(Moon, _cfg_get("aggregator.role_importance.Moon", 0.7)),
-            role_importance(L10, _cfg_get("aggregator.role_importance.L10", 1.0)),
-            role_importance(L3, _cfg_get("aggregator.role_importance.L3", 1.0)),
+            role_importance(L1, importance["L1"]),
+            role_importance(LQ, importance["LQ"]),
+            role_importance(Moon, importance["Moon"]),
+            role_importance(L10, importance["L10"]),
+            role_importance(L3, importance["L3"]),
             *testimonies,
         ]
     else:
@@ -104,13 +102,14 @@ def evaluate_chart(
     else:
         score, ledger = aggregator_fn(testimonies)
     # Surface ledger details for downstream inspection and debugging
-    logger.info(
-        "Contribution ledger: %s",
-        [
-            {**entry, "key": token_to_string(entry.get("key"))}
-            for entry in ledger
-        ],
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Contribution ledger: %s",
+            [
+                {**entry, "key": token_to_string(entry.get("key"))}
+                for entry in ledger
+            ],
+        )
     rationale = build_rationale(ledger)
     verdict = "YES" if score > 0 else "NO"
     return {
@@ -3,14 +3,24 @@ Horary Engine Configuration Loader
 Loads and caches configuration from YAML file with lazy singleton pattern
 
 Created for horary_engine.py refactor
+
+The configuration can be reloaded while the process runs: ``reload_config()``
+reads and validates the file first and only then swaps it in, bumping
+``HoraryConfig.version``; a file that fails to load or validate leaves the
+current configuration in place. ``reload_config_if_changed()`` does this when
+the file's modification time changed, at most every
+``config_reload.check_seconds``. Caches built from configuration register
+with ``add_config_reload_listener`` to be dropped when their section changes.
 """
 
 import os
+import threading
+import time
 import yaml
 import logging
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +35,11 @@ class HoraryConfig:
     
     _instance: Optional['HoraryConfig'] = None
     _config: Optional[SimpleNamespace] = None
+    _mtime_ns: Optional[int] = None
+    _checked: float = 0.0
+    # Incremented every time a configuration is loaded or reloaded
+    version: int = 0
+    _lock = threading.RLock()
     
     def __new__(cls) -> 'HoraryConfig':
         if cls._instance is None:
@@ -38,19 +53,32 @@ class HoraryConfig:
     def _load_config(self) -> None:
         """Load configuration from YAML file"""
         
+        with self._lock:
+            if self._config is None:
+                config_file = self._config_file()
+                config, mtime_ns = self._read_config(config_file)
+                self._install(config, mtime_ns)
+    
+    @staticmethod
+    def _config_file() -> Path:
+        """Path of the configuration file"""
+        
         # Allow override via environment variable for testing
         config_path = os.environ.get('HORARY_CONFIG')
         
         if config_path:
-            config_file = Path(config_path)
-        else:
-            # Default to horary_constants.yaml in same directory as this file
-            config_file = Path(__file__).parent / 'horary_constants.yaml'
+            return Path(config_path)
+        # Default to horary_constants.yaml in same directory as this file
+        return Path(__file__).parent / 'horary_constants.yaml'
+    
+    def _read_config(self, config_file: Path) -> Tuple[SimpleNamespace, Optional[int]]:
+        """Parse ``config_file`` into a namespace, with its modification time"""
         
         try:
             if not config_file.exists():
                 raise HoraryError(f"Configuration file not found: {config_file}")
             
+            mtime_ns = config_file.stat().st_mtime_ns
             with open(config_file, 'r', encoding='utf-8') as f:
                 config_dict = yaml.safe_load(f)
             
@@ -58,15 +86,86 @@ class HoraryConfig:
                 raise HoraryError(f"Empty or invalid configuration file: {config_file}")
             
             # Convert nested dict to nested SimpleNamespace for dot notation access
-            self._config = self._dict_to_namespace(config_dict)
+            config = self._dict_to_namespace(config_dict)
             
             logger.info(f"Loaded horary configuration from {config_file}")
+            return config, mtime_ns
             
         except yaml.YAMLError as e:
             raise HoraryError(f"Invalid YAML in configuration file {config_file}: {e}")
         except Exception as e:
             raise HoraryError(f"Failed to load configuration from {config_file}: {e}")
     
+    @classmethod
+    def _install(cls, config: SimpleNamespace, mtime_ns: Optional[int]) -> None:
+        cls._config = config
+        cls._mtime_ns = mtime_ns
+        cls._checked = time.monotonic()
+        cls.version += 1
+    
+    def reload(self) -> SimpleNamespace:
+        """
+        Re-read the configuration file and swap it in
+        
+        The new file is parsed and validated before anything changes, so
+        callers see either the old or the new configuration, never a mix.
+        Reload listeners run after the swap.
+        
+        Returns:
+            The new configuration namespace
+            
+        Raises:
+            HoraryError: If the file cannot be loaded or lacks required keys;
+                the current configuration is kept
+        """
+        with self._lock:
+            config_file = self._config_file()
+            config, mtime_ns = self._read_config(config_file)
+            missing_keys = self._missing_keys(config)
+            if missing_keys:
+                raise HoraryError(f"Missing required configuration keys: {missing_keys}")
+            previous = self._config
+            self._install(config, mtime_ns)
+            logger.info(f"Reloaded horary configuration (version {self.version})")
+        _notify(previous, config)
+        return config
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Reload when the configuration file changed on disk
+        
+        The modification time is checked at most every
+        ``config_reload.check_seconds``. A failed reload is logged and the
+        current configuration kept.
+        
+        Returns:
+            True if a new configuration was swapped in
+        """
+        config = self.config
+        settings = getattr(config, 'config_reload', None)
+        if not getattr(settings, 'enabled', False):
+            return False
+        interval = getattr(settings, 'check_seconds', 2.0)
+        now = time.monotonic()
+        if now - self._checked < interval:
+            return False
+        with self._lock:
+            if now - self._checked < interval:
+                return False
+            HoraryConfig._checked = now
+            try:
+                mtime_ns = self._config_file().stat().st_mtime_ns
+            except OSError:
+                return False
+            if mtime_ns == self._mtime_ns:
+                return False
+            try:
+                self.reload()
+            except HoraryError as e:
+                logger.error(f"Configuration reload failed, keeping version {self.version}: {e}")
+                return False
+            return True
+    
     def _dict_to_namespace(self, d: Dict[str, Any]) -> SimpleNamespace:
         """Convert nested dictionary to nested SimpleNamespace"""
         if isinstance(d, dict):
@@ -128,31 +227,67 @@ class HoraryConfig:
     def validate_required_keys(self) -> None:
         """Validate that all required configuration keys are present"""
         
-        required_keys = [
-            'timing.default_moon_speed_fallback',
-            'orbs.conjunction',
-            'confidence.base_confidence',
-            'confidence.lunar_confidence_caps.favorable',
-            'confidence.lunar_confidence_caps.unfavorable',
-            'radicality.asc_too_early',
-            'radicality.asc_too_late'
-        ]
+        missing_keys = self._missing_keys(self.config)
+        
+        if missing_keys:
+            raise HoraryError(f"Missing required configuration keys: {missing_keys}")
+    
+    @staticmethod
+    def _missing_keys(config: SimpleNamespace) -> List[str]:
+        """Required keys absent from ``config``"""
         
         missing_keys = []
-        for key in required_keys:
+        for key in REQUIRED_KEYS:
+            value = config
             try:
-                self.require(key)
-            except HoraryError:
+                for part in key.split('.'):
+                    value = getattr(value, part)
+            except AttributeError:
                 missing_keys.append(key)
-        
-        if missing_keys:
-            raise HoraryError(f"Missing required configuration keys: {missing_keys}")
+        return missing_keys
     
     @classmethod
     def reset(cls) -> None:
         """Reset singleton for testing"""
         cls._instance = None
         cls._config = None
+        cls._mtime_ns = None
+
+
+REQUIRED_KEYS = [
+    'timing.default_moon_speed_fallback',
+    'orbs.conjunction',
+    'confidence.base_confidence',
+    'confidence.lunar_confidence_caps.favorable',
+    'confidence.lunar_confidence_caps.unfavorable',
+    'radicality.asc_too_early',
+    'radicality.asc_too_late'
+]
+
+_listeners: List[Tuple[Callable[[], None], Optional[str]]] = []
+
+
+def add_config_reload_listener(callback: Callable[[], None], section: Optional[str] = None) -> None:
+    """
+    Call ``callback()`` after a configuration reload
+    
+    Args:
+        callback: Function taking no arguments, e.g. a cache reset
+        section: Only call it when this top-level section changed
+            (default: after every reload)
+    """
+    with HoraryConfig._lock:
+        _listeners.append((callback, section))
+
+
+def _notify(previous: Optional[SimpleNamespace], config: SimpleNamespace) -> None:
+    for callback, section in list(_listeners):
+        if section is not None and getattr(previous, section, None) == getattr(config, section, None):
+            continue
+        try:
+            callback()
+        except Exception:
+            logger.exception(f"Configuration reload listener {callback!r} failed")
 
 
 # Global configuration instance
@@ -167,6 +302,16 @@ def cfg() -> SimpleNamespace:
     return get_config().config
 
 
+def reload_config() -> SimpleNamespace:
+    """Reload the configuration file now (see ``HoraryConfig.reload``)"""
+    return get_config().reload()
+
+
+def reload_config_if_changed() -> bool:
+    """Reload the configuration if its file changed (see ``HoraryConfig.reload_if_changed``)"""
+    return get_config().reload_if_changed()
+
+
 # Validate configuration on import (unless in test environment)
 if os.environ.get('HORARY_CONFIG_SKIP_VALIDATION') != 'true':
     try:
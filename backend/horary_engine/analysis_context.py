@@ -0,0 +1,111 @@
+"""Per-chart cache of facts derived while judging a chart.
+
+The judgment helpers ask the same questions of a chart many times: which
+aspects join two planets, how long until a planet leaves its sign, how fast
+the Moon is moving, what the Moon's next aspect is. :class:`ChartAnalysisContext`
+answers each of them once. Aspects are indexed by planet and by planet pair
+(keeping the order of ``chart.aspects``), sign-exit times are cached by
+position, and anything else can be memoized under a key with :meth:`memo`.
+
+The context is attached to ``HoraryChart.analysis_context`` on first use by
+:func:`get_analysis_context`. Everything stored must depend only on the
+chart's positions, aspects and Julian day, because charts served from the
+chart cache share their context. Cached values are shared between callers
+and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .calculation.helpers import days_to_sign_exit
+
+try:
+    from ..models import AspectInfo, HoraryChart, Planet, PlanetPosition
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import AspectInfo, HoraryChart, Planet, PlanetPosition
+
+
+_EMPTY: Tuple[AspectInfo, ...] = ()
+
+
+class ChartAnalysisContext:
+    """Indexed aspects and memoized derived facts for one chart."""
+
+    __slots__ = ("_aspects", "_by_planet", "_by_pair", "_sign_exits", "_memo")
+
+    def __init__(self, chart: HoraryChart) -> None:
+        self._aspects = chart.aspects
+        by_planet: Dict[Planet, List[AspectInfo]] = {}
+        by_pair: Dict[FrozenSet[Planet], List[AspectInfo]] = {}
+        for aspect in chart.aspects:
+            by_planet.setdefault(aspect.planet1, []).append(aspect)
+            if aspect.planet2 != aspect.planet1:
+                by_planet.setdefault(aspect.planet2, []).append(aspect)
+            by_pair.setdefault(frozenset((aspect.planet1, aspect.planet2)), []).append(aspect)
+        self._by_planet = {planet: tuple(aspects) for planet, aspects in by_planet.items()}
+        self._by_pair = {pair: tuple(aspects) for pair, aspects in by_pair.items()}
+        self._sign_exits: Dict[Tuple[float, float], Optional[float]] = {}
+        self._memo: Dict[Any, Any] = {}
+
+    def aspects_of(self, planet: Planet) -> Tuple[AspectInfo, ...]:
+        """Aspects involving ``planet``, in chart order."""
+
+        return self._by_planet.get(planet, _EMPTY)
+
+    def aspects_between(self, planet1: Planet, planet2: Planet) -> Tuple[AspectInfo, ...]:
+        """Aspects joining the two planets (either way round), in chart order."""
+
+        return self._by_pair.get(frozenset((planet1, planet2)), _EMPTY)
+
+    def applying_aspect(self, planet1: Planet, planet2: Planet) -> Optional[AspectInfo]:
+        """First applying aspect between the two planets, if any."""
+
+        for aspect in self.aspects_between(planet1, planet2):
+            if aspect.applying:
+                return aspect
+        return None
+
+    def separating_aspect(self, planet1: Planet, planet2: Planet) -> Optional[AspectInfo]:
+        """First separating aspect between the two planets, if any."""
+
+        for aspect in self.aspects_between(planet1, planet2):
+            if not aspect.applying:
+                return aspect
+        return None
+
+    def days_to_sign_exit(self, pos: PlanetPosition) -> Optional[float]:
+        """``days_to_sign_exit`` for a position, cached by longitude and speed."""
+
+        key = (pos.longitude, pos.speed)
+        try:
+            return self._sign_exits[key]
+        except KeyError:
+            days = self._sign_exits[key] = days_to_sign_exit(pos.longitude, pos.speed)
+            return days
+
+    def memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """Return the value stored under ``key``, computing it on first use."""
+
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+
+def get_analysis_context(chart: HoraryChart) -> ChartAnalysisContext:
+    """The chart's analysis context, created and attached on first use.
+
+    A context built for a different aspect list (e.g. after the chart's
+    aspects were replaced) is discarded and rebuilt.
+    """
+
+    context = getattr(chart, "analysis_context", None)
+    if context is None or context._aspects is not chart.aspects:
+        context = ChartAnalysisContext(chart)
+        try:
+            chart.analysis_context = context
+        except AttributeError:  # pragma: no cover - read-only chart stand-ins
+            pass
+    return context
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import swisseph as swe
 
@@ -12,7 +12,15 @@ try:
     from ..models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
 except ImportError:  # pragma: no cover - fallback when executed as script
     from models import Aspect, AspectInfo, LunarAspect, Planet, PlanetPosition
+from .calculation.aspect_kernel import ASPECTS, find_aspects
 from .calculation.helpers import days_to_sign_exit
+from .config_snapshot import ConfigSnapshot, config_snapshot, moiety_orb
+from .calculation.refinement import (
+    RefinedPerfection,
+    get_perfection_refiner,
+    is_refined,
+    refine_perfection,
+)
 
 
 def _orb_motion(pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect) -> float:
@@ -26,6 +34,26 @@ def _orb_motion(pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect) -> f
     return diff * (pos1.speed - pos2.speed)
 
 
+def _refined_perfection(
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    jd_ut: Optional[float],
+    max_future_days: Optional[float] = None,
+) -> Optional[RefinedPerfection]:
+    """Ephemeris-accurate perfection in ``refined`` mode, else ``None``.
+
+    Either side of the aspect counts, as with the orb-based estimates here.
+    """
+
+    if jd_ut is None or not is_refined():
+        return None
+    if max_future_days is None:
+        max_future_days = cfg().timing.max_future_days
+    angles = {aspect.degrees % 360, -aspect.degrees % 360}
+    return refine_perfection(pos1.planet, pos2.planet, sorted(angles), jd_ut, max_future_days)
+
+
 def _signed_longitude_delta(lon1: float, lon2: float) -> float:
     """Return signed longitudinal difference lon1-lon2 normalised to [-180, 180]."""
 
@@ -213,71 +241,124 @@ def format_timing_description(days: float) -> str:
 
 
 def calculate_enhanced_aspects(
-    planets: Dict[Planet, PlanetPosition], jd_ut: float
+    planets: Dict[Planet, PlanetPosition],
+    jd_ut: float,
+    config: Optional[ConfigSnapshot] = None,
 ) -> List[AspectInfo]:
-    """Enhanced aspect calculation with configuration"""
-    aspects: List[AspectInfo] = []
-    planet_list = list(planets.keys())
-    config = cfg()
-
-    for i, planet1 in enumerate(planet_list):
-        for planet2 in planet_list[i + 1 :]:
-            pos1 = planets[planet1]
-            pos2 = planets[planet2]
-
-            # Calculate angular separation using signed delta
-            angle_diff = abs(_signed_longitude_delta(pos1.longitude, pos2.longitude))
-
-            # Check each traditional aspect
-            for aspect_type in Aspect:
-                orb_diff = abs(angle_diff - aspect_type.degrees)
-
-                # ENHANCED: Traditional moiety-based orb calculation
-                max_orb = calculate_moiety_based_orb(
-                    planet1, planet2, aspect_type, config
+    """Enhanced aspect calculation with configuration
+
+    ``config`` defaults to the current :func:`config_snapshot`. Every pair
+    is tested against every aspect at once by
+    :func:`~horary_engine.calculation.aspect_kernel.find_aspects`, using
+    the snapshot's precomputed orb matrix.
+    """
+    return calculate_enhanced_aspects_batch([planets], [jd_ut], config)[0]
+
+
+def calculate_enhanced_aspects_batch(
+    planet_sets: Sequence[Dict[Planet, PlanetPosition]],
+    jd_uts: Sequence[float],
+    config: Optional[ConfigSnapshot] = None,
+) -> List[List[AspectInfo]]:
+    """:func:`calculate_enhanced_aspects` for many charts
+
+    Charts with the same bodies (in the same order) share one kernel pass.
+    Returns one aspect list per chart, in input order.
+    """
+    settings = config or config_snapshot()
+    max_future_days = settings.timing.max_future_days
+    refine = is_refined()
+    results: List[List[AspectInfo]] = [[] for _ in planet_sets]
+
+    groups: Dict[Tuple[Planet, ...], List[int]] = {}
+    for row, planets in enumerate(planet_sets):
+        groups.setdefault(tuple(planets), []).append(row)
+
+    for planet_list, rows in groups.items():
+        positions = [[planet_sets[row][planet] for planet in planet_list] for row in rows]
+        matches = find_aspects(
+            [[pos.longitude for pos in chart] for chart in positions],
+            planet_list,
+            settings.orbs.orb_matrix,
+        )
+        exits_chart, exits = None, []
+        for chart, first, second, aspect_index, delta, orb in zip(
+            matches.chart.tolist(),
+            matches.first.tolist(),
+            matches.second.tolist(),
+            matches.aspect.tolist(),
+            matches.delta.tolist(),
+            matches.orb.tolist(),
+        ):
+            if chart != exits_chart:
+                # Days to sign exit of each body, shared by all its aspects
+                exits_chart = chart
+                exits = [days_to_sign_exit(pos.longitude, pos.speed) for pos in positions[chart]]
+            pos1 = positions[chart][first]
+            pos2 = positions[chart][second]
+            aspect = ASPECTS[aspect_index]
+            jd_ut = jd_uts[rows[chart]]
+            refined = _refined_perfection(pos1, pos2, aspect, jd_ut, max_future_days) if refine else None
+            applying, within_sign, degrees_to_exact, exact_time = _aspect_state(
+                pos1, pos2, aspect, delta, orb, jd_ut, max_future_days, refined, exits[first], exits[second]
+            )
+            results[rows[chart]].append(
+                AspectInfo(
+                    planet1=planet_list[first],
+                    planet2=planet_list[second],
+                    aspect=aspect,
+                    orb=orb,
+                    applying=applying,
+                    perfection_within_sign=within_sign,
+                    exact_time=exact_time,
+                    degrees_to_exact=degrees_to_exact,
                 )
+            )
 
-                # Fallback to configured orbs if moiety system disabled
-                if max_orb == 0:
-                    max_orb = aspect_type.orb
-                    # Luminary bonuses (legacy)
-                    if Planet.SUN in [planet1, planet2]:
-                        max_orb += config.orbs.sun_orb_bonus
-                    if Planet.MOON in [planet1, planet2]:
-                        max_orb += config.orbs.moon_orb_bonus
-
-                if orb_diff <= max_orb:
-                    # Determine if applying
-                    applying, within_sign = is_applying_enhanced(
-                        pos1, pos2, aspect_type, jd_ut
-                    )
+    return results
 
-                    # Calculate degrees to exact and timing
-                    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
-                        pos1, pos2, aspect_type, jd_ut
-                    )
 
-                    aspects.append(
-                        AspectInfo(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            applying=applying,
-                            perfection_within_sign=within_sign,
-                            exact_time=exact_time,
-                            degrees_to_exact=degrees_to_exact,
-                        )
-                    )
-                    break
+def _aspect_state(
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    delta: float,
+    orb: float,
+    jd_ut: float,
+    max_future_days: float,
+    refined: Optional[RefinedPerfection],
+    exit1: Optional[float],
+    exit2: Optional[float],
+) -> Tuple[bool, bool, float, Optional[datetime.datetime]]:
+    """Applying flag, in-sign perfection, degrees to exact and exact time
+
+    ``delta`` (signed separation) and ``orb`` (distance from exact) come
+    from the aspect kernel, ``exit1``/``exit2`` are the bodies' days to sign
+    exit and ``refined`` the refined perfection (or ``None``). The relative
+    speed is worked out once and shared; the arithmetic is that of
+    :func:`is_applying_enhanced` and :func:`calculate_enhanced_degrees_to_exact`.
+    """
+    diff = (delta - aspect.degrees + 180) % 360 - 180
+    relative_speed = pos1.speed - pos2.speed
 
-    return aspects
+    applying = diff * relative_speed < 0
+    within_sign = _perfects_before_sign_exit(
+        pos1, pos2, abs(diff), jd_ut, refined, relative_speed, exit1, exit2
+    )
+    degrees_to_exact, exact_time = _degrees_and_exact_time(
+        orb, relative_speed, applying, jd_ut, refined, max_future_days
+    )
+    return applying, within_sign, degrees_to_exact, exact_time
 
 
 def calculate_moiety_based_orb(
     planet1: Planet, planet2: Planet, aspect_type: Aspect, config
 ) -> float:
-    """Calculate traditional moiety-based orb for two planets (ENHANCED)"""
+    """Calculate traditional moiety-based orb for two planets (ENHANCED)
+
+    Full orbs come from ``config.orbs.moieties``; each body contributes half
+    (its moiety), scaled per aspect by ``MOIETY_ASPECT_FACTORS``.
+    """
 
     if not hasattr(config.orbs, "moieties"):
         return 0  # Fallback to legacy system
@@ -285,24 +366,7 @@ def calculate_moiety_based_orb(
     # Get planetary full orb values and convert to moieties (half-orbs)
     full_orb1 = getattr(config.orbs.moieties, planet1.value, 0.0)
     full_orb2 = getattr(config.orbs.moieties, planet2.value, 0.0)
-
-    moiety1 = full_orb1 / 2.0
-    moiety2 = full_orb2 / 2.0
-
-    # Combined moiety orb (sum of half-orbs)
-    combined_moiety = moiety1 + moiety2
-
-    # Traditional aspect-specific adjustments
-    if aspect_type in [Aspect.CONJUNCTION, Aspect.OPPOSITION]:
-        # Conjunction and opposition get full combined moieties
-        return combined_moiety
-    if aspect_type in [Aspect.TRINE, Aspect.SQUARE]:
-        # Squares and trines get slightly reduced orbs
-        return combined_moiety * 0.85
-    if aspect_type == Aspect.SEXTILE:
-        # Sextiles get more restrictive orbs
-        return combined_moiety * 0.7
-    return combined_moiety * 0.8  # Other aspects
+    return moiety_orb(full_orb1, full_orb2, aspect_type)
 
 
 def is_applying_enhanced(
@@ -324,7 +388,7 @@ def is_applying_enhanced(
 
     applying = _orb_motion(pos1, pos2, aspect) < 0
     perfection_within_sign = _will_perfect_before_sign_exit(
-        pos1, pos2, aspect, current_orb
+        pos1, pos2, aspect, current_orb, jd_ut
     )
 
     return applying, perfection_within_sign
@@ -368,21 +432,44 @@ def _calculate_orb_to_aspect_at_time(pos1: PlanetPosition, pos2: PlanetPosition,
 
 
 def _will_perfect_before_sign_exit(pos1: PlanetPosition, pos2: PlanetPosition, 
-                                 aspect: Aspect, current_orb: float) -> bool:
+                                 aspect: Aspect, current_orb: float,
+                                 jd_ut: Optional[float] = None) -> bool:
     """Check if aspect will perfect before either planet exits its current sign"""
+
+    refined = _refined_perfection(pos1, pos2, aspect, jd_ut)
+    return _perfects_before_sign_exit(
+        pos1, pos2, current_orb, jd_ut, refined, pos1.speed - pos2.speed,
+        days_to_sign_exit(pos1.longitude, pos1.speed), days_to_sign_exit(pos2.longitude, pos2.speed)
+    )
+
+
+def _perfects_before_sign_exit(pos1: PlanetPosition, pos2: PlanetPosition, current_orb: float,
+                               jd_ut: Optional[float], refined: Optional[RefinedPerfection],
+                               relative_speed: float, pos1_days_to_exit: Optional[float],
+                               pos2_days_to_exit: Optional[float]) -> bool:
+    """:func:`_will_perfect_before_sign_exit` from its intermediates
+
+    ``refined`` is the refined perfection (or ``None``), ``relative_speed``
+    is ``pos1.speed - pos2.speed`` and the ``*_days_to_exit`` are
+    :func:`days_to_sign_exit` of each body.
+    """
+
+    if refined is not None:
+        if refined.days is None:
+            return False
+        refiner = get_perfection_refiner()
+        return refiner.stays_in_sign(pos1.planet, jd_ut, refined.days) and refiner.stays_in_sign(
+            pos2.planet, jd_ut, refined.days
+        )
     
     # Calculate relative speed
-    relative_speed = abs(pos1.speed - pos2.speed)
+    relative_speed = abs(relative_speed)
     if relative_speed == 0:
         return False  # No relative motion = no perfection
     
     # Estimate days to perfection
     days_to_perfect = current_orb / relative_speed
     
-    # Check days until each planet exits its current sign
-    pos1_days_to_exit = days_to_sign_exit(pos1.longitude, pos1.speed)
-    pos2_days_to_exit = days_to_sign_exit(pos2.longitude, pos2.speed)
-    
     # If either planet exits sign before perfection, aspect won't perfect
     if pos1_days_to_exit and days_to_perfect > pos1_days_to_exit:
         return False
@@ -403,21 +490,38 @@ def calculate_enhanced_degrees_to_exact(
     # Orb from exact
     orb_from_exact = abs(separation - aspect.degrees)
 
+    max_future_days = cfg().timing.max_future_days
+    refined = _refined_perfection(pos1, pos2, aspect, jd_ut, max_future_days)
+    applying = _orb_motion(pos1, pos2, aspect) < 0
+    return _degrees_and_exact_time(
+        orb_from_exact, pos1.speed - pos2.speed, applying, jd_ut, refined, max_future_days
+    )
+
+
+def _degrees_and_exact_time(
+    orb_from_exact: float,
+    relative_speed: float,
+    applying: bool,
+    jd_ut: float,
+    refined: Optional[RefinedPerfection],
+    max_future_days: float,
+) -> Tuple[float, Optional[datetime.datetime]]:
+    """:func:`calculate_enhanced_degrees_to_exact` from its intermediates"""
+
     # Calculate exact time if planets are applying
     exact_time = None
-    if abs(pos1.speed - pos2.speed) > 0:
-        days_to_exact = orb_from_exact / abs(pos1.speed - pos2.speed)
+    if applying and (refined is not None or abs(relative_speed) > 0):
+        if refined is not None:
+            days_to_exact = refined.days if refined.days is not None else float("inf")
+        else:
+            days_to_exact = orb_from_exact / abs(relative_speed)
 
-        max_future_days = cfg().timing.max_future_days
         if days_to_exact < max_future_days:
+            # UT calendar date of the perfection, to the minute
+            year, month, day, hour = swe.revjul(jd_ut + days_to_exact, swe.GREG_CAL)
             try:
-                exact_jd = jd_ut + days_to_exact
-                # Convert back to datetime
-                year, month, day, hour = swe.jdut1_to_utc(exact_jd, 1)  # Flag 1 for Gregorian
-                exact_time = datetime.datetime(
-                    int(year), int(month), int(day), int(hour), int((hour % 1) * 60)
-                )
-            except Exception:
+                exact_time = datetime.datetime(year, month, day, int(hour), int((hour % 1) * 60))
+            except ValueError:  # outside datetime's years (e.g. charts without a Julian day)
                 exact_time = None
 
     # If already very close, return small value
@@ -14,6 +14,20 @@ from .helpers import (
     normalize_longitude,
     degrees_to_dms,
 )
+from .ephemeris import (
+    ChebyshevEphemeris,
+    EphemerisArrays,
+    get_ephemeris_table,
+    planet_positions,
+)
+from .stations import StationFinder, get_station_finder
+from .event_calendar import (
+    CalendarEvent,
+    EventCalendar,
+    build_event_calendar,
+    get_event_calendar,
+)
+from .aspect_timeline import AspectEvent, AspectTimeline, get_aspect_timeline
 
 __all__ = [
     "calculate_next_station_time",
@@ -28,4 +42,17 @@ __all__ = [
     "check_aspect_separation_order",
     "normalize_longitude",
     "degrees_to_dms",
+    "ChebyshevEphemeris",
+    "EphemerisArrays",
+    "get_ephemeris_table",
+    "planet_positions",
+    "StationFinder",
+    "get_station_finder",
+    "CalendarEvent",
+    "EventCalendar",
+    "build_event_calendar",
+    "get_event_calendar",
+    "AspectEvent",
+    "AspectTimeline",
+    "get_aspect_timeline",
 ]
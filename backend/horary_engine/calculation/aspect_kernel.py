@@ -0,0 +1,100 @@
+"""Vectorised aspect detection for one chart or a batch of charts.
+
+For every pair of bodies the signed separation::
+
+    Δ = (λ1 − λ2 + 180) mod 360 − 180
+
+and its distance from each aspect angle ``| |Δ| − θ |`` are computed for
+all pairs (and all charts) in one numpy pass, then compared with the orb
+matrix of the configuration snapshot (``OrbSettings.orb_matrix``). As in
+the per-pair loop it replaces, the first aspect in ``Aspect`` order that is
+within orb is the pair's aspect. The arithmetic is the same, so the
+matches, separations and orbs are identical to the scalar ones.
+
+:func:`find_aspects` only finds the aspects. Applying status, in-sign
+perfection and time to exact are derived per match from the returned
+``delta`` and ``orb`` in :mod:`horary_engine.aspects`.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from ...models import Aspect, Planet
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Aspect, Planet
+
+
+# Axis order of ``OrbSettings.orb_matrix``
+PLANETS: Tuple[Planet, ...] = tuple(Planet)
+ASPECTS: Tuple[Aspect, ...] = tuple(Aspect)
+
+_ANGLES = np.array([aspect.degrees for aspect in ASPECTS], dtype=float)
+_PLANET_INDEX: Dict[Planet, int] = {planet: i for i, planet in enumerate(PLANETS)}
+_PAIRS: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _pairs(count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Column indices ``(i, j)`` of every pair ``i < j``, in nested-loop order."""
+
+    pairs = _PAIRS.get(count)
+    if pairs is None:
+        pairs = _PAIRS[count] = np.triu_indices(count, 1)
+    return pairs
+
+
+class AspectMatches(NamedTuple):
+    """Aspects found by :func:`find_aspects`, one entry per aspected pair.
+
+    Entries are ordered by chart, then by pair in the order of the nested
+    loop ``for i: for j > i``. ``first``/``second`` are column indices into
+    the ``planets`` passed in, ``aspect`` indexes :data:`ASPECTS`.
+    """
+
+    chart: np.ndarray
+    first: np.ndarray
+    second: np.ndarray
+    aspect: np.ndarray
+    delta: np.ndarray  # signed separation, degrees in [-180, 180)
+    orb: np.ndarray  # distance from the exact aspect
+
+
+def find_aspects(
+    longitudes: Sequence, planets: Sequence[Planet], orb_matrix: np.ndarray
+) -> AspectMatches:
+    """Aspected pairs among ``planets`` in one chart or many.
+
+    Parameters
+    ----------
+    longitudes:
+        Ecliptic longitudes, shape ``(len(planets),)`` for one chart or
+        ``(charts, len(planets))`` for a batch with the same bodies.
+    planets:
+        Body of each longitude column.
+    orb_matrix:
+        ``OrbSettings.orb_matrix`` of the configuration snapshot.
+    """
+
+    lon = np.asarray(longitudes, dtype=float)
+    if lon.ndim == 1:
+        lon = lon[np.newaxis, :]
+    first, second = _pairs(len(planets))
+    index = np.array([_PLANET_INDEX[planet] for planet in planets], dtype=np.intp)
+
+    delta = (lon[:, first] - lon[:, second] + 180.0) % 360.0 - 180.0
+    orb = np.abs(np.abs(delta)[..., np.newaxis] - _ANGLES)
+    within = orb <= orb_matrix[index[first], index[second]]
+
+    chart, pair = np.nonzero(within.any(axis=-1))
+    aspect = within[chart, pair].argmax(axis=-1)
+    return AspectMatches(
+        chart=chart,
+        first=first[pair],
+        second=second[pair],
+        aspect=aspect,
+        delta=delta[chart, pair],
+        orb=orb[chart, pair, aspect],
+    )
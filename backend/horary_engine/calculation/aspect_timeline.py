@@ -0,0 +1,214 @@
+"""Aspect perfection times for every pair of traditional planets.
+
+With planets moving at their current (signed) speeds, planet ``A`` reaches
+aspect angle ``θ`` ahead of planet ``B`` when::
+
+    λA + vA·t ≡ λB + vB·t + θ  (mod 360)
+
+so the first solution is ``t₀ = ((λB + θ − λA) mod 360) / (vA − vB)`` and the
+later ones follow every ``360 / (vA − vB)`` days. Only the planet gaining on
+the other (``vA > vB``) has positive solutions, so solving both orderings of
+each pair covers every perfection.
+
+:class:`AspectTimeline` solves the 7 x 7 x 5 system in one numpy pass and
+keeps every perfection inside the look-ahead window as a list of
+:class:`AspectEvent` sorted by time, which is queried with binary search.
+:meth:`AspectTimeline.reach_time` reproduces the engine's
+``_calculate_future_aspect_time`` exactly (same arithmetic, same cut-offs).
+
+As with the per-pair solver, motion is linear: stations and speed changes
+within the window are not modelled.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from horary_config import cfg
+
+try:
+    from ...models import Aspect, HoraryChart, Planet
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Aspect, HoraryChart, Planet
+
+
+PLANETS: Tuple[Planet, ...] = (
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+)
+
+ASPECTS: Tuple[Aspect, ...] = (
+    Aspect.CONJUNCTION,
+    Aspect.SEXTILE,
+    Aspect.SQUARE,
+    Aspect.TRINE,
+    Aspect.OPPOSITION,
+)
+
+_ANGLES = np.array([0.0, 60.0, 90.0, 120.0, 180.0])
+_PLANET_INDEX = {planet: i for i, planet in enumerate(PLANETS)}
+_ASPECT_INDEX = {aspect: i for i, aspect in enumerate(ASPECTS)}
+
+# Relative speeds below this are treated as no relative motion
+MIN_RELATIVE_SPEED = 1e-6
+
+
+class AspectEvent(NamedTuple):
+    """One aspect perfection, ``days`` after the chart moment.
+
+    ``planet`` is the one applying (moving faster in the zodiac than
+    ``other``).
+    """
+
+    days: float
+    planet: Planet
+    other: Planet
+    aspect: Aspect
+
+    def involves(self, planet: Planet) -> bool:
+        return self.planet == planet or self.other == planet
+
+
+class AspectTimeline:
+    """Every aspect perfection between the traditional planets in a window.
+
+    Parameters
+    ----------
+    positions:
+        ``{planet: position}``; planets missing from the mapping take no part.
+    window:
+        Look-ahead in days. Defaults to ``timing.max_future_days``.
+    """
+
+    __slots__ = ("window", "_first", "_events", "_times")
+
+    def __init__(self, positions, window: Optional[float] = None) -> None:
+        if window is None:
+            window = float(getattr(getattr(cfg(), "timing", None), "max_future_days", 365))
+        self.window = window
+
+        longitudes = np.full(len(PLANETS), np.nan)
+        speeds = np.full(len(PLANETS), np.nan)
+        for i, planet in enumerate(PLANETS):
+            pos = positions.get(planet)
+            if pos is not None:
+                longitudes[i] = pos.longitude
+                speeds[i] = pos.speed
+
+        # rel[i, j]: how fast i gains on j; delta[i, j, a]: arc i must gain
+        # to stand at aspect a ahead of j. Same operation order as the
+        # per-pair solver so the results agree to the last bit.
+        rel = speeds[:, None] - speeds[None, :]
+        delta = (longitudes[None, :, None] + _ANGLES[None, None, :] - longitudes[:, None, None]) % 360.0
+        gaining = np.broadcast_to((rel >= MIN_RELATIVE_SPEED)[:, :, None], delta.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            first = np.where(gaining, delta / rel[:, :, None], np.inf)
+            period = np.where(gaining, 360.0 / rel[:, :, None], np.inf)
+        self._first = first
+
+        # An aspect exact at the chart moment is not a future perfection;
+        # its next occurrence is one period later.
+        start = np.where(first > 0, first, first + period)
+        i, j, a = np.nonzero(start <= window)
+        start, period = start[i, j, a], period[i, j, a]
+        counts = np.floor((window - start) / period).astype(np.int64) + 1
+        group = np.repeat(np.arange(len(counts)), counts)
+        cycle = np.arange(group.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        times = start[group] + cycle * period[group]
+        order = np.argsort(times, kind="stable")
+
+        times = times[order].tolist()
+        group = group[order].tolist()
+        i, j, a = i.tolist(), j.tolist(), a.tolist()
+        self._times: List[float] = times
+        self._events: List[AspectEvent] = [
+            AspectEvent(t, PLANETS[i[g]], PLANETS[j[g]], ASPECTS[a[g]]) for t, g in zip(times, group)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[AspectEvent]:
+        return iter(self._events)
+
+    @property
+    def events(self) -> Sequence[AspectEvent]:
+        """All events in the window, earliest first."""
+
+        return self._events
+
+    def reach_time(self, planet: Planet, other: Planet, aspect: Aspect,
+                   max_days: Optional[float] = None) -> Optional[float]:
+        """Days until ``planet`` first perfects ``aspect`` to ``other``.
+
+        ``None`` when ``planet`` is not gaining on ``other``, the aspect is
+        exact now, or the time exceeds ``max_days`` (defaults to the window).
+        """
+
+        try:
+            t = self._first[_PLANET_INDEX[planet], _PLANET_INDEX[other], _ASPECT_INDEX[aspect]]
+        except KeyError:
+            return None
+        if max_days is None:
+            max_days = self.window
+        if not 0 < t <= max_days:
+            return None
+        return float(t)
+
+    def between(self, start: float, end: float) -> Sequence[AspectEvent]:
+        """Events with ``start <= days < end``, earliest first."""
+
+        return self._events[bisect_left(self._times, start):bisect_left(self._times, end)]
+
+    def after(self, start: float) -> Sequence[AspectEvent]:
+        """Events strictly after ``start`` days, earliest first."""
+
+        return self._events[bisect_right(self._times, start):]
+
+    def first(self, planet: Planet, other: Optional[Planet] = None, aspect: Optional[Aspect] = None,
+              start: float = 0.0, end: Optional[float] = None) -> Optional[AspectEvent]:
+        """Earliest event involving ``planet`` (and ``other``, ``aspect`` if given).
+
+        Only events with ``start <= days < end`` are considered; ``end``
+        defaults to the window.
+        """
+
+        times = self._times
+        stop = len(times) if end is None else bisect_left(times, end)
+        for index in range(bisect_left(times, start), stop):
+            event = self._events[index]
+            if not event.involves(planet):
+                continue
+            if other is not None and not event.involves(other):
+                continue
+            if aspect is not None and event.aspect != aspect:
+                continue
+            return event
+        return None
+
+    def partners(self, planets: Sequence[Planet], start: float, end: float) -> set:
+        """Planets that perfect any aspect with one of ``planets`` in ``[start, end)``."""
+
+        found = set()
+        for event in self.between(start, end):
+            if event.planet in planets:
+                found.add(event.other)
+            if event.other in planets:
+                found.add(event.planet)
+        return found
+
+
+def get_aspect_timeline(chart: HoraryChart) -> AspectTimeline:
+    """The chart's timeline, built once per chart through its analysis context."""
+
+    from ..analysis_context import get_analysis_context
+
+    return get_analysis_context(chart).memo("aspect_timeline", lambda: AspectTimeline(chart.planets))
@@ -0,0 +1,320 @@
+"""Vectorised planetary ephemeris backed by a Chebyshev table.
+
+The chart calculator and the timing helpers historically called
+``swe.calc_ut`` once per planet and Julian day. Station searches and timing
+scans evaluate the same planet at thousands of instants, so this module
+accepts whole arrays of Julian days and returns NumPy arrays of longitude,
+latitude and speed.
+
+Inside the configured date range (``ephemeris.table_start_year`` to
+``ephemeris.table_end_year``) positions are interpolated from Chebyshev
+series fitted to Swiss Ephemeris samples. Segments are fitted lazily on first
+use and kept for the life of the process, so the table costs nothing until a
+region of time is actually queried. Outside the range, or when the table is
+disabled, every instant falls back to ``swe.calc_ut``.
+
+Interpolation error is typically below 1e-6 degrees and at worst a few
+1e-4 degrees (about one arc-second) in longitude, far inside any orb used by
+the engine. Charts themselves are still cast directly from Swiss Ephemeris.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import add_config_reload_listener, cfg
+try:
+    from ...models import Planet
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Planet
+
+
+SWE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+# Swiss Ephemeris body ids for the traditional planets
+SWE_PLANET_IDS: Dict[Planet, int] = {
+    Planet.SUN: swe.SUN,
+    Planet.MOON: swe.MOON,
+    Planet.MERCURY: swe.MERCURY,
+    Planet.VENUS: swe.VENUS,
+    Planet.MARS: swe.MARS,
+    Planet.JUPITER: swe.JUPITER,
+    Planet.SATURN: swe.SATURN,
+}
+
+PlanetLike = Union[Planet, int]
+
+
+@dataclass
+class EphemerisArrays:
+    """Positions of one body at an array of Julian days."""
+
+    longitude: np.ndarray
+    latitude: np.ndarray
+    speed: np.ndarray
+
+
+def _swe_id(planet: PlanetLike) -> int:
+    if isinstance(planet, Planet):
+        try:
+            return SWE_PLANET_IDS[planet]
+        except KeyError:
+            raise ValueError(f"No ephemeris body for {planet}") from None
+    return int(planet)
+
+
+def _year_to_jd(year: int) -> float:
+    return swe.julday(int(year), 1, 1, 0.0)
+
+
+def _calc_swe(planet_id: int, jds: np.ndarray) -> np.ndarray:
+    """Scalar Swiss Ephemeris fallback returning an ``(n, 3)`` array."""
+
+    out = np.empty((len(jds), 3))
+    for i, jd in enumerate(jds):
+        data, _ = swe.calc_ut(float(jd), planet_id, SWE_FLAGS)
+        out[i] = (data[0], data[1], data[3])
+    return out
+
+
+class ChebyshevEphemeris:
+    """Piecewise Chebyshev approximation of planetary positions.
+
+    Parameters
+    ----------
+    start_jd, end_jd:
+        Julian day range covered by the table.
+    degree:
+        Degree of the Chebyshev series fitted to each segment.
+    segment_days:
+        Mapping of Swiss Ephemeris body id to segment length in days. Bodies
+        not listed use ``default_segment_days``.
+    default_segment_days:
+        Segment length for bodies without an explicit entry.
+    """
+
+    def __init__(
+        self,
+        start_jd: float,
+        end_jd: float,
+        degree: int = 13,
+        segment_days: Optional[Dict[int, float]] = None,
+        default_segment_days: float = 16.0,
+    ) -> None:
+        if end_jd <= start_jd:
+            raise ValueError("Ephemeris table end must be after its start")
+        self.start_jd = float(start_jd)
+        self.end_jd = float(end_jd)
+        self.degree = int(degree)
+        self.segment_days = dict(segment_days or {})
+        self.default_segment_days = float(default_segment_days)
+
+        n = self.degree + 1
+        self._nodes = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+        # Discrete cosine transform matrix turning node samples into
+        # Chebyshev coefficients (exact interpolation at the nodes)
+        k = np.arange(n)[:, None]
+        self._fit_matrix = (2.0 / n) * np.cos(np.pi * k * (np.arange(n) + 0.5) / n)
+        self._fit_matrix[0] *= 0.5
+
+        self._segments: Dict[int, Dict[int, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "ChebyshevEphemeris":
+        """Build a table from the ``ephemeris`` configuration section."""
+
+        config = cfg().ephemeris
+        segment_days = {}
+        for name, days in vars(config.segment_days).items():
+            if name == "default":
+                continue
+            segment_days[SWE_PLANET_IDS[Planet[name.upper()]]] = float(days)
+        return cls(
+            _year_to_jd(config.table_start_year),
+            _year_to_jd(config.table_end_year),
+            degree=config.chebyshev_degree,
+            segment_days=segment_days,
+            default_segment_days=config.segment_days.default,
+        )
+
+    def covers(self, jds: np.ndarray) -> np.ndarray:
+        """Boolean mask of Julian days inside the table range."""
+
+        jds = np.asarray(jds, dtype=float)
+        return (jds >= self.start_jd) & (jds < self.end_jd)
+
+    def _segment_length(self, planet_id: int) -> float:
+        return self.segment_days.get(planet_id, self.default_segment_days)
+
+    def _fit_segment(self, planet_id: int, index: int) -> np.ndarray:
+        length = self._segment_length(planet_id)
+        start = self.start_jd + index * length
+        samples = _calc_swe(planet_id, start + (self._nodes + 1.0) * 0.5 * length)
+        samples[:, 0] = np.degrees(np.unwrap(np.radians(samples[:, 0])))
+        # Shape (degree + 1, 3): coefficients for longitude, latitude, speed
+        return self._fit_matrix @ samples
+
+    def _coefficients(self, planet_id: int, indices: np.ndarray) -> np.ndarray:
+        table = self._segments.setdefault(planet_id, {})
+        unique = np.unique(indices)
+        missing = [int(i) for i in unique if int(i) not in table]
+        if missing:
+            fitted = {i: self._fit_segment(planet_id, i) for i in missing}
+            with self._lock:
+                table.update(fitted)
+        if not len(indices):
+            return np.empty((0, self.degree + 1, 3))
+        # Consecutive instants mostly share segments: stack each once
+        inverse = np.searchsorted(unique, indices)
+        return np.stack([table[int(i)] for i in unique])[inverse]
+
+    def evaluate(self, planet: PlanetLike, jds: Sequence[float]) -> EphemerisArrays:
+        """Interpolate positions for Julian days that lie inside the table."""
+
+        planet_id = _swe_id(planet)
+        jds = np.asarray(jds, dtype=float)
+        if not np.all(self.covers(jds)):
+            raise ValueError("Julian day outside ephemeris table range")
+
+        length = self._segment_length(planet_id)
+        offset = (jds - self.start_jd) / length
+        indices = np.floor(offset).astype(np.int64)
+        x = 2.0 * (offset - indices) - 1.0
+        coeffs = self._coefficients(planet_id, indices)
+
+        # Clenshaw recurrence over all instants at once
+        x = x[:, None]
+        b1 = np.zeros((len(jds), 3))
+        b2 = np.zeros((len(jds), 3))
+        for k in range(self.degree, 0, -1):
+            b1, b2 = 2.0 * x * b1 - b2 + coeffs[:, k], b1
+        values = x * b1 - b2 + coeffs[:, 0]
+
+        return EphemerisArrays(
+            longitude=values[:, 0] % 360.0,
+            latitude=values[:, 1],
+            speed=values[:, 2],
+        )
+
+    def position(self, planet: PlanetLike, jd: float) -> Tuple[float, float, float]:
+        """Longitude, latitude and speed at a single Julian day inside the table.
+
+        Scalar counterpart of :meth:`evaluate` for root finders that step
+        one instant at a time, where array overhead would dominate.
+        """
+
+        planet_id = _swe_id(planet)
+        if not self.start_jd <= jd < self.end_jd:
+            raise ValueError("Julian day outside ephemeris table range")
+        length = self._segment_length(planet_id)
+        offset = (jd - self.start_jd) / length
+        index = int(offset // 1)
+        coeffs = self._segments.get(planet_id, {}).get(index)
+        if coeffs is None:
+            coeffs = self._coefficients(planet_id, np.array([index]))[0]
+        x = 2.0 * (offset - index) - 1.0
+        values = []
+        for column in coeffs.T.tolist():
+            b1 = b2 = 0.0
+            for k in range(self.degree, 0, -1):
+                b1, b2 = 2.0 * x * b1 - b2 + column[k], b1
+            values.append(x * b1 - b2 + column[0])
+        return values[0] % 360.0, values[1], values[2]
+
+    def precompute(self, planets: Optional[Iterable[PlanetLike]] = None) -> None:
+        """Fit every segment of the range up front (e.g. before forking workers)."""
+
+        for planet in planets or SWE_PLANET_IDS:
+            planet_id = _swe_id(planet)
+            count = int(np.ceil((self.end_jd - self.start_jd) / self._segment_length(planet_id)))
+            self._coefficients(planet_id, np.arange(count))
+
+
+_table: Optional[ChebyshevEphemeris] = None
+_table_lock = threading.Lock()
+
+
+def _shared_table() -> ChebyshevEphemeris:
+    """The process-wide table, built from config on first use."""
+
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = ChebyshevEphemeris.from_config()
+    return _table
+
+
+def get_ephemeris_table() -> Optional[ChebyshevEphemeris]:
+    """Return the process-wide table, or ``None`` when disabled in config."""
+
+    if not getattr(cfg().ephemeris, "use_table", True):
+        return None
+    return _shared_table()
+
+
+def reset_ephemeris_table() -> None:
+    """Drop the process-wide table so it is rebuilt from current config."""
+
+    global _table
+    with _table_lock:
+        _table = None
+
+
+add_config_reload_listener(reset_ephemeris_table, section="ephemeris")
+
+
+def planet_positions(
+    jds: Union[float, Sequence[float]],
+    planets: Optional[Iterable[PlanetLike]] = None,
+    use_table: Optional[bool] = None,
+) -> Dict[PlanetLike, EphemerisArrays]:
+    """Positions of ``planets`` at every Julian day in ``jds``.
+
+    Parameters
+    ----------
+    jds:
+        Scalar or array of Julian days (UT).
+    planets:
+        :class:`Planet` members or Swiss Ephemeris body ids. Defaults to the
+        seven traditional planets.
+    use_table:
+        Force (``True``) or bypass (``False``) the Chebyshev table. ``None``
+        follows ``ephemeris.use_table`` in configuration. Forcing the table
+        while configuration disables it still uses the process-wide table.
+
+    Returns
+    -------
+    dict
+        Mapping of each requested planet, keyed as passed in, to its
+        :class:`EphemerisArrays`.
+    """
+
+    jds = np.atleast_1d(np.asarray(jds, dtype=float))
+    if use_table is None:
+        table = get_ephemeris_table()
+    else:
+        table = _shared_table() if use_table else None
+    inside = table.covers(jds) if table is not None else np.zeros(len(jds), dtype=bool)
+
+    results: Dict[PlanetLike, EphemerisArrays] = {}
+    for planet in planets if planets is not None else SWE_PLANET_IDS:
+        planet_id = _swe_id(planet)
+        values = np.empty((len(jds), 3))
+        if inside.any():
+            interpolated = table.evaluate(planet_id, jds[inside])
+            values[inside, 0] = interpolated.longitude
+            values[inside, 1] = interpolated.latitude
+            values[inside, 2] = interpolated.speed
+        if not inside.all():
+            values[~inside] = _calc_swe(planet_id, jds[~inside])
+        results[planet] = EphemerisArrays(
+            longitude=values[:, 0], latitude=values[:, 1], speed=values[:, 2]
+        )
+    return results
@@ -0,0 +1,274 @@
+"""Precomputed calendar of planetary stations and sign ingresses.
+
+Stations and ingresses do not depend on the querent or location, so they can
+be computed once for a range of years and shared by every request. A built
+calendar is a directory holding ``meta.json`` and two arrays per planet:
+
+* ``<planet>_stations.npy`` with shape ``(2, n)``: Julian day, and direction
+  after the station (``+1`` turning direct, ``-1`` turning retrograde);
+* ``<planet>_ingresses.npy`` with shape ``(3, n)``: Julian day, index of the
+  sign entered (0 = Aries) and direction of motion (``+1`` / ``-1``).
+
+Rows are sorted by Julian day and stored contiguously, so arrays are opened
+memory-mapped and searched with :func:`numpy.searchsorted` without being
+copied; forked or separate worker processes share the same pages.
+
+Build a calendar from the ``backend`` directory with::
+
+    python build_event_calendar.py --start 1900 --end 2100 --out data/event_calendar
+
+and point ``event_calendar.path`` in ``horary_constants.yaml`` at it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import swisseph as swe
+
+from horary_config import add_config_reload_listener, cfg
+try:
+    from ...models import Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Planet, Sign
+from .ephemeris import SWE_PLANET_IDS, planet_positions
+from .stations import MAX_STEP_DAYS, StationFinder, _brent_root
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_VERSION = 1
+
+SIGNS = list(Sign)
+
+# Sampling step (days) when scanning for ingresses. Small enough that no
+# planet can cross two sign boundaries between samples; station instants are
+# added to the grid so a boundary re-crossed around a station is not missed.
+INGRESS_STEP_DAYS = {
+    Planet.SUN: 1.0,
+    Planet.MOON: 0.25,
+    Planet.MERCURY: 0.5,
+    Planet.VENUS: 0.5,
+    Planet.MARS: 1.0,
+    Planet.JUPITER: 2.0,
+    Planet.SATURN: 2.0,
+}
+
+_PLANETS_BY_SWE_ID = {swe_id: planet for planet, swe_id in SWE_PLANET_IDS.items()}
+
+PlanetLike = Union[Planet, int]
+
+
+class CalendarEvent(NamedTuple):
+    """A station or ingress read from the calendar."""
+
+    jd: float
+    direction: int
+    sign: Optional[Sign] = None
+
+
+def _as_planet(planet: PlanetLike) -> Planet:
+    if isinstance(planet, Planet):
+        return planet
+    return _PLANETS_BY_SWE_ID[int(planet)]
+
+
+def _year_to_jd(year: int) -> float:
+    return swe.julday(int(year), 1, 1, 0.0)
+
+
+def _swe_longitude(planet_id: int, jd: float) -> float:
+    data, _ = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    return data[0]
+
+
+def _find_ingresses(
+    planet: Planet, start_jd: float, end_jd: float, stations: np.ndarray
+) -> np.ndarray:
+    planet_id = SWE_PLANET_IDS[planet]
+    step = INGRESS_STEP_DAYS[planet]
+    rows = []
+
+    # Scan a year at a time to keep the vectorised evaluation small
+    chunk = 366.0
+    t = start_jd
+    while t < end_jd:
+        stop = min(t + chunk, end_jd)
+        grid = np.arange(t, stop, step)
+        inside = stations[(stations > t) & (stations < stop)]
+        grid = np.union1d(np.append(grid, stop), inside)
+
+        longitudes = planet_positions(grid, [planet_id])[planet_id].longitude
+        signs = (longitudes // 30.0).astype(int) % 12
+        for i in np.nonzero(signs[1:] != signs[:-1])[0]:
+            before, after = int(signs[i]), int(signs[i + 1])
+            direction = 1 if (after - before) % 12 == 1 else -1
+            boundary = 30.0 * (after if direction > 0 else before)
+
+            def offset(jd, boundary=boundary):
+                return (_swe_longitude(planet_id, jd) - boundary + 180.0) % 360.0 - 180.0
+
+            a, b = float(grid[i]), float(grid[i + 1])
+            fa, fb = offset(a), offset(b)
+            if fa * fb > 0:
+                # Interpolated samples straddled the boundary but the exact
+                # positions do not; nudge the bracket outward by one step.
+                a, b = a - step, b + step
+                fa, fb = offset(a), offset(b)
+                if fa * fb > 0:
+                    continue
+            jd = _brent_root(offset, a, b, fa, fb, 1e-5)
+            if start_jd <= jd < end_jd:
+                rows.append((jd, after, direction))
+        t = stop
+
+    if not rows:
+        return np.zeros((3, 0))
+    rows.sort()
+    return np.ascontiguousarray(np.array(rows, dtype=float).T)
+
+
+def build_event_calendar(start_year: int, end_year: int, out_dir: Union[str, Path]) -> Path:
+    """Compute stations and ingresses for ``[start_year, end_year)`` and save them.
+
+    Parameters
+    ----------
+    start_year, end_year:
+        Calendar range; ``end_year`` is exclusive (ends on 1 January).
+    out_dir:
+        Directory to write; created if needed.
+
+    Returns
+    -------
+    Path
+        The output directory.
+    """
+
+    start_jd, end_jd = _year_to_jd(start_year), _year_to_jd(end_year)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    finder = StationFinder()
+
+    for planet, planet_id in SWE_PLANET_IDS.items():
+        if planet_id in MAX_STEP_DAYS:
+            found = np.array(
+                [jd for jd in finder._find_stations(planet_id, start_jd, end_jd) if jd < end_jd]
+            )
+            directions = np.array(
+                [1.0 if finder._speed(planet_id, jd + 0.01) > 0 else -1.0 for jd in found]
+            )
+            stations = np.ascontiguousarray(np.vstack([found, directions]).reshape(2, -1))
+        else:
+            stations = np.zeros((2, 0))
+        ingresses = _find_ingresses(planet, start_jd, end_jd, stations[0])
+
+        name = planet.name.lower()
+        np.save(out / f"{name}_stations.npy", stations)
+        np.save(out / f"{name}_ingresses.npy", ingresses)
+        logger.info(
+            f"{planet.value}: {stations.shape[1]} stations, {ingresses.shape[1]} ingresses"
+        )
+
+    meta = {
+        "version": CALENDAR_VERSION,
+        "start_year": int(start_year),
+        "end_year": int(end_year),
+        "start_jd": start_jd,
+        "end_jd": end_jd,
+    }
+    (out / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return out
+
+
+class EventCalendar:
+    """Read-only, memory-mapped view of a built event calendar."""
+
+    def __init__(self, path: Union[str, Path], mmap: bool = True) -> None:
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != CALENDAR_VERSION:
+            raise ValueError(f"Unsupported event calendar version: {meta.get('version')}")
+        self.start_jd = float(meta["start_jd"])
+        self.end_jd = float(meta["end_jd"])
+
+        mode = "r" if mmap else None
+        self._stations: Dict[Planet, np.ndarray] = {}
+        self._ingresses: Dict[Planet, np.ndarray] = {}
+        for planet in SWE_PLANET_IDS:
+            name = planet.name.lower()
+            self._stations[planet] = np.load(self.path / f"{name}_stations.npy", mmap_mode=mode)
+            self._ingresses[planet] = np.load(self.path / f"{name}_ingresses.npy", mmap_mode=mode)
+
+    def covers(self, jd: float) -> bool:
+        """Whether ``jd`` falls inside the calendar range."""
+
+        return self.start_jd <= jd < self.end_jd
+
+    @staticmethod
+    def _next(table: np.ndarray, jd: float) -> Optional[Tuple[float, ...]]:
+        index = int(np.searchsorted(table[0], jd, side="right"))
+        if index >= table.shape[1]:
+            return None
+        return tuple(float(v) for v in table[:, index])
+
+    def next_station(self, planet: PlanetLike, jd: float) -> Optional[CalendarEvent]:
+        """First station strictly after ``jd``, or ``None`` if none is recorded."""
+
+        row = self._next(self._stations[_as_planet(planet)], jd)
+        if row is None:
+            return None
+        return CalendarEvent(jd=row[0], direction=int(row[1]))
+
+    def next_ingress(self, planet: PlanetLike, jd: float) -> Optional[CalendarEvent]:
+        """First sign ingress strictly after ``jd``, or ``None`` if none is recorded."""
+
+        row = self._next(self._ingresses[_as_planet(planet)], jd)
+        if row is None:
+            return None
+        return CalendarEvent(jd=row[0], direction=int(row[2]), sign=SIGNS[int(row[1])])
+
+
+_calendar: Optional[EventCalendar] = None
+_calendar_loaded = False
+_calendar_lock = threading.Lock()
+
+
+def get_event_calendar() -> Optional[EventCalendar]:
+    """Return the configured calendar, loading it on first use.
+
+    ``None`` when ``event_calendar.path`` is unset or cannot be loaded; callers
+    then fall back to computing events directly.
+    """
+
+    global _calendar, _calendar_loaded
+    if not _calendar_loaded:
+        with _calendar_lock:
+            if not _calendar_loaded:
+                path = getattr(getattr(cfg(), "event_calendar", None), "path", None)
+                if path:
+                    path = Path(path)
+                    if not path.is_absolute():
+                        path = Path(__file__).resolve().parents[2] / path
+                    try:
+                        _calendar = EventCalendar(path)
+                        logger.info(f"Loaded event calendar from {path}")
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.warning(f"Event calendar unavailable at {path}: {e}")
+                _calendar_loaded = True
+    return _calendar
+
+
+def reset_event_calendar() -> None:
+    """Forget the loaded calendar so the next access reloads from config."""
+
+    global _calendar, _calendar_loaded
+    with _calendar_lock:
+        _calendar = None
+        _calendar_loaded = False
+
+
+add_config_reload_listener(reset_event_calendar, section="event_calendar")
@@ -18,12 +18,20 @@ import datetime
 from typing import Tuple, Optional, Dict, Any
 import swisseph as swe
 
+from .event_calendar import get_event_calendar
+from .stations import get_station_finder
+
 
 def calculate_next_station_time(planet_id: int, jd_start: float, 
                                max_days: int = 365) -> Optional[float]:
     """
-    Calculate when a planet will next station (turn retrograde/direct)
-    using Swiss Ephemeris.
+    Calculate when a planet will next station (turn retrograde/direct).
+    
+    Answered from the precomputed event calendar when one is configured and
+    covers ``jd_start``; otherwise delegates to the shared
+    :class:`~.stations.StationFinder`, which brackets speed sign changes
+    adaptively, refines them with Brent's method and caches results per
+    planet and time bucket.
     
     Args:
         planet_id: Swiss Ephemeris planet ID
@@ -35,69 +43,17 @@ def calculate_next_station_time(planet_id: int, jd_start: float,
     
     Classical source: Lilly III Chap. XXI - "Of the frustration of Planets"
     """
-    step_size = 0.1  # Check every 0.1 days
-    
     try:
-        # Get initial speed
-        initial_data, _ = swe.calc_ut(jd_start, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        initial_speed = initial_data[3]
-        
-        # Search forward in time
-        current_jd = jd_start + step_size
-        max_jd = jd_start + max_days
-        
-        previous_speed = initial_speed
-        
-        while current_jd < max_jd:
-            try:
-                planet_data, _ = swe.calc_ut(current_jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                current_speed = planet_data[3]
-                
-                # Check for sign change in speed (station)
-                if (previous_speed > 0 and current_speed < 0) or (previous_speed < 0 and current_speed > 0):
-                    # Found a station, refine the timing
-                    return _refine_station_time(planet_id, current_jd - step_size, current_jd)
-                
-                previous_speed = current_speed
-                current_jd += step_size
-                
-            except Exception:
-                # Skip errors and continue
-                current_jd += step_size
-                continue
-    
+        calendar = get_event_calendar()
+        if calendar is not None and calendar.covers(jd_start):
+            event = calendar.next_station(planet_id, jd_start)
+            if event is not None:
+                return event.jd if event.jd - jd_start < max_days else None
+            if planet_id in (swe.SUN, swe.MOON) or calendar.covers(jd_start + max_days):
+                return None
+        return get_station_finder().next_station(planet_id, jd_start, max_days)
     except Exception:
-        pass
-    
-    return None
-
-
-def _refine_station_time(planet_id: int, jd_before: float, jd_after: float) -> float:
-    """Refine station time to higher precision using binary search"""
-    tolerance = 0.001  # About 1.5 minutes
-    
-    while (jd_after - jd_before) > tolerance:
-        jd_mid = (jd_before + jd_after) / 2
-        
-        try:
-            data_before, _ = swe.calc_ut(jd_before, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            data_mid, _ = swe.calc_ut(jd_mid, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            
-            speed_before = data_before[3]
-            speed_mid = data_mid[3]
-            
-            # Check which side of midpoint the station is on
-            if (speed_before > 0 and speed_mid > 0) or (speed_before < 0 and speed_mid < 0):
-                # Station is after midpoint
-                jd_before = jd_mid
-            else:
-                # Station is before midpoint
-                jd_after = jd_mid
-                
-        except Exception:
-            break
-    
-    return (jd_before + jd_after) / 2
+        return None
 
 
 def calculate_future_longitude(longitude: float, speed: float, days: float, 
@@ -0,0 +1,156 @@
+"""Bounded cache of calculated horary charts.
+
+A chart depends only on the moment, the place and the house system, while
+the judgment flags (``ignoreRadicality``, ``ignoreVoidMoon`` ...) only affect
+the judgment pass. Re-submitting a chart with different toggles therefore
+reuses the cached :class:`HoraryChart` and skips the ephemeris work.
+
+Keys round the Julian day to ``chart_cache.jd_resolution_seconds`` and the
+coordinates to ``chart_cache.coordinate_precision`` decimal places. Entries
+are evicted least-recently-used beyond ``max_entries`` and expire after
+``ttl_seconds``. Cached charts are shared between requests and must be
+treated as read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from horary_config import add_config_reload_listener, cfg
+try:
+    from ..models import HoraryChart
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import HoraryChart
+
+
+SECONDS_PER_DAY = 86400.0
+
+
+class ChartCache:
+    """Thread-safe LRU cache with time-to-live for :class:`HoraryChart` objects."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600.0,
+        jd_resolution_seconds: float = 1.0,
+        coordinate_precision: int = 6,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = int(max_entries)
+        self.ttl_seconds = float(ttl_seconds)
+        self.jd_resolution_seconds = float(jd_resolution_seconds)
+        self.coordinate_precision = int(coordinate_precision)
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, HoraryChart]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_config(cls) -> "ChartCache":
+        """Build a cache from the ``chart_cache`` configuration section."""
+
+        config = cfg().chart_cache
+        return cls(
+            max_entries=config.max_entries,
+            ttl_seconds=config.ttl_seconds,
+            jd_resolution_seconds=config.jd_resolution_seconds,
+            coordinate_precision=config.coordinate_precision,
+        )
+
+    def make_key(self, jd_ut: float, lat: float, lon: float, house_system: bytes) -> Tuple:
+        """Cache key for a chart cast at ``jd_ut`` and ``(lat, lon)``."""
+
+        resolution_days = self.jd_resolution_seconds / SECONDS_PER_DAY
+        return (
+            round(jd_ut / resolution_days),
+            round(lat, self.coordinate_precision),
+            round(lon, self.coordinate_precision),
+            house_system,
+        )
+
+    def get(self, key: Hashable) -> Optional[HoraryChart]:
+        """Return the cached chart for ``key`` or ``None`` (counted as a miss)."""
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, chart: HoraryChart) -> None:
+        """Store ``chart`` under ``key``, evicting the oldest entries if full."""
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, chart)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached chart (counters are kept)."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for ``/api/metrics``."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": bool(getattr(getattr(cfg(), "chart_cache", None), "enabled", False)),
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+_cache: Optional[ChartCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_chart_cache() -> ChartCache:
+    """Return the process-wide chart cache."""
+
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ChartCache.from_config()
+    return _cache
+
+
+def reset_chart_cache() -> None:
+    """Drop the process-wide cache so it is rebuilt from current config.
+
+    Cached charts embed configured orbs and dignities, so this runs after
+    every configuration reload.
+    """
+
+    global _cache
+    with _cache_lock:
+        _cache = None
+
+
+add_config_reload_listener(reset_chart_cache)
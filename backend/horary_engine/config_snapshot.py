@@ -0,0 +1,240 @@
+"""Typed, read-only view of the configuration for hot loops.
+
+The nested ``SimpleNamespace`` returned by ``cfg()`` is convenient but every
+access is a chain of attribute lookups, and the aspect and perfection loops
+repeat the same ones (plus the moiety arithmetic) for every planet pair of
+every chart. :func:`config_snapshot` copies the values those loops use into
+frozen, slotted dataclasses and precomputes the orb tables once:
+
+* ``OrbSettings.max_orbs[(planet1, planet2, aspect)]`` is the orb within
+  which :func:`~horary_engine.aspects.calculate_enhanced_aspects` accepts an
+  aspect: the moiety-based orb, or the aspect orb plus the luminary bonuses
+  when no moieties are configured;
+* ``OrbSettings.orb_matrix`` holds the same values as a read-only array
+  indexed ``[planet, planet, aspect]`` in ``Planet`` and ``Aspect`` order
+  (the seven planets come first, then the chart points), for the vectorised
+  aspect kernel;
+* ``OrbSettings.timed_orb_limits[(name1, name2)]`` (keyed by ``Planet.value``)
+  is the sum of the two full moieties used by the timed perfection check.
+
+A snapshot carries the ``HoraryConfig.version`` it was built from and is
+rebuilt after the configuration is reloaded. Functions that accept one as
+``config`` use the current snapshot when none is given.
+
+Runtime switches that are flipped on the live namespace (``timing.perfection_mode``,
+``moon.void_gating``, ``chart_cache.enabled`` ...) are deliberately not part
+of the snapshot and are still read from ``cfg()``.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+import numpy as np
+
+from horary_config import get_config
+try:
+    from ..models import Aspect, Planet
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Aspect, Planet
+
+
+# Traditional full orbs used where ``orbs.moieties`` has no entry
+TRADITIONAL_MOIETIES: Mapping[Planet, float] = MappingProxyType({
+    Planet.SUN: 17.0,
+    Planet.MOON: 12.5,
+    Planet.MERCURY: 7.0,
+    Planet.VENUS: 8.0,
+    Planet.MARS: 7.5,
+    Planet.JUPITER: 9.0,
+    Planet.SATURN: 9.5,
+})
+DEFAULT_MOIETY = 8.0
+
+# Share of the combined moieties allowed per aspect (others get 0.8)
+MOIETY_ASPECT_FACTORS: Mapping[Aspect, float] = MappingProxyType({
+    Aspect.CONJUNCTION: 1.0,
+    Aspect.OPPOSITION: 1.0,
+    Aspect.TRINE: 0.85,
+    Aspect.SQUARE: 0.85,
+    Aspect.SEXTILE: 0.7,
+})
+
+DEFAULT_ROLE_IMPORTANCE: Mapping[str, float] = MappingProxyType({
+    "L1": 1.0,
+    "LQ": 1.0,
+    "Moon": 0.7,
+    "L10": 1.0,
+    "L3": 1.0,
+})
+
+
+def moiety_orb(full_orb1: float, full_orb2: float, aspect: Aspect) -> float:
+    """Orb allowed for ``aspect`` between bodies with the given full orbs."""
+
+    combined_moiety = full_orb1 / 2.0 + full_orb2 / 2.0
+    return combined_moiety * MOIETY_ASPECT_FACTORS.get(aspect, 0.8)
+
+
+@dataclass(frozen=True, slots=True)
+class OrbSettings:
+    """Orb values from the ``orbs`` section and the tables derived from them."""
+
+    aspect_orbs: Mapping[Aspect, float]
+    sun_orb_bonus: float
+    moon_orb_bonus: float
+    max_orbs: Mapping[Tuple[Planet, Planet, Aspect], float]
+    timed_orb_limits: Mapping[Tuple[str, str], float]
+    orb_matrix: np.ndarray = field(repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class TimingSettings:
+    """Look-ahead limits from the ``timing`` section."""
+
+    max_future_days: float
+    max_window_days: float
+
+
+@dataclass(frozen=True, slots=True)
+class AggregatorSettings:
+    """The ``aggregator`` section."""
+
+    use_dsl: bool
+    role_importance: Mapping[str, float]
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Immutable configuration values used on the judgment hot path.
+
+    Parameters
+    ----------
+    version:
+        ``HoraryConfig.version`` of the configuration it was built from.
+    orbs, timing, aggregator:
+        Typed copies of the corresponding sections.
+    source:
+        The configuration object it was built from.
+    """
+
+    version: int
+    orbs: OrbSettings
+    timing: TimingSettings
+    aggregator: AggregatorSettings
+    source: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def build(cls, source: Any, version: int = 0) -> "ConfigSnapshot":
+        """Snapshot ``source``, a configuration namespace (or an object with
+        ``get(path, default)`` such as :class:`~horary_config.HoraryConfig`)."""
+
+        return cls(
+            version=version,
+            orbs=_orb_settings(source),
+            timing=TimingSettings(
+                max_future_days=_lookup(source, "timing.max_future_days", 365),
+                max_window_days=_lookup(source, "timing.max_window_days", 365),
+            ),
+            aggregator=AggregatorSettings(
+                use_dsl=_lookup(source, "aggregator.use_dsl", False),
+                role_importance=MappingProxyType({
+                    role: _lookup(source, f"aggregator.role_importance.{role}", default)
+                    for role, default in DEFAULT_ROLE_IMPORTANCE.items()
+                }),
+            ),
+            source=source,
+        )
+
+
+def _lookup(config: Any, path: str, default: Any = None) -> Any:
+    """``config.<path>``, or ``default`` where a part is missing or ``None``."""
+
+    if hasattr(config, "get"):
+        return config.get(path, default)
+    current = config
+    for part in path.split("."):
+        current = getattr(current, part, None)
+        if current is None:
+            return default
+    return current
+
+
+def _orb_settings(source: Any) -> OrbSettings:
+    aspect_orbs = {aspect: _lookup(source, f"orbs.{aspect.config_key}", 8.0) for aspect in Aspect}
+    sun_orb_bonus = _lookup(source, "orbs.sun_orb_bonus", 0.0)
+    moon_orb_bonus = _lookup(source, "orbs.moon_orb_bonus", 0.0)
+
+    use_moieties = _lookup(source, "orbs.moieties") is not None
+    configured = {planet: _lookup(source, f"orbs.moieties.{planet.value}") for planet in Planet}
+
+    max_orbs = {}
+    timed_orb_limits = {}
+    for planet1 in Planet:
+        for planet2 in Planet:
+            for aspect in Aspect:
+                max_orb = 0.0
+                if use_moieties:
+                    max_orb = moiety_orb(configured[planet1] or 0.0, configured[planet2] or 0.0, aspect)
+                # Without moieties: configured aspect orb plus the luminary bonuses
+                if max_orb == 0:
+                    max_orb = aspect_orbs[aspect]
+                    if Planet.SUN in (planet1, planet2):
+                        max_orb += sun_orb_bonus
+                    if Planet.MOON in (planet1, planet2):
+                        max_orb += moon_orb_bonus
+                max_orbs[planet1, planet2, aspect] = max_orb
+            timed_orb_limits[planet1.value, planet2.value] = (
+                _full_moiety(configured, planet1) + _full_moiety(configured, planet2)
+            )
+
+    orb_matrix = np.array(
+        [[[max_orbs[planet1, planet2, aspect] for aspect in Aspect] for planet2 in Planet] for planet1 in Planet],
+        dtype=float,
+    )
+    orb_matrix.flags.writeable = False
+
+    return OrbSettings(
+        aspect_orbs=MappingProxyType(aspect_orbs),
+        sun_orb_bonus=sun_orb_bonus,
+        moon_orb_bonus=moon_orb_bonus,
+        max_orbs=MappingProxyType(max_orbs),
+        timed_orb_limits=MappingProxyType(timed_orb_limits),
+        orb_matrix=orb_matrix,
+    )
+
+
+def _full_moiety(configured: Mapping[Planet, Optional[float]], planet: Planet) -> float:
+    value = configured[planet]
+    if value is None:
+        return TRADITIONAL_MOIETIES.get(planet, DEFAULT_MOIETY)
+    return value
+
+
+_snapshot: Optional[ConfigSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def config_snapshot(source: Any = None) -> ConfigSnapshot:
+    """Snapshot of ``source`` (default: the live configuration).
+
+    The last snapshot is kept and reused while it was built from the same
+    configuration object; a reload installs a new one, so the next call
+    builds a fresh snapshot.
+    """
+
+    global _snapshot
+    holder = get_config()
+    if source is None:
+        source = holder.config
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.source is source:
+        return snapshot
+    with _snapshot_lock:
+        snapshot = _snapshot
+        if snapshot is None or snapshot.source is not source:
+            snapshot = _snapshot = ConfigSnapshot.build(source, holder.version)
+    return snapshot
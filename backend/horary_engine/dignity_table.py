@@ -0,0 +1,232 @@
+"""Precomputed essential dignity lookup.
+
+Essential dignity depends only on the planet, its sign, the whole degree
+within the sign and whether the chart is diurnal. :class:`DignityTable`
+evaluates rulership, exaltation, triplicity, term, face, detriment and fall
+once for every combination (7 planets x 12 signs x 30 degrees x day/night)
+and stores the result as a bit mask in a flat ``bytes`` object, so a lookup
+is a single index operation instead of several dictionary scans of the
+configuration.
+
+Term and face boundaries come from ``reception.terms`` and
+``reception.faces`` and must fall on whole degrees. Two triplicity schemes
+are in use: the chart calculator's (water: Venus by day, Mars by night) and
+the reception calculator's (water: Mars by day, Venus by night); each gets
+its own table from :func:`get_dignity_table`.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from horary_config import add_config_reload_listener, cfg
+
+try:
+    from ..models import Planet, Sign
+except ImportError:  # pragma: no cover - fallback when executed as script
+    from models import Planet, Sign
+
+
+DOMICILE = 1
+EXALTATION = 2
+TRIPLICITY = 4
+TERM = 8
+FACE = 16
+DETRIMENT = 32
+FALL = 64
+
+# Positive dignities in order of strength, as named in reception results
+DIGNITY_NAMES: Tuple[Tuple[int, str], ...] = (
+    (DOMICILE, "domicile"),
+    (EXALTATION, "exaltation"),
+    (TRIPLICITY, "triplicity"),
+    (TERM, "term"),
+    (FACE, "face"),
+)
+
+PLANETS: Tuple[Planet, ...] = (
+    Planet.SUN,
+    Planet.MOON,
+    Planet.MERCURY,
+    Planet.VENUS,
+    Planet.MARS,
+    Planet.JUPITER,
+    Planet.SATURN,
+)
+SIGNS: Tuple[Sign, ...] = tuple(Sign)
+
+_PLANET_INDEX = {planet: i for i, planet in enumerate(PLANETS)}
+_SIGN_INDEX = {sign: i for i, sign in enumerate(SIGNS)}
+
+EXALTATIONS = {
+    Planet.SUN: Sign.ARIES,
+    Planet.MOON: Sign.TAURUS,
+    Planet.MERCURY: Sign.VIRGO,
+    Planet.VENUS: Sign.PISCES,
+    Planet.MARS: Sign.CAPRICORN,
+    Planet.JUPITER: Sign.CANCER,
+    Planet.SATURN: Sign.LIBRA,
+}
+
+FALLS = {
+    Planet.SUN: Sign.LIBRA,
+    Planet.MOON: Sign.SCORPIO,
+    Planet.MERCURY: Sign.PISCES,
+    Planet.VENUS: Sign.VIRGO,
+    Planet.MARS: Sign.CANCER,
+    Planet.JUPITER: Sign.CAPRICORN,
+    Planet.SATURN: Sign.ARIES,
+}
+
+DETRIMENTS = {
+    Planet.SUN: (Sign.AQUARIUS,),
+    Planet.MOON: (Sign.CAPRICORN,),
+    Planet.MERCURY: (Sign.PISCES, Sign.SAGITTARIUS),
+    Planet.VENUS: (Sign.ARIES, Sign.SCORPIO),
+    Planet.MARS: (Sign.LIBRA, Sign.TAURUS),
+    Planet.JUPITER: (Sign.GEMINI, Sign.VIRGO),
+    Planet.SATURN: (Sign.CANCER, Sign.LEO),
+}
+
+_FIRE = (Sign.ARIES, Sign.LEO, Sign.SAGITTARIUS)
+_EARTH = (Sign.TAURUS, Sign.VIRGO, Sign.CAPRICORN)
+_AIR = (Sign.GEMINI, Sign.LIBRA, Sign.AQUARIUS)
+_WATER = (Sign.CANCER, Sign.SCORPIO, Sign.PISCES)
+
+
+def _triplicities(*elements: Tuple[Tuple[Sign, ...], Planet, Planet]) -> Dict[Sign, Dict[str, Planet]]:
+    return {sign: {"day": day, "night": night} for signs, day, night in elements for sign in signs}
+
+
+# Triplicity rulers used for chart dignity scores
+CALCULATOR_TRIPLICITY_RULERS = _triplicities(
+    (_FIRE, Planet.SUN, Planet.JUPITER),
+    (_EARTH, Planet.VENUS, Planet.MOON),
+    (_AIR, Planet.SATURN, Planet.MERCURY),
+    (_WATER, Planet.VENUS, Planet.MARS),
+)
+
+# Triplicity rulers used for reception
+RECEPTION_TRIPLICITY_RULERS = _triplicities(
+    (_FIRE, Planet.SUN, Planet.JUPITER),
+    (_EARTH, Planet.VENUS, Planet.MOON),
+    (_AIR, Planet.SATURN, Planet.MERCURY),
+    (_WATER, Planet.MARS, Planet.VENUS),
+)
+
+TRIPLICITY_SCHEMES = {
+    "calculator": CALCULATOR_TRIPLICITY_RULERS,
+    "reception": RECEPTION_TRIPLICITY_RULERS,
+}
+
+_NAMES_BY_FLAGS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(name for bit, name in DIGNITY_NAMES if flags & bit) for flags in range(128)
+)
+
+
+def _degree_rulers(table: Mapping, sign: Sign, kind: str) -> List[Optional[Planet]]:
+    """Ruler of each whole degree of ``sign`` from a terms/faces table."""
+
+    rulers: List[Optional[Planet]] = [None] * 30
+    for entry in getattr(table, sign.sign_name, None) or ():
+        if entry.start != int(entry.start) or entry.end != int(entry.end):
+            raise ValueError(f"{kind} boundaries for {sign.sign_name} must be whole degrees")
+        ruler = Planet[entry.ruler.upper()]
+        for degree in range(max(0, int(entry.start)), min(30, int(entry.end))):
+            if rulers[degree] is None:
+                rulers[degree] = ruler
+    return rulers
+
+
+class DignityTable:
+    """Essential dignity bit masks by planet, sign, degree and sect.
+
+    Parameters
+    ----------
+    triplicity_rulers:
+        ``{sign: {"day": planet, "night": planet}}``.
+    terms, faces:
+        The ``reception.terms`` / ``reception.faces`` configuration sections;
+        default to the current configuration.
+    """
+
+    __slots__ = ("_flags",)
+
+    def __init__(self, triplicity_rulers: Mapping[Sign, Mapping[str, Planet]],
+                 terms: Optional[Mapping] = None, faces: Optional[Mapping] = None) -> None:
+        if terms is None or faces is None:
+            reception = getattr(cfg(), "reception", None)
+            terms = terms if terms is not None else getattr(reception, "terms", None)
+            faces = faces if faces is not None else getattr(reception, "faces", None)
+
+        flags = bytearray(len(PLANETS) * len(SIGNS) * 30 * 2)
+        for s, sign in enumerate(SIGNS):
+            term_rulers = _degree_rulers(terms, sign, "Term")
+            face_rulers = _degree_rulers(faces, sign, "Face")
+            sect_rulers = triplicity_rulers.get(sign, {})
+            for p, planet in enumerate(PLANETS):
+                base = 0
+                if sign.ruler == planet:
+                    base |= DOMICILE
+                if EXALTATIONS.get(planet) == sign:
+                    base |= EXALTATION
+                if sign in DETRIMENTS.get(planet, ()):
+                    base |= DETRIMENT
+                if FALLS.get(planet) == sign:
+                    base |= FALL
+                for degree in range(30):
+                    value = base
+                    if term_rulers[degree] == planet:
+                        value |= TERM
+                    if face_rulers[degree] == planet:
+                        value |= FACE
+                    index = ((p * 12 + s) * 30 + degree) * 2
+                    flags[index] = value | (TRIPLICITY if sect_rulers.get("night") == planet else 0)
+                    flags[index + 1] = value | (TRIPLICITY if sect_rulers.get("day") == planet else 0)
+        self._flags = bytes(flags)
+
+    def flags(self, planet: Planet, sign: Sign, sign_degree: float, is_day: bool) -> int:
+        """Dignity bits of ``planet`` at ``sign_degree`` (0-30) of ``sign``.
+
+        Planets outside the seven traditional ones have no dignities.
+        """
+
+        p = _PLANET_INDEX.get(planet)
+        if p is None:
+            return 0
+        degree = int(sign_degree)
+        if degree > 29:
+            degree = 29
+        return self._flags[((p * 12 + _SIGN_INDEX[sign]) * 30 + degree) * 2 + bool(is_day)]
+
+    def dignities(self, planet: Planet, sign: Sign, sign_degree: float, is_day: bool) -> List[str]:
+        """Names of the positive dignities held, strongest first."""
+
+        return list(_NAMES_BY_FLAGS[self.flags(planet, sign, sign_degree, is_day)])
+
+
+_tables: Dict[str, DignityTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_dignity_table(scheme: str = "calculator") -> DignityTable:
+    """Shared table for a triplicity scheme (``calculator`` or ``reception``)."""
+
+    table = _tables.get(scheme)
+    if table is None:
+        with _tables_lock:
+            table = _tables.get(scheme)
+            if table is None:
+                table = _tables[scheme] = DignityTable(TRIPLICITY_SCHEMES[scheme])
+    return table
+
+
+def reset_dignity_tables() -> None:
+    """Drop the shared tables so they are rebuilt from the current configuration."""
+
+    with _tables_lock:
+        _tables.clear()
+
+
+add_config_reload_listener(reset_dignity_tables, section="reception")
@@ -10,15 +10,16 @@ Refactored with comprehensive configuration system and enhanced lunar calculatio
 """
 
 import os
+import copy
 import datetime
 import logging
 import re
 import math
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Any, Tuple
 from types import SimpleNamespace
 
 # Configuration system
-from horary_config import get_config, cfg, HoraryError
+from horary_config import get_config, cfg, HoraryError, reload_config_if_changed
 
 # Timezone handling
 import swisseph as swe
@@ -37,6 +38,21 @@ from .calculation.helpers import (
     normalize_longitude,
     degrees_to_dms,
 )
+from .analysis_context import get_analysis_context
+from .calculation.refinement import is_refined, refine_perfection
+from .chart_cache import get_chart_cache
+from .dignity_table import (
+    DETRIMENT,
+    DOMICILE,
+    EXALTATION,
+    FACE,
+    FALL,
+    TERM,
+    TRIPLICITY,
+    get_dignity_table,
+)
+from .result_fields import parse_fields, wants
+from .tracing import collect_trace, span, tracing_enabled
 from .services.geolocation import (
     TimezoneManager,
     LocationError,
@@ -311,15 +327,23 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
             Aspect.TRINE,
             Aspect.OPPOSITION,
         ]
+        # Refined mode times the main and the intervening aspects with the
+        # judgment engine's ephemeris-refined solver, within the timing window
+        refined = is_refined()
+        if refined:
+            calc_time = EnhancedTraditionalHoraryJudgmentEngine._calculate_future_aspect_time
+            max_days = config_snapshot().timing.max_window_days
+        else:
+            calc_time, max_days = _calc_future_aspect_time, 0.0
         times: List[float] = []
         for a in aspect_types:
-            t = _calc_future_aspect_time(pos1, pos2, a)
+            t = calc_time(pos1, pos2, a, chart.julian_day, max_days)
             if t and t > 0:
                 times.append(t)
         if times:
             days_ahead = min(times)
             result = check_future_prohibitions(
-                chart, sig1, sig2, days_ahead, _calc_future_aspect_time
+                chart, sig1, sig2, days_ahead, calc_time if refined else None
             )
             if result.get("type") == "translation":
                 primitives.append(
@@ -353,7 +377,7 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
         # --------------------------------------------------------------
         # Receptions
         # --------------------------------------------------------------
-        reception_calc = TraditionalReceptionCalculator()
+        reception_calc = get_reception_calculator()
         reception_result = reception_calc.calculate_comprehensive_reception(
             chart, sig1, sig2
         )
@@ -394,6 +418,7 @@ try:
         SolarCondition,
         SolarAnalysis,
         AspectInfo,
+        Deferred,
         LunarAspect,
         Significator,
     )
@@ -404,6 +429,7 @@ except ImportError:  # pragma: no cover - fallback when executed as script
         SolarCondition,
         SolarAnalysis,
         AspectInfo,
+        Deferred,
         LunarAspect,
         Significator,
     )
@@ -419,12 +445,13 @@ try:
 except ImportError:  # pragma: no cover - fallback when package context is missing
     from taxonomy import Category, resolve_category, resolve as resolve_significators, get_defaults
     from category_rules import get_category_rules
-from .reception import TraditionalReceptionCalculator
+from .reception import TraditionalReceptionCalculator, get_reception_calculator
 from .aspects import (
-    calculate_enhanced_aspects,
+    calculate_enhanced_aspects_batch,
     calculate_moon_last_aspect,
     calculate_moon_next_aspect,
 )
+from .config_snapshot import DEFAULT_MOIETY, TRADITIONAL_MOIETIES, config_snapshot
 from .radicality import check_enhanced_radicality
 from .serialization import (
     serialize_chart_for_frontend,
@@ -437,6 +464,9 @@ from .perfection import check_future_prohibitions
 class EnhancedTraditionalAstrologicalCalculator:
     """Enhanced Traditional astrological calculations with configuration system"""
     
+    # Regiomontanus - traditional for horary
+    HOUSE_SYSTEM = b'R'
+    
     def __init__(self, timezone_manager=None):
         # Set Swiss Ephemeris path
         swe.set_ephe_path('')
@@ -494,129 +524,222 @@ class EnhancedTraditionalAstrologicalCalculator:
             return cfg().timing.default_moon_speed_fallback
     
     def calculate_chart(self, dt_local: datetime.datetime, dt_utc: datetime.datetime, 
-                       timezone_info: str, lat: float, lon: float, location_name: str) -> HoraryChart:
-        """Enhanced Calculate horary chart with configuration system"""
-        
-        # Convert UTC datetime to Julian Day for Swiss Ephemeris
-        jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
-                          dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
-        
-        logger.info(f"Calculating chart for:")
-        logger.info(f"  Local time: {dt_local} ({timezone_info})")
-        logger.info(f"  UTC time: {dt_utc}")
-        logger.info(f"  Julian Day (UT): {jd_ut}")
-        # Safe logging with Unicode handling for location names
-        try:
-            logger.info(f"  Location: {location_name} ({lat:.4f}, {lon:.4f})")
-        except UnicodeEncodeError:
-            safe_location = location_name.encode('ascii', 'replace').decode('ascii')
-            logger.info(f"  Location: {safe_location} ({lat:.4f}, {lon:.4f})")
+                       timezone_info: str, lat: float, lon: float, location_name: str,
+                       use_cache: Optional[bool] = None) -> HoraryChart:
+        """Enhanced Calculate horary chart with configuration system
+        
+        Charts are served from the shared chart cache when enabled
+        (``chart_cache.enabled``, overridable per call with ``use_cache``).
+        A cached chart is returned as a shallow copy carrying this request's
+        local time, timezone and location name; the copy shares the cached
+        chart's lazily computed fields.
+        """
+        return self.calculate_charts(
+            [(dt_local, dt_utc, timezone_info, lat, lon, location_name)], use_cache)[0]
+
+    def calculate_charts(self, moments: List[Tuple[datetime.datetime, datetime.datetime, str, float, float, str]],
+                         use_cache: Optional[bool] = None) -> List[HoraryChart]:
+        """Cast several charts in one pass
+        
+        ``moments`` holds :meth:`calculate_chart` arguments as
+        ``(dt_local, dt_utc, timezone_info, lat, lon, location_name)``
+        tuples. Cached charts are served as :meth:`calculate_chart` serves
+        them; the rest are cast together, with the planets evaluated once per
+        distinct instant (charts for one moment at several places share
+        them) and the aspects of every chart found in a single
+        :func:`calculate_enhanced_aspects_batch` pass. Returns one chart per
+        moment, in order.
+        """
         
-        # Calculate traditional planets only
-        planets = {}
+        if use_cache is None:
+            use_cache = getattr(getattr(cfg(), "chart_cache", None), "enabled", False)
+        cache = get_chart_cache() if use_cache else None
+        
+        charts: List[Optional[HoraryChart]] = [None] * len(moments)
+        pending = []
+        for index, (dt_local, dt_utc, timezone_info, lat, lon, location_name) in enumerate(moments):
+            # Convert UTC datetime to Julian Day for Swiss Ephemeris
+            jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
+                              dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
+            
+            logger.info(f"Calculating chart for:")
+            logger.info(f"  Local time: {dt_local} ({timezone_info})")
+            logger.info(f"  UTC time: {dt_utc}")
+            logger.info(f"  Julian Day (UT): {jd_ut}")
+            # Safe logging with Unicode handling for location names
+            try:
+                logger.info(f"  Location: {location_name} ({lat:.4f}, {lon:.4f})")
+            except UnicodeEncodeError:
+                safe_location = location_name.encode('ascii', 'replace').decode('ascii')
+                logger.info(f"  Location: {safe_location} ({lat:.4f}, {lon:.4f})")
+            
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.make_key(jd_ut, lat, lon, self.HOUSE_SYSTEM)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.info("  Using cached chart")
+                    # A shallow copy rather than dataclasses.replace, which would
+                    # read (and so compute) every lazy field
+                    chart = copy.copy(cached)
+                    chart.date_time = dt_local
+                    chart.date_time_utc = dt_utc
+                    chart.timezone_info = timezone_info
+                    chart.location = (lat, lon)
+                    chart.location_name = location_name
+                    charts[index] = chart
+                    continue
+            pending.append((index, jd_ut, cache_key))
+        
+        if pending:
+            built = self._build_charts([moments[index] + (jd_ut,) for index, jd_ut, _ in pending])
+            for (index, _, cache_key), chart in zip(pending, built):
+                if cache is not None:
+                    cache.put(cache_key, chart)
+                charts[index] = chart
+        return charts
+    
+    def _planet_ephemeris(self, jd_ut: float) -> Dict[Planet, Optional[Tuple[float, float, float]]]:
+        """Swiss Ephemeris ``(longitude, latitude, speed)`` of each traditional
+        planet at ``jd_ut`` (``None`` where the calculation failed)"""
+        
+        ephemeris: Dict[Planet, Optional[Tuple[float, float, float]]] = {}
         for planet_enum, planet_id in self.planets_swe.items():
             try:
                 planet_data, ret_flag = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                
-                longitude = planet_data[0]
-                latitude = planet_data[1]
-                speed = planet_data[3]  # degrees/day
-                retrograde = speed < 0
-                
-                sign = self._get_sign(longitude)
-                
-                planets[planet_enum] = PlanetPosition(
-                    planet=planet_enum,
-                    longitude=longitude,
-                    latitude=latitude,
-                    house=0,  # Will be calculated after houses
-                    sign=sign,
-                    dignity_score=0,  # Will be calculated after solar analysis
-                    retrograde=retrograde,
-                    speed=speed
-                )
-                
+                ephemeris[planet_enum] = (planet_data[0], planet_data[1], planet_data[3])
             except Exception as e:
                 logger.error(f"Error calculating {planet_enum.value}: {e}")
-                # Create fallback
-                planets[planet_enum] = PlanetPosition(
-                    planet=planet_enum,
-                    longitude=0.0,
-                    latitude=0.0,
-                    house=1,
-                    sign=Sign.ARIES,
-                    dignity_score=0,
-                    speed=0.0
-                )
-        
-        # Calculate houses (Regiomontanus - traditional for horary)
-        try:
-            houses_data, ascmc = swe.houses(jd_ut, lat, lon, b'R')  # Regiomontanus
-            houses = list(houses_data)
-            ascendant = ascmc[0]
-            midheaven = ascmc[1]
-        except Exception as e:
-            logger.error(f"Error calculating houses: {e}")
-            ascendant = 0.0
-            midheaven = 90.0
-            houses = [i * 30.0 for i in range(12)]
-        
-        # Calculate house positions and house rulers
-        house_rulers = {}
-        for i, cusp in enumerate(houses, 1):
-            sign = self._get_sign(cusp)
-            house_rulers[i] = sign.ruler
-        
-        # Update planet house positions
-        for planet_pos in planets.values():
-            house = self._calculate_house_position(planet_pos.longitude, houses)
-            planet_pos.house = house
-        
-        # Enhanced solar condition analysis
-        sun_pos = planets[Planet.SUN]
-        solar_analyses = {}
-        
-        for planet_enum, planet_pos in planets.items():
-            solar_analysis = self._analyze_enhanced_solar_condition(
-                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut)
-            solar_analyses[planet_enum] = solar_analysis
-            
-            # Calculate comprehensive traditional dignity with all factors
-            dignity_info = self._calculate_comprehensive_traditional_dignity(
-                planet_pos.planet, planet_pos, houses, planets[Planet.SUN], solar_analysis)
-            planet_pos.dignity_score = dignity_info["score"]
-            planet_pos.dignities = dignity_info["dignities"]
-        
-        # Calculate enhanced traditional aspects
-        aspects = calculate_enhanced_aspects(planets, jd_ut)
-
-        # NEW: Calculate last and next lunar aspects
-        moon_last_aspect = calculate_moon_last_aspect(
-            planets, jd_ut, self.get_real_moon_speed
-        )
-        moon_next_aspect = calculate_moon_next_aspect(
-            planets, jd_ut, self.get_real_moon_speed
-        )
-        
-        chart = HoraryChart(
-            date_time=dt_local,
-            date_time_utc=dt_utc,
-            timezone_info=timezone_info,
-            location=(lat, lon),
-            location_name=location_name,
-            planets=planets,
-            aspects=aspects,
-            houses=houses,
-            house_rulers=house_rulers,
-            ascendant=ascendant,
-            midheaven=midheaven,
-            solar_analyses=solar_analyses,
-            julian_day=jd_ut,
-            moon_last_aspect=moon_last_aspect,
-            moon_next_aspect=moon_next_aspect
-        )
-        
-        return chart
+                ephemeris[planet_enum] = None
+        return ephemeris
+    
+    def _build_charts(self, specs: List[Tuple]) -> List[HoraryChart]:
+        """Cast the charts for ``(dt_local, dt_utc, timezone_info, lat, lon,
+        location_name, jd_ut)`` specs (uncached)"""
+        
+        ephemeris: Dict[float, Dict[Planet, Optional[Tuple[float, float, float]]]] = {}
+        casts = []
+        for dt_local, dt_utc, timezone_info, lat, lon, location_name, jd_ut in specs:
+            # Traditional planets only, evaluated once per instant
+            with span("calculate_chart.planets"):
+                if jd_ut not in ephemeris:
+                    ephemeris[jd_ut] = self._planet_ephemeris(jd_ut)
+                planets = {}
+                moon_speed = cfg().timing.default_moon_speed_fallback
+                for planet_enum, row in ephemeris[jd_ut].items():
+                    if row is None:
+                        # Create fallback
+                        planets[planet_enum] = PlanetPosition(
+                            planet=planet_enum,
+                            longitude=0.0,
+                            latitude=0.0,
+                            house=1,
+                            sign=Sign.ARIES,
+                            dignity_score=0,
+                            speed=0.0
+                        )
+                        continue
+
+                    longitude, latitude, speed = row  # speed in degrees/day
+                    retrograde = speed < 0
+                    if planet_enum == Planet.MOON:
+                        # The value get_real_moon_speed would fetch again
+                        moon_speed = abs(speed)
+
+                    sign = self._get_sign(longitude)
+
+                    planets[planet_enum] = PlanetPosition(
+                        planet=planet_enum,
+                        longitude=longitude,
+                        latitude=latitude,
+                        house=0,  # Will be calculated after houses
+                        sign=sign,
+                        dignity_score=0,  # Will be calculated after solar analysis
+                        retrograde=retrograde,
+                        speed=speed
+                    )
+
+            # Calculate houses (Regiomontanus - traditional for horary)
+            with span("calculate_chart.houses"):
+                try:
+                    houses_data, ascmc = swe.houses(jd_ut, lat, lon, self.HOUSE_SYSTEM)
+                    houses = list(houses_data)
+                    ascendant = ascmc[0]
+                    midheaven = ascmc[1]
+                except Exception as e:
+                    logger.error(f"Error calculating houses: {e}")
+                    ascendant = 0.0
+                    midheaven = 90.0
+                    houses = [i * 30.0 for i in range(12)]
+
+                # Calculate house positions and house rulers
+                house_rulers = {}
+                for i, cusp in enumerate(houses, 1):
+                    sign = self._get_sign(cusp)
+                    house_rulers[i] = sign.ruler
+
+                # Update planet house positions
+                for planet_pos in planets.values():
+                    house = self._calculate_house_position(planet_pos.longitude, houses)
+                    planet_pos.house = house
+
+            # Enhanced solar condition analysis
+            with span("calculate_chart.dignities"):
+                sun_pos = planets[Planet.SUN]
+                solar_analyses = {}
+
+                for planet_enum, planet_pos in planets.items():
+                    solar_analysis = self._analyze_enhanced_solar_condition(
+                        planet_enum, planet_pos, sun_pos, lat, lon, jd_ut)
+                    solar_analyses[planet_enum] = solar_analysis
+
+                    # Calculate comprehensive traditional dignity with all factors
+                    dignity_info = self._calculate_comprehensive_traditional_dignity(
+                        planet_pos.planet, planet_pos, houses, planets[Planet.SUN], solar_analysis)
+                    planet_pos.dignity_score = dignity_info["score"]
+                    planet_pos.dignities = dignity_info["dignities"]
+
+            casts.append((planets, moon_speed, houses, house_rulers, ascendant, midheaven, solar_analyses))
+
+        # Calculate enhanced traditional aspects, every chart in one kernel pass
+        with span("calculate_chart.aspects"):
+            aspect_lists = calculate_enhanced_aspects_batch(
+                [cast[0] for cast in casts], [spec[-1] for spec in specs], config_snapshot())
+
+        charts = []
+        for spec, cast, aspects in zip(specs, casts, aspect_lists):
+            dt_local, dt_utc, timezone_info, lat, lon, location_name, jd_ut = spec
+            planets, moon_speed, houses, house_rulers, ascendant, midheaven, solar_analyses = cast
+            charts.append(HoraryChart(
+                date_time=dt_local,
+                date_time_utc=dt_utc,
+                timezone_info=timezone_info,
+                location=(lat, lon),
+                location_name=location_name,
+                planets=planets,
+                aspects=aspects,
+                houses=houses,
+                house_rulers=house_rulers,
+                ascendant=ascendant,
+                midheaven=midheaven,
+                solar_analyses=solar_analyses,
+                julian_day=jd_ut,
+                # NEW: Last and next lunar aspects, computed when first read
+                moon_last_aspect=self._lunar_aspect(calculate_moon_last_aspect, planets, jd_ut, moon_speed),
+                moon_next_aspect=self._lunar_aspect(calculate_moon_next_aspect, planets, jd_ut, moon_speed),
+                moon_speed=moon_speed
+            ))
+        
+        return charts
+    
+    @staticmethod
+    def _lunar_aspect(calculate, planets: Dict[Planet, PlanetPosition], jd_ut: float,
+                      moon_speed: float) -> Deferred:
+        """Defer one of the Moon's last/next aspect calculations until first read"""
+        def compute():
+            with span("calculate_chart.moon_aspects"):
+                return calculate(planets, jd_ut, lambda _jd: moon_speed)
+        return Deferred(compute)
     
     
     # [Continue with the rest of the methods...]
@@ -822,59 +945,40 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         # === ESSENTIAL DIGNITIES ===
         
+        # Day = Sun in houses 7-12 (below horizon), as in _calculate_triplicity_dignity
+        is_day = sun_pos.house in (7, 8, 9, 10, 11, 12)
+        essential = get_dignity_table("calculator").flags(planet, sign, sign_degree, is_day)
+
         # Rulership (+5)
-        if sign.ruler == planet:
+        if essential & DOMICILE:
             score += config.dignity.rulership
             dignities.append("rulership")
         
         # Exaltation (+4)
-        if planet in self.exaltations and self.exaltations[planet] == sign:
+        if essential & EXALTATION:
             score += config.dignity.exaltation
             dignities.append("exaltation")
         
         # Triplicity (+3) - traditional day/night rulers
-        triplicity_score = self._calculate_triplicity_dignity(planet, sign, sun_pos)
-        if triplicity_score:
-            score += triplicity_score
+        if essential & TRIPLICITY:
+            score += config.dignity.triplicity
             dignities.append("triplicity")
 
         # Terms (+2) and Faces (+1)
-        try:
-            terms_table = getattr(cfg().reception.terms, sign.sign_name)
-            for term in terms_table:
-                if term.start <= sign_degree < term.end and Planet[term.ruler.upper()] == planet:
-                    score += 2
-                    dignities.append("term")
-                    break
-        except AttributeError:
-            pass
+        if essential & TERM:
+            score += 2
+            dignities.append("term")
 
-        try:
-            faces_table = getattr(cfg().reception.faces, sign.sign_name)
-            for face in faces_table:
-                if face.start <= sign_degree < face.end and Planet[face.ruler.upper()] == planet:
-                    score += 1
-                    dignities.append("face")
-                    break
-        except AttributeError:
-            pass
+        if essential & FACE:
+            score += 1
+            dignities.append("face")
         
         # Detriment (-5)
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN], 
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
+        if essential & DETRIMENT:
             score += config.dignity.detriment
         
         # Fall (-4)
-        if planet in self.falls and self.falls[planet] == sign:
+        if essential & FALL:
             score += config.dignity.fall
         
         # === ACCIDENTAL DIGNITIES ===
@@ -935,39 +1039,12 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition) -> int:
         """Calculate traditional triplicity dignity (ENHANCED)"""
-        # Traditional triplicity rulers by element and day/night (CORRECTED)
-        triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius) 
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-            
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-            
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.SCORPIO: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.PISCES: {"day": Planet.VENUS, "night": Planet.MARS}
-        }
-        
-        if sign not in triplicity_rulers:
-            return 0
-            
         # Determine if it's day or night (Sun above or below horizon)
         # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6 (above horizon)
         sun_house = sun_pos.house
         is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
-        sect = "day" if is_day else "night"
         
-        if triplicity_rulers[sign][sect] == planet:
+        if get_dignity_table("calculator").flags(planet, sign, 0, is_day) & TRIPLICITY:
             return cfg().dignity.triplicity  # Configurable triplicity score
             
         return 0
@@ -1162,8 +1239,16 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                       ignore_combustion: bool = False,
                       ignore_saturn_7th: bool = False,
                       # Legacy reception weighting (now configurable)
-                      exaltation_confidence_boost: float = None) -> Dict[str, Any]:
-        """Enhanced Traditional horary judgment with configuration system"""
+                      exaltation_confidence_boost: float = None,
+                      resolved_location: Optional[Tuple[float, float, str]] = None,
+                      fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Enhanced Traditional horary judgment with configuration system
+
+        ``resolved_location`` is an already geocoded ``(lat, lon, address)``
+        for ``location``; callers that geocode asynchronously pass it to skip
+        the blocking lookup here. ``fields`` limits the result to the named
+        sections (see :mod:`horary_engine.result_fields`).
+        """
         
         logger.info("=== JUDGE_QUESTION METHOD CALLED ===")
         logger.info(f"Location parameter: {location}")
@@ -1175,45 +1260,79 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
             
             # Fail-fast geocoding
-            try:
-                lat, lon, full_location = safe_geocode(location)
-            except LocationError as e:
-                raise e
+            with span("geocode"):
+                if resolved_location is not None:
+                    lat, lon, full_location = resolved_location
+                else:
+                    lat, lon, full_location = safe_geocode(location)
             
             # Handle datetime with proper timezone support
-            if use_current_time:
-                dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
-            else:
-                if not date_str or not time_str:
-                    raise ValueError("Date and time must be provided when not using current time")
-                dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
-                    date_str, time_str, timezone_str, lat, lon)
-            
-            chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
-            
-            # Analyze question traditionally
-            question_analysis = self.question_analyzer.analyze_question(question)
-            
-            # Override with manual houses if provided
-            if manual_houses:
-                question_analysis["relevant_houses"] = manual_houses
-                question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
+            with span("resolve_time"):
+                if use_current_time:
+                    dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
+                else:
+                    if not date_str or not time_str:
+                        raise ValueError("Date and time must be provided when not using current time")
+                    dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
+                        date_str, time_str, timezone_str, lat, lon)
             
-            # Extract window_days from timeframe analysis
-            timeframe_analysis = question_analysis.get("timeframe_analysis", {})
-            window_days = timeframe_analysis.get("window_days")
+            with span("calculate_chart"):
+                chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
             
-            # Use default window if no timeframe specified
-            if window_days is None:
-                config = cfg()
-                window_days = getattr(config.timing, "default_window_days", 90)
+            return self._judge_chart(
+                question, chart, lat, lon, full_location,
+                dt_local, dt_utc, timezone_used, manual_houses,
+                ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+                exaltation_confidence_boost, fields=fields)
             
-            # Apply enhanced judgment with configuration
+        except Exception as e:
+            return self._error_response(e, "judge_question")
+    
+    def _judge_chart(self, question: str, chart: HoraryChart,
+                     lat: float, lon: float, full_location: str,
+                     dt_local: datetime.datetime, dt_utc: datetime.datetime,
+                     timezone_used: str, manual_houses: Optional[List[int]],
+                     ignore_radicality: bool, ignore_void_moon: bool,
+                     ignore_combustion: bool, ignore_saturn_7th: bool,
+                     exaltation_confidence_boost: float,
+                     question_analysis: Optional[Dict[str, Any]] = None,
+                     fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Judge ``question`` against an already calculated chart.
+
+        Shared by :meth:`judge_question` and :meth:`judge_batch`. The chart is
+        only read, so one chart may be judged for several questions.
+        ``question_analysis`` may be supplied by callers that have already
+        analysed the question; it is modified when ``manual_houses`` is given.
+        Sections not named in ``fields`` are neither built nor returned.
+        """
+        fields = parse_fields(fields)
+        # Analyze question traditionally
+        with span("question_analysis"):
+            if question_analysis is None:
+                question_analysis = self.question_analyzer.analyze_question(question)
+
+        # Override with manual houses if provided
+        if manual_houses:
+            question_analysis["relevant_houses"] = manual_houses
+            question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
+
+        # Extract window_days from timeframe analysis
+        timeframe_analysis = question_analysis.get("timeframe_analysis", {})
+        window_days = timeframe_analysis.get("window_days")
+
+        # Use default window if no timeframe specified
+        if window_days is None:
+            config = cfg()
+            window_days = getattr(config.timing, "default_window_days", 90)
+
+        # Apply enhanced judgment with configuration
+        with span("apply_enhanced_judgment"):
             judgment = self._apply_enhanced_judgment(
                 chart, question_analysis,
                 ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
                 exaltation_confidence_boost, window_days)
 
+        with span("evaluate_enhanced"):
             structured_reasoning = _structure_reasoning(judgment.get("reasoning", []))
             question_type = resolve_category(question_analysis.get("question_type"))
             category_rules = get_category_rules(question_type)
@@ -1222,63 +1341,213 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             judgment["confidence"] = int(evaluation["confidence"])
             judgment["scoring_trace"] = evaluation["trace"]
 
-            # Serialize chart data for frontend
-            chart_data_serialized = serialize_chart_for_frontend(chart, chart.solar_analyses)
-
-            general_info = self._calculate_general_info(chart)
-            considerations = self._calculate_considerations(chart, question_analysis)
-
-            return {
-                "question": question,
-                "judgment": judgment["result"],
-                "confidence": judgment["confidence"],
-                "reasoning": judgment["reasoning"],
-                "scoring_trace": judgment.get("scoring_trace", []),
-                
-                "chart_data": chart_data_serialized,
-                
-                "question_analysis": question_analysis,
-                "timing": judgment.get("timing"),
-                "moon_aspects": self._build_moon_story(chart),  # Enhanced Moon story
-                "traditional_factors": judgment.get("traditional_factors", {}),
-                "solar_factors": judgment.get("solar_factors", {}),
-                "general_info": general_info,
-                "considerations": considerations,
-                
-                # NEW: Enhanced lunar aspects
-                "moon_last_aspect": serialize_lunar_aspect(chart.moon_last_aspect),
-                "moon_next_aspect": serialize_lunar_aspect(chart.moon_next_aspect),
-                
-                "timezone_info": {
-                    "local_time": dt_local.isoformat(),
-                    "utc_time": dt_utc.isoformat(),
-                    "timezone": timezone_used,
-                    "location_name": full_location,
-                    "coordinates": {
-                        "latitude": lat,
-                        "longitude": lon
-                    }
+        result = {
+            "question": question,
+            "judgment": judgment["result"],
+            "confidence": judgment["confidence"],
+        }
+        if wants(fields, "verdict"):
+            result["reasoning"] = judgment["reasoning"]
+            result["scoring_trace"] = judgment.get("scoring_trace", [])
+
+        # Serialize chart data for frontend
+        if wants(fields, "chart"):
+            with span("serialize_chart"):
+                result["chart_data"] = serialize_chart_for_frontend(chart, chart.solar_analyses)
+
+        if wants(fields, "question"):
+            result["question_analysis"] = question_analysis
+        if wants(fields, "timing"):
+            result["timing"] = judgment.get("timing")
+        if wants(fields, "moon"):
+            result["moon_aspects"] = self._build_moon_story(chart)  # Enhanced Moon story
+        if wants(fields, "factors"):
+            result["traditional_factors"] = judgment.get("traditional_factors", {})
+            result["solar_factors"] = judgment.get("solar_factors", {})
+        if wants(fields, "summary"):
+            with span("chart_summary"):
+                result["general_info"] = self._calculate_general_info(chart)
+                result["considerations"] = self._calculate_considerations(chart, question_analysis)
+
+        if wants(fields, "moon"):
+            # NEW: Enhanced lunar aspects
+            result["moon_last_aspect"] = serialize_lunar_aspect(chart.moon_last_aspect)
+            result["moon_next_aspect"] = serialize_lunar_aspect(chart.moon_next_aspect)
+
+        if wants(fields, "timezone"):
+            result["timezone_info"] = {
+                "local_time": dt_local.isoformat(),
+                "utc_time": dt_utc.isoformat(),
+                "timezone": timezone_used,
+                "location_name": full_location,
+                "coordinates": {
+                    "latitude": lat,
+                    "longitude": lon
                 }
             }
-            
-        except LocationError as e:
+
+        return result
+    
+    @staticmethod
+    def _error_response(error: Exception, context: str) -> Dict[str, Any]:
+        """Build the error payload returned in place of a judgment."""
+        if isinstance(error, LocationError):
             return {
-                "error": str(e),
+                "error": str(error),
                 "judgment": "LOCATION_ERROR",
                 "confidence": 0,
-                "reasoning": _structure_reasoning([f"Location error: {e}"]),
+                "reasoning": _structure_reasoning([f"Location error: {error}"]),
                 "error_type": "LocationError"
             }
-        except Exception as e:
-            import traceback
-            logger.error(f"Error in judge_question: {e}")
-            logger.error(traceback.format_exc())
-            return {
-                "error": str(e),
-                "judgment": "ERROR",
-                "confidence": 0,
-                "reasoning": _structure_reasoning([f"Calculation error: {e}"])
-            }
+        import traceback
+        logger.error(f"Error in {context}: {error}")
+        logger.error(traceback.format_exc())
+        return {
+            "error": str(error),
+            "judgment": "ERROR",
+            "confidence": 0,
+            "reasoning": _structure_reasoning([f"Calculation error: {error}"])
+        }
+    
+    def judge_batch(self, records: List[Dict[str, Any]],
+                    finish: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Judge many questions in one call, sharing work between records.
+
+        Each record is a dict of :meth:`judge_question` keyword arguments,
+        plus an optional ``trace`` flag. ``finish`` (if given) post-processes
+        each successful result as part of its record's work.
+        Geocoding runs once per location string and time resolution once per
+        location and timestamp. Every chart the batch needs is then cast in
+        one :meth:`calculate_charts` call, once per instant and place: the
+        planets are evaluated once per instant and the aspects of all charts
+        come from one batch aspect kernel pass. Question analysis runs once
+        per question text, and identical records are judged only once.
+
+        Results are returned in input order. A failing record yields the same
+        error payload as :meth:`judge_question` without affecting the others.
+        Traced records (or all of them with ``tracing.enabled``) carry
+        ``_performance``. It covers the work done for that record: the shared
+        lookups and chart casting are timed on the batch's first record, and a
+        duplicate's trace is just its copy.
+        """
+        default_boost = cfg().confidence.reception.mutual_exaltation_bonus
+
+        locations: Dict[str, Any] = {}
+        moments: Dict[Tuple, Any] = {}
+        charts: Dict[Tuple, Any] = {}
+        analyses: Dict[str, Dict[str, Any]] = {}
+        judged: Dict[str, Dict[str, Any]] = {}
+
+        def shared(cache: Dict, key: Any, compute):
+            # Failures are cached too so a bad location is only tried once
+            if key not in cache:
+                try:
+                    cache[key] = (True, compute())
+                except Exception as e:
+                    cache[key] = (False, e)
+            ok, value = cache[key]
+            if not ok:
+                raise value
+            return value
+
+        def locate(record: Dict[str, Any]) -> Tuple:
+            """Resolve a record's place and moment, and key the chart they need."""
+            location = record["location"]
+            date_str = record.get("date_str")
+            time_str = record.get("time_str")
+            timezone_str = record.get("timezone_str")
+            use_current_time = record.get("use_current_time", True)
+
+            with span("geocode"):
+                lat, lon, full_location = shared(
+                    locations, location,
+                    lambda: record.get("resolved_location") or safe_geocode(location))
+
+            def resolve_moment():
+                if use_current_time:
+                    return self.timezone_manager.get_current_time_for_location(lat, lon)
+                if not date_str or not time_str:
+                    raise ValueError("Date and time must be provided when not using current time")
+                return self.timezone_manager.parse_datetime_with_timezone(
+                    date_str, time_str, timezone_str, lat, lon)
+
+            moment_key = (location, bool(use_current_time)) if use_current_time else (
+                location, False, date_str, time_str, timezone_str)
+            with span("resolve_time"):
+                dt_local, dt_utc, timezone_used = shared(moments, moment_key, resolve_moment)
+
+            chart_key = (dt_utc.isoformat(), dt_local.isoformat(), timezone_used, lat, lon, full_location)
+            return chart_key, (dt_local, dt_utc, timezone_used, lat, lon, full_location)
+
+        def cast_charts() -> None:
+            """Cast the chart of every record that can be located in one pass."""
+            wanted: Dict[Tuple, Tuple] = {}
+            for record in records:
+                try:
+                    chart_key, moment = locate(record)
+                except Exception:
+                    continue  # Reported when the record itself is judged
+                wanted.setdefault(chart_key, moment)
+            if not wanted:
+                return
+            with span("calculate_chart"):
+                try:
+                    cast = self.calculator.calculate_charts(list(wanted.values()))
+                except Exception:
+                    # Left to judge_record, which casts (and reports) chart by chart
+                    return
+            for chart_key, chart in zip(wanted, cast):
+                charts[chart_key] = (True, chart)
+
+        def judge_record(record: Dict[str, Any]) -> Dict[str, Any]:
+            question = record["question"]
+            manual_houses = record.get("manual_houses")
+            exaltation_confidence_boost = record.get("exaltation_confidence_boost")
+            if exaltation_confidence_boost is None:
+                exaltation_confidence_boost = default_boost
+
+            chart_key, moment = locate(record)
+            dt_local, dt_utc, timezone_used, lat, lon, full_location = moment
+            with span("calculate_chart"):
+                chart = shared(charts, chart_key, lambda: self.calculator.calculate_chart(*moment))
+
+            if question not in analyses:
+                analyses[question] = self.question_analyzer.analyze_question(question)
+
+            return self._judge_chart(
+                question, chart, lat, lon, full_location,
+                dt_local, dt_utc, timezone_used, manual_houses,
+                record.get("ignore_radicality", False),
+                record.get("ignore_void_moon", False),
+                record.get("ignore_combustion", False),
+                record.get("ignore_saturn_7th", False),
+                exaltation_confidence_boost,
+                question_analysis=copy.deepcopy(analyses[question]),
+                fields=record.get("fields"))
+
+        trace_all = tracing_enabled()
+        results = []
+        for index, record in enumerate(records):
+            record_key = repr(sorted(record.items()))
+            with collect_trace(bool(record.get("trace")) or trace_all) as trace:
+                if index == 0:
+                    cast_charts()
+                if record_key in judged:
+                    # Duplicates get their own copy; callers mutate results
+                    result = copy.deepcopy(judged[record_key])
+                else:
+                    try:
+                        result = judge_record(record)
+                        if finish is not None:
+                            with span("audit"):
+                                result = finish(result)
+                    except Exception as e:
+                        result = self._error_response(e, "judge_batch")
+                    judged[record_key] = result
+            if trace is not None:
+                result = dict(result, _performance=trace.to_dict())
+            results.append(result)
+        return results
     
     def _moon_aspects_significator_directly(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> bool:
         """
@@ -2608,7 +2877,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             querent_aspect = None
             quesited_aspect = None
             
-            for aspect in chart.aspects:
+            for aspect in get_analysis_context(chart).aspects_of(planet):
                 # Check orb limits using moiety-based calculation
                 if not self._is_aspect_within_orb_limits(chart, aspect):
                     continue  # Skip aspects that exceed proper orb limits
@@ -2755,15 +3024,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
             # Find aspects involving the translator
             translator_aspects = []
-            for aspect in chart.aspects:
-                if aspect.planet1 == translator_planet or aspect.planet2 == translator_planet:
-                    other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
-                    translator_aspects.append({
-                        "other": other_planet,
-                        "aspect": aspect,
-                        "applying": aspect.applying,
-                        "degrees_to_exact": aspect.degrees_to_exact
-                    })
+            for aspect in get_analysis_context(chart).aspects_of(translator_planet):
+                other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
+                translator_aspects.append({
+                    "other": other_planet,
+                    "aspect": aspect,
+                    "applying": aspect.applying,
+                    "degrees_to_exact": aspect.degrees_to_exact
+                })
             
             # Check for transaction translation patterns:
             # Pattern 1: Translator separates from item, applies to seller/buyer
@@ -2847,67 +3115,66 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 break
         
         # Check all current Moon aspects
-        for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+        for aspect in get_analysis_context(chart).aspects_of(Planet.MOON):
+            other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+            
+            # Check if this is a significator aspect
+            if other_planet in [querent, quesited]:
+                # Determine which house this planet rules
+                house_role = ""
+                if other_planet == querent:
+                    house_role = "querent (L1)"
+                elif other_planet == quesited:
+                    # Find which house this quesited planet rules
+                    for house, ruler in chart.house_rulers.items():
+                        if ruler == other_planet:
+                            house_role = f"L{house}"
+                            break
+                    if not house_role:
+                        house_role = "quesited"
                 
-                # Check if this is a significator aspect
-                if other_planet in [querent, quesited]:
-                    # Determine which house this planet rules
-                    house_role = ""
-                    if other_planet == querent:
-                        house_role = "querent (L1)"
-                    elif other_planet == quesited:
-                        # Find which house this quesited planet rules
-                        for house, ruler in chart.house_rulers.items():
-                            if ruler == other_planet:
-                                house_role = f"L{house}"
-                                break
-                        if not house_role:
-                            house_role = "quesited"
-                    
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
-                    
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": house_role,
-                        "description": f"{aspect_desc} ({house_role})",
-                        "testimony_type": "significator"
-                    })
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
                 
-                # ADDED: Check Moon-to-benefic testimony (FIXED: missing benefic support detection)
-                elif other_planet in [Planet.JUPITER, Planet.VENUS, Planet.SUN]:
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
-                    
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": f"benefic in {chart.planets[other_planet].house}th house",
-                        "description": f"{aspect_desc} (Moon to benefic {other_planet.value})",
-                        "testimony_type": "moon_to_benefic"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": house_role,
+                    "description": f"{aspect_desc} ({house_role})",
+                    "testimony_type": "significator"
+                })
+            
+            # ADDED: Check Moon-to-benefic testimony (FIXED: missing benefic support detection)
+            elif other_planet in [Planet.JUPITER, Planet.VENUS, Planet.SUN]:
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
                 
-                # ADDED: Check planets-in-house testimony (Moon to planet located in quesited house)
-                elif quesited_house_number and chart.planets[other_planet].house == quesited_house_number:
-                    favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-                    aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
-                    
-                    moon_significator_aspects.append({
-                        "planet": other_planet,
-                        "aspect": aspect.aspect,
-                        "applying": aspect.applying,
-                        "favorable": favorable,
-                        "house_role": f"planet in {quesited_house_number}th house",
-                        "description": f"{aspect_desc} (planet in {quesited_house_number}th house)",
-                        "testimony_type": "planet_in_house"
-                    })
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": f"benefic in {chart.planets[other_planet].house}th house",
+                    "description": f"{aspect_desc} (Moon to benefic {other_planet.value})",
+                    "testimony_type": "moon_to_benefic"
+                })
+            
+            # ADDED: Check planets-in-house testimony (Moon to planet located in quesited house)
+            elif quesited_house_number and chart.planets[other_planet].house == quesited_house_number:
+                favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+                aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
+                
+                moon_significator_aspects.append({
+                    "planet": other_planet,
+                    "aspect": aspect.aspect,
+                    "applying": aspect.applying,
+                    "favorable": favorable,
+                    "house_role": f"planet in {quesited_house_number}th house",
+                    "description": f"{aspect_desc} (planet in {quesited_house_number}th house)",
+                    "testimony_type": "planet_in_house"
+                })
         
         # If Moon has significant aspects to significators, prioritize this
         if moon_significator_aspects:
@@ -2919,10 +3186,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 applying_with_degrees = []
                 for aspect_data in applying_aspects:
                     # Find corresponding aspect in chart.aspects to get degrees_to_exact
-                    for chart_aspect in chart.aspects:
-                        if (Planet.MOON in [chart_aspect.planet1, chart_aspect.planet2] and
-                            aspect_data["planet"] in [chart_aspect.planet1, chart_aspect.planet2] and
-                            chart_aspect.aspect == aspect_data["aspect"] and
+                    for chart_aspect in get_analysis_context(chart).aspects_between(Planet.MOON, aspect_data["planet"]):
+                        if (chart_aspect.aspect == aspect_data["aspect"] and
                             chart_aspect.applying == aspect_data["applying"]):
                             
                             applying_with_degrees.append({
@@ -3093,42 +3358,39 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     continue
 
                 # Find aspects between benefic and significator
-                for aspect in chart.aspects:
-                    if ((aspect.planet1 == benefic and aspect.planet2 == significator) or
-                        (aspect.planet1 == significator and aspect.planet2 == benefic)):
-
-                        if not aspect.applying:
-                            # Record separating aspects as historical notes only
-                            separating_notes.append(
-                                self._format_aspect_for_display(
-                                    benefic.value,
-                                    aspect.aspect.value,
-                                    significator.value,
-                                    aspect.applying,
-                                )
+                for aspect in get_analysis_context(chart).aspects_between(benefic, significator):
+                    if not aspect.applying:
+                        # Record separating aspects as historical notes only
+                        separating_notes.append(
+                            self._format_aspect_for_display(
+                                benefic.value,
+                                aspect.aspect.value,
+                                significator.value,
+                                aspect.applying,
                             )
-                            continue
-
-                        # Calculate benefic strength
-                        aspect_strength = self._calculate_benefic_aspect_strength(
-                            benefic, significator, aspect, chart)
-
-                        if aspect_strength > 0:
-                            description = self._format_aspect_for_display(
-                                benefic.value, aspect.aspect.value,
-                                significator.value, aspect.applying)
-                            benefic_aspects.append({
-                                "benefic": benefic.value,
-                                "significator": significator.value,
-                                "aspect": aspect.aspect.value,
-                                "applying": aspect.applying,
-                                "degrees": aspect.degrees_to_exact,
-                                "strength": aspect_strength,
-                                "house_position": benefic_pos.house,
-                                "description": description,
-                                "type": "aspect",
-                            })
-                            total_score += aspect_strength
+                        )
+                        continue
+
+                    # Calculate benefic strength
+                    aspect_strength = self._calculate_benefic_aspect_strength(
+                        benefic, significator, aspect, chart)
+
+                    if aspect_strength > 0:
+                        description = self._format_aspect_for_display(
+                            benefic.value, aspect.aspect.value,
+                            significator.value, aspect.applying)
+                        benefic_aspects.append({
+                            "benefic": benefic.value,
+                            "significator": significator.value,
+                            "aspect": aspect.aspect.value,
+                            "applying": aspect.applying,
+                            "degrees": aspect.degrees_to_exact,
+                            "strength": aspect_strength,
+                            "house_position": benefic_pos.house,
+                            "description": description,
+                            "type": "aspect",
+                        })
+                        total_score += aspect_strength
 
         # Check for benefic planets located in the quesited's house
         if quesited_house_number:
@@ -3289,6 +3551,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         reception_calc = self.reception_calculator.calculate_comprehensive_reception(chart, planet1, planet2)
         return reception_calc.get("traditional_strength", 0)
     
+    def _real_moon_speed(self, chart: HoraryChart) -> float:
+        """Ephemeris Moon speed at the chart moment (once per chart)."""
+        if chart.moon_speed is not None:
+            return chart.moon_speed
+        return get_analysis_context(chart).memo(
+            "real_moon_speed", lambda: self.calculator.get_real_moon_speed(chart.julian_day))
+
     def _is_moon_void_of_course_enhanced(self, chart: HoraryChart) -> Dict[str, Any]:
         """Traditional void of course check - GROUND TRUTH implementation
         
@@ -3298,7 +3567,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         permitted orb, considering true motion (including retrograde).
         """
         
-        return self._void_traditional_ground_truth(chart)
+        # Several helpers ask per judgment; the answer is fixed for the chart
+        return dict(get_analysis_context(chart).memo(
+            "void_of_course", lambda: self._void_traditional_ground_truth(chart)))
     
     def _void_traditional_ground_truth(self, chart: HoraryChart) -> Dict[str, Any]:
         """GROUND TRUTH: Traditional void of course implementation
@@ -3324,11 +3595,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             }
 
         # Determine next lunar aspect using analytic helper
-        moon_next_aspect = calculate_moon_next_aspect(
-            chart.planets,
-            chart.julian_day,
-            self.calculator.get_real_moon_speed,
-        )
+        moon_next_aspect = chart.moon_next_aspect
 
         if moon_next_aspect is None:
             return {
@@ -3382,38 +3649,37 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Enhanced Moon story with real timing calculations"""
         
         moon_pos = chart.planets[Planet.MOON]
-        moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
+        moon_speed = self._real_moon_speed(chart)
         
         # Get current aspects
         current_moon_aspects = []
-        for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
-                
-                # Enhanced timing using analytic solver
-                if aspect.applying:
-                    other_pos = chart.planets[other_planet]
-                    timing_days = self._calculate_future_aspect_time(
-                        moon_pos,
-                        other_pos,
-                        aspect.aspect,
-                        chart.julian_day,
-                        cfg().timing.max_future_days,
-                    ) or 0
-                    timing_estimate = self._format_timing_description_enhanced(timing_days)
-                else:
-                    timing_estimate = "Past"
-                    timing_days = 0
-                
-                current_moon_aspects.append({
-                    "planet": other_planet.value,
-                    "aspect": aspect.aspect.display_name,
-                    "orb": float(aspect.orb),
-                    "applying": bool(aspect.applying),
-                    "status": "applying" if aspect.applying else "separating",
-                    "timing": str(timing_estimate),
-                    "days_to_perfect": float(timing_days) if aspect.applying else 0.0
-                })
+        for aspect in get_analysis_context(chart).aspects_of(Planet.MOON):
+            other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+            
+            # Enhanced timing using analytic solver
+            if aspect.applying:
+                other_pos = chart.planets[other_planet]
+                timing_days = self._calculate_future_aspect_time(
+                    moon_pos,
+                    other_pos,
+                    aspect.aspect,
+                    chart.julian_day,
+                    cfg().timing.max_future_days,
+                ) or 0
+                timing_estimate = self._format_timing_description_enhanced(timing_days)
+            else:
+                timing_estimate = "Past"
+                timing_days = 0
+            
+            current_moon_aspects.append({
+                "planet": other_planet.value,
+                "aspect": aspect.aspect.display_name,
+                "orb": float(aspect.orb),
+                "applying": bool(aspect.applying),
+                "status": "applying" if aspect.applying else "separating",
+                "timing": str(timing_estimate),
+                "days_to_perfect": float(timing_days) if aspect.applying else 0.0
+            })
         
         # Sort by timing for applying aspects, orb for separating
         current_moon_aspects.sort(key=lambda x: x.get("days_to_perfect", 999) if x["applying"] else x["orb"])
@@ -3448,7 +3714,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 # Handle Aspect object - get degrees_to_exact from perfection root level
                 degrees = perfection.get("degrees_to_exact") or perfection.get("t_perfect_days", 0) * 13.0  # Fallback calculation
                 
-            moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
+            moon_speed = self._real_moon_speed(chart)
             if degrees > 0 and moon_speed > 0:
                 timing_days = degrees / moon_speed
                 return self._format_timing_description_enhanced(timing_days)
@@ -3475,14 +3741,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
     def _find_applying_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find applying aspect between two planets (preserved)"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)) and aspect.applying:
-                return {
-                    "aspect": aspect.aspect,
-                    "orb": aspect.orb,
-                    "degrees_to_exact": aspect.degrees_to_exact
-                }
+        aspect = get_analysis_context(chart).applying_aspect(planet1, planet2)
+        if aspect is not None:
+            return {
+                "aspect": aspect.aspect,
+                "orb": aspect.orb,
+                "degrees_to_exact": aspect.degrees_to_exact
+            }
         return None
     
     def _check_enhanced_perfection(self, chart: HoraryChart, querent: Planet, quesited: Planet,
@@ -3698,15 +3963,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Check for future direct perfection between significators within timeframe window"""
         
         config = cfg()
-        max_window = min(window_days, getattr(config.timing, "max_window_days", 365))
+        settings = config_snapshot()
+        max_window = min(window_days, settings.timing.max_window_days)
 
         querent_pos = chart.planets[querent]
         quesited_pos = chart.planets[quesited]
 
-        # Moiety-based orb limit
-        moiety_q = getattr(config.orbs.moieties, querent.value, self._get_planet_moiety(querent))
-        moiety_qs = getattr(config.orbs.moieties, quesited.value, self._get_planet_moiety(quesited))
-        orb_limit = moiety_q + moiety_qs
+        # Moiety-based orb limit (sum of full moieties)
+        orb_limit = settings.orbs.timed_orb_limits[querent.value, quesited.value]
 
         target_angles = {
             Aspect.CONJUNCTION: 0,
@@ -3719,12 +3983,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         alignment_info = None
         
         # First check if there's an existing aspect between significators
-        existing_aspect = None
-        for aspect_info in chart.aspects:
-            if ((aspect_info.planet1 == querent and aspect_info.planet2 == quesited) or
-                (aspect_info.planet1 == quesited and aspect_info.planet2 == querent)):
-                existing_aspect = aspect_info
-                break
+        pair_aspects = get_analysis_context(chart).aspects_between(querent, quesited)
+        existing_aspect = pair_aspects[0] if pair_aspects else None
         
         # Calculate future aspect perfection times
         aspect_types = [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.SQUARE, Aspect.TRINE, Aspect.OPPOSITION]
@@ -3755,8 +4015,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if days_to_perfection is not None and 0 < days_to_perfection <= max_window:
                 # Sign boundary check
                 if getattr(config.perfection, "require_in_sign", False):
-                    exit_q = days_to_sign_exit(querent_pos.longitude, querent_pos.speed)
-                    exit_qs = days_to_sign_exit(quesited_pos.longitude, quesited_pos.speed)
+                    context = get_analysis_context(chart)
+                    exit_q = context.days_to_sign_exit(querent_pos)
+                    exit_qs = context.days_to_sign_exit(quesited_pos)
                     exits = [e for e in (exit_q, exit_qs) if e is not None]
                     if exits and days_to_perfection > min(exits):
                         return {
@@ -3834,6 +4095,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 elif days_to_perfection <= 30:
                     base_confidence += 2
 
+                reception_info = self.reception_calculator.calculate_comprehensive_reception(
+                    chart, querent, quesited
+                )
+                mutual = reception_info.get("mutual", "none")
+                one_way = reception_info.get("one_way", [])
                 if mutual != "none":
                     reception_bonus = getattr(
                         config.confidence.reception, f"{mutual}_bonus", 5
@@ -3862,8 +4128,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         return {"perfects": False, "reason": "No future perfection within timeframe"}
     
+    @staticmethod
     def _calculate_future_aspect_time(
-        self,
         pos1: PlanetPosition,
         pos2: PlanetPosition,
         aspect_type: Aspect,
@@ -3876,6 +4142,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         positive ``t``. Speeds are signed so retrograde motion is respected.
         ``Δλ`` is normalised to ``[0, 360)`` before solving. Returns ``None``
         if perfection does not occur within ``max_days``.
+
+        With ``timing.perfection_mode: refined`` the linear solution seeds a
+        root search against the ephemeris from ``jd_start`` (see
+        :mod:`horary_engine.calculation.refinement`), so stations and the
+        Moon's changing speed are taken into account.
         """
 
         target_angles = {
@@ -3892,16 +4163,28 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         # Relative speed (signed)
         relative_speed = pos1.speed - pos2.speed
-        if abs(relative_speed) < 1e-6:
-            return None
-
-        # Normalised longitudinal difference
-        delta = (pos2.longitude + target_angle - pos1.longitude) % 360.0
-
-        # Solve for time
-        t = delta / relative_speed
-        if t <= 0 or t > max_days:
-            return None
+        t = None
+        if abs(relative_speed) >= 1e-6:
+            # Normalised longitudinal difference
+            delta = (pos2.longitude + target_angle - pos1.longitude) % 360.0
+
+            # Solve for time
+            t = delta / relative_speed
+            if t <= 0 or t > max_days:
+                t = None
+
+        if is_refined():
+            # Linear estimate seeds a search against the actual ephemeris
+            refined = refine_perfection(
+                pos1.planet, pos2.planet, (target_angle,), jd_start, max_days, seed_days=t
+            )
+            if refined is not None:
+                if refined.lost_to_station:
+                    logger.debug(
+                        "%s %s %s lost to a station", pos1.planet.value,
+                        aspect_type.display_name.lower(), pos2.planet.value,
+                    )
+                return refined.days
 
         return t
     
@@ -3971,7 +4254,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         """Check for future applying aspect from planet to house ruler within timeframe"""
         
         config = cfg()
-        max_window = min(window_days, getattr(config.timing, "max_window_days", 365))
+        max_window = min(window_days, config_snapshot().timing.max_window_days)
         
         planet_pos = chart.planets[planet]
         ruler_pos = chart.planets[ruler]
@@ -4062,13 +4345,16 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         This delegates to :func:`check_future_prohibitions` which implements
         classical Lilly/Sahl rules for prohibition, translation and collection
-        of light. The helper is passed a reference to this engine's
-        ``_calculate_future_aspect_time`` so it can solve timing analytically.
+        of light. Aspect times come from the chart's aspect timeline, which
+        solves every planet pair with the same analytic formula as
+        ``_calculate_future_aspect_time``.
         """
 
-        return check_future_prohibitions(
-            chart, querent, quesited, days_ahead, self._calculate_future_aspect_time
-        )
+        if is_refined():
+            return check_future_prohibitions(
+                chart, querent, quesited, days_ahead, self._calculate_future_aspect_time
+            )
+        return check_future_prohibitions(chart, querent, quesited, days_ahead)
     
     def _check_moon_sun_education_perfection(self, chart: HoraryChart, question_analysis: Dict) -> Dict[str, Any]:
         """Check Moon-Sun aspects in education questions (traditional co-significator analysis)"""
@@ -4115,15 +4401,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _find_separating_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find separating aspect between two planets"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)):
-                if not aspect.applying:  # Separating
-                    return {
-                        "aspect": aspect.aspect,
-                        "orb": aspect.orb,
-                        "applying": False
-                    }
+        aspect = get_analysis_context(chart).separating_aspect(planet1, planet2)
+        if aspect is not None:
+            return {
+                "aspect": aspect.aspect,
+                "orb": aspect.orb,
+                "applying": False
+            }
         return None
     
     def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
@@ -4159,8 +4443,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue
             
             # TRADITIONAL REQUIREMENT 4: Timing validation - collection must complete in current signs
-            querent_days_to_sign = self._days_to_sign_exit(querent_pos)
-            quesited_days_to_sign = self._days_to_sign_exit(quesited_pos)
+            querent_days_to_sign = get_analysis_context(chart).days_to_sign_exit(querent_pos)
+            quesited_days_to_sign = get_analysis_context(chart).days_to_sign_exit(quesited_pos)
             
             # Calculate when collection aspects will perfect
             querent_collection_days = self._days_to_aspect_perfection(querent_pos, pos, aspects_from_querent)
@@ -4373,8 +4657,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         Returns tuple (perfects, impediment) where impediment details reason if False."""
         
         # Use enhanced sign exit calculations
-        days_to_exit_1 = days_to_sign_exit(pos1.longitude, pos1.speed)
-        days_to_exit_2 = days_to_sign_exit(pos2.longitude, pos2.speed)
+        context = get_analysis_context(chart)
+        days_to_exit_1 = context.days_to_sign_exit(pos1)
+        days_to_exit_2 = context.days_to_sign_exit(pos2)
 
         # Estimate days until aspect perfects using analytic solver
         days_to_perfect = self._calculate_future_aspect_time(
@@ -4833,16 +5118,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # Get all translator aspects
         translator_aspects = []
-        for aspect in chart.aspects:
-            if aspect.planet1 == translator or aspect.planet2 == translator:
-                # Skip the separating and applying aspects we already know about
-                other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
-                if (other_planet == separating_aspect.planet2 if separating_aspect.planet1 == translator else separating_aspect.planet1):
-                    continue  # This is the separating aspect
-                if (other_planet == applying_aspect.planet2 if applying_aspect.planet1 == translator else applying_aspect.planet1):
-                    continue  # This is the applying aspect
-                    
-                translator_aspects.append(aspect)
+        for aspect in get_analysis_context(chart).aspects_of(translator):
+            # Skip the separating and applying aspects we already know about
+            other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
+            if (other_planet == separating_aspect.planet2 if separating_aspect.planet1 == translator else separating_aspect.planet1):
+                continue  # This is the separating aspect
+            if (other_planet == applying_aspect.planet2 if applying_aspect.planet1 == translator else applying_aspect.planet1):
+                continue  # This is the applying aspect
+                
+            translator_aspects.append(aspect)
         
         # Check if any applying aspects occur between separation and application
         for aspect in translator_aspects:
@@ -4876,16 +5160,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _get_planet_moiety(self, planet: Planet) -> float:
         """Get traditional moiety for planet"""
-        moieties = {
-            Planet.SUN: 17.0,
-            Planet.MOON: 12.5,
-            Planet.MERCURY: 7.0,
-            Planet.VENUS: 8.0,
-            Planet.MARS: 7.5,
-            Planet.JUPITER: 9.0,
-            Planet.SATURN: 9.5
-        }
-        return moieties.get(planet, 8.0)  # Default orb if not found
+        return TRADITIONAL_MOIETIES.get(planet, DEFAULT_MOIETY)  # Default orb if not found
     
     def _validate_translation_sequence_timing(self, chart: HoraryChart, translator: Planet, 
                                             separating_aspect, applying_aspect) -> bool:
@@ -4924,6 +5199,9 @@ class HoraryEngine:
     This is the main entry point as specified in the requirements
     """
     
+    # Result keys kept by judge_fast (error keys only appear on failure)
+    FAST_RESULT_KEYS = ("question", "judgment", "confidence", "timing", "error", "error_type")
+    
     def __init__(self):
         self.engine = EnhancedTraditionalHoraryJudgmentEngine()
     
@@ -4936,12 +5214,89 @@ class HoraryEngine:
             settings: Dictionary containing all judgment settings
         
         Returns:
-            Dictionary with judgment result and analysis
+            Dictionary with judgment result and analysis. When
+            ``settings["trace"]`` is set (or ``tracing.enabled``), per-stage
+            timings are included under ``_performance``.
         """
+        reload_config_if_changed()
         logger.info(f"=== JUDGE METHOD CALLED ===")
         logger.info(f"Question: {question}")
         logger.info(f"Settings: {settings}")
         
+        # Call the enhanced engine
+        logger.info("About to call self.engine.judge_question()...")
+        with collect_trace(bool(settings.get("trace")) or tracing_enabled()) as trace:
+            try:
+                result = self.engine.judge_question(**self._judge_question_kwargs(question, settings))
+                logger.info("self.engine.judge_question() completed successfully")
+            except Exception as engine_error:
+                logger.error(f"ERROR in self.engine.judge_question(): {str(engine_error)}")
+                logger.error(f"Exception type: {type(engine_error)}")
+                import traceback
+                logger.error(f"Full traceback: {traceback.format_exc()}")
+                raise
+            
+            with span("audit"):
+                result = self._audit_result(result)
+        
+        if trace is not None:
+            result["_performance"] = trace.to_dict()
+        return result
+    
+    def judge_fast(self, question: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Verdict-only judgment for high-volume scoring clients
+        
+        Runs the same chart calculation, question analysis and scoring as
+        ``judge``, so ``judgment``, ``confidence`` and ``timing`` are
+        identical, but builds only the timing section of the result: no
+        frontend chart serialization, Moon story, general info or
+        considerations, and no explanation audit. ``settings["fields"]`` is
+        ignored.
+        
+        Returns:
+            Dictionary with ``question``, ``judgment``, ``confidence`` and
+            ``timing`` (``error``/``error_type`` instead of ``timing`` when
+            the judgment failed), plus ``_performance`` when tracing.
+        """
+        reload_config_if_changed()
+        kwargs = self._judge_question_kwargs(question, settings)
+        kwargs["fields"] = ("timing",)
+        with collect_trace(bool(settings.get("trace")) or tracing_enabled()) as trace:
+            result = self.engine.judge_question(**kwargs)
+        
+        compact = {key: result[key] for key in self.FAST_RESULT_KEYS if key in result}
+        if trace is not None:
+            compact["_performance"] = trace.to_dict()
+        return compact
+    
+    def judge_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Batch entry point: judge many ``{"question": ..., "settings": {...}}`` records
+        
+        Locations, timestamps, charts and question analyses shared between
+        records are computed once, and all the batch's charts are cast
+        together (see ``EnhancedTraditionalHoraryJudgmentEngine.judge_batch``).
+        Results are returned in input order and
+        errors are reported per record, as ``judge`` would report them. A
+        record whose settings ask for ``trace`` (or every record, with
+        ``tracing.enabled``) gets its stage timings under ``_performance``.
+        """
+        reload_config_if_changed()
+        logger.info(f"=== JUDGE_BATCH METHOD CALLED ({len(records)} records) ===")
+        
+        batch = []
+        for record in records:
+            settings = record.get("settings") or {}
+            kwargs = self._judge_question_kwargs(record.get("question", ""), settings)
+            kwargs["trace"] = bool(settings.get("trace"))
+            batch.append(kwargs)
+        return self.engine.judge_batch(batch, finish=self._audit_result)
+    
+    @staticmethod
+    def _judge_question_kwargs(question: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a ``settings`` dictionary onto ``judge_question`` keyword arguments"""
+        
         # Extract settings with defaults
         location = settings.get("location", "London, England")
         date_str = settings.get("date")
@@ -4962,31 +5317,25 @@ class HoraryEngine:
             # Use configured default
             exaltation_confidence_boost = cfg().confidence.reception.mutual_exaltation_bonus
         
-        # Call the enhanced engine
-        logger.info("About to call self.engine.judge_question()...")
-        try:
-            result = self.engine.judge_question(
-                question=question,
-                location=location,
-                date_str=date_str,
-                time_str=time_str,
-                timezone_str=timezone_str,
-                use_current_time=use_current_time,
-                manual_houses=manual_houses,
-                ignore_radicality=ignore_radicality,
-                ignore_void_moon=ignore_void_moon,
-                ignore_combustion=ignore_combustion,
-                ignore_saturn_7th=ignore_saturn_7th,
-                exaltation_confidence_boost=exaltation_confidence_boost
-            )
-            logger.info("self.engine.judge_question() completed successfully")
-        except Exception as engine_error:
-            logger.error(f"ERROR in self.engine.judge_question(): {str(engine_error)}")
-            logger.error(f"Exception type: {type(engine_error)}")
-            import traceback
-            logger.error(f"Full traceback: {traceback.format_exc()}")
-            raise
-        
+        return {
+            "question": question,
+            "location": location,
+            "date_str": date_str,
+            "time_str": time_str,
+            "timezone_str": timezone_str,
+            "use_current_time": use_current_time,
+            "manual_houses": manual_houses,
+            "ignore_radicality": ignore_radicality,
+            "ignore_void_moon": ignore_void_moon,
+            "ignore_combustion": ignore_combustion,
+            "ignore_saturn_7th": ignore_saturn_7th,
+            "exaltation_confidence_boost": exaltation_confidence_boost,
+            "resolved_location": settings.get("resolved_location"),
+            "fields": settings.get("fields"),
+        }
+    
+    def _audit_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply the explanation consistency audit to a judgment result"""
         # ENHANCED: Apply explanation consistency audit
         if hasattr(result, 'get') and result.get('chart_data'):
             chart = result.get('chart_data')  # Chart data for audit
@@ -5174,12 +5523,11 @@ class TraditionalOverrides:
         moon_to_querent = None
         moon_to_quesited = None
         
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == Planet.MOON and aspect.planet2 == querent) or
-                (aspect.planet2 == Planet.MOON and aspect.planet1 == querent)):
+        for aspect in get_analysis_context(chart).aspects_of(Planet.MOON):
+            other = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
+            if other == querent:
                 moon_to_querent = aspect
-            elif ((aspect.planet1 == Planet.MOON and aspect.planet2 == quesited) or
-                  (aspect.planet2 == Planet.MOON and aspect.planet1 == quesited)):
+            elif other == quesited:
                 moon_to_quesited = aspect
         
         # Perfect translation requires applying aspects to both
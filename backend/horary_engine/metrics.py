@@ -0,0 +1,307 @@
+"""Sharded latency histograms and counters for the API.
+
+Every thread writes to its own shard, so recording a request or a judgment
+stage never takes a lock. Readers merge the shards on demand. When a
+short-lived request thread exits, its shard is folded into a shared base
+shard, so the number of shards follows the number of live threads.
+
+Latencies go into fixed log-spaced buckets: quarter powers of two from 10 µs
+to about two minutes, i.e. roughly 19% relative resolution. Percentiles
+(p50/p90/p99) are read from the buckets; ``max`` and the sum are exact.
+:meth:`MetricsRegistry.prometheus_text` renders everything in the Prometheus
+text exposition format.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Bucket upper bounds in seconds: 10us * 2**(i/4)
+BUCKET_BOUNDS: Tuple[float, ...] = tuple(1e-5 * 2 ** (i / 4) for i in range(96))
+# Every fourth bound (powers of two) is exported to Prometheus
+PROMETHEUS_BOUNDS: Tuple[float, ...] = BUCKET_BOUNDS[::4]
+
+REQUEST_DURATION = "horary_http_request_duration_seconds"
+REQUESTS_TOTAL = "horary_http_requests_total"
+REQUEST_ERRORS = "horary_http_request_errors_total"
+REQUESTS_IN_FLIGHT = "horary_http_requests_in_flight"
+STAGE_DURATION = "horary_judgment_stage_duration_seconds"
+
+HELP = {
+    REQUEST_DURATION: ("histogram", "API request latency by endpoint."),
+    REQUESTS_TOTAL: ("counter", "API requests by endpoint."),
+    REQUEST_ERRORS: ("counter", "Failed API requests (exception or 4xx/5xx) by endpoint and type."),
+    REQUESTS_IN_FLIGHT: ("gauge", "API requests currently being served."),
+    STAGE_DURATION: ("histogram", "Judgment pipeline stage latency per request."),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "maximum", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.total = 0.0
+        self.maximum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def merge(self, other: "_Histogram") -> None:
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.total += other.total
+        self.count += other.count
+        self.maximum = max(self.maximum, other.maximum)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile ``q`` (capped at max)."""
+
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                bound = BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.maximum
+                return min(bound, self.maximum)
+        return self.maximum  # pragma: no cover
+
+    def summary(self) -> Dict[str, float]:
+        """Count plus mean/p50/p90/p99/max in milliseconds."""
+
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000.0, 3) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.50) * 1000.0, 3),
+            "p90_ms": round(self.quantile(0.90) * 1000.0, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000.0, 3),
+            "max_ms": round(self.maximum * 1000.0, 3),
+        }
+
+
+class _Shard:
+    __slots__ = ("histograms", "counters")
+
+    def __init__(self) -> None:
+        self.histograms: Dict[Tuple[str, LabelKey], _Histogram] = {}
+        self.counters: Dict[Tuple[str, LabelKey], float] = {}
+
+    def merge(self, other: "_Shard") -> None:
+        # list() snapshots the dict atomically while its owner thread writes
+        for key, histogram in list(other.histograms.items()):
+            mine = self.histograms.get(key)
+            if mine is None:
+                mine = self.histograms[key] = _Histogram()
+            mine.merge(histogram)
+        for key, value in list(other.counters.items()):
+            self.counters[key] = self.counters.get(key, 0) + value
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class MetricsRegistry:
+    """Histograms and counters keyed by metric name and labels."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._base = _Shard()
+        self._shards: List[_Shard] = []
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            weakref.finalize(threading.current_thread(), self._retire, shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        with self._lock:
+            if shard in self._shards:
+                self._shards.remove(shard)
+                self._base.merge(shard)
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """Add one latency observation (seconds) to histogram ``name``."""
+
+        key = (name, _label_key(labels))
+        histograms = self._shard().histograms
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = _Histogram()
+        histogram.observe(seconds)
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` (may be negative, for gauges) to counter ``name``."""
+
+        key = (name, _label_key(labels))
+        counters = self._shard().counters
+        counters[key] = counters.get(key, 0) + amount
+
+    def _merged(self) -> _Shard:
+        merged = _Shard()
+        with self._lock:
+            merged.merge(self._base)
+            for shard in list(self._shards):
+                merged.merge(shard)
+        return merged
+
+    def reset(self) -> None:
+        """Forget every observation (used by tests)."""
+
+        with self._lock:
+            self._base = _Shard()
+            for shard in self._shards:
+                shard.histograms.clear()
+                shard.counters.clear()
+
+    # ----------------------------------------------------------- recording
+
+    @contextmanager
+    def track_request(self, endpoint: str) -> Iterator[Dict[str, Any]]:
+        """Count, time and track in-flight state for one API request.
+
+        The caller may set ``outcome["status"]`` to the HTTP status it
+        returned; 4xx/5xx statuses are counted as errors. An exception counts
+        as an error of that exception's type and is re-raised.
+        """
+
+        outcome: Dict[str, Any] = {"status": 200}
+        self.inc(REQUESTS_TOTAL, endpoint=endpoint)
+        self.inc(REQUESTS_IN_FLIGHT, endpoint=endpoint)
+        start = time.perf_counter()
+        try:
+            yield outcome
+        except Exception as e:
+            self.inc(REQUEST_ERRORS, endpoint=endpoint, type=type(e).__name__)
+            raise
+        else:
+            status = int(outcome.get("status") or 200)
+            if status >= 400:
+                self.inc(REQUEST_ERRORS, endpoint=endpoint, type=f"HTTP{status}")
+        finally:
+            self.observe(REQUEST_DURATION, time.perf_counter() - start, endpoint=endpoint)
+            self.inc(REQUESTS_IN_FLIGHT, -1, endpoint=endpoint)
+
+    def record_trace(self, performance: Optional[Dict[str, Any]]) -> None:
+        """Add a ``Trace.to_dict()`` payload: each stage plus the ``total``."""
+
+        if not performance:
+            return
+        self.observe(STAGE_DURATION, performance.get("total_ms", 0.0) / 1000.0, stage="total")
+        for stage, timing in performance.get("stages", {}).items():
+            self.observe(STAGE_DURATION, timing.get("total_ms", 0.0) / 1000.0, stage=stage)
+
+    # ------------------------------------------------------------- reading
+
+    def endpoint_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per endpoint: requests, errors, error rate, in-flight and latency percentiles."""
+
+        merged = self._merged()
+        stats: Dict[str, Dict[str, Any]] = {}
+        for (name, labels), value in merged.counters.items():
+            endpoint = dict(labels).get("endpoint")
+            entry = stats.setdefault(endpoint, {"requests": 0, "errors": 0, "in_flight": 0, "error_types": {}})
+            if name == REQUESTS_TOTAL:
+                entry["requests"] += int(value)
+            elif name == REQUESTS_IN_FLIGHT:
+                entry["in_flight"] += int(value)
+            elif name == REQUEST_ERRORS:
+                entry["errors"] += int(value)
+                entry["error_types"][dict(labels)["type"]] = int(value)
+        for (name, labels), histogram in merged.histograms.items():
+            if name == REQUEST_DURATION:
+                endpoint = dict(labels)["endpoint"]
+                stats.setdefault(endpoint, {"requests": 0, "errors": 0, "in_flight": 0, "error_types": {}})
+                stats[endpoint]["latency"] = histogram.summary()
+        for entry in stats.values():
+            entry["error_rate"] = (entry["errors"] / entry["requests"]) if entry["requests"] else 0.0
+        return stats
+
+    def stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """Latency summary per judgment stage."""
+
+        merged = self._merged()
+        return {
+            dict(labels)["stage"]: histogram.summary()
+            for (name, labels), histogram in merged.histograms.items()
+            if name == STAGE_DURATION
+        }
+
+    def prometheus_text(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+
+        merged = self._merged()
+        lines: List[str] = []
+        names = sorted({name for name, _ in merged.histograms} | {name for name, _ in merged.counters})
+        for name in names:
+            kind, description = HELP.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "histogram":
+                for (metric, labels), histogram in sorted(merged.histograms.items()):
+                    if metric == name:
+                        lines.extend(_prometheus_histogram(name, labels, histogram))
+            else:
+                for (metric, labels), value in sorted(merged.counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{_prometheus_labels(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_labels(labels: Iterable[Tuple[str, str]], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (
+        f'{k}="' + v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') + '"' for k, v in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _prometheus_histogram(name: str, labels: LabelKey, histogram: _Histogram) -> List[str]:
+    lines = []
+    cumulative = 0
+    bucket = 0
+    for bound in PROMETHEUS_BOUNDS:
+        while bucket < len(BUCKET_BOUNDS) and BUCKET_BOUNDS[bucket] <= bound:
+            cumulative += histogram.counts[bucket]
+            bucket += 1
+        lines.append(f"{name}_bucket{_prometheus_labels(labels, ('le', f'{bound:.6g}'))} {cumulative}")
+    lines.append(f"{name}_bucket{_prometheus_labels(labels, ('le', '+Inf'))} {histogram.count}")
+    lines.append(f"{name}_sum{_prometheus_labels(labels)} {histogram.total!r}")
+    lines.append(f"{name}_count{_prometheus_labels(labels)} {histogram.count}")
+    return lines
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """The process-wide metrics registry."""
+
+    return _registry
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 
 from horary_config import cfg
-from .calculation.helpers import days_to_sign_exit
-from .reception import TraditionalReceptionCalculator
+from .analysis_context import get_analysis_context
+from .calculation.aspect_timeline import get_aspect_timeline
+from .reception import get_reception_calculator
 try:
     from ..models import Planet, Aspect, HoraryChart
 except ImportError:  # pragma: no cover - fallback when executed as script
@@ -34,7 +35,7 @@ def check_future_prohibitions(
     sig1: Planet,
     sig2: Planet,
     days_ahead: float,
-    calc_future_aspect_time: Callable[[Any, Any, Aspect, float, float], float],
+    calc_future_aspect_time: Optional[Callable[[Any, Any, Aspect, float, float], float]] = None,
 ) -> Dict[str, Any]:
     """Scan for intervening aspects before a main perfection.
 
@@ -46,8 +47,11 @@ def check_future_prohibitions(
         Significators forming the main perfection.
     days_ahead : float
         Time until the main perfection in days.
-    calc_future_aspect_time : callable
-        Function for computing time to a future aspect.
+    calc_future_aspect_time : callable, optional
+        Function for computing time to a future aspect. By default times are
+        read from the chart's :class:`AspectTimeline`, which also lets planets
+        with no aspect to either significator before ``days_ahead`` be
+        skipped without solving anything.
     """
 
     config = cfg()
@@ -56,7 +60,18 @@ def check_future_prohibitions(
 
     pos1 = chart.planets[sig1]
     pos2 = chart.planets[sig2]
-    reception_calc = TraditionalReceptionCalculator()
+    reception_calc = get_reception_calculator()
+    context = get_analysis_context(chart)
+
+    candidates = None
+    if calc_future_aspect_time is None:
+        timeline = get_aspect_timeline(chart)
+
+        def calc_future_aspect_time(p_a, p_b, aspect, jd_start, max_days):
+            return timeline.reach_time(p_a.planet, p_b.planet, aspect, max_days)
+
+        if days_ahead <= timeline.window:
+            candidates = timeline.partners((sig1, sig2), 0.0, days_ahead)
 
     def _valid(t: float, p_a, p_b) -> bool:
         if t is None or t <= 0 or t >= days_ahead:
@@ -65,13 +80,15 @@ def check_future_prohibitions(
             return True
         if allow_out_of_sign:
             return True
-        exit_a = days_to_sign_exit(p_a.longitude, p_a.speed)
-        exit_b = days_to_sign_exit(p_b.longitude, p_b.speed)
+        exit_a = context.days_to_sign_exit(p_a)
+        exit_b = context.days_to_sign_exit(p_b)
         return t < exit_a and t < exit_b
 
     for planet in CLASSICAL_PLANETS:
         if planet in (sig1, sig2):
             continue
+        if candidates is not None and planet not in candidates:
+            continue
         p_pos = chart.planets.get(planet)
         if not p_pos:
             continue
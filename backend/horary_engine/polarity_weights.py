@@ -6,9 +6,9 @@ from enum import Enum
 
 from .polarity import Polarity
 try:
-    from ..rule_engine import get_rule_weight
+    from ..rule_engine import add_reload_listener, get_rule_weight
 except ImportError:  # pragma: no cover - fallback when executed as script
-    from rule_engine import get_rule_weight
+    from rule_engine import add_reload_listener, get_rule_weight
 
 
 class TestimonyKey(Enum):
@@ -213,3 +213,13 @@ WEIGHT_TABLE: dict[TestimonyKey, float] = {
     token: abs(get_rule_weight(rule_id)) for token, rule_id in TOKEN_RULE_MAP.items()
 }
 
+
+def _refresh_weights(pack) -> None:
+    """Re-derive ``WEIGHT_TABLE`` in place after the rule pack is reloaded."""
+    WEIGHT_TABLE.update(
+        {token: abs(pack.weight(rule_id)) for token, rule_id in TOKEN_RULE_MAP.items()}
+    )
+
+
+add_reload_listener(_refresh_weights)
+
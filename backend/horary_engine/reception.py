@@ -1,13 +1,12 @@
 """Reception calculations for the horary engine."""
 
-from typing import Dict, List, Tuple, Any
-
-from horary_config import cfg
+from typing import Dict, List, Optional, Tuple, Any
 
 try:
     from ..models import Planet, Sign, HoraryChart
 except ImportError:  # pragma: no cover - fallback when executed as script
     from models import Planet, Sign, HoraryChart
+from .dignity_table import RECEPTION_TRIPLICITY_RULERS, TRIPLICITY, DignityTable, get_dignity_table
 
 
 class TraditionalReceptionCalculator:
@@ -26,43 +25,38 @@ class TraditionalReceptionCalculator:
         }
 
         # Traditional triplicity rulers (day/night)
-        self.triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius)
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.SCORPIO: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.PISCES: {"day": Planet.MARS, "night": Planet.VENUS},
-        }
+        self.triplicity_rulers = RECEPTION_TRIPLICITY_RULERS
+
+    @property
+    def dignity_table(self) -> DignityTable:
+        return get_dignity_table("reception")
+
+    def reception_matrix(self, chart: HoraryChart) -> "ReceptionMatrix":
+        """The chart's :class:`ReceptionMatrix`, attached on first use."""
+        matrix = getattr(chart, "reception_matrix", None)
+        if matrix is None:
+            matrix = ReceptionMatrix(chart, self)
+            try:
+                chart.reception_matrix = matrix
+            except AttributeError:  # pragma: no cover - read-only chart stand-ins
+                pass
+        return matrix
 
     def calculate_comprehensive_reception(
         self, chart: HoraryChart, planet1: Planet, planet2: Planet
     ) -> Dict[str, Any]:
         """SINGLE SOURCE OF TRUTH for all reception calculations
-        Returns comprehensive reception data used by both reasoning and structured output."""
+        Returns comprehensive reception data used by both reasoning and structured output.
+
+        Results are memoized per chart and ordered pair; treat them as read-only."""
+        return self.reception_matrix(chart).get(planet1, planet2)
 
-        # Get planet positions
+    def _compute_reception(
+        self, chart: HoraryChart, planet1: Planet, planet2: Planet, is_day: bool
+    ) -> Dict[str, Any]:
         pos1 = chart.planets[planet1]
         pos2 = chart.planets[planet2]
 
-        # Determine day/night for triplicity calculations
-        sun_pos = chart.planets[Planet.SUN]
-        sun_house = self._calculate_house_position(sun_pos.longitude, chart.houses)
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
-
         # Check all dignity types for both directions
         reception_1_to_2 = self._check_all_dignities(planet1, pos2, is_day)
         reception_2_to_1 = self._check_all_dignities(planet2, pos1, is_day)
@@ -104,69 +98,26 @@ class TraditionalReceptionCalculator:
             ),
         }
 
+    def is_day_chart(self, chart: HoraryChart) -> bool:
+        """Sun below the horizon (houses 7-12) = day chart, for triplicity."""
+        sun_pos = chart.planets[Planet.SUN]
+        sun_house = self._calculate_house_position(sun_pos.longitude, chart.houses)
+        return sun_house in [7, 8, 9, 10, 11, 12]
+
     def _check_all_dignities(
         self, receiving_planet: Planet, received_position, is_day: bool
     ) -> List[str]:
-        """Check all traditional dignity types for reception"""
-        dignities: List[str] = []
-
-        # 1. Domicile/Rulership (strongest)
-        if received_position.sign.ruler == receiving_planet:
-            dignities.append("domicile")
-
-        # 2. Exaltation (second strongest)
-        if (
-            receiving_planet in self.exaltations
-            and self.exaltations[receiving_planet] == received_position.sign
-        ):
-            dignities.append("exaltation")
-
-        # 3. Triplicity (third strongest)
-        if self._has_triplicity_dignity(
-            receiving_planet, received_position.sign, is_day
-        ):
-            dignities.append("triplicity")
-
-        # Get position within sign for terms/faces
-        sign_degree = (
-            received_position.longitude - received_position.sign.start_degree
-        ) % 30
-
-        # 4. Terms (Egyptian terms)
-        try:
-            terms_table = getattr(
-                cfg().reception.terms, received_position.sign.sign_name
-            )
-            for term in terms_table:
-                if term.start <= sign_degree < term.end:
-                    if Planet[term.ruler.upper()] == receiving_planet:
-                        dignities.append("term")
-                    break
-        except AttributeError:
-            pass
-
-        # 5. Faces/Decans
-        try:
-            faces_table = getattr(
-                cfg().reception.faces, received_position.sign.sign_name
-            )
-            for face in faces_table:
-                if face.start <= sign_degree < face.end:
-                    if Planet[face.ruler.upper()] == receiving_planet:
-                        dignities.append("face")
-                    break
-        except AttributeError:
-            pass
+        """Check all traditional dignity types for reception
 
-        return dignities
+        Domicile, exaltation, triplicity, term and face, strongest first.
+        """
+        sign = received_position.sign
+        sign_degree = (received_position.longitude - sign.start_degree) % 30
+        return self.dignity_table.dignities(receiving_planet, sign, sign_degree, is_day)
 
     def _has_triplicity_dignity(self, planet: Planet, sign: Sign, is_day: bool) -> bool:
         """Check if planet has triplicity dignity in sign"""
-        if sign not in self.triplicity_rulers:
-            return False
-
-        sect = "day" if is_day else "night"
-        return self.triplicity_rulers[sign][sect] == planet
+        return bool(self.dignity_table.flags(planet, sign, 0, is_day) & TRIPLICITY)
 
     def _classify_reception(
         self,
@@ -303,3 +254,51 @@ class TraditionalReceptionCalculator:
                     return i + 1
 
         return 1
+
+
+class ReceptionMatrix:
+    """Reception results for one chart, filled in per ordered planet pair.
+
+    Each ``(planet1, planet2)`` pair is computed at most once and the chart's
+    sect is determined once, so the many reception checks made while judging
+    a chart share their work. The matrix lives on ``HoraryChart.reception_matrix``;
+    concurrent fills of the same cell are harmless because results are
+    deterministic.
+    """
+
+    __slots__ = ("_chart", "_calculator", "_is_day", "_cells")
+
+    def __init__(self, chart: HoraryChart, calculator: TraditionalReceptionCalculator) -> None:
+        self._chart = chart
+        self._calculator = calculator
+        self._is_day = None
+        self._cells: Dict[Tuple[Planet, Planet], Dict[str, Any]] = {}
+
+    @property
+    def is_day(self) -> bool:
+        if self._is_day is None:
+            self._is_day = self._calculator.is_day_chart(self._chart)
+        return self._is_day
+
+    def get(self, planet1: Planet, planet2: Planet) -> Dict[str, Any]:
+        key = (planet1, planet2)
+        result = self._cells.get(key)
+        if result is None:
+            result = self._cells[key] = self._calculator._compute_reception(
+                self._chart, planet1, planet2, self.is_day
+            )
+        return result
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+
+_calculator: Optional[TraditionalReceptionCalculator] = None
+
+
+def get_reception_calculator() -> TraditionalReceptionCalculator:
+    """Shared stateless calculator for module-level helpers."""
+    global _calculator
+    if _calculator is None:
+        _calculator = TraditionalReceptionCalculator()
+    return _calculator
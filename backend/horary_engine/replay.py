@@ -0,0 +1,147 @@
+"""Recording and loading of ``/api/calculate-chart`` replay corpora.
+
+With ``replay.record_path`` set, the API appends every chart request to a
+JSON Lines file after sanitising it:
+
+* only the fields the endpoint reads are kept;
+* e-mail addresses, URLs and long digit runs in the question are masked;
+* "use current time" requests are pinned to the moment they were received
+  (as UTC), so replaying the file always asks for the same charts.
+
+``load_test.py`` replays such a file against a running server. A corpus line
+is either a bare payload or an object with the payload under ``"payload"``
+(other keys, e.g. a ``request_id``, are ignored).
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from horary_config import cfg
+
+
+logger = logging.getLogger(__name__)
+
+# Request fields read by /api/calculate-chart
+PAYLOAD_FIELDS = (
+    "question",
+    "location",
+    "date",
+    "time",
+    "timezone",
+    "useCurrentTime",
+    "manualHouses",
+    "ignoreRadicality",
+    "ignoreVoidMoon",
+    "ignoreCombustion",
+    "ignoreSaturn7th",
+    "exaltationConfidenceBoost",
+)
+
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(\.[\w-]+)+")
+_URL = re.compile(r"\bhttps?://\S+|\bwww\.\S+", re.IGNORECASE)
+_LONG_NUMBER = re.compile(r"\+?\d[\d\s().-]{5,}\d")
+
+
+def scrub_text(text: str) -> str:
+    """Mask e-mail addresses, URLs and phone/account-like numbers."""
+
+    text = _EMAIL.sub("[email]", text)
+    text = _URL.sub("[url]", text)
+    return _LONG_NUMBER.sub("[number]", text)
+
+
+def sanitize_payload(data: Dict[str, Any], received_at: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+    """Return the replayable, PII-scrubbed form of a chart request.
+
+    Parameters
+    ----------
+    data:
+        Request JSON as sent to ``/api/calculate-chart``.
+    received_at:
+        When the request arrived (defaults to now); used to pin
+        ``useCurrentTime`` requests to a fixed UTC date and time.
+    """
+
+    payload = {key: data[key] for key in PAYLOAD_FIELDS if key in data}
+    payload["question"] = scrub_text(str(payload.get("question") or "").strip())
+    if payload.get("useCurrentTime", True):
+        moment = (received_at or datetime.datetime.now(datetime.timezone.utc)).astimezone(datetime.timezone.utc)
+        payload.update(
+            useCurrentTime=False,
+            date=moment.strftime("%Y-%m-%d"),
+            time=moment.strftime("%H:%M"),
+            timezone="UTC",
+        )
+    return payload
+
+
+class RequestRecorder:
+    """Append sanitised payloads to a JSON Lines file (thread-safe)."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def record(self, data: Dict[str, Any]) -> None:
+        line = json.dumps(sanitize_payload(data), ensure_ascii=False, sort_keys=True)
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.recorded += 1
+
+
+_recorder: Optional[RequestRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_request_recorder() -> Optional[RequestRecorder]:
+    """The recorder for ``replay.record_path``, or ``None`` when recording is off."""
+
+    global _recorder
+    path = getattr(getattr(cfg(), "replay", None), "record_path", None)
+    if not path:
+        return None
+    with _recorder_lock:
+        if _recorder is None or _recorder.path != Path(path):
+            _recorder = RequestRecorder(path)
+        return _recorder
+
+
+def record_request(data: Dict[str, Any]) -> None:
+    """Record one chart request if recording is enabled; never raises."""
+
+    recorder = get_request_recorder()
+    if recorder is None:
+        return
+    try:
+        recorder.record(data)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not record request for replay: {e}")
+
+
+def load_corpus(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Read replay payloads from a JSON Lines file, in file order.
+
+    Blank lines are skipped; lines without a question raise ``ValueError``.
+    """
+
+    payloads = []
+    with Path(path).open(encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            payload = entry.get("payload", entry) if isinstance(entry, dict) else None
+            if not isinstance(payload, dict) or not str(payload.get("question") or "").strip():
+                raise ValueError(f"{path}:{number}: expected a chart request with a question")
+            payloads.append(payload)
+    return payloads
@@ -0,0 +1,62 @@
+"""Selectable sections of a judgment result.
+
+Clients that only poll for the verdict do not need the serialized chart, the
+Moon's story or the chart summaries, which cost more to build (and to send)
+than the judgment itself. A request may therefore name the sections it
+wants, e.g. ``fields=verdict,timing``; only those are computed and returned.
+
+``question``, ``judgment`` and ``confidence`` are always included. Leaving
+``fields`` out returns every section, as before.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Union
+
+
+# Section name -> result keys it adds
+RESULT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "verdict": ("reasoning", "scoring_trace"),
+    "timing": ("timing",),
+    "question": ("question_analysis",),
+    "factors": ("traditional_factors", "solar_factors"),
+    "chart": ("chart_data",),
+    "moon": ("moon_aspects", "moon_last_aspect", "moon_next_aspect"),
+    "summary": ("general_info", "considerations"),
+    "timezone": ("timezone_info",),
+}
+
+ALWAYS_INCLUDED: Tuple[str, ...] = ("question", "judgment", "confidence")
+
+
+def parse_fields(value: Union[None, str, Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """Normalize a ``fields`` option into a set of section names.
+
+    Accepts a comma-separated string or a list of names. ``None`` or an
+    empty value means every section. ``verdict`` is always implied.
+
+    Raises
+    ------
+    ValueError
+        If a name is not one of :data:`RESULT_FIELDS`.
+    """
+
+    if value is None:
+        return None
+    names = value.split(",") if isinstance(value, str) else list(value)
+    selected = {str(name).strip().lower() for name in names} - {""}
+    if not selected:
+        return None
+    unknown = selected - RESULT_FIELDS.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))} "
+            f"(expected any of {', '.join(RESULT_FIELDS)})"
+        )
+    return frozenset(selected | {"verdict"})
+
+
+def wants(fields: Optional[FrozenSet[str]], name: str) -> bool:
+    """Whether section ``name`` is requested (``fields`` from :func:`parse_fields`)."""
+
+    return fields is None or name in fields
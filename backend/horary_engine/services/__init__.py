@@ -1,5 +1,17 @@
 """Service utilities for the horary engine."""
 
-from .geolocation import TimezoneManager, LocationError, safe_geocode
+from .geolocation import TimezoneManager, LocationError, LocationNotFoundError, safe_geocode
+from .gazetteer import Gazetteer, build_gazetteer
+from .location_cache import LocationCache, location_cache_stats, warm_location_caches
 
-__all__ = ["TimezoneManager", "LocationError", "safe_geocode"]
+__all__ = [
+    "TimezoneManager",
+    "LocationError",
+    "LocationNotFoundError",
+    "safe_geocode",
+    "Gazetteer",
+    "build_gazetteer",
+    "LocationCache",
+    "location_cache_stats",
+    "warm_location_caches",
+]
@@ -0,0 +1,391 @@
+"""Offline geocoding from a compact on-disk gazetteer.
+
+A gazetteer is built once from a GeoNames cities dump (``cities500.txt``,
+``cities15000.txt`` ...) and stored as a directory of flat arrays:
+
+* ``keys.bin`` / ``key_offsets.npy`` - every normalised place name (name,
+  ASCII name and alternate names), concatenated in sorted order;
+* ``key_records.npy`` - the record each key belongs to;
+* ``records.npy`` - ``(n, 3)`` latitude, longitude and population;
+* ``labels.bin`` / ``label_offsets.npy`` - display labels
+  ("Name, Region, Country");
+* ``country_codes.npy`` / ``region_codes.npy`` - ISO country code and
+  GeoNames first-level region code (``TX``, ``ENG`` ...) per record;
+* ``key_lengths.npy`` - length of each key in characters;
+* ``gram_codes.npy`` / ``gram_offsets.npy`` / ``gram_postings.npy`` - a
+  trigram index: the sorted distinct trigrams of all keys (padded with two
+  NULs at each end, three code points packed into an int64) and, per
+  trigram, the keys containing it.
+
+All arrays are opened memory-mapped, and lookups binary-search the sorted
+keys directly in the mapped blob, so a lookup touches a few pages and takes
+well under a millisecond. Misspelt names are found through the trigram
+index (see :meth:`Gazetteer.lookup`). Build one from the ``backend``
+directory with::
+
+    python build_gazetteer.py --cities cities15000.txt --admin1 admin1CodesASCII.txt --out data/gazetteer
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pytz
+
+
+GAZETTEER_VERSION = 2
+
+# Common qualifiers that are not GeoNames country or region names
+COUNTRY_ALIASES = {
+    "usa": "US",
+    "us": "US",
+    "united states of america": "US",
+    "america": "US",
+    "uk": "GB",
+    "great britain": "GB",
+    "britain": "GB",
+    "england": "GB",
+    "scotland": "GB",
+    "wales": "GB",
+    "northern ireland": "GB",
+}
+
+# Prefix matching considers at most this many keys starting with the query
+MAX_PREFIX_CANDIDATES = 5000
+
+GRAM_SIZE = 3
+_GRAM_PAD = "\0" * (GRAM_SIZE - 1)
+
+
+def normalize_name(text: str) -> str:
+    """Case-fold, strip accents and collapse whitespace/punctuation."""
+
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.casefold().replace("-", " ").replace(".", " ").replace("'", "")
+    return " ".join(text.split())
+
+
+def gram_codes(name: str) -> np.ndarray:
+    """Sorted distinct trigrams of ``name`` (padded), each packed into an int64."""
+
+    padded = _GRAM_PAD + name + _GRAM_PAD
+    codes = {
+        (ord(padded[i]) << 42) | (ord(padded[i + 1]) << 21) | ord(padded[i + 2])
+        for i in range(len(padded) - GRAM_SIZE + 1)
+    }
+    return np.array(sorted(codes), dtype=np.int64)
+
+
+def edit_distances(name: str, candidates: List[str]) -> np.ndarray:
+    """Edit distance from ``name`` to each candidate, adjacent transpositions
+    counting as one edit, computed for all candidates at once.
+
+    Each row of the dynamic programme is vectorised over the candidates; the
+    insertion step ``d[j] = min(x[j], d[j - 1] + 1)`` is a running minimum of
+    ``x[j] - j``.
+    """
+
+    if not candidates:
+        return np.zeros(0, dtype=np.int64)
+    width = max(len(c) for c in candidates)
+    chars = np.full((len(candidates), width), -1, dtype=np.int64)
+    for row, candidate in enumerate(candidates):
+        chars[row, :len(candidate)] = [ord(ch) for ch in candidate]
+    steps = np.arange(width + 1)
+
+    before = None
+    previous = np.broadcast_to(steps, (len(candidates), width + 1))
+    for i, ca in enumerate(map(ord, name), 1):
+        best = np.minimum(previous[:, :-1] + (chars != ca), previous[:, 1:] + 1)
+        if before is not None and width > 1:
+            swapped = (chars[:, :-1] == ca) & (chars[:, 1:] == ord(name[i - 2]))
+            best[:, 1:] = np.where(swapped, np.minimum(best[:, 1:], before[:, :-2] + 1), best[:, 1:])
+        current = np.empty_like(previous)
+        current[:, 0] = i
+        current[:, 1:] = best
+        current = np.minimum.accumulate(current - steps, axis=1) + steps
+        before, previous = previous, current
+    return previous[np.arange(len(candidates)), [len(c) for c in candidates]]
+
+
+def build_gazetteer(
+    cities_file: Union[str, Path],
+    out_dir: Union[str, Path],
+    admin1_file: Optional[Union[str, Path]] = None,
+    min_population: int = 0,
+) -> Path:
+    """Build a gazetteer directory from GeoNames dumps.
+
+    Parameters
+    ----------
+    cities_file:
+        GeoNames ``cities*.txt`` (tab separated, standard column layout).
+    out_dir:
+        Directory to write; created if needed.
+    admin1_file:
+        Optional ``admin1CodesASCII.txt`` used to name first-level regions
+        (states, provinces, England/Scotland ...).
+    min_population:
+        Skip places smaller than this.
+
+    Returns
+    -------
+    Path
+        The output directory.
+    """
+
+    admin1: Dict[str, str] = {}
+    if admin1_file:
+        with open(admin1_file, encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) >= 2:
+                    admin1[parts[0]] = parts[1]
+
+    records: List[Tuple[float, float, float]] = []
+    labels: List[str] = []
+    countries: List[str] = []
+    regions: List[str] = []
+    keys: List[Tuple[bytes, int]] = []
+
+    with open(cities_file, encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t")
+            if len(parts) < 15:
+                continue
+            population = int(parts[14] or 0)
+            if population < min_population:
+                continue
+            name, ascii_name, alternates = parts[1], parts[2], parts[3]
+            country_code = parts[8]
+            region = admin1.get(f"{country_code}.{parts[10]}", "")
+            country = pytz.country_names.get(country_code.lower(), country_code)
+
+            index = len(records)
+            records.append((float(parts[4]), float(parts[5]), float(population)))
+            labels.append(", ".join(p for p in (name, region, country) if p))
+            countries.append(country_code)
+            regions.append(parts[10])
+
+            names = {normalize_name(n) for n in [name, ascii_name, *alternates.split(",")]}
+            keys.extend((n.encode("utf-8"), index) for n in names if n)
+
+    keys.sort()
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    key_blob = b"".join(k for k, _ in keys)
+    key_offsets = np.zeros(len(keys) + 1, dtype=np.uint64)
+    key_offsets[1:] = np.cumsum([len(k) for k, _ in keys])
+    (out / "keys.bin").write_bytes(key_blob)
+    np.save(out / "key_offsets.npy", key_offsets)
+    np.save(out / "key_records.npy", np.array([i for _, i in keys], dtype=np.uint32))
+
+    encoded_labels = [label.encode("utf-8") for label in labels]
+    label_offsets = np.zeros(len(labels) + 1, dtype=np.uint64)
+    label_offsets[1:] = np.cumsum([len(b) for b in encoded_labels])
+    (out / "labels.bin").write_bytes(b"".join(encoded_labels))
+    np.save(out / "label_offsets.npy", label_offsets)
+
+    np.save(out / "records.npy", np.array(records, dtype=np.float64).reshape(-1, 3))
+    np.save(out / "country_codes.npy", np.array(countries, dtype="S2"))
+    np.save(out / "region_codes.npy", np.array([r.encode("ascii", "ignore") for r in regions], dtype="S20"))
+
+    names = [k.decode("utf-8") for k, _ in keys]
+    np.save(out / "key_lengths.npy", np.array([len(n) for n in names], dtype=np.uint16))
+    key_grams = [gram_codes(n) for n in names]
+    codes = np.concatenate(key_grams) if key_grams else np.zeros(0, dtype=np.int64)
+    owners = np.repeat(np.arange(len(names), dtype=np.uint32), [len(g) for g in key_grams])
+    order = np.lexsort((owners, codes))
+    codes, owners = codes[order], owners[order]
+    distinct, starts = np.unique(codes, return_index=True)
+    gram_offsets = np.append(starts, len(codes)).astype(np.uint64)
+    np.save(out / "gram_codes.npy", distinct.astype(np.int64))
+    np.save(out / "gram_offsets.npy", gram_offsets)
+    np.save(out / "gram_postings.npy", owners)
+
+    meta = {"version": GAZETTEER_VERSION, "places": len(records), "names": len(keys)}
+    (out / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return out
+
+
+class Gazetteer:
+    """Memory-mapped gazetteer supporting exact, prefix and fuzzy lookup."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        meta = json.loads((self.path / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("version") != GAZETTEER_VERSION:
+            raise ValueError(f"Unsupported gazetteer version: {meta.get('version')}")
+
+        self._keys = self._map_bytes("keys.bin")
+        self._key_offsets = np.load(self.path / "key_offsets.npy", mmap_mode="r")
+        self._key_records = np.load(self.path / "key_records.npy", mmap_mode="r")
+        self._labels = self._map_bytes("labels.bin")
+        self._label_offsets = np.load(self.path / "label_offsets.npy", mmap_mode="r")
+        self._records = np.load(self.path / "records.npy", mmap_mode="r")
+        self._countries = np.load(self.path / "country_codes.npy", mmap_mode="r")
+        self._regions = np.load(self.path / "region_codes.npy", mmap_mode="r")
+        self._key_lengths = np.load(self.path / "key_lengths.npy", mmap_mode="r")
+        self._gram_codes = np.load(self.path / "gram_codes.npy", mmap_mode="r")
+        self._gram_offsets = np.load(self.path / "gram_offsets.npy", mmap_mode="r")
+        self._gram_postings = np.load(self.path / "gram_postings.npy", mmap_mode="r")
+        self._size = len(self._key_records)
+
+    def _map_bytes(self, name: str) -> memoryview:
+        path = self.path / name
+        if path.stat().st_size == 0:
+            return memoryview(b"")
+        return memoryview(np.memmap(path, dtype=np.uint8, mode="r"))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _key(self, i: int) -> bytes:
+        return bytes(self._keys[int(self._key_offsets[i]):int(self._key_offsets[i + 1])])
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _label(self, record: int) -> str:
+        start, end = int(self._label_offsets[record]), int(self._label_offsets[record + 1])
+        return bytes(self._labels[start:end]).decode("utf-8")
+
+    def _exact(self, key: bytes) -> List[int]:
+        i = self._lower_bound(key)
+        found = []
+        while i < self._size and self._key(i) == key:
+            found.append(int(self._key_records[i]))
+            i += 1
+        return found
+
+    def _prefix(self, prefix: bytes, limit: int) -> Iterable[Tuple[bytes, int]]:
+        i = self._lower_bound(prefix)
+        end = min(self._size, i + limit)
+        while i < end:
+            key = self._key(i)
+            if not key.startswith(prefix):
+                break
+            yield key, int(self._key_records[i])
+            i += 1
+
+    def _fuzzy(self, name: str, limit: int) -> List[Tuple[int, int]]:
+        """``(distance, record)`` for the closest keys within ``limit`` edits.
+
+        An edit changes at most ``GRAM_SIZE + 1`` of the padded trigrams (a
+        transposition touches four), so a key missing ``m`` of the distinct
+        trigrams of ``name`` is at least ``ceil(m / (GRAM_SIZE + 1))`` edits
+        away. Keys are compared by edit distance in order of that bound,
+        stopping once no remaining key can be closer than the best found.
+        """
+
+        grams = gram_codes(name)
+        slots = np.searchsorted(self._gram_codes, grams)
+        postings = [
+            self._gram_postings[int(self._gram_offsets[slot]):int(self._gram_offsets[slot + 1])]
+            for slot, gram in zip(slots.tolist(), grams.tolist())
+            if slot < len(self._gram_codes) and self._gram_codes[slot] == gram
+        ]
+        if not postings:
+            return []
+        counts = np.bincount(np.concatenate(postings))
+        candidates = np.flatnonzero(counts >= len(grams) - limit * (GRAM_SIZE + 1))
+        lengths = self._key_lengths[candidates].astype(np.int64)
+        candidates = candidates[np.abs(lengths - len(name)) <= limit]
+        bounds = -((counts[candidates] - len(grams)) // (GRAM_SIZE + 1))
+
+        scored: List[Tuple[int, int]] = []
+        for bound in range(limit + 1):
+            batch = candidates[bounds == bound].tolist()
+            distances = edit_distances(name, [self._key(i).decode("utf-8") for i in batch])
+            scored.extend(
+                (int(d), int(self._key_records[i])) for i, d in zip(batch, distances.tolist()) if d <= limit
+            )
+            if scored and min(d for d, _ in scored) <= bound:
+                break
+        return scored
+
+    def _matches_qualifiers(self, record: int, qualifiers: List[str]) -> bool:
+        parts = {normalize_name(p) for p in self._label(record).split(",")}
+        codes = {self._countries[record].decode("ascii"), self._regions[record].decode("ascii")}
+        country = self._countries[record].decode("ascii")
+        for qualifier in qualifiers:
+            if qualifier in parts or qualifier.upper() in codes:
+                continue
+            if COUNTRY_ALIASES.get(qualifier) == country:
+                continue
+            return False
+        return True
+
+    def _best(self, candidates: Iterable[int], qualifiers: List[str]) -> Optional[int]:
+        candidates = list(dict.fromkeys(candidates))
+        if not candidates:
+            return None
+        if qualifiers:
+            qualified = [r for r in candidates if self._matches_qualifiers(r, qualifiers)]
+            # Unknown qualifiers (e.g. a region missing from the build) do not
+            # veto an otherwise unique name
+            candidates = qualified or candidates
+        return max(candidates, key=lambda r: self._records[r, 2])
+
+    def lookup(self, location: str, fuzzy: bool = True) -> Optional[Tuple[float, float, str]]:
+        """Resolve ``"City[, Region][, Country]"`` to ``(lat, lon, label)``.
+
+        Tries an exact name match, then names starting with the query, then
+        (optionally) names within edit distance 1 (2 from seven characters),
+        found through the trigram index. Among several places the
+        qualifiers pick the matching region/country, then population decides.
+        Returns ``None`` when nothing matches.
+        """
+
+        parts = [normalize_name(p) for p in location.split(",")]
+        parts = [p for p in parts if p]
+        if not parts or not self._size:
+            return None
+        name, qualifiers = parts[0], parts[1:]
+        key = name.encode("utf-8")
+
+        record = self._best(self._exact(key), qualifiers)
+        if record is None:
+            record = self._best((r for _, r in self._prefix(key, MAX_PREFIX_CANDIDATES)), qualifiers)
+        if record is None and fuzzy and len(name) >= 4:
+            scored = self._fuzzy(name, 1 if len(name) < 7 else 2)
+            if scored:
+                closest = min(d for d, _ in scored)
+                record = self._best((r for d, r in scored if d == closest), qualifiers)
+
+        if record is None:
+            return None
+        lat, lon, _ = self._records[record]
+        return float(lat), float(lon), self._label(record)
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_path: Optional[Path] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer(path: Union[str, Path]) -> Gazetteer:
+    """Return the shared :class:`Gazetteer` for ``path``, opening it once."""
+
+    global _gazetteer, _gazetteer_path
+    path = Path(path)
+    if _gazetteer is None or _gazetteer_path != path:
+        with _gazetteer_lock:
+            if _gazetteer is None or _gazetteer_path != path:
+                _gazetteer = Gazetteer(path)
+                _gazetteer_path = path
+    return _gazetteer
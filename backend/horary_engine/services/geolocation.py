@@ -1,4 +1,6 @@
+import hashlib
 import logging
+from pathlib import Path
 from typing import Optional, Tuple
 
 import datetime
@@ -18,6 +20,10 @@ except ImportError:  # pragma: no cover
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
 
+from horary_config import cfg
+from .gazetteer import Gazetteer, get_gazetteer, normalize_name
+from .location_cache import MISSING, get_geocode_cache, get_timezone_cache, location_cache_enabled
+
 
 logger = logging.getLogger(__name__)
 
@@ -27,27 +33,36 @@ class LocationError(Exception):
     pass
 
 
-def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float, str]:
-    """Geocode a location string with fail-fast behaviour.
+class LocationNotFoundError(LocationError):
+    """The geocoder answered, but does not know the location."""
+    pass
 
-    Args:
-        location_string: Location to geocode.
-        timeout: Timeout in seconds.
 
-    Returns:
-        Tuple of (latitude, longitude, full_address).
+def _not_found(location_string: str) -> LocationNotFoundError:
+    return LocationNotFoundError(
+        f"Location not found: '{location_string}'. Please provide a more specific location."
+    )
 
-    Raises:
-        LocationError: If geocoding fails or the library is unavailable.
-    """
+
+_nominatim: Optional[Nominatim] = None
+
+
+def _get_nominatim() -> Nominatim:
+    """Return a shared Nominatim client (created on first use)."""
+    global _nominatim
+    if _nominatim is None:
+        _nominatim = Nominatim(user_agent="horary_astrology_precise")
+    return _nominatim
+
+
+def _geocode_nominatim(location_string: str, timeout: int) -> Tuple[float, float, str]:
     try:
-        geolocator = Nominatim(user_agent="horary_astrology_precise")
-        location = geolocator.geocode(location_string, timeout=timeout)
+        location = _get_nominatim().geocode(location_string, timeout=timeout)
         if location is None:
-            raise LocationError(
-                f"Location not found: '{location_string}'. Please provide a more specific location."
-            )
+            raise _not_found(location_string)
         return (location.latitude, location.longitude, location.address)
+    except LocationError:
+        raise
     except (GeocoderTimedOut, GeocoderUnavailable) as e:
         raise LocationError(f"Geocoding service unavailable: {e}")
     except ImportError:
@@ -56,6 +71,108 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
         raise LocationError(f"Geocoding failed for '{location_string}': {e}")
 
 
+def _local_gazetteer() -> Optional[Gazetteer]:
+    """The configured offline gazetteer, or ``None`` if unavailable."""
+    path = getattr(cfg().geocoding, "gazetteer_path", None)
+    if not path:
+        return None
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    try:
+        return get_gazetteer(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Offline gazetteer unavailable at {path}: {e}")
+        return None
+
+
+def _geocode_stub(location_string: str) -> Tuple[float, float, str]:
+    """Offline stand-in geocoder for load tests.
+
+    Coordinates are derived from a hash of the normalised name, so the same
+    string always lands on the same (land-plausible) latitude and longitude.
+    """
+    key = normalize_name(location_string)
+    if not key:
+        raise _not_found(location_string)
+    digest = hashlib.sha1(key.encode("utf-8")).digest()
+    lat = -55.0 + 125.0 * int.from_bytes(digest[:4], "big") / 2 ** 32
+    lon = -180.0 + 360.0 * int.from_bytes(digest[4:8], "big") / 2 ** 32
+    return (round(lat, 4), round(lon, 4), location_string.strip())
+
+
+def geocode_cache_key(location_string: str) -> Tuple[str, str]:
+    """Geocode cache key: the configured provider and the normalised name.
+
+    Providers disagree (the stub invents coordinates), so answers of one are
+    never served after switching to another, even from the persistent level.
+    """
+    return (getattr(cfg().geocoding, "provider", "nominatim"), normalize_name(location_string))
+
+
+def safe_geocode(location_string: str, timeout: Optional[int] = None) -> Tuple[float, float, str]:
+    """Geocode a location string with fail-fast behaviour.
+
+    The provider is chosen by ``geocoding.provider``: ``nominatim`` (online),
+    ``local`` (offline gazetteer at ``geocoding.gazetteer_path``) or ``stub``
+    (deterministic fake coordinates, for offline load tests). With the
+    local provider, Nominatim is only tried for names the gazetteer does not
+    know and only when ``geocoding.fallback_to_nominatim`` is set.
+
+    Args:
+        location_string: Location to geocode.
+        timeout: Timeout in seconds for online lookups
+            (defaults to ``geocoding.timeout_seconds``).
+
+    Returns:
+        Tuple of (latitude, longitude, full_address).
+
+    Results, including "not found", are cached by provider and normalised
+    location string (see ``location_cache``); service errors are not.
+
+    Raises:
+        LocationNotFoundError: If the location is unknown.
+        LocationError: If geocoding fails or the library is unavailable.
+    """
+    if not location_cache_enabled():
+        return _resolve_location(location_string, timeout)
+
+    cache = get_geocode_cache()
+    key = geocode_cache_key(location_string)
+    cached = cache.get(key)
+    if cached is None:
+        raise _not_found(location_string)
+    if cached is not MISSING:
+        return cached
+    try:
+        result = _resolve_location(location_string, timeout)
+    except LocationNotFoundError:
+        cache.put(key, None)
+        raise
+    cache.put(key, result)
+    return result
+
+
+def _resolve_location(location_string: str, timeout: Optional[int]) -> Tuple[float, float, str]:
+    config = cfg().geocoding
+    if timeout is None:
+        timeout = getattr(config, "timeout_seconds", 10)
+
+    provider = getattr(config, "provider", "nominatim")
+    if provider == "stub":
+        return _geocode_stub(location_string)
+    if provider == "local":
+        gazetteer = _local_gazetteer()
+        if gazetteer is not None:
+            result = gazetteer.lookup(location_string, fuzzy=getattr(config, "fuzzy", True))
+            if result is not None:
+                return result
+        if not getattr(config, "fallback_to_nominatim", False):
+            raise _not_found(location_string)
+
+    return _geocode_nominatim(location_string, timeout)
+
+
 class TimezoneManager:
     """Handles timezone operations for horary calculations."""
 
@@ -81,51 +198,75 @@ class TimezoneManager:
             self.geolocator = None
 
     def get_timezone_for_location(self, lat: float, lon: float) -> Optional[str]:
-        """Get timezone string for given coordinates with enhanced debugging."""
-        logger.info(f"=== TIMEZONE DETECTION STARTED for {lat}, {lon} ===")
+        """Get timezone string for given coordinates, using the location cache.
+
+        Only answers of a lookup that ran cleanly are cached (``None`` as "no
+        timezone"); after a lookup error the coordinate fallback is returned
+        uncached, so the next request tries again.
+        """
+        cache = None
+        if location_cache_enabled():
+            precision = getattr(cfg().location_cache, "coordinate_precision", 4)
+            cache = get_timezone_cache()
+            key = (round(lat, precision), round(lon, precision))
+            cached = cache.get(key)
+            if cached is not MISSING:
+                return cached
 
         try:
-            if self.tf is not None:
-                logger.info("Using TimezoneFinder library")
-                timezone_result = self.tf.timezone_at(lat=lat, lng=lon)
-                logger.info(f"TimezoneFinder raw result: {timezone_result}")
-
-                if timezone_result:
-                    logger.info("Validating timezone result...")
-                    validated_tz = self._validate_timezone_for_coordinates(
-                        timezone_result, lat, lon
-                    )
-                    if validated_tz:
-                        logger.info(
-                            f"=== FINAL TIMEZONE: {validated_tz} (after validation) ==="
-                        )
-                        return validated_tz
-            else:
-                logger.info(
-                    f"TimezoneFinder not available, using fallback for {lat}, {lon}"
-                )
-                timezone_result = None
+            timezone_result = self._lookup_timezone(lat, lon)
+        except Exception as e:
+            logger.error(f"Error getting timezone for {lat}, {lon}: {e}")
+            return self._fallback_after_error(lat, lon)
+        if cache is not None:
+            cache.put(key, timezone_result)
+        return timezone_result
 
+    def _fallback_after_error(self, lat: float, lon: float) -> Optional[str]:
+        try:
             fallback_tz = self._get_fallback_timezone(lat, lon)
-            if fallback_tz:
-                logger.warning(
-                    f"Using fallback timezone {fallback_tz} for {lat}, {lon} (TimezoneFinder returned: {timezone_result})"
-                )
-                return fallback_tz
+        except Exception:
+            return None
+        if fallback_tz:
+            logger.warning(f"Using fallback timezone {fallback_tz} after TimezoneFinder error")
+        return fallback_tz
 
-            return timezone_result
-        except Exception as e:  # pragma: no cover - unexpected errors
-            logger.error(f"Error getting timezone for {lat}, {lon}: {e}")
-            try:
-                fallback_tz = self._get_fallback_timezone(lat, lon)
-                if fallback_tz:
-                    logger.warning(
-                        f"Using fallback timezone {fallback_tz} after TimezoneFinder error"
+    def _lookup_timezone(self, lat: float, lon: float) -> Optional[str]:
+        """Get timezone string for given coordinates with enhanced debugging.
+
+        Errors from TimezoneFinder propagate to the caller.
+        """
+        logger.info(f"=== TIMEZONE DETECTION STARTED for {lat}, {lon} ===")
+
+        if self.tf is not None:
+            logger.info("Using TimezoneFinder library")
+            timezone_result = self.tf.timezone_at(lat=lat, lng=lon)
+            logger.info(f"TimezoneFinder raw result: {timezone_result}")
+
+            if timezone_result:
+                logger.info("Validating timezone result...")
+                validated_tz = self._validate_timezone_for_coordinates(
+                    timezone_result, lat, lon
+                )
+                if validated_tz:
+                    logger.info(
+                        f"=== FINAL TIMEZONE: {validated_tz} (after validation) ==="
                     )
-                    return fallback_tz
-            except Exception:
-                pass
-            return None
+                    return validated_tz
+        else:
+            logger.info(
+                f"TimezoneFinder not available, using fallback for {lat}, {lon}"
+            )
+            timezone_result = None
+
+        fallback_tz = self._get_fallback_timezone(lat, lon)
+        if fallback_tz:
+            logger.warning(
+                f"Using fallback timezone {fallback_tz} for {lat}, {lon} (TimezoneFinder returned: {timezone_result})"
+            )
+            return fallback_tz
+
+        return timezone_result
 
     def _validate_timezone_for_coordinates(
         self, timezone_str: str, lat: float, lon: float
@@ -0,0 +1,296 @@
+"""Two-level cache for geocoding and timezone lookups.
+
+Most questions come from a small set of places, so both ``safe_geocode`` and
+``TimezoneManager.get_timezone_for_location`` consult a :class:`LocationCache`
+first. Each cache keeps an in-process LRU in front of an optional SQLite store
+(``location_cache.db_path``) shared between workers and restarts.
+
+"Not found" answers are cached too (as ``None``) but expire after the shorter
+``negative_ttl_seconds``, so a typo does not hammer the geocoder while a place
+added upstream is picked up reasonably soon. Service errors are never cached.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from horary_config import add_config_reload_listener, cfg
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel returned by :meth:`LocationCache.get` when nothing is cached
+MISSING = object()
+
+
+class LocationCache:
+    """Thread-safe LRU with TTL and optional SQLite persistence.
+
+    Parameters
+    ----------
+    namespace:
+        Table-row prefix separating geocode and timezone entries in a shared
+        database file.
+    max_entries:
+        In-memory entries kept before least-recently-used eviction.
+    ttl_seconds / negative_ttl_seconds:
+        Lifetime of found and "not found" (``None``) entries.
+    db_path:
+        SQLite file for the second level, or ``None`` for memory only.
+    clock:
+        Wall-clock source (``time.time``); persisted expiry times must survive
+        restarts, so a monotonic clock is not suitable here.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 4096,
+        ttl_seconds: float = 30 * 86400.0,
+        negative_ttl_seconds: float = 3600.0,
+        db_path: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.namespace = namespace
+        self.max_entries = int(max_entries)
+        self.ttl_seconds = float(ttl_seconds)
+        self.negative_ttl_seconds = float(negative_ttl_seconds)
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if db_path:
+            self._db = self._open_db(Path(db_path))
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _open_db(path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS location_cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT, expires REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Location cache database unavailable at {path}: {e}")
+            return None
+
+    @staticmethod
+    def _db_key(key: Hashable) -> str:
+        return key if isinstance(key, str) else json.dumps(key)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value (possibly ``None``) or :data:`MISSING`."""
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is None and self._db is not None:
+                entry = self._load(key, now)
+                if entry is not None:
+                    self.disk_hits += 1
+                    self._remember(key, entry)
+            elif entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            if entry[1] is None:
+                self.negative_hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache ``value``; ``None`` records a "not found" answer."""
+
+        ttl = self.negative_ttl_seconds if value is None else self.ttl_seconds
+        entry = (self._clock() + ttl, value)
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO location_cache VALUES (?, ?, ?, ?)",
+                        (self.namespace, self._db_key(key), json.dumps(value), entry[0]),
+                    )
+                except sqlite3.Error as e:
+                    logger.warning(f"Location cache write failed: {e}")
+
+    def _remember(self, key: Hashable, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _load(self, key: Hashable, now: float) -> Optional[Tuple[float, Any]]:
+        try:
+            row = self._db.execute(
+                "SELECT value, expires FROM location_cache WHERE namespace = ? AND key = ?",
+                (self.namespace, self._db_key(key)),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Location cache read failed: {e}")
+            return None
+        if row is None or row[1] <= now:
+            return None
+        value = json.loads(row[0])
+        # JSON has no tuples; geocode results are (lat, lon, address)
+        return row[1], tuple(value) if isinstance(value, list) else value
+
+    def clear(self) -> None:
+        """Drop every entry from both levels (counters are kept)."""
+
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM location_cache WHERE namespace = ?", (self.namespace,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for ``/api/metrics``."""
+
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "persistent": self._db is not None,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "negative_hits": self.negative_hits,
+                "evictions": self.evictions,
+                "hit_rate": ((self.hits + self.disk_hits) / lookups) if lookups else 0.0,
+            }
+
+
+def _db_path() -> Optional[Path]:
+    path = getattr(cfg().location_cache, "db_path", None)
+    if not path:
+        return None
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path(__file__).resolve().parents[2] / path
+    return path
+
+
+def _from_config(namespace: str) -> LocationCache:
+    config = cfg().location_cache
+    return LocationCache(
+        namespace,
+        max_entries=config.max_entries,
+        ttl_seconds=config.ttl_seconds,
+        negative_ttl_seconds=config.negative_ttl_seconds,
+        db_path=_db_path(),
+    )
+
+
+_caches: Dict[str, LocationCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _get_cache(namespace: str) -> LocationCache:
+    cache = _caches.get(namespace)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(namespace)
+            if cache is None:
+                cache = _caches[namespace] = _from_config(namespace)
+    return cache
+
+
+def get_geocode_cache() -> LocationCache:
+    """Process-wide cache of ``safe_geocode`` results."""
+
+    return _get_cache("geocode")
+
+
+def get_timezone_cache() -> LocationCache:
+    """Process-wide cache of coordinate -> timezone lookups."""
+
+    return _get_cache("timezone")
+
+
+def reset_location_caches() -> None:
+    """Forget the shared caches so the next access re-reads the configuration."""
+
+    with _caches_lock:
+        _caches.clear()
+
+
+add_config_reload_listener(reset_location_caches, section="location_cache")
+
+
+def location_cache_enabled() -> bool:
+    return bool(getattr(getattr(cfg(), "location_cache", None), "enabled", False))
+
+
+def location_cache_stats() -> Dict[str, Any]:
+    """Geocode and timezone cache counters for ``/api/metrics``."""
+
+    return {
+        "enabled": location_cache_enabled(),
+        "geocode": get_geocode_cache().stats(),
+        "timezone": get_timezone_cache().stats(),
+    }
+
+
+def warm_location_caches(locations: Optional[Iterable[str]] = None) -> int:
+    """Resolve ``locations`` (default ``location_cache.seed_locations``) into the caches.
+
+    Each place is geocoded and its timezone looked up, so the first real
+    request from a common city is already a cache hit. Failures are logged
+    and skipped. Returns the number of places warmed.
+    """
+
+    try:
+        from .geolocation import LocationError, TimezoneManager, safe_geocode
+    except ImportError:  # pragma: no cover - fallback when executed as script
+        from geolocation import LocationError, TimezoneManager, safe_geocode
+
+    if locations is None:
+        locations = getattr(cfg().location_cache, "seed_locations", None) or []
+    timezone_manager = None
+    warmed = 0
+    for location in locations:
+        try:
+            lat, lon, _ = safe_geocode(location)
+        except LocationError as e:
+            logger.info(f"Skipping cache seed '{location}': {e}")
+            continue
+        if timezone_manager is None:
+            timezone_manager = TimezoneManager()
+        timezone_manager.get_timezone_for_location(lat, lon)
+        warmed += 1
+    return warmed
+
+
+def start_location_cache_warmup() -> Optional[threading.Thread]:
+    """Warm the caches from ``location_cache.seed_locations`` in a daemon thread.
+
+    Returns the thread, or ``None`` when caching is off or no seeds are set.
+    """
+
+    if not location_cache_enabled() or not getattr(cfg().location_cache, "seed_locations", None):
+        return None
+    thread = threading.Thread(target=warm_location_caches, name="location-cache-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -1,8 +1,20 @@
-"""Aggregate testimonies with role importance scaling."""
+"""Aggregate testimonies with role importance scaling.
+
+Scoring a token needs its polarity, family, kind and base weight from the
+``polarity_weights`` tables and the product of every role importance whose
+role name appears in the token name. None of that depends on the testimony
+set, so :func:`scoring_plan` resolves it once per role-importance set into a
+:class:`ScoringPlan`: one :class:`ScoringRecord` per ``TestimonyKey``, stored
+in ``token_to_string`` order so sorting tokens is sorting their indices.
+(The contract only affects which tokens DSL dispatch produces, not how they
+score, so plans are keyed on role importances alone.)
+"""
 from __future__ import annotations
 
-from typing import Iterable, List, Tuple, Dict, Sequence, Any
 import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Dict, Sequence, Any
 
 from .polarity_weights import (
     POLARITY_TABLE,
@@ -17,8 +29,136 @@ from .dsl_to_testimony import dispatch as dsl_dispatch
 from .utils import token_to_string
 try:  # pragma: no cover - allow running as script
     from ..models import Planet
+    from ..rule_engine import add_reload_listener
 except ImportError:  # pragma: no cover
     from models import Planet
+    from rule_engine import add_reload_listener
+
+
+# Every key in ``token_to_string`` order; a key's position is its sort rank
+_KEYS: Tuple[TestimonyKey, ...] = tuple(sorted(TestimonyKey, key=token_to_string))
+_KEY_INDEX: Dict[TestimonyKey, int] = {key: index for index, key in enumerate(_KEYS)}
+_KEY_BY_VALUE: Dict[str, TestimonyKey] = {key.value: key for key in TestimonyKey}
+
+# Role-importance sets whose plans are kept
+PLAN_CACHE_SIZE = 256
+
+
+class ScoringRecord(NamedTuple):
+    """Everything :func:`aggregate` needs to score one token."""
+
+    key: TestimonyKey | str
+    name: str
+    polarity: Polarity
+    family: Optional[str]
+    kind: Optional[str]
+    weight: float
+    role_factor: float
+    scored: bool
+
+
+def _role_factor(token_name: str, role_weights: Sequence[Tuple[str, float]]) -> float:
+    role_factor = 1.0
+    for role_name, factor in role_weights:
+        if re.search(rf"(^|_){re.escape(role_name)}(_|$)", token_name):
+            role_factor *= factor
+    return role_factor
+
+
+def _record(token: TestimonyKey | str, role_weights: Sequence[Tuple[str, float]]) -> ScoringRecord:
+    name = token_to_string(token)
+    role_factor = _role_factor(name.lower(), role_weights)
+    if isinstance(token, TestimonyKey):
+        polarity = POLARITY_TABLE.get(token, Polarity.NEUTRAL)
+        return ScoringRecord(
+            token,
+            name,
+            polarity,
+            FAMILY_TABLE.get(token),
+            KIND_TABLE.get(token),
+            WEIGHT_TABLE.get(token, 0.0) * role_factor,
+            role_factor,
+            polarity is not Polarity.NEUTRAL,
+        )
+    # Unknown strings are kept in the ledger as neutral, weightless entries
+    return ScoringRecord(token, name, Polarity.NEUTRAL, None, None, 0.0 * role_factor, role_factor, True)
+
+
+class ScoringPlan:
+    """Resolved scoring records for one role-importance set.
+
+    Parameters
+    ----------
+    role_weights:
+        ``(role name, importance)`` pairs in the order they were declared.
+    """
+
+    __slots__ = ("role_weights", "records", "_strings")
+
+    # Raw string tokens (e.g. generated aspect tokens) whose records are kept
+    MAX_STRING_RECORDS = 4096
+
+    def __init__(self, role_weights: Sequence[Tuple[str, float]]) -> None:
+        self.role_weights = tuple(role_weights)
+        self.records: Tuple[ScoringRecord, ...] = tuple(_record(key, self.role_weights) for key in _KEYS)
+        self._strings: Dict[str, ScoringRecord] = {}
+
+    def record(self, token: TestimonyKey | str) -> ScoringRecord:
+        """The record for one token."""
+
+        if isinstance(token, TestimonyKey):
+            return self.records[_KEY_INDEX[token]]
+        record = self._strings.get(token)
+        if record is None:
+            record = _record(token, self.role_weights)
+            if len(self._strings) < self.MAX_STRING_RECORDS:
+                self._strings[token] = record
+        return record
+
+    def ordered(self, tokens: Iterable[TestimonyKey | str]) -> List[ScoringRecord]:
+        """Records for the distinct ``tokens``, in ``token_to_string`` order."""
+
+        distinct = set(tokens)
+        if all(type(token) is TestimonyKey for token in distinct):
+            return [self.records[index] for index in sorted(_KEY_INDEX[token] for token in distinct)]
+        # Raw strings interleave with the keys by name
+        return sorted(map(self.record, distinct), key=_record_name)
+
+
+def _record_name(record: ScoringRecord) -> str:
+    return record.name
+
+
+_plans: "OrderedDict[Tuple[Tuple[str, float], ...], ScoringPlan]" = OrderedDict()
+_plans_lock = threading.Lock()
+
+
+def scoring_plan(role_weights: Dict[str, float] | Sequence[Tuple[str, float]] = ()) -> ScoringPlan:
+    """The cached :class:`ScoringPlan` for ``role_weights``."""
+
+    items = tuple(role_weights.items()) if isinstance(role_weights, dict) else tuple(role_weights)
+    with _plans_lock:
+        plan = _plans.get(items)
+        if plan is not None:
+            _plans.move_to_end(items)
+            return plan
+    plan = ScoringPlan(items)
+    with _plans_lock:
+        _plans[items] = plan
+        while len(_plans) > PLAN_CACHE_SIZE:
+            _plans.popitem(last=False)
+    return plan
+
+
+def clear_scoring_plans(*_: Any) -> None:
+    """Forget cached plans (after the weight tables change)."""
+
+    with _plans_lock:
+        _plans.clear()
+
+
+# Plans hold role-scaled weights taken from the rule pack
+add_reload_listener(clear_scoring_plans)
 
 
 def _coerce(
@@ -39,15 +179,8 @@ def _coerce(
             tokens.append(raw)
             continue
         if isinstance(raw, str):
-            try:
-                tokens.append(TestimonyKey(raw))
-            except ValueError:
-                tokens.append(raw)
-            continue
-        try:
-            tokens.append(TestimonyKey(raw))
-        except ValueError:
-            continue
+            tokens.append(_KEY_BY_VALUE.get(raw, raw))
+        # Anything else (an undispatched DSL primitive) never names a key
     return tokens, role_weights
 
 
@@ -76,41 +209,27 @@ def aggregate(
     total_yes = 0.0
     total_no = 0.0
     ledger: List[Dict[str, float | TestimonyKey | Polarity | str | bool | Any]] = []
-    seen: set[TestimonyKey | str] = set()
     families_seen: set[str] = set()
 
-    for token in sorted(tokens, key=token_to_string):
-        if token in seen:
-            continue
-        seen.add(token)
-
-        polarity = POLARITY_TABLE.get(token, Polarity.NEUTRAL) if isinstance(token, TestimonyKey) else Polarity.NEUTRAL
-        if polarity is Polarity.NEUTRAL and not isinstance(token, str):
+    for record in scoring_plan(role_weights).ordered(tokens):
+        if not record.scored:
             continue
 
-        family = FAMILY_TABLE.get(token) if isinstance(token, TestimonyKey) else None
-        kind = KIND_TABLE.get(token) if isinstance(token, TestimonyKey) else None
+        family = record.family
         context_only = family is not None and family in families_seen
         if family is not None and not context_only:
             families_seen.add(family)
 
-        weight = WEIGHT_TABLE.get(token, 0.0) if isinstance(token, TestimonyKey) else 0.0
-
-        role_factor = 1.0
-        token_name = token_to_string(token).lower()
-        for role_name, factor in role_weights.items():
-            pattern = rf"(^|_){re.escape(role_name)}(_|$)"
-            if re.search(pattern, token_name):
-                role_factor *= factor
-        weight *= role_factor
-
+        weight = record.weight
         if weight < 0:
             raise ValueError("Weights must be non-negative for monotonicity")
 
+        polarity = record.polarity
         delta_yes = weight if (not context_only and polarity is Polarity.POSITIVE) else 0.0
         delta_no = weight if (not context_only and polarity is Polarity.NEGATIVE) else 0.0
         total_yes += delta_yes
         total_no += delta_no
+        token = record.key
         entry = {
             "key": token,
             "polarity": polarity,
@@ -118,9 +237,9 @@ def aggregate(
             "delta_yes": delta_yes,
             "delta_no": delta_no,
             "family": family,
-            "kind": kind,
+            "kind": record.kind,
             "context": context_only,
-            "role_factor": role_factor,
+            "role_factor": record.role_factor,
         }
         if token in extra_info:
             entry.update(extra_info[token])
@@ -0,0 +1,136 @@
+"""Per-request timing spans for the judgment pipeline.
+
+Stages of ``judge_question`` and ``calculate_chart`` are wrapped in
+:func:`span`::
+
+    with span("calculate_chart.aspects"):
+        aspects = calculate_enhanced_aspects(planets, jd_ut)
+
+Spans only record anything while a :class:`Trace` is active in the current
+context (see :func:`collect_trace`); otherwise :func:`span` returns a shared
+no-op object after a single context-variable read. A trace keeps the call
+count, total and maximum duration per stage, measured with
+``time.perf_counter``.
+
+Finished traces are folded into the stage latency histograms of
+:mod:`horary_engine.metrics`.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from horary_config import cfg
+
+
+class Trace:
+    """Stage durations collected for one request."""
+
+    __slots__ = ("started", "stages")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        # name -> [count, total seconds, max seconds]
+        self.stages: Dict[str, List[float]] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        stage = self.stages.get(name)
+        if stage is None:
+            self.stages[name] = [1, seconds, seconds]
+        else:
+            stage[0] += 1
+            stage[1] += seconds
+            if seconds > stage[2]:
+                stage[2] = seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form returned under ``_performance``."""
+
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000.0, 3),
+            "stages": {
+                name: {
+                    "count": int(count),
+                    "total_ms": round(total * 1000.0, 3),
+                    "max_ms": round(longest * 1000.0, 3),
+                }
+                for name, (count, total, longest) in self.stages.items()
+            },
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("horary_trace", default=None)
+
+
+class _Span:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: Trace, name: str) -> None:
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.trace.record(self.name, time.perf_counter() - self.start)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """Context manager timing the ``name`` stage of the active trace (if any)."""
+
+    trace = _current_trace.get()
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+def tracing_enabled() -> bool:
+    """Whether every judgment is traced (``tracing.enabled``)."""
+
+    return bool(getattr(getattr(cfg(), "tracing", None), "enabled", False))
+
+
+@contextmanager
+def collect_trace(enabled: bool = True) -> Iterator[Optional[Trace]]:
+    """Activate a fresh :class:`Trace` for the enclosed block.
+
+    Yields ``None`` (and records nothing) when ``enabled`` is false. A trace
+    already active in this context is reused, so nested entry points add to
+    the outer request's trace.
+    """
+
+    if not enabled:
+        yield None
+        return
+    outer = _current_trace.get()
+    if outer is not None:
+        yield outer
+        return
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
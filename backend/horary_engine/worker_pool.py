@@ -0,0 +1,227 @@
+"""Process pool running horary judgments on several cores.
+
+Judgment is pure-Python CPU work, so threads serialise on the GIL. With
+``worker_pool.enabled`` the API hands each request to a pool of worker
+processes instead. Every worker builds its own :class:`HoraryEngine` once (in
+the pool initializer), loads the configuration and touches the Swiss
+Ephemeris, so requests only pay for the judgment itself.
+
+Work is shipped as ``(question, settings)`` with the plain ``judge`` settings
+dictionary, never as Flask objects, and results come back as the usual
+judgment dictionaries. If a worker dies the pool is rebuilt and the request is
+retried once.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from horary_config import cfg
+
+
+logger = logging.getLogger(__name__)
+
+# Engine owned by a worker process, created by ``_init_worker``
+_worker_engine = None
+
+
+def _init_worker() -> None:
+    """Pool initializer: build and warm this process's engine."""
+
+    global _worker_engine
+    import swisseph as swe
+
+    try:
+        from .engine import HoraryEngine
+    except ImportError:  # pragma: no cover - fallback when executed as script
+        from horary_engine.engine import HoraryEngine
+
+    cfg()
+    _worker_engine = HoraryEngine()
+    swe.calc_ut(2451545.0, swe.SUN, swe.FLG_SWIEPH | swe.FLG_SPEED)
+    # Worker chatter would otherwise duplicate the parent's request logging
+    logging.getLogger("horary_engine").setLevel(logging.WARNING)
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _judge_in_worker(question: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_engine.judge(question, settings)
+
+
+def _judge_fast_in_worker(question: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_engine.judge_fast(question, settings)
+
+
+def _judge_batch_in_worker(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _worker_engine.judge_batch(records)
+
+
+def _shared_work_key(record: Dict[str, Any]) -> Tuple:
+    """Records with equal keys share their geocode, moment and chart in ``judge_batch``."""
+
+    settings = record.get("settings") or {}
+    if settings.get("use_current_time", True):
+        return (settings.get("location"), True)
+    return (settings.get("location"), False, settings.get("date"), settings.get("time"), settings.get("timezone"))
+
+
+class JudgmentPool:
+    """Pool of worker processes each holding a warmed :class:`HoraryEngine`.
+
+    Parameters
+    ----------
+    workers:
+        Number of processes; defaults to the CPU count.
+    max_tasks_per_child:
+        Recycle a worker after this many tasks (``None`` keeps them).
+    start_method:
+        ``multiprocessing`` start method. ``spawn`` (the default) gives each
+        worker a clean interpreter, which is the safe choice inside a threaded
+        web server.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        self.workers = int(workers or os.cpu_count() or 1)
+        self.max_tasks_per_child = max_tasks_per_child
+        self._context = multiprocessing.get_context(start_method)
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+        self.restarts = 0
+
+    @classmethod
+    def from_config(cls) -> "JudgmentPool":
+        """Build a pool from the ``worker_pool`` configuration section."""
+
+        config = cfg().worker_pool
+        return cls(
+            workers=config.workers,
+            max_tasks_per_child=config.max_tasks_per_child,
+            start_method=config.start_method,
+        )
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        kwargs = {}
+        if self.max_tasks_per_child and self._context.get_start_method() != "fork":
+            kwargs["max_tasks_per_child"] = int(self.max_tasks_per_child)
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self._context,
+            initializer=_init_worker,
+            **kwargs,
+        )
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        with self._lock:
+            # Several callers may notice the same crash; rebuild only once
+            if self._executor is broken:
+                logger.warning("Judgment worker died; restarting the process pool")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+                self.restarts += 1
+
+    def _run_all(self, fn, argument_lists: List[tuple], timeout: Optional[float] = None) -> List[Any]:
+        """Run ``fn(*args)`` for each argument tuple, retrying once after a crash."""
+
+        for attempt in range(2):
+            executor = self._executor
+            try:
+                futures = [executor.submit(fn, *args) for args in argument_lists]
+                return [future.result(timeout=timeout) for future in futures]
+            except BrokenProcessPool:
+                self._restart(executor)
+                if attempt:
+                    raise
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def warm(self) -> List[int]:
+        """Start every worker now (running its initializer) and return their pids."""
+
+        return sorted(set(self._run_all(_worker_ready, [()] * self.workers * 2)))
+
+    def submit(self, question: str, settings: Dict[str, Any]) -> Future:
+        """Queue one judgment and return its future (no crash retry)."""
+
+        return self._executor.submit(_judge_in_worker, question, settings)
+
+    def judge(self, question: str, settings: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Judge one question in a worker process, as ``HoraryEngine.judge``."""
+
+        return self._run_all(_judge_in_worker, [(question, settings)], timeout=timeout)[0]
+
+    def judge_fast(self, question: str, settings: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Verdict-only judgment in a worker process, as ``HoraryEngine.judge_fast``."""
+
+        return self._run_all(_judge_fast_in_worker, [(question, settings)], timeout=timeout)[0]
+
+    def judge_batch(self, records: List[Dict[str, Any]], timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Spread ``HoraryEngine.judge_batch`` records across the workers.
+
+        Records are grouped by location and moment first, so every record
+        that can share a chart lands in the same worker, and the groups are
+        dealt out largest first to the least loaded chunk. Results keep the
+        input order.
+        """
+
+        if not records:
+            return []
+        groups: Dict[Tuple, List[int]] = {}
+        for index, record in enumerate(records):
+            groups.setdefault(_shared_work_key(record), []).append(index)
+
+        chunks: List[List[int]] = [[] for _ in range(min(self.workers, len(groups)))]
+        for indices in sorted(groups.values(), key=len, reverse=True):
+            min(chunks, key=len).extend(indices)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(records)
+        chunk_results = self._run_all(
+            _judge_batch_in_worker, [([records[i] for i in chunk],) for chunk in chunks], timeout=timeout)
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            for index, result in zip(chunk, chunk_result):
+                results[index] = result
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_pool: Optional[JudgmentPool] = None
+_pool_lock = threading.Lock()
+
+
+def worker_pool_enabled() -> bool:
+    return bool(getattr(getattr(cfg(), "worker_pool", None), "enabled", False))
+
+
+def get_judgment_pool() -> JudgmentPool:
+    """Return the process-wide judgment pool, starting it on first use."""
+
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = JudgmentPool.from_config()
+    return _pool
+
+
+def shutdown_judgment_pool() -> None:
+    """Stop the shared pool (if started)."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+            _pool = None
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Replay recorded chart requests against the API at a fixed rate.
+
+Record traffic by setting ``replay.record_path`` in ``horary_constants.yaml``
+(see ``horary_engine/replay.py``), or turn any JSON Lines file of
+``/api/calculate-chart`` payloads into a corpus with ``sanitize``. Then:
+
+    python load_test.py serve --port 5001                   # offline server, stub geocoder
+    python load_test.py replay corpus.jsonl --url http://127.0.0.1:5001 \\
+        --rps 20 --concurrency 8 --requests 500 --out report.json
+
+Requests are sent open-loop: request ``i`` is due at ``i / rps`` seconds
+after the start whatever happened to earlier ones, and its latency is
+measured from that due time, so a saturated server shows up as growing
+latency rather than as a quietly lower send rate. ``service_ms`` is the
+time from actually sending to the response. The corpus is replayed in file
+order (cycling if more requests are asked for), so runs are repeatable.
+"""
+
+import argparse
+import json
+import logging
+import socket
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from horary_engine.replay import load_corpus, sanitize_payload
+
+
+def _send(url: str, payload: Dict[str, Any], timeout: float, due: float) -> Dict[str, Any]:
+    body = json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    sent = time.perf_counter()
+    judgment = None
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            result = json.loads(response.read() or b"{}")
+        outcome = "ok"
+        judgment = result.get("judgment")
+    except urllib.error.HTTPError as e:
+        outcome = f"HTTP{e.code}"
+    except (socket.timeout, TimeoutError):
+        outcome = "timeout"
+    except urllib.error.URLError as e:
+        outcome = "timeout" if isinstance(e.reason, (socket.timeout, TimeoutError)) else "connection"
+    except ValueError:
+        outcome = "bad_response"
+    done = time.perf_counter()
+    return {
+        "outcome": outcome,
+        "judgment": judgment,
+        "latency_ms": (done - due) * 1000.0,
+        "service_ms": (done - sent) * 1000.0,
+    }
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def rank(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {
+        "mean": round(statistics.fmean(ordered), 3),
+        "p50": rank(0.50),
+        "p90": rank(0.90),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def replay(payloads: List[Dict[str, Any]], url: str, rps: float = 5.0, concurrency: int = 4,
+           requests: Optional[int] = None, timeout: float = 30.0) -> Dict[str, Any]:
+    """Send ``requests`` payloads (default: the corpus once) at ``rps`` and report.
+
+    Returns throughput, latency percentiles (ms, successful requests only),
+    an error breakdown by type and the judgments returned.
+    """
+
+    if not payloads:
+        raise ValueError("Replay corpus is empty")
+    if rps <= 0 or concurrency < 1:
+        raise ValueError("rps must be positive and concurrency at least 1")
+    total = len(payloads) if requests is None else int(requests)
+    endpoint = url.rstrip("/")
+    if not endpoint.endswith("/api/calculate-chart"):
+        endpoint += "/api/calculate-chart"
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="replay") as pool:
+        futures = []
+        for i in range(total):
+            due = start + i / rps
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(pool.submit(_send, endpoint, payloads[i % len(payloads)], timeout, due))
+        results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    ok = [r for r in results if r["outcome"] == "ok"]
+    return {
+        "url": endpoint,
+        "requests": total,
+        "concurrency": concurrency,
+        "target_rps": rps,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(ok) / elapsed, 3) if elapsed else 0.0,
+        "succeeded": len(ok),
+        "errors": dict(Counter(r["outcome"] for r in results if r["outcome"] != "ok")),
+        "error_rate": round((total - len(ok)) / total, 4) if total else 0.0,
+        "latency_ms": _summary([r["latency_ms"] for r in ok]),
+        "service_ms": _summary([r["service_ms"] for r in ok]),
+        "judgments": dict(Counter(str(r["judgment"]) for r in ok)),
+    }
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['requests']} requests to {report['url']} in {report['duration_s']:.1f}s "
+          f"(target {report['target_rps']:g} rps, concurrency {report['concurrency']})")
+    print(f"  throughput {report['throughput_rps']:.2f} rps, "
+          f"{report['succeeded']} ok, error rate {report['error_rate']:.1%}")
+    for label in ("latency_ms", "service_ms"):
+        stats = report[label]
+        if stats:
+            print(f"  {label:10} p50 {stats['p50']:9.1f}  p90 {stats['p90']:9.1f}  "
+                  f"p99 {stats['p99']:9.1f}  max {stats['max']:9.1f}")
+    for outcome, count in sorted(report["errors"].items()):
+        print(f"  error {outcome}: {count}")
+
+
+def _serve(host: str, port: int, record_path: Optional[str]) -> None:
+    from horary_config import cfg
+
+    config = cfg()
+    config.geocoding.provider = "stub"
+    config.replay.record_path = record_path
+
+    from werkzeug.serving import run_simple
+    from app import app
+
+    print(f"Serving offline (stub geocoder) on http://{host}:{port}")
+    run_simple(host, port, app, threaded=True, use_reloader=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record-and-replay load generator for /api/calculate-chart")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("replay", help="Replay a corpus against a running server")
+    run.add_argument("corpus", help="JSON Lines file of chart request payloads")
+    run.add_argument("--url", default="http://127.0.0.1:5000", help="Server base URL")
+    run.add_argument("--rps", type=float, default=5.0, help="Target requests per second")
+    run.add_argument("--concurrency", type=int, default=4, help="Maximum requests in flight")
+    run.add_argument("--requests", type=int, help="Requests to send (default: corpus size)")
+    run.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    run.add_argument("--out", help="Write the report JSON here")
+
+    sanitize = commands.add_parser("sanitize", help="Sanitize a JSON Lines file of payloads into a corpus")
+    sanitize.add_argument("source")
+    sanitize.add_argument("out")
+
+    serve = commands.add_parser("serve", help="Run the Flask API offline with the stub geocoder")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=5000)
+    serve.add_argument("--record", help="Also record sanitized requests to this file")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command == "serve":
+        _serve(args.host, args.port, args.record)
+        return 0
+
+    if args.command == "sanitize":
+        payloads = load_corpus(args.source)
+        with open(args.out, "w", encoding="utf-8") as f:
+            for payload in payloads:
+                f.write(json.dumps(sanitize_payload(payload), ensure_ascii=False, sort_keys=True) + "\n")
+        print(f"Wrote {len(payloads)} payloads to {args.out}")
+        return 0
+
+    report = replay(load_corpus(args.corpus), args.url, args.rps, args.concurrency, args.requests, args.timeout)
+    _print_report(report)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0 if report["succeeded"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 import datetime
 import logging
 from horary_config import cfg
@@ -135,6 +135,63 @@ class Significator:
     role: str  # "querent", "quesited", etc.
 
 
+class Deferred:
+    """A chart value computed the first time it is read (see :class:`LazyField`).
+
+    The result is kept on the ``Deferred`` itself, so shallow copies of a
+    chart (e.g. charts served from the chart cache) share one computation.
+    """
+
+    __slots__ = ("_compute", "_value")
+
+    _PENDING = object()
+
+    def __init__(self, compute: Callable[[], Any]) -> None:
+        self._compute = compute
+        self._value = self._PENDING
+
+    @property
+    def resolved(self) -> bool:
+        return self._value is not self._PENDING
+
+    def resolve(self) -> Any:
+        if self._value is self._PENDING:
+            self._value = self._compute()
+            self._compute = None
+        return self._value
+
+
+class LazyField:
+    """Dataclass field descriptor that resolves :class:`Deferred` values on access.
+
+    Assigning a plain value works as for any field; assigning a ``Deferred``
+    postpones the computation until the attribute is first read.
+    """
+
+    def __init__(self, default: Any = None) -> None:
+        self.default = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attribute = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self.default
+        value = obj.__dict__.get(self.attribute, self.default)
+        if type(value) is Deferred:
+            return value.resolve()
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.attribute] = value
+
+    def is_pending(self, obj: Any) -> bool:
+        """Whether ``obj`` holds a ``Deferred`` that has not been computed yet."""
+
+        value = obj.__dict__.get(self.attribute)
+        return type(value) is Deferred and not value.resolved
+
+
 @dataclass
 class HoraryChart:
     date_time: datetime.datetime
@@ -148,8 +205,22 @@ class HoraryChart:
     house_rulers: Dict[int, Planet]  # Which planet rules each house
     ascendant: float
     midheaven: float
+    # ``aspects``, ``solar_analyses`` and the planets' dignities stay eager:
+    # every judgment (``judge_fast`` included) reads all three, the aspects
+    # through the analysis context and the solar analyses for combustion,
+    # and the dignities are plain ``PlanetPosition`` fields scored from the
+    # solar analysis, so deferring them would add indirection but save nothing
     solar_analyses: Optional[Dict[Planet, SolarAnalysis]] = None
     julian_day: float = 0.0
-    moon_last_aspect: Optional[LunarAspect] = None
-    moon_next_aspect: Optional[LunarAspect] = None
+    # Read by the Moon's story, the serialized chart and only some judgment
+    # paths, so the calculator supplies them as Deferred values
+    moon_last_aspect: Optional[LunarAspect] = LazyField()
+    moon_next_aspect: Optional[LunarAspect] = LazyField()
+    # Ephemeris Moon speed (degrees/day) from the chart calculation, read by
+    # the lunar aspects and the judgment; None for charts built elsewhere
+    moon_speed: Optional[float] = field(default=None, repr=False, compare=False)
+    # Lazily filled by TraditionalReceptionCalculator (see reception.ReceptionMatrix)
+    reception_matrix: Optional[object] = field(default=None, repr=False, compare=False)
+    # Lazily filled by horary_engine.analysis_context.get_analysis_context
+    analysis_context: Optional[object] = field(default=None, repr=False, compare=False)
 
@@ -1,4 +1,5 @@
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Iterable, List, NamedTuple, Optional, Pattern, Tuple
 import re
 import logging
 
@@ -10,6 +11,262 @@ except ImportError:  # pragma: no cover - fallback for script execution
 logger = logging.getLogger(__name__)
 
 
+# Keyword tables of the analyzer helpers. Keywords are matched as substrings
+# (``keyword in question``) unless listed as whole words (``\bword\b``).
+TRANSACTION_WORDS = ("sell", "buy", "purchase", "sale", "profit", "gain", "lose", "cost", "price", "payment", "trade", "exchange", "loan")
+POSSESSION_WORDS = ("car", "house", "vehicle", "property", "possessions", "belongings", "assets", "furniture", "jewelry", "valuables")
+PARTNER_WORDS = ("partner", "spouse", "husband", "wife", "boyfriend", "girlfriend", "relationship")
+HEALING_WORDS = ("heal", "healing", "therapy", "therapist", "mature", "maturity", "growth", "grow")
+EDUCATION_INDICATORS = ("exam", "test", "student", "school", "college", "university", "pass", "graduate")
+LEGAL_INDICATORS = ("court", "lawsuit", "judge", "trial", "litigation", "case")
+
+SALE_INDICATORS = ("sell", "buy", "sale", "purchase", "trade")
+POSSESSION_INDICATORS = ("property", "money", "possessions", "belongings", "assets")
+# Whole words naming whose possessions are asked about
+PARTNER_POSSESSIVE_WORDS = ("his", "her", "husband", "wife", "spouse")
+FATHER_WORDS = ("father", "dad")
+MOTHER_WORDS = ("mother", "mom")
+QUERENT_WORDS = ("my", "i", "will i")
+
+# Traditional Natural Significators (from Lilly, Bonatti, etc.)
+NATURAL_SIGNIFICATORS = {
+    # Vehicles & Transportation
+    "vehicles": {
+        "keywords": ["car", "vehicle", "automobile", "truck", "motorcycle", "bike"],
+        "significator": "sun",  # Sun = valuable possessions, status symbols
+        "category": Category.VEHICLE,
+    },
+
+    # Real Estate
+    "real_estate": {
+        "keywords": ["house", "home", "property", "building", "land", "estate"],
+        "significator": "moon",  # Moon = home, real estate (4th house connection)
+        "category": Category.PROPERTY,
+    },
+
+    # Precious Items
+    "precious_items": {
+        "keywords": ["jewelry", "gold", "silver", "diamond", "ring", "watch", "precious"],
+        "significator": "venus",  # Venus = luxury items, beauty, value
+        "category": Category.PRECIOUS,
+    },
+
+    # Technology
+    "technology": {
+        "keywords": ["computer", "phone", "laptop", "electronics", "device", "gadget"],
+        "significator": "mercury",  # Mercury = communication, technology
+        "category": Category.TECHNOLOGY,
+    },
+
+    # Livestock & Animals
+    "livestock": {
+        "keywords": ["horse", "cattle", "cow", "livestock", "animal"],
+        "significator": "mars",  # Mars = large animals (traditional)
+        "category": Category.LIVESTOCK,
+    },
+
+    # Boats & Ships
+    "maritime": {
+        "keywords": ["boat", "ship", "yacht", "vessel"],
+        "significator": "moon",  # Moon = water-related items
+        "category": Category.MARITIME,
+    },
+}
+
+LONG_DISTANCE_KEYWORDS = (
+    "far", "foreign", "abroad", "overseas", "international",
+    "long-distance", "long distance", "long-term", "extended",
+    "distant", "vacation", "holiday", "cruise", "pilgrimage",
+)
+FUNDING_FROM_OTHERS_WORDS = ("secure", "get", "receive", "obtain", "raise", "from investors", "investor", "vc", "angel")
+OWN_FUNDING_WORDS = ("my funding", "our funding", "have enough", "sufficient capital")
+DEBT_WORDS = ("debt", "loan", "owe", "borrow")
+FRIEND_WORDS = ("friend", "ally")
+# Whole words pointing at another person
+OTHER_PERSON_WORDS = ("other", "they", "he", "she", "person", "someone")
+
+POST_EVENT_WORDS = ("just", "already")
+_POST_EVENT = re.compile(r"(just|already)\s+(took|did|submitted|happened)")
+
+# Strong 3rd person indicators, in order of precedence
+THIRD_PERSON_PATTERNS = (
+    # Direct pronouns
+    r"\bwill he\b", r"\bwill she\b", r"\bwill they\b",
+    r"\bdid he\b", r"\bdid she\b",
+    r"\bhas he\b", r"\bhas she\b",
+    r"\bdoes he\b", r"\bdoes she\b",
+    r"\bcan he\b", r"\bcan she\b",
+    r"\bshould he\b", r"\bshould she\b",
+    r"\bis he\b", r"\bis she\b", r"\bis they\b",
+    # Possessives
+    r"\bhis\b", r"\bher\b", r"\btheir\b",
+    # Specific relationships
+    r"the student", r"my student", r"the teacher", r"my friend", r"my partner", r"my husband",
+    r"my wife", r"my child", r"my son", r"my daughter", r"the patient", r"my client",
+    # Question about someone else
+    r"asked by his", r"asked by her", r"asked by the",
+)
+TEACHER_PHRASES = ("asked by his teacher", "asked by her teacher", "asked by the teacher")
+
+MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+TIMEFRAME_PATTERNS = {
+    "this_month": (r"this month", r"by the end of this month", r"within this month"),
+    "next_month": (r"next month", r"by next month"),
+    "this_year": (r"this year", r"by the end of this year", r"within this year"),
+    "this_week": (r"this week", r"by the end of this week", r"within this week"),
+    "today": (r"today", r"by today", r"by the end of today"),
+    "soon": (r"soon", r"quickly", r"fast"),
+    "by_date": (r"by (\w+ \d+)", r"before (\w+ \d+)"),
+    "specific_month": (r"in (" + "|".join(MONTH_NAMES) + ")",),
+    # NEW: Numeric timeframes
+    "within_days": (r"within (\d+) days?", r"in (\d+) days?"),
+    "within_weeks": (r"within (\d+) weeks?", r"in (\d+) weeks?"),
+    "within_months": (r"within (\d+) months?", r"in (\d+) months?"),
+    "by_numeric_date": (r"by (\d{4}-\d{2}-\d{2})", r"before (\d{4}-\d{2}-\d{2})"),
+}
+
+_PLAIN = re.compile(r"[\w ]+")
+_WORD = re.compile(r"\w+")
+_DIGIT = re.compile(r"\d")
+
+
+def _plain_keyword(pattern: str) -> Optional[Tuple[str, bool]]:
+    """``(keyword, whole_word)`` for a pattern that is plain text, optionally
+    between ``\\b`` anchors; ``None`` for any other regex."""
+
+    whole_word = len(pattern) > 4 and pattern.startswith(r"\b") and pattern.endswith(r"\b")
+    text = pattern[2:-2] if whole_word else pattern
+    if _PLAIN.fullmatch(text):
+        return text, whole_word
+    return None
+
+
+# Each timeframe pattern as (plain keyword or None, compiled regex or None)
+_TIMEFRAME_MATCHERS: Dict[str, Tuple[Tuple[Optional[str], Optional[Pattern]], ...]] = {
+    timeframe_type: tuple(
+        (pattern, None) if _plain_keyword(pattern) else (None, re.compile(pattern, re.IGNORECASE))
+        for pattern in patterns
+    )
+    for timeframe_type, patterns in TIMEFRAME_PATTERNS.items()
+}
+_SPECIFIC_MONTH = _TIMEFRAME_MATCHERS["specific_month"][0][1]
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex alternation of ``keywords`` factored into a prefix tree.
+
+    Branches start with distinct characters and the continuation after a
+    complete keyword is an optional greedy group, so the match at a position
+    is the longest keyword starting there.
+    """
+
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordIndex:
+    """Fixed keyword vocabulary compiled for a single pass over a text.
+
+    The text is split on whitespace once. A keyword made of word characters
+    only lies inside one token, so each distinct token is matched against all
+    such keywords with one prefix-tree alternation inside a lookahead:
+    ``finditer`` stops at every position where a keyword starts and reports
+    the longest one, and any other keyword starting there is a prefix of it.
+    Token results are cached, as questions share most of their words.
+    Keywords with spaces or punctuation are checked against the full text,
+    and only when each of their words was found.
+
+    :meth:`scan` thus reports exactly the keywords for which ``keyword in
+    text`` holds, and among them those for which ``re.search(r"\\bkeyword\\b",
+    text)`` would match.
+
+    Parameters
+    ----------
+    keywords:
+        Keywords to look for (case-sensitive).
+    cache_size:
+        Number of distinct tokens whose matches are kept.
+    """
+
+    def __init__(self, keywords: Iterable[str], cache_size: int = 4096) -> None:
+        vocabulary = sorted(set(keywords))
+        self.keywords: FrozenSet[str] = frozenset(vocabulary)
+        self._single_words = frozenset(keyword for keyword in vocabulary if _WORD.fullmatch(keyword))
+
+        # Phrases by their first word ("" for phrases without one)
+        self._phrases: Dict[str, List[Tuple[str, Tuple[str, ...], Pattern]]] = {}
+        for keyword in vocabulary:
+            if keyword not in self._single_words:
+                pieces = tuple(_WORD.findall(keyword))
+                bounded = re.compile(r"\b" + re.escape(keyword) + r"\b")
+                self._phrases.setdefault(pieces[0] if pieces else "", []).append((keyword, pieces, bounded))
+        self._phrase_heads = frozenset(self._phrases)
+
+        words = sorted(self._single_words.union(*(
+            pieces for phrases in self._phrases.values() for _, pieces, _ in phrases
+        )))
+        self._pattern = re.compile("(?=(" + _trie_pattern(words) + "))")
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            word: tuple(other for other in words if word.startswith(other)) for word in words
+        }
+        self._match_token = lru_cache(maxsize=cache_size)(self._token_keywords)
+
+    def _token_keywords(self, token: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Words found in ``token`` (whitespace-free), and those that are whole words in it."""
+
+        found = set()
+        for match in self._pattern.finditer(token):
+            found.update(self._prefixes[match.group(1)])
+        return frozenset(found), self._single_words.intersection(_WORD.findall(token))
+
+    def scan(self, text: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Keywords occurring in ``text``, and those occurring as whole words."""
+
+        found = set()
+        whole_words = set()
+        for token in set(text.split()):
+            token_found, token_words = self._match_token(token)
+            found |= token_found
+            whole_words |= token_words
+
+        heads = self._phrase_heads.intersection(found)
+        if "" in self._phrase_heads:
+            heads.add("")
+        for head in heads:
+            for phrase, pieces, bounded in self._phrases[head]:
+                if found.issuperset(pieces) and phrase in text:
+                    found.add(phrase)
+                    if bounded.search(text):
+                        whole_words.add(phrase)
+        return self.keywords.intersection(found), frozenset(whole_words)
+
+
+class QuestionScan(NamedTuple):
+    """Keyword hits of one question, shared by the analyzer helpers."""
+
+    found: FrozenSet[str]  # keyword in question
+    words: FrozenSet[str]  # re.search(r"\bkeyword\b", question)
+    folded_found: FrozenSet[str]  # as ``found``, ignoring case
+    folded_words: FrozenSet[str]  # as ``words``, ignoring case
+    has_digit: bool
+
+
 class TraditionalHoraryQuestionAnalyzer:
     """Analyze questions using traditional horary house assignments"""
     
@@ -70,7 +327,67 @@ class TraditionalHoraryQuestionAnalyzer:
             5: ["child", "son", "daughter", "baby"],
             11: ["friend", "ally", "benefactor"]
         }
-    
+
+        self._compile_keywords()
+
+    def _compile_keywords(self) -> None:
+        """Compile every keyword the helpers test into one :class:`KeywordIndex`.
+
+        Short category keywords (three letters or less) only count as whole
+        words, matched ignoring case like the time frame patterns.
+        """
+
+        self._category_keywords = tuple(
+            (
+                q_type,
+                tuple((keyword, len(keyword) <= 3) for keyword in keywords),
+                frozenset(keyword for keyword in keywords if len(keyword) <= 3),
+                frozenset(keyword for keyword in keywords if len(keyword) > 3),
+            )
+            for q_type, keywords in self.question_patterns.items()
+        )
+        third_person = [_plain_keyword(pattern) for pattern in THIRD_PERSON_PATTERNS]
+        self._third_person = tuple(zip(THIRD_PERSON_PATTERNS, third_person))
+        timeframe = [keyword for matchers in _TIMEFRAME_MATCHERS.values() for keyword, _ in matchers if keyword]
+        timeframe += MONTH_NAMES
+
+        # Keywords matched ignoring case; regexes for questions that are not ASCII
+        folded = [keyword for _, _, short_words, _ in self._category_keywords for keyword in short_words]
+        self._folded_patterns = tuple(
+            (keyword, whole_word, re.compile(r"\b" + re.escape(keyword) + r"\b" if whole_word else re.escape(keyword), re.IGNORECASE))
+            for keywords, whole_word in ((folded, True), (timeframe, False))
+            for keyword in keywords
+        )
+
+        vocabulary = [keyword for keywords in self.question_patterns.values() for keyword in keywords]
+        vocabulary += [keyword for keywords in self.house_meanings.values() for keyword in keywords]
+        vocabulary += [keyword for info in NATURAL_SIGNIFICATORS.values() for keyword in info["keywords"]]
+        vocabulary += [keyword for keyword, _ in third_person] + timeframe
+        for keywords in (
+            TRANSACTION_WORDS, POSSESSION_WORDS, PARTNER_WORDS, HEALING_WORDS, EDUCATION_INDICATORS,
+            LEGAL_INDICATORS, SALE_INDICATORS, POSSESSION_INDICATORS, PARTNER_POSSESSIVE_WORDS, FATHER_WORDS,
+            MOTHER_WORDS, QUERENT_WORDS, LONG_DISTANCE_KEYWORDS, FUNDING_FROM_OTHERS_WORDS, OWN_FUNDING_WORDS,
+            DEBT_WORDS, FRIEND_WORDS, OTHER_PERSON_WORDS, POST_EVENT_WORDS, TEACHER_PHRASES,
+        ):
+            vocabulary += keywords
+        self._keywords = KeywordIndex(vocabulary)
+        # Helpers called for the same question share one scan
+        self._scan = lru_cache(maxsize=256)(self._scan_question)
+
+    def _scan_question(self, question: str) -> QuestionScan:
+        """Match the whole keyword vocabulary against ``question`` once."""
+
+        found, words = self._keywords.scan(question)
+        if not question.isascii():
+            # Case folding may pair non-ASCII letters with ASCII ones (e.g. "ſ" and "s")
+            folded_found = frozenset(k for k, whole, rx in self._folded_patterns if not whole and rx.search(question))
+            folded_words = frozenset(k for k, whole, rx in self._folded_patterns if whole and rx.search(question))
+        elif question.lower() == question:
+            folded_found, folded_words = found, words
+        else:
+            folded_found, folded_words = self._keywords.scan(question.lower())
+        return QuestionScan(found, words, folded_found, folded_words, _DIGIT.search(question) is not None)
+
     def _turn(self, base: int, offset: int) -> int:
         """Return the house offset steps from base (1-based)."""
         return ((base + offset - 1) % 12) + 1
@@ -79,34 +396,27 @@ class TraditionalHoraryQuestionAnalyzer:
     
     def _parse_question_timeframe(self, question: str) -> Dict[str, Any]:
         """Parse timeframe constraints from question text"""
-        import re
         from datetime import datetime, timedelta
         import calendar
-        
-        timeframe_patterns = {
-            "this_month": [r"this month", r"by the end of this month", r"within this month"],
-            "next_month": [r"next month", r"by next month"],
-            "this_year": [r"this year", r"by the end of this year", r"within this year"], 
-            "this_week": [r"this week", r"by the end of this week", r"within this week"],
-            "today": [r"today", r"by today", r"by the end of today"],
-            "soon": [r"soon", r"quickly", r"fast"],
-            "by_date": [r"by (\w+ \d+)", r"before (\w+ \d+)"],
-            "specific_month": [
-                r"in (january|february|march|april|may|june|july|august|september|october|november|december)"
-            ],
-            # NEW: Numeric timeframes
-            "within_days": [r"within (\d+) days?", r"in (\d+) days?"],
-            "within_weeks": [r"within (\d+) weeks?", r"in (\d+) weeks?"],
-            "within_months": [r"within (\d+) months?", r"in (\d+) months?"],
-            "by_numeric_date": [r"by (\d{4}-\d{2}-\d{2})", r"before (\d{4}-\d{2}-\d{2})"],
-        }
-        
+
+        scan = self._scan(question)
         detected_timeframes = []
         numeric_extracts = {}  # Store captured numeric values
-        
-        for timeframe_type, patterns in timeframe_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, question, re.IGNORECASE)
+
+        for timeframe_type, matchers in _TIMEFRAME_MATCHERS.items():
+            for keyword, regex in matchers:
+                if keyword is not None:
+                    if keyword in scan.folded_found:
+                        detected_timeframes.append(timeframe_type)
+                        break
+                    continue
+                # Patterns with a digit class cannot match without a digit, nor
+                # a month pattern without a month name
+                if not scan.has_digit and r"\d" in regex.pattern:
+                    continue
+                if timeframe_type == "specific_month" and scan.folded_found.isdisjoint(MONTH_NAMES):
+                    continue
+                match = regex.search(question)
                 if match:
                     detected_timeframes.append(timeframe_type)
                     # Extract numeric values for numeric patterns
@@ -159,9 +469,7 @@ class TraditionalHoraryQuestionAnalyzer:
             window_days = 1
         elif "specific_month" in detected_timeframes:
             # End of referenced month in current year
-            match = re.search(
-                timeframe_patterns["specific_month"][0], question, re.IGNORECASE
-            )
+            match = _SPECIFIC_MONTH.search(question)
             if match:
                 month_str = match.group(1).lower()
                 month_numbers = {
@@ -199,10 +507,11 @@ class TraditionalHoraryQuestionAnalyzer:
         """Analyze question to determine significators using traditional methods"""
 
         question_lower = question.lower()
+        scan = self._scan(question_lower)
 
         # Detect post-event phrasing (e.g., "just took", "already did")
-        post_event = bool(
-            re.search(r"(just|already)\s+(took|did|submitted|happened)", question_lower)
+        post_event = not scan.found.isdisjoint(POST_EVENT_WORDS) and bool(
+            _POST_EVENT.search(question_lower)
         )
 
         # ENHANCEMENT: Detect 3rd person questions requiring house turning
@@ -246,31 +555,12 @@ class TraditionalHoraryQuestionAnalyzer:
     
     def _detect_third_person_question(self, question: str) -> Dict[str, Any]:
         """Detect if question is about someone else requiring house turning"""
-        
-        import re
-
-        # Strong 3rd person indicators
-        third_person_patterns = [
-            # Direct pronouns
-            r"\bwill he\b", r"\bwill she\b", r"\bwill they\b",
-            r"\bdid he\b", r"\bdid she\b",
-            r"\bhas he\b", r"\bhas she\b",
-            r"\bdoes he\b", r"\bdoes she\b",
-            r"\bcan he\b", r"\bcan she\b",
-            r"\bshould he\b", r"\bshould she\b",
-            r"\bis he\b", r"\bis she\b", r"\bis they\b",
-            # Possessives
-            r"\bhis\b", r"\bher\b", r"\btheir\b",
-            # Specific relationships
-            r"the student", r"my student", r"the teacher", r"my friend", r"my partner", r"my husband",
-            r"my wife", r"my child", r"my son", r"my daughter", r"the patient", r"my client",
-            # Question about someone else
-            r"asked by his", r"asked by her", r"asked by the",
-        ]
+
+        scan = self._scan(question)
 
         # Context clues that suggest 3rd person
-        for pattern in third_person_patterns:
-            if re.search(pattern, question):
+        for pattern, (keyword, whole_word) in self._third_person:
+            if keyword in (scan.words if whole_word else scan.found):
                 return {
                     "is_third_person": True,
                     "subject_house": 7,  # The other person = 7th house
@@ -279,7 +569,7 @@ class TraditionalHoraryQuestionAnalyzer:
                 }
         
         # Educational context: teacher asking about student
-        if any(x in question for x in ["asked by his teacher", "asked by her teacher", "asked by the teacher"]):
+        if not scan.found.isdisjoint(TEACHER_PHRASES):
             return {
                 "is_third_person": True,
                 "subject_house": 7,  # Student = 7th house from teacher's perspective
@@ -299,9 +589,10 @@ class TraditionalHoraryQuestionAnalyzer:
         
         # CRITICAL FIX: Distinguish between SALE TRANSACTIONS and POSSESSION questions
         
+        scan = self._scan(question_lower)
+
         # SALE/TRANSACTION questions (will X sell Y?) use natural significators
-        sale_indicators = ["sell", "buy", "sale", "purchase", "trade"]
-        if any(word in question_lower for word in sale_indicators):
+        if not scan.found.isdisjoint(SALE_INDICATORS):
             # Detect valuable items using traditional natural significators
             natural_significator = self._detect_natural_significator(question_lower)
 
@@ -317,19 +608,18 @@ class TraditionalHoraryQuestionAnalyzer:
                 return {"type": Category.MONEY, "houses": [1, 7]}
         
         # POSSESSION questions (does X own Y?) use house derivation
-        possession_indicators = ["property", "money", "possessions", "belongings", "assets"]
-        if any(word in question_lower for word in possession_indicators):
+        if not scan.found.isdisjoint(POSSESSION_INDICATORS):
             # Determine whose possessions - check for other people first, then default to querent
-            if re.search(r"\b(his|her|husband|wife|spouse)\b", question_lower):
+            if not scan.words.isdisjoint(PARTNER_POSSESSIVE_WORDS):
                 # Partner's possessions = 8th house (2nd from 7th)
                 return {"type": Category.MONEY, "houses": [1, 7, 8]}  # Querent + partner + partner's possessions
-            elif re.search(r"\b(father|dad)\b", question_lower):
+            elif not scan.words.isdisjoint(FATHER_WORDS):
                 # Father's possessions = 5th house (2nd from 4th)
                 return {"type": Category.MONEY, "houses": [1, 4, 5]}
-            elif re.search(r"\b(mother|mom)\b", question_lower):
+            elif not scan.words.isdisjoint(MOTHER_WORDS):
                 # Mother's possessions = 11th house (2nd from 10th)
                 return {"type": Category.MONEY, "houses": [1, 10, 11]}
-            elif re.search(r"\b(my|i|will i)\b", question_lower):
+            elif not scan.words.isdisjoint(QUERENT_WORDS):
                 return {"type": Category.MONEY, "houses": [1, 2]}  # Querent's possessions
             else:
                 # Default: assume querent's possessions if no person specified
@@ -340,55 +630,12 @@ class TraditionalHoraryQuestionAnalyzer:
     def _detect_natural_significator(self, question_lower: str) -> Dict:
         """Detect natural significators based on traditional horary assignments"""
         
-        # Traditional Natural Significators (from Lilly, Bonatti, etc.)
-        natural_significators = {
-            # Vehicles & Transportation
-            "vehicles": {
-                "keywords": ["car", "vehicle", "automobile", "truck", "motorcycle", "bike"],
-                "significator": "sun",  # Sun = valuable possessions, status symbols
-                "category": Category.VEHICLE,
-            },
-
-            # Real Estate
-            "real_estate": {
-                "keywords": ["house", "home", "property", "building", "land", "estate"],
-                "significator": "moon",  # Moon = home, real estate (4th house connection)
-                "category": Category.PROPERTY,
-            },
+        scan = self._scan(question_lower)
 
-            # Precious Items
-            "precious_items": {
-                "keywords": ["jewelry", "gold", "silver", "diamond", "ring", "watch", "precious"],
-                "significator": "venus",  # Venus = luxury items, beauty, value
-                "category": Category.PRECIOUS,
-            },
-
-            # Technology
-            "technology": {
-                "keywords": ["computer", "phone", "laptop", "electronics", "device", "gadget"],
-                "significator": "mercury",  # Mercury = communication, technology
-                "category": Category.TECHNOLOGY,
-            },
-
-            # Livestock & Animals
-            "livestock": {
-                "keywords": ["horse", "cattle", "cow", "livestock", "animal"],
-                "significator": "mars",  # Mars = large animals (traditional)
-                "category": Category.LIVESTOCK,
-            },
-
-            # Boats & Ships
-            "maritime": {
-                "keywords": ["boat", "ship", "yacht", "vessel"],
-                "significator": "moon",  # Moon = water-related items
-                "category": Category.MARITIME,
-            },
-        }
-        
         # Detect which category matches
-        for category, info in natural_significators.items():
-            if any(keyword in question_lower for keyword in info["keywords"]):
-                item_name = next(keyword for keyword in info["keywords"] if keyword in question_lower)
+        for category, info in NATURAL_SIGNIFICATORS.items():
+            if not scan.found.isdisjoint(info["keywords"]):
+                item_name = next(keyword for keyword in info["keywords"] if keyword in scan.found)
                 return {
                     item_name: info["significator"],
                     "category": info["category"],
@@ -400,41 +647,34 @@ class TraditionalHoraryQuestionAnalyzer:
     def _determine_question_type(self, question: str) -> tuple[Category, List[str]]:
         """Enhanced question type determination with transaction and possession priority"""
         
+        scan = self._scan(question)
+        found = scan.found
+
         # PRIORITY 1: Financial transactions override relationship keywords
-        transaction_words = ["sell", "buy", "purchase", "sale", "profit", "gain", "lose", "cost", "price", "payment", "trade", "exchange", "loan"]
-        if any(word in question for word in transaction_words):
-            return Category.MONEY, [word for word in transaction_words if word in question]
+        if not found.isdisjoint(TRANSACTION_WORDS):
+            return Category.MONEY, [word for word in TRANSACTION_WORDS if word in found]
         
         # PRIORITY 2: Possession/property questions override person keywords  
-        possession_words = ["car", "house", "vehicle", "property", "possessions", "belongings", "assets", "furniture", "jewelry", "valuables"]
-        if any(word in question for word in possession_words):
-            return Category.MONEY, [word for word in possession_words if word in question]
+        if not found.isdisjoint(POSSESSION_WORDS):
+            return Category.MONEY, [word for word in POSSESSION_WORDS if word in found]
 
         # PRIORITY 3: Partner healing or maturity questions
-        partner_words = ["partner", "spouse", "husband", "wife", "boyfriend", "girlfriend", "relationship"]
-        healing_words = ["heal", "healing", "therapy", "therapist", "mature", "maturity", "growth", "grow"]
-        if any(p in question for p in partner_words) and any(h in question for h in healing_words):
-            return Category.PARTNER_HEALING, [word for word in healing_words if word in question]
+        if not found.isdisjoint(PARTNER_WORDS) and not found.isdisjoint(HEALING_WORDS):
+            return Category.PARTNER_HEALING, [word for word in HEALING_WORDS if word in found]
 
         # ENHANCED: Priority-based matching to handle overlapping keywords
         # Some words like "paralegal" contain "legal" but should match "education" not "lawsuit"
         
         matches = []
-        for q_type, keywords in self.question_patterns.items():
+        for q_type, keywords, short_words, long_words in self._category_keywords:
             # FIXED: Better word boundary matching to avoid false positives like "ex" in "exam"
-            matched_keywords = []
-            for keyword in keywords:
-                # Use word boundary checks for short words that can cause false positives
-                if len(keyword) <= 3:
-                    # For short words, require word boundaries or specific context
-                    import re
-                    pattern = r'\b' + re.escape(keyword) + r'\b'
-                    if re.search(pattern, question, re.IGNORECASE):
-                        matched_keywords.append(keyword)
-                else:
-                    # For longer words, simple substring matching is usually fine
-                    if keyword in question:
-                        matched_keywords.append(keyword)
+            # Short words need word boundaries (any case); longer ones match as substrings
+            if found.isdisjoint(long_words) and scan.folded_words.isdisjoint(short_words):
+                continue
+            matched_keywords = [
+                keyword for keyword, short in keywords
+                if keyword in (scan.folded_words if short else found)
+            ]
             
             if matched_keywords:
                 matches.append((q_type, matched_keywords))
@@ -460,12 +700,10 @@ class TraditionalHoraryQuestionAnalyzer:
         # If both education and lawsuit match, prefer education for exam/student contexts
         if education_match and lawsuit_match:
             # Check for strong education indicators
-            education_indicators = ["exam", "test", "student", "school", "college", "university", "pass", "graduate"]
-            if any(indicator in question for indicator in education_indicators):
+            if not found.isdisjoint(EDUCATION_INDICATORS):
                 return Category.EDUCATION, education_match[1]
             # Check for strong legal indicators  
-            legal_indicators = ["court", "lawsuit", "judge", "trial", "litigation", "case"]
-            if any(indicator in question for indicator in legal_indicators):
+            if not found.isdisjoint(LEGAL_INDICATORS):
                 return Category.LAWSUIT, lawsuit_match[1]
 
         # Default: return the first match (maintains original behavior for other cases)
@@ -481,12 +719,15 @@ class TraditionalHoraryQuestionAnalyzer:
         possession_analysis = self._analyze_possession_questions(question.lower())
         if possession_analysis:
             return possession_analysis["houses"], possession_analysis
+
+        scan = self._scan(question)
+        found = scan.found
         
         # ENHANCED: Comprehensive house determination
         if question_type == Category.LOST_OBJECT:
             houses.append(2)  # Moveable possessions
 
-        elif question_type == Category.MARRIAGE or "spouse" in question:
+        elif question_type == Category.MARRIAGE or "spouse" in found:
             houses.append(7)  # Marriage/spouse
 
         elif question_type == Category.RELATIONSHIP:
@@ -512,12 +753,7 @@ class TraditionalHoraryQuestionAnalyzer:
 
         elif question_type == Category.TRAVEL:
             # Enhanced long-distance travel detection
-            long_distance_keywords = [
-                "far", "foreign", "abroad", "overseas", "international", 
-                "long-distance", "long distance", "long-term", "extended",
-                "distant", "vacation", "holiday", "cruise", "pilgrimage"
-            ]
-            if any(word in question for word in long_distance_keywords):
+            if not found.isdisjoint(LONG_DISTANCE_KEYWORDS):
                 houses.append(9)  # Long journeys/foreign travel  
             else:
                 houses.append(3)  # Short journeys/local travel
@@ -528,15 +764,15 @@ class TraditionalHoraryQuestionAnalyzer:
                 
         elif question_type == Category.FUNDING:
             # ENHANCED: Funding questions use L2/L8 axis (self resources vs others' money)
-            if any(word in question for word in ["secure", "get", "receive", "obtain", "raise", "from investors", "investor", "vc", "angel"]):
+            if not found.isdisjoint(FUNDING_FROM_OTHERS_WORDS):
                 houses.extend([1, 8])  # L1 = querent, L8 = funding from others/investors
-            elif any(word in question for word in ["my funding", "our funding", "have enough", "sufficient capital"]):
+            elif not found.isdisjoint(OWN_FUNDING_WORDS):
                 houses.extend([1, 2])  # L1 = querent, L2 = self resources
             else:
                 houses.extend([2, 8])  # Default: both self resources and others' money
             
         elif question_type == Category.MONEY:
-            if any(word in question for word in ["debt", "loan", "owe", "borrow"]):
+            if not found.isdisjoint(DEBT_WORDS):
                 houses.append(8)  # Debts and others' money
             else:
                 houses.append(2)  # Personal money/possessions
@@ -566,16 +802,16 @@ class TraditionalHoraryQuestionAnalyzer:
                 
                 houses = [1, student_house, prep_house, success_house]  # Querent, student, prep, success
                 
-            elif re.search(r"\b(my|i|will i)\b", question):
+            elif not scan.words.isdisjoint(QUERENT_WORDS):
                 houses.extend([10, 9])  # L10 = success/result first, then L9 = exam/knowledge
             else:
                 houses.extend([10, 9])  # Default: L10 success primary, L9 knowledge secondary
                 
         # NEW: Person-specific house assignments
         elif question_type == Category.PARENT:
-            if any(word in question for word in ["father", "dad"]):
+            if not found.isdisjoint(FATHER_WORDS):
                 houses.append(4)  # 4th house = father
-            elif any(word in question for word in ["mother", "mom"]):
+            elif not found.isdisjoint(MOTHER_WORDS):
                 houses.append(10)  # 10th house = mother
             else:
                 houses.append(4)  # Default to father
@@ -584,7 +820,7 @@ class TraditionalHoraryQuestionAnalyzer:
             houses.append(3)  # 3rd house = siblings
             
         elif question_type == Category.FRIEND_ENEMY:
-            if any(word in question for word in ["friend", "ally"]):
+            if not found.isdisjoint(FRIEND_WORDS):
                 houses.append(11)  # 11th house = friends
             else:
                 houses.append(7)   # 7th house = open enemies
@@ -603,7 +839,7 @@ class TraditionalHoraryQuestionAnalyzer:
             
         else:
             # Enhanced default logic - analyze question context
-            if re.search(r"\b(other|they|he|she|person|someone)\b", question):
+            if not scan.words.isdisjoint(OTHER_PERSON_WORDS):
                 houses.append(7)  # 7th house for other people
             else:
                 houses.append(7)  # Default fallback
@@ -611,7 +847,7 @@ class TraditionalHoraryQuestionAnalyzer:
         # Look for specific house keywords (but not for general questions to avoid confusion)
         if question_type != Category.GENERAL:
             for house, keywords in self.house_meanings.items():
-                if house not in houses and any(keyword in question for keyword in keywords):
+                if house not in houses and not found.isdisjoint(keywords):
                     houses.append(house)
 
         if question_type == Category.GENERAL:
@@ -1,26 +1,42 @@
-"""Rule evaluation utilities implementing tiered priority with first-hit wins."""
+"""Rule evaluation utilities implementing tiered priority with first-hit wins.
+
+Rule packs live in ``RULES_DIR`` (next to this module) as
+``rules_<pack>.yaml``. Each is
+compiled once into a :class:`RulePack`:
+
+* every ``(tier, id)`` entry gets one bit, assigned tier by tier in
+  ``PRIORITY_TIERS`` order and by id within a tier, so the first hit of a
+  tier is the lowest set bit of ``candidates & tier_mask``;
+* ids map to their weight through a dict instead of a scan of ``RULES``.
+
+Several packs can be loaded side by side (``get_rule_pack(name)``); the
+module-level functions use ``RULE_PACK`` unless given another pack. A pack
+whose file changes on disk is recompiled on next use, at most every
+``RELOAD_CHECK_SECONDS``; callbacks registered with
+:func:`add_reload_listener` are then told, so tables derived from rule
+weights can be rebuilt.
+"""
 from __future__ import annotations
 
+import logging
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
 
+logger = logging.getLogger(__name__)
+
 # Default rule pack selection
 RULE_PACK = "lilly_general_v1"
 
+# Directory holding the ``rules_<pack>.yaml`` files
+RULES_DIR = Path(__file__).parent
 
-def load_rules(pack: str = RULE_PACK) -> List[Dict[str, Any]]:
-    """Load rule definitions from a YAML rule pack."""
-    path = Path(__file__).with_name(f"rules_{pack}.yaml")
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    return data.get("rules", [])
-
-
-# Loaded rule set used throughout the module
-RULES = load_rules()
+# Minimum interval between checks of a pack file's modification time
+RELOAD_CHECK_SECONDS = 1.0
 
 # Fixed priority order for rule tiers
 PRIORITY_TIERS = [
@@ -34,13 +50,181 @@ PRIORITY_TIERS = [
 ]
 
 
-def evaluate_rules(candidate_ids: Iterable[str]) -> List[str]:
+def rule_pack_path(pack: str) -> Path:
+    return RULES_DIR / f"rules_{pack}.yaml"
+
+
+def load_rules(pack: str = RULE_PACK) -> List[Dict[str, Any]]:
+    """Load rule definitions from a YAML rule pack."""
+    path = rule_pack_path(pack)
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return data.get("rules", [])
+
+
+def available_rule_packs() -> List[str]:
+    """Names of the rule packs found in ``RULES_DIR``."""
+    return sorted(path.stem[len("rules_"):] for path in RULES_DIR.glob("rules_*.yaml"))
+
+
+class RulePack:
+    """Compiled, read-only form of one rule pack.
+
+    Parameters
+    ----------
+    name:
+        Pack name (``rules_<name>.yaml``).
+    rules:
+        Rule definitions as loaded by :func:`load_rules`.
+    mtime_ns:
+        Modification time of the file the rules came from, if any.
+    """
+
+    def __init__(self, name: str, rules: List[Dict[str, Any]], mtime_ns: Optional[int] = None) -> None:
+        self.name = name
+        self.rules = rules
+        self.mtime_ns = mtime_ns
+
+        # First definition of an id wins, as with a scan of the list
+        self._weights: Dict[str, Any] = {}
+        for rule in rules:
+            if "id" in rule:
+                self._weights.setdefault(rule["id"], rule.get("weight"))
+
+        self.tiers: Dict[str, Tuple[str, ...]] = {}
+        self._tier_masks: List[int] = []
+        self._id_masks: Dict[str, int] = {}
+        bit_ids: List[str] = []
+        for tier in PRIORITY_TIERS:
+            ids = tuple(sorted(r["id"] for r in rules if r.get("tier") == tier and "id" in r))
+            self.tiers[tier] = ids
+            mask = 0
+            for rule_id in ids:
+                bit = 1 << len(bit_ids)
+                bit_ids.append(rule_id)
+                mask |= bit
+                self._id_masks[rule_id] = self._id_masks.get(rule_id, 0) | bit
+            self._tier_masks.append(mask)
+        self._bit_ids = tuple(bit_ids)
+
+    @classmethod
+    def load(cls, name: str = RULE_PACK) -> "RulePack":
+        """Compile ``rules_<name>.yaml``."""
+        path = rule_pack_path(name)
+        mtime_ns = path.stat().st_mtime_ns
+        return cls(name, load_rules(name), mtime_ns)
+
+    def mask(self, candidate_ids: Iterable[str]) -> int:
+        """Bitset of the tier entries for ``candidate_ids``."""
+        id_masks = self._id_masks
+        mask = 0
+        for rule_id in candidate_ids:
+            mask |= id_masks.get(rule_id, 0)
+        return mask
+
+    def evaluate(self, candidate_ids: Iterable[str], void_gating: bool = True) -> List[str]:
+        """First hit per tier among ``candidate_ids``; ``H2`` only with ``void_gating``."""
+        candidates = self.mask(candidate_ids)
+        if not void_gating:
+            candidates &= ~self._id_masks.get("H2", 0)
+        selected: List[str] = []
+        for tier_mask in self._tier_masks:
+            hits = candidates & tier_mask
+            if hits:
+                selected.append(self._bit_ids[(hits & -hits).bit_length() - 1])
+        return selected
+
+    def weight(self, rule_id: str) -> float:
+        """Numeric weight of ``rule_id``."""
+        try:
+            weight = self._weights[rule_id]
+        except KeyError:
+            raise KeyError(f"Unknown rule id: {rule_id}") from None
+        if isinstance(weight, (int, float)):
+            return float(weight)
+        raise ValueError(f"Rule '{rule_id}' lacks a numeric weight")
+
+
+_packs: Dict[str, RulePack] = {}
+_checked: Dict[str, float] = {}
+_listeners: Dict[str, List[Callable[[RulePack], None]]] = {}
+_packs_lock = threading.RLock()
+
+
+def _notify(pack: RulePack) -> None:
+    for callback in list(_listeners.get(pack.name, ())):
+        try:
+            callback(pack)
+        except Exception:
+            logger.exception("Rule pack reload listener failed for %s", pack.name)
+
+
+def get_rule_pack(name: str = RULE_PACK) -> RulePack:
+    """The compiled pack ``name``, recompiled if its file changed on disk.
+
+    A pack that fails to load on reload keeps serving its previous rules.
+    """
+    pack = _packs.get(name)
+    now = time.monotonic()
+    if pack is not None and now - _checked.get(name, 0.0) < RELOAD_CHECK_SECONDS:
+        return pack
+    with _packs_lock:
+        pack = _packs.get(name)
+        _checked[name] = now
+        if pack is None:
+            pack = _packs[name] = RulePack.load(name)
+            return pack
+        try:
+            mtime_ns = rule_pack_path(name).stat().st_mtime_ns
+            if mtime_ns == pack.mtime_ns:
+                return pack
+            reloaded = RulePack.load(name)
+        except Exception:
+            logger.exception("Reloading rule pack %s failed; keeping the loaded rules", name)
+            return pack
+        _packs[name] = reloaded
+        if name == RULE_PACK:
+            RULES[:] = reloaded.rules
+        logger.info("Reloaded rule pack %s", name)
+        _notify(reloaded)
+        return reloaded
+
+
+def reload_rule_pack(name: str = RULE_PACK) -> RulePack:
+    """Recompile pack ``name`` now, whether or not its file changed.
+
+    The error of a pack that fails to load is raised; a loaded pack of that
+    name keeps serving its previous rules.
+    """
+    with _packs_lock:
+        pack = RulePack.load(name)
+        _packs[name] = pack
+        _checked[name] = time.monotonic()
+        if name == RULE_PACK:
+            RULES[:] = pack.rules
+        _notify(pack)
+        return pack
+
+
+def add_reload_listener(callback: Callable[[RulePack], None], pack: str = RULE_PACK) -> None:
+    """Call ``callback(new_pack)`` whenever pack ``pack`` is recompiled."""
+    with _packs_lock:
+        _listeners.setdefault(pack, []).append(callback)
+
+
+# Loaded rule set used throughout the module (kept in step with reloads)
+RULES = list(get_rule_pack().rules)
+
+
+def evaluate_rules(candidate_ids: Iterable[str], pack: Optional[str] = None) -> List[str]:
     """Return rule IDs selected according to priority tiers with config gating.
 
     Parameters
     ----------
     candidate_ids: Iterable[str]
         Iterable of rule IDs that evaluate to true.
+    pack: str, optional
+        Rule pack to evaluate against; defaults to ``RULE_PACK``.
 
     Returns
     -------
@@ -49,33 +233,15 @@ def evaluate_rules(candidate_ids: Iterable[str]) -> List[str]:
     """
     from horary_config import cfg
     config = cfg()
-    
-    candidates = set(candidate_ids)
-    selected: List[str] = []
-    for tier in PRIORITY_TIERS:
-        tier_rules = sorted(
-            (r for r in RULES if r.get("tier") == tier),
-            key=lambda r: r["id"],
-        )
-        for rule in tier_rules:
-            if rule["id"] in candidates:
-                # Gate void moon rule on configuration
-                if rule["id"] == "H2" and not getattr(config.moon, "void_gating", False):
-                    continue  # Skip void moon if gating is disabled
-                selected.append(rule["id"])
-                break  # first-hit wins within tier
-    return selected
-
-
-def get_rule_weight(rule_id: str) -> float:
+
+    # Gate void moon rule on configuration
+    void_gating = bool(getattr(config.moon, "void_gating", False))
+    return get_rule_pack(pack or RULE_PACK).evaluate(candidate_ids, void_gating)
+
+
+def get_rule_weight(rule_id: str, pack: Optional[str] = None) -> float:
     """Return the numeric weight for a rule ID."""
-    for rule in RULES:
-        if rule.get("id") == rule_id:
-            weight = rule.get("weight")
-            if isinstance(weight, (int, float)):
-                return float(weight)
-            raise ValueError(f"Rule '{rule_id}' lacks a numeric weight")
-    raise KeyError(f"Unknown rule id: {rule_id}")
+    return get_rule_pack(pack or RULE_PACK).weight(rule_id)
 
 
 def apply_rule(rule_id: str, value: float) -> float:
@@ -0,0 +1,133 @@
+import datetime
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine import engine as engine_module
+from horary_engine.analysis_context import get_analysis_context
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Aspect, AspectInfo, HoraryChart, Planet, PlanetPosition, Sign
+
+
+def _pos(planet: Planet, longitude: float, speed: float = 1.0) -> PlanetPosition:
+    return PlanetPosition(
+        planet=planet,
+        longitude=longitude,
+        latitude=0.0,
+        house=1,
+        sign=list(Sign)[int(longitude // 30)],
+        dignity_score=0,
+        speed=speed,
+    )
+
+
+def _make_chart() -> HoraryChart:
+    planets = {
+        Planet.SUN: _pos(Planet.SUN, 10.0),
+        Planet.MOON: _pos(Planet.MOON, 14.0, 13.0),
+        Planet.MARS: _pos(Planet.MARS, 75.0, 0.6),
+        Planet.VENUS: _pos(Planet.VENUS, 18.0, 1.2),
+    }
+    aspects = [
+        AspectInfo(Planet.MOON, Planet.SUN, Aspect.CONJUNCTION, 4.0, False),
+        AspectInfo(Planet.MOON, Planet.VENUS, Aspect.CONJUNCTION, 4.0, True, degrees_to_exact=4.0),
+        AspectInfo(Planet.MARS, Planet.MOON, Aspect.SEXTILE, 1.0, True, degrees_to_exact=1.0),
+        AspectInfo(Planet.VENUS, Planet.MOON, Aspect.SEXTILE, 3.0, False),
+    ]
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+    return HoraryChart(
+        date_time=dt,
+        date_time_utc=dt,
+        timezone_info="UTC",
+        location=(51.5, 0.0),
+        location_name="Test",
+        planets=planets,
+        aspects=aspects,
+        houses=[i * 30.0 for i in range(12)],
+        house_rulers={},
+        ascendant=0.0,
+        midheaven=270.0,
+        julian_day=2460371.0,
+    )
+
+
+def test_aspect_indexes_keep_chart_order():
+    chart = _make_chart()
+    context = get_analysis_context(chart)
+    assert get_analysis_context(chart) is context
+    assert [a.planet2 for a in context.aspects_of(Planet.MOON)[:2]] == [Planet.SUN, Planet.VENUS]
+    assert len(context.aspects_of(Planet.MOON)) == 4
+    assert context.aspects_between(Planet.VENUS, Planet.MOON) == (chart.aspects[1], chart.aspects[3])
+    assert context.applying_aspect(Planet.VENUS, Planet.MOON) is chart.aspects[1]
+    assert context.separating_aspect(Planet.MOON, Planet.VENUS) is chart.aspects[3]
+    assert context.aspects_between(Planet.SUN, Planet.MARS) == ()
+
+
+def test_context_rebuilt_when_aspects_replaced():
+    chart = _make_chart()
+    context = get_analysis_context(chart)
+    chart.aspects = chart.aspects[:1]
+    rebuilt = get_analysis_context(chart)
+    assert rebuilt is not context
+    assert rebuilt.applying_aspect(Planet.MOON, Planet.VENUS) is None
+
+
+def test_memo_and_sign_exit_are_computed_once():
+    context = get_analysis_context(_make_chart())
+    calls = []
+    assert context.memo("answer", lambda: calls.append(1) or 42) == 42
+    assert context.memo("answer", lambda: calls.append(1) or 0) == 42
+    assert calls == [1]
+    moon = _pos(Planet.MOON, 14.0, 13.0)
+    assert context.days_to_sign_exit(moon) == context.days_to_sign_exit(moon) > 0
+
+
+def test_void_of_course_and_moon_speed_are_computed_once_per_chart(monkeypatch):
+    calls = {"next_aspect": 0, "speed": 0}
+    original = engine_module.calculate_moon_next_aspect
+
+    def counting_next_aspect(*args, **kwargs):
+        calls["next_aspect"] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(engine_module, "calculate_moon_next_aspect", counting_next_aspect)
+    judgment_engine = EnhancedTraditionalHoraryJudgmentEngine()
+    real_speed = judgment_engine.calculator.get_real_moon_speed
+
+    def counting_speed(jd):
+        calls["speed"] += 1
+        return real_speed(jd)
+
+    monkeypatch.setattr(judgment_engine.calculator, "get_real_moon_speed", counting_speed)
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+    chart = judgment_engine.calculator.calculate_chart(
+        dt, dt, "UTC", 51.5, 0.0, "Test", use_cache=False)
+    first = judgment_engine._is_moon_void_of_course_enhanced(chart)
+    second = judgment_engine._is_moon_void_of_course_enhanced(chart)
+    assert first == second and first is not second
+    assert chart.moon_next_aspect is chart.moon_next_aspect
+    assert calls["next_aspect"] == 1
+
+    assert judgment_engine._real_moon_speed(chart) == chart.moon_speed
+    assert chart.moon_speed == abs(chart.planets[Planet.MOON].speed)
+    assert calls["speed"] == 0
+
+
+def test_moon_speed_falls_back_to_ephemeris_once(monkeypatch):
+    judgment_engine = EnhancedTraditionalHoraryJudgmentEngine()
+    real_speed = judgment_engine.calculator.get_real_moon_speed
+    calls = []
+
+    def counting_speed(jd):
+        calls.append(jd)
+        return real_speed(jd)
+
+    monkeypatch.setattr(judgment_engine.calculator, "get_real_moon_speed", counting_speed)
+    chart = _make_chart()
+    assert chart.moon_speed is None
+    assert judgment_engine._real_moon_speed(chart) == judgment_engine._real_moon_speed(chart)
+    assert calls == [chart.julian_day]
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import sys
+import threading
+import datetime
+from pathlib import Path
+
+import pytz
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+import asgi_app
+from asgi_app import AsyncHoraryApp
+
+
+class FakeEngine:
+    def __init__(self, release=None):
+        self.calls = []
+        self.release = release
+
+    def judge(self, question, settings):
+        self.calls.append((question, settings))
+        if self.release is not None:
+            self.release.wait(5)
+        return {"question": question, "judgment": "YES", "confidence": 70, "reasoning": []}
+
+
+class FakeTimezoneManager:
+    def get_timezone_for_location(self, lat, lon):
+        return "Europe/London"
+
+    def get_current_time_for_location(self, lat, lon):
+        dt_utc = datetime.datetime(2024, 3, 1, 12, 0, tzinfo=pytz.UTC)
+        return dt_utc.astimezone(pytz.timezone("Europe/London")), dt_utc, "Europe/London"
+
+
+async def _request(app, path, payload, method="POST"):
+    body = json.dumps(payload).encode()
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app({"type": "http", "method": method, "path": path}, receive, send)
+    headers = dict(sent[0]["headers"])
+    content = sent[1]["body"]
+    return sent[0]["status"], headers, json.loads(content) if content else None
+
+
+def _app(monkeypatch, engine=None, **kwargs):
+    monkeypatch.setattr(asgi_app, "safe_geocode", lambda location: (51.5, -0.12, f"{location}, England"))
+    monkeypatch.setattr(asgi_app, "_attach_evaluation", lambda result: None)
+    return AsyncHoraryApp(engine=engine or FakeEngine(), timezone_manager=FakeTimezoneManager(), **kwargs)
+
+
+def test_calculate_chart_passes_resolved_location(monkeypatch):
+    engine = FakeEngine()
+    app = _app(monkeypatch, engine)
+    status, headers, result = asyncio.run(
+        _request(app, "/api/calculate-chart", {"question": "Will I get the job?", "location": "London"}))
+
+    assert status == 200
+    assert result["judgment"] == "YES"
+    assert "calculation_time_seconds" in result["calculation_metadata"]
+    assert headers[b"access-control-allow-origin"] == b"*"
+    question, settings = engine.calls[0]
+    assert question == "Will I get the job?"
+    assert settings["resolved_location"] == (51.5, -0.12, "London, England")
+
+    status, _, result = asyncio.run(_request(app, "/api/calculate-chart", {"location": "London"}))
+    assert status == 400 and result["error"] == "Question is required"
+
+
+def test_timezone_and_current_time(monkeypatch):
+    app = _app(monkeypatch)
+    monkeypatch.setattr(asgi_app, "_timezone_cache", {})
+    status, _, result = asyncio.run(_request(app, "/api/get-timezone", {"location": "Bath"}))
+    assert status == 200 and result["timezone"] == "Europe/London"
+
+    status, _, result = asyncio.run(_request(app, "/api/current-time", {"location": "Bath"}))
+    assert status == 200
+    assert result["utc_offset"] == "+0000"
+    assert result["utc_time"].startswith("2024-03-01T12:00")
+
+    status, _, _ = asyncio.run(_request(app, "/api/current-time", {}))
+    assert status == 400
+    status, _, _ = asyncio.run(_request(app, "/api/version", {}))
+    assert status == 404
+
+
+def test_back_pressure_and_timeout(monkeypatch):
+    release = threading.Event()
+    app = _app(monkeypatch, FakeEngine(release), max_in_flight=1, request_timeout=0.5)
+
+    async def scenario():
+        slow = asyncio.ensure_future(_request(app, "/api/calculate-chart", {"question": "Q?"}))
+        while app.in_flight == 0:
+            await asyncio.sleep(0.01)
+        busy = await _request(app, "/api/calculate-chart", {"question": "Q?"})
+        timed_out = await slow
+        release.set()
+        return busy, timed_out
+
+    busy, timed_out = asyncio.run(scenario())
+    assert busy[0] == 503 and busy[1][b"retry-after"] == b"1"
+    assert timed_out[0] == 504
+    assert app.rejected == 1 and app.timeouts == 1 and app.in_flight == 0
+    app.close()
+
+
+def test_timed_out_work_counts_against_admission(monkeypatch):
+    release = threading.Event()
+    app = _app(monkeypatch, FakeEngine(release), max_in_flight=1, request_timeout=0.2)
+
+    async def scenario():
+        timed_out = await _request(app, "/api/calculate-chart", {"question": "Q?"})
+        busy = await _request(app, "/api/calculate-chart", {"question": "Q?"})
+        abandoned = app.abandoned
+        release.set()
+        while app.abandoned:
+            await asyncio.sleep(0.01)
+        after = await _request(app, "/api/calculate-chart", {"question": "Q?"})
+        return timed_out, busy, abandoned, after
+
+    timed_out, busy, abandoned, after = asyncio.run(scenario())
+    assert timed_out[0] == 504
+    assert busy[0] == 503 and abandoned == 1
+    assert after[0] == 200
+    app.close()
+
+
+def test_many_requests_share_bounded_pools(monkeypatch):
+    app = _app(monkeypatch, cpu_workers=2, io_workers=2)
+
+    async def scenario():
+        return await asyncio.gather(*[
+            _request(app, "/api/calculate-chart", {"question": f"Question {i}?"}) for i in range(100)
+        ])
+
+    before = threading.active_count()
+    responses = asyncio.run(scenario())
+    assert all(status == 200 for status, _, _ in responses)
+    assert threading.active_count() - before <= 4
+    app.close()
+
+
+def test_judge_fast_route(monkeypatch):
+    class FastEngine(FakeEngine):
+        def judge_fast(self, question, settings):
+            self.calls.append((question, settings))
+            return {"question": question, "judgment": "NO", "confidence": 40, "timing": None}
+
+    engine = FastEngine()
+    app = _app(monkeypatch, engine)
+    status, _, result = asyncio.run(
+        _request(app, "/api/judge-fast", {"question": "Will it rain?", "location": "Leeds"}))
+    assert status == 200 and result["judgment"] == "NO"
+    assert engine.calls[0][1]["resolved_location"] == (51.5, -0.12, "Leeds, England")
+
+    status, _, _ = asyncio.run(_request(app, "/api/judge-fast", {"location": "Leeds"}))
+    assert status == 400
+
+
+def test_judge_fast_error_status_matches_flask(monkeypatch):
+    errors = [{"error": "Location not found", "error_type": "LocationError"},
+              {"error": "Ephemeris failure"}]
+
+    class FailingEngine(FakeEngine):
+        def judge_fast(self, question, settings):
+            return dict(errors.pop(0), judgment="ERROR", confidence=0)
+
+    app = _app(monkeypatch, FailingEngine())
+    payload = {"question": "Will it rain?", "location": "Leeds"}
+    status, _, result = asyncio.run(_request(app, "/api/judge-fast", payload))
+    assert status == 400 and result["error_type"] == "LocationError"
+    status, _, _ = asyncio.run(_request(app, "/api/judge-fast", payload))
+    assert status == 500
+    app.close()
@@ -0,0 +1,145 @@
+import datetime
+from pathlib import Path
+import random
+import sys
+
+import swisseph as swe
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.aspects import (
+    calculate_enhanced_aspects,
+    calculate_enhanced_aspects_batch,
+    calculate_enhanced_degrees_to_exact,
+    calculate_moiety_based_orb,
+    is_applying_enhanced,
+)
+from horary_engine.calculation.aspect_kernel import ASPECTS, find_aspects
+from horary_engine.config_snapshot import config_snapshot
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Aspect, AspectInfo, Planet, PlanetPosition, Sign
+
+
+TRADITIONAL = [Planet.SUN, Planet.MOON, Planet.MERCURY, Planet.VENUS, Planet.MARS, Planet.JUPITER, Planet.SATURN]
+
+
+def _reference_aspects(planets, jd_ut):
+    """The per-pair loop the kernel replaced."""
+
+    aspects = []
+    planet_list = list(planets.keys())
+    config = cfg()
+    for i, planet1 in enumerate(planet_list):
+        for planet2 in planet_list[i + 1:]:
+            pos1, pos2 = planets[planet1], planets[planet2]
+            angle_diff = abs((pos1.longitude - pos2.longitude + 180) % 360 - 180)
+            for aspect_type in Aspect:
+                orb_diff = abs(angle_diff - aspect_type.degrees)
+                max_orb = calculate_moiety_based_orb(planet1, planet2, aspect_type, config)
+                if max_orb == 0:
+                    max_orb = aspect_type.orb
+                    if Planet.SUN in [planet1, planet2]:
+                        max_orb += config.orbs.sun_orb_bonus
+                    if Planet.MOON in [planet1, planet2]:
+                        max_orb += config.orbs.moon_orb_bonus
+                if orb_diff <= max_orb:
+                    applying, within_sign = is_applying_enhanced(pos1, pos2, aspect_type, jd_ut)
+                    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
+                        pos1, pos2, aspect_type, jd_ut
+                    )
+                    aspects.append(AspectInfo(planet1, planet2, aspect_type, orb_diff, applying,
+                                              within_sign, exact_time, degrees_to_exact))
+                    break
+    return aspects
+
+
+def _random_planets(rng):
+    planets = {}
+    for planet in rng.sample(TRADITIONAL, len(TRADITIONAL)):
+        longitude = rng.choice([rng.uniform(0, 360), float(rng.randrange(0, 360, 30)), 359.999999])
+        speed = rng.choice([rng.uniform(-1.5, 15.0), 0.0, 0.0005, -0.3])
+        planets[planet] = PlanetPosition(planet=planet, longitude=longitude, latitude=0.0, house=1,
+                                         sign=list(Sign)[int(longitude // 30) % 12], dignity_score=0,
+                                         speed=speed)
+    return planets
+
+
+def test_kernel_matches_per_pair_loop():
+    rng = random.Random(24)
+    jd_ut = swe.julday(2024, 3, 1, 12.0)
+    for _ in range(300):
+        planets = _random_planets(rng)
+        assert calculate_enhanced_aspects(planets, jd_ut) == _reference_aspects(planets, jd_ut)
+
+
+def test_applying_aspect_has_exact_time():
+    jd_ut = swe.julday(2024, 3, 1, 12.0)
+    moon = PlanetPosition(planet=Planet.MOON, longitude=100.0, latitude=0.0, house=1,
+                          sign=Sign.CANCER, dignity_score=0, speed=13.0)
+    sun = PlanetPosition(planet=Planet.SUN, longitude=161.0, latitude=0.0, house=1,
+                         sign=Sign.VIRGO, dignity_score=0, speed=1.0)
+    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(moon, sun, Aspect.SEXTILE, jd_ut)
+    assert degrees_to_exact == 1.0
+    # 1 degree at 12 degrees a day: two hours after noon
+    assert exact_time == datetime.datetime(2024, 3, 1, 14, 0)
+
+
+def test_separating_aspect_has_no_exact_time():
+    jd_ut = swe.julday(2024, 3, 1, 12.0)
+    # Moon 61 degrees ahead of the Sun and pulling away: separating from the sextile
+    moon = PlanetPosition(planet=Planet.MOON, longitude=222.0, latitude=0.0, house=1,
+                          sign=Sign.SCORPIO, dignity_score=0, speed=13.0)
+    sun = PlanetPosition(planet=Planet.SUN, longitude=161.0, latitude=0.0, house=1,
+                         sign=Sign.VIRGO, dignity_score=0, speed=1.0)
+    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(moon, sun, Aspect.SEXTILE, jd_ut)
+    assert degrees_to_exact == 1.0
+    assert exact_time is None
+
+    aspects = calculate_enhanced_aspects({Planet.MOON: moon, Planet.SUN: sun}, jd_ut)
+    assert [(a.applying, a.exact_time) for a in aspects] == [(False, None)]
+
+
+def test_batch_matches_single_charts():
+    rng = random.Random(7)
+    planet_sets = [_random_planets(rng) for _ in range(40)]
+    # Charts listing the same bodies in another order form their own group
+    planet_sets.append(dict(reversed(list(planet_sets[0].items()))))
+    jd_uts = [swe.julday(2024, 1, 1, 0.0) + day for day in range(len(planet_sets))]
+
+    batch = calculate_enhanced_aspects_batch(planet_sets, jd_uts)
+    assert batch == [calculate_enhanced_aspects(p, jd) for p, jd in zip(planet_sets, jd_uts)]
+
+
+def test_find_aspects_batch_layout():
+    planets = [Planet.SUN, Planet.MOON, Planet.SATURN]
+    longitudes = [[0.0, 61.0, 179.5], [10.0, 10.5, 100.0]]
+    matches = find_aspects(longitudes, planets, config_snapshot().orbs.orb_matrix)
+
+    found = [
+        (chart, planets[first], planets[second], ASPECTS[aspect], orb)
+        for chart, first, second, aspect, orb in zip(*(m.tolist() for m in (
+            matches.chart, matches.first, matches.second, matches.aspect, matches.orb)))
+    ]
+    assert found == [
+        (0, Planet.SUN, Planet.MOON, Aspect.SEXTILE, 1.0),
+        (0, Planet.SUN, Planet.SATURN, Aspect.OPPOSITION, 0.5),
+        (0, Planet.MOON, Planet.SATURN, Aspect.TRINE, 1.5),
+        (1, Planet.SUN, Planet.MOON, Aspect.CONJUNCTION, 0.5),
+        (1, Planet.SUN, Planet.SATURN, Aspect.SQUARE, 0.0),
+        (1, Planet.MOON, Planet.SATURN, Aspect.SQUARE, 0.5),
+    ]
+    assert matches.delta.tolist()[:2] == [-61.0, -179.5]
+
+
+def test_refined_mode_matches_per_pair_loop(monkeypatch):
+    calculator = EnhancedTraditionalHoraryJudgmentEngine().calculator
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+    chart = calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London", use_cache=False)
+
+    monkeypatch.setattr(cfg().timing, "perfection_mode", "refined")
+    assert calculate_enhanced_aspects(chart.planets, chart.julian_day) == _reference_aspects(
+        chart.planets, chart.julian_day
+    )
@@ -0,0 +1,123 @@
+import datetime
+import random
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.calculation.aspect_timeline import (
+    ASPECTS,
+    PLANETS,
+    AspectTimeline,
+    get_aspect_timeline,
+)
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from horary_engine.perfection import check_future_prohibitions
+from models import Aspect, HoraryChart, Planet, PlanetPosition, Sign
+
+
+def _pos(planet: Planet, longitude: float, speed: float) -> PlanetPosition:
+    return PlanetPosition(
+        planet=planet,
+        longitude=longitude,
+        latitude=0.0,
+        house=1,
+        sign=list(Sign)[int(longitude // 30)],
+        dignity_score=0,
+        speed=speed,
+    )
+
+
+def _random_positions(seed: int):
+    rng = random.Random(seed)
+    speeds = {
+        Planet.SUN: (0.95, 1.02),
+        Planet.MOON: (11.8, 15.2),
+        Planet.MERCURY: (-1.3, 2.2),
+        Planet.VENUS: (-0.6, 1.25),
+        Planet.MARS: (-0.4, 0.8),
+        Planet.JUPITER: (-0.14, 0.25),
+        Planet.SATURN: (-0.08, 0.13),
+    }
+    return {
+        planet: _pos(planet, rng.uniform(0, 360), rng.uniform(*speeds[planet]))
+        for planet in PLANETS
+    }
+
+
+def _make_chart(planets) -> HoraryChart:
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+    return HoraryChart(
+        date_time=dt,
+        date_time_utc=dt,
+        timezone_info="UTC",
+        location=(51.5, 0.0),
+        location_name="Test",
+        planets=planets,
+        aspects=[],
+        houses=[i * 30.0 for i in range(12)],
+        house_rulers={},
+        ascendant=0.0,
+        midheaven=270.0,
+        julian_day=2460371.0,
+    )
+
+
+def test_reach_time_matches_pairwise_solver():
+    solver = EnhancedTraditionalHoraryJudgmentEngine()._calculate_future_aspect_time
+    for seed in range(20):
+        positions = _random_positions(seed)
+        timeline = AspectTimeline(positions, window=365)
+        for p1 in PLANETS:
+            for p2 in PLANETS:
+                for aspect in ASPECTS:
+                    for max_days in (5, 30, 365):
+                        expected = solver(positions[p1], positions[p2], aspect, 0.0, max_days)
+                        assert timeline.reach_time(p1, p2, aspect, max_days) == expected
+
+
+def test_events_cover_every_cycle_in_order():
+    positions = _random_positions(7)
+    timeline = AspectTimeline(positions, window=60)
+    times = [event.days for event in timeline]
+    assert times == sorted(times)
+    assert all(0 < t <= 60 for t in times)
+
+    moon_sun = [e for e in timeline if e.planet == Planet.MOON and e.other == Planet.SUN
+                and e.aspect == Aspect.CONJUNCTION]
+    period = 360.0 / (positions[Planet.MOON].speed - positions[Planet.SUN].speed)
+    assert moon_sun[0].days == timeline.reach_time(Planet.MOON, Planet.SUN, Aspect.CONJUNCTION)
+    assert len(moon_sun) == int((60 - moon_sun[0].days) // period) + 1
+    for earlier, later in zip(moon_sun, moon_sun[1:]):
+        assert abs(later.days - earlier.days - period) < 1e-9
+
+
+def test_queries_use_time_bounds():
+    planets = {
+        Planet.SUN: _pos(Planet.SUN, 10.0, 1.0),
+        Planet.MOON: _pos(Planet.MOON, 0.0, 13.0),
+        Planet.MARS: _pos(Planet.MARS, 100.0, 0.5),
+    }
+    timeline = AspectTimeline(planets, window=30)
+    conjunction = timeline.first(Planet.MOON, Planet.SUN, Aspect.CONJUNCTION)
+    assert conjunction.planet == Planet.MOON and abs(conjunction.days - 10.0 / 12.0) < 1e-12
+    assert timeline.first(Planet.MOON) == timeline.events[0]
+    assert all(e.days < 2.0 for e in timeline.between(0.0, 2.0))
+    assert all(e.days > 2.0 for e in timeline.after(2.0))
+    assert len(timeline.between(0.0, 2.0)) + len(timeline.after(2.0)) == len(timeline)
+    assert timeline.first(Planet.SATURN) is None
+    assert timeline.reach_time(Planet.SATURN, Planet.SUN, Aspect.CONJUNCTION) is None
+    assert timeline.partners((Planet.SUN,), 0.0, 1.0) == {Planet.MOON}
+
+
+def test_timeline_prohibitions_match_pairwise_solver():
+    solver = EnhancedTraditionalHoraryJudgmentEngine()._calculate_future_aspect_time
+    for seed in range(40):
+        chart = _make_chart(_random_positions(seed))
+        assert get_aspect_timeline(chart) is get_aspect_timeline(chart)
+        for days_ahead in (3.0, 20.0, 120.0):
+            expected = check_future_prohibitions(chart, Planet.MARS, Planet.VENUS, days_ahead, solver)
+            assert check_future_prohibitions(chart, Planet.MARS, Planet.VENUS, days_ahead) == expected
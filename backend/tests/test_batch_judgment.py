@@ -0,0 +1,169 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+import horary_engine.engine as engine_module
+from horary_engine.engine import HoraryEngine
+from horary_engine.services.geolocation import LocationError
+
+
+LOCATIONS = {
+    "London, England": (51.5074, -0.1278, "London, England"),
+    "New York, USA": (40.7128, -74.0060, "New York, USA"),
+}
+
+
+def _stub_geocode(monkeypatch):
+    calls = []
+
+    def fake_geocode(location, timeout=10):
+        calls.append(location)
+        if location not in LOCATIONS:
+            raise LocationError(f"Location '{location}' not found")
+        return LOCATIONS[location]
+
+    monkeypatch.setattr(engine_module, "safe_geocode", fake_geocode)
+    return calls
+
+
+def _settings(location, date="2024-03-01", time="12:00"):
+    return {
+        "location": location,
+        "date": date,
+        "time": time,
+        "use_current_time": False,
+    }
+
+
+def test_batch_matches_individual_judgments(monkeypatch):
+    _stub_geocode(monkeypatch)
+    engine = HoraryEngine()
+    records = [
+        {"question": "Will I get the job?", "settings": _settings("London, England")},
+        {"question": "Will my loan be approved?", "settings": _settings("New York, USA", time="09:30")},
+        {"question": "Does my partner love me?", "settings": _settings("London, England", date="2024-06-15")},
+    ]
+
+    batch = engine.judge_batch(records)
+    single = [engine.judge(r["question"], r["settings"]) for r in records]
+
+    assert len(batch) == len(records)
+    for got, expected in zip(batch, single):
+        assert got["question"] == expected["question"]
+        assert got["judgment"] == expected["judgment"]
+        assert got["confidence"] == expected["confidence"]
+        assert got["chart_data"] == expected["chart_data"]
+        assert got["timezone_info"] == expected["timezone_info"]
+
+
+def test_batch_shares_geocoding_and_charts(monkeypatch):
+    calls = _stub_geocode(monkeypatch)
+    engine = HoraryEngine()
+    chart_calls = []
+    calculate_charts = engine.engine.calculator.calculate_charts
+
+    def counting_calculate_charts(moments, *args, **kwargs):
+        chart_calls.append(moments)
+        return calculate_charts(moments, *args, **kwargs)
+
+    monkeypatch.setattr(engine.engine.calculator, "calculate_charts", counting_calculate_charts)
+
+    records = [
+        {"question": "Will I get the job?", "settings": _settings("London, England")},
+        {"question": "Will I get the job?", "settings": _settings("London, England")},
+        {"question": "Will I move house?", "settings": _settings("London, England")},
+        {"question": "Will I move house?", "settings": _settings("New York, USA")},
+    ]
+    results = engine.judge_batch(records)
+
+    assert calls == ["London, England", "New York, USA"]
+    # Both charts are cast together, once each
+    assert [len(moments) for moments in chart_calls] == [2]
+    assert [r["question"] for r in results] == [r["question"] for r in records]
+    # Duplicate records get independent copies
+    assert results[0] == results[1]
+    assert results[0] is not results[1]
+
+
+def test_batch_reports_errors_per_record(monkeypatch):
+    calls = _stub_geocode(monkeypatch)
+    engine = HoraryEngine()
+    records = [
+        {"question": "Will I get the job?", "settings": _settings("Atlantis")},
+        {"question": "Will I get the job?", "settings": _settings("London, England")},
+        {"question": "Will I find my keys?", "settings": _settings("Atlantis")},
+        {"question": "Will I get the job?", "settings": {"location": "London, England", "use_current_time": False}},
+    ]
+    results = engine.judge_batch(records)
+
+    assert results[0]["judgment"] == "LOCATION_ERROR"
+    assert results[0]["error_type"] == "LocationError"
+    assert results[1]["judgment"] not in ("ERROR", "LOCATION_ERROR")
+    assert results[2]["judgment"] == "LOCATION_ERROR"
+    assert results[3]["judgment"] == "ERROR"
+    assert "Date and time" in results[3]["error"]
+    # The failing location is only looked up once
+    assert calls.count("Atlantis") == 1
+
+
+def test_batch_endpoint_rejects_malformed_json(monkeypatch):
+    from app import app
+
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    client = app.test_client()
+    response = client.post("/api/calculate-charts", data="{not json", content_type="application/json")
+    assert response.status_code == 400
+
+    payload = {"records": [{"question": "Will I get the job?", "location": "Testville", "useCurrentTime": False,
+                            "date": "2024-03-01", "time": "12:00", "timezone": "UTC"}]}
+    response = client.post("/api/calculate-charts", json=payload)
+    assert response.status_code == 200
+    assert "_performance" not in response.get_json()["results"][0]
+
+
+def test_batch_traces_records_that_ask_for_it(monkeypatch):
+    _stub_geocode(monkeypatch)
+    engine = HoraryEngine()
+    records = [
+        {"question": "Will I get the job?", "settings": {**_settings("London, England"), "trace": True}},
+        {"question": "Will I move house?", "settings": _settings("London, England")},
+    ]
+    traced, plain = engine.judge_batch(records)
+
+    stages = traced["_performance"]["stages"]
+    assert {"apply_enhanced_judgment", "audit"} <= set(stages)
+    assert "_performance" not in plain
+
+
+def test_calculate_charts_share_ephemeris_per_instant(monkeypatch):
+    import datetime
+
+    calculator = HoraryEngine().engine.calculator
+    evaluated = []
+    planet_ephemeris = calculator._planet_ephemeris
+
+    def counting_planet_ephemeris(jd_ut):
+        evaluated.append(jd_ut)
+        return planet_ephemeris(jd_ut)
+
+    monkeypatch.setattr(calculator, "_planet_ephemeris", counting_planet_ephemeris)
+    noon = datetime.datetime(2024, 3, 1, 12, 0)
+    moments = [
+        (noon, noon, "UTC", *LOCATIONS["London, England"]),
+        (noon, noon, "UTC", *LOCATIONS["New York, USA"]),
+        (noon + datetime.timedelta(days=1), noon + datetime.timedelta(days=1), "UTC", *LOCATIONS["London, England"]),
+    ]
+    charts = calculator.calculate_charts(moments, use_cache=False)
+
+    # Both places at noon share one evaluation of the planets
+    assert len(evaluated) == len(set(evaluated)) == 2
+    for moment, chart in zip(moments, charts):
+        single = calculator.calculate_chart(*moment, use_cache=False)
+        assert chart.planets == single.planets
+        assert chart.aspects == single.aspects
+        assert chart.houses == single.houses
+    assert charts[0].planets is not charts[1].planets
@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+import benchmark
+from horary_config import cfg
+
+
+def test_run_benchmarks_times_each_stage_per_case():
+    enabled = cfg().chart_cache.enabled
+    document = benchmark.run_benchmarks(
+        repeat=1, only=["calculate_chart", "judge"], cases=["void_moon", "mercury_cazimi"]
+    )
+    assert cfg().chart_cache.enabled == enabled
+    assert document["meta"]["cases"] == ["void_moon", "mercury_cazimi"]
+    assert set(document["benchmarks"]) == {"calculate_chart", "judge"}
+    result = document["benchmarks"]["judge"]
+    assert result["samples"] == 2
+    assert set(result["cases"]) == {"void_moon", "mercury_cazimi"}
+    assert 0 < result["min_ms"] <= result["median_ms"] <= result["p90_ms"]
+
+
+def test_compare_flags_regressions_over_threshold():
+    baseline = {"benchmarks": {"a": {"median_ms": 10.0}, "b": {"median_ms": 10.0}, "gone": {"median_ms": 1.0}}}
+    current = {"benchmarks": {"a": {"median_ms": 10.5}, "b": {"median_ms": 12.0}, "new": {"median_ms": 1.0}}}
+    rows = {row["benchmark"]: row for row in benchmark.compare_results(baseline, current, threshold=0.10)}
+    assert set(rows) == {"a", "b"}
+    assert not rows["a"]["regression"]
+    assert rows["b"]["regression"]
+    assert rows["b"]["change"] == 0.2
+
+
+def test_batch_benchmark_reports_both_rates():
+    result = benchmark.run_batch_benchmark(repeat=1, questions_per_chart=2, cases=["career", "money"])
+    assert result["records"] == 4
+    assert result["charts"] == 2
+    assert result["loop_records_per_second"] > 0
+    assert result["batch_records_per_second"] > 0
+    assert result["speedup"] > 0
@@ -0,0 +1,80 @@
+import sys
+import datetime
+from pathlib import Path
+
+import pytz
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+import horary_engine.engine as engine_module
+from horary_engine.chart_cache import ChartCache
+from horary_engine.engine import EnhancedTraditionalAstrologicalCalculator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _moment():
+    dt_utc = datetime.datetime(2024, 3, 1, 12, 0, tzinfo=pytz.UTC)
+    return dt_utc.astimezone(pytz.timezone("Europe/London")), dt_utc
+
+
+def test_lru_eviction_and_ttl():
+    clock = FakeClock()
+    cache = ChartCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("a", "chart-a")
+    cache.put("b", "chart-b")
+    assert cache.get("a") == "chart-a"  # "a" is now most recent
+    cache.put("c", "chart-c")
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert cache.expirations == 1
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+def test_key_rounds_julian_day_and_coordinates():
+    cache = ChartCache(jd_resolution_seconds=1.0, coordinate_precision=4)
+    key = cache.make_key(2460371.0, 51.50741, -0.12781, b"R")
+    assert key == cache.make_key(2460371.0 + 0.2 / 86400, 51.507412, -0.127811, b"R")
+    assert key != cache.make_key(2460371.0 + 2 / 86400, 51.50741, -0.12781, b"R")
+    assert key != cache.make_key(2460371.0, 51.50741, -0.12781, b"P")
+
+
+def test_calculator_reuses_cached_chart(monkeypatch):
+    cache = ChartCache()
+    monkeypatch.setattr(engine_module, "get_chart_cache", lambda: cache)
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    dt_local, dt_utc = _moment()
+
+    first = calculator.calculate_chart(dt_local, dt_utc, "Europe/London", 51.5, -0.12, "London", use_cache=True)
+    second = calculator.calculate_chart(dt_local, dt_utc, "Europe/London", 51.5, -0.12, "Greater London", use_cache=True)
+
+    assert cache.hits == 1 and cache.misses == 1
+    assert second.planets is first.planets
+    assert second.location_name == "Greater London"
+    assert first.location_name == "London"
+
+
+def test_opt_out_bypasses_cache(monkeypatch):
+    cache = ChartCache()
+    monkeypatch.setattr(engine_module, "get_chart_cache", lambda: cache)
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    dt_local, dt_utc = _moment()
+
+    first = calculator.calculate_chart(dt_local, dt_utc, "Europe/London", 51.5, -0.12, "London", use_cache=False)
+    second = calculator.calculate_chart(dt_local, dt_utc, "Europe/London", 51.5, -0.12, "London", use_cache=False)
+
+    assert cache.hits == 0 and cache.misses == 0
+    assert second.planets is not first.planets
+    assert second.ascendant == first.ascendant
@@ -0,0 +1,129 @@
+import os
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+import horary_config
+from horary_config import HoraryConfig, HoraryError, add_config_reload_listener, cfg, get_config
+from horary_engine.aspects import calculate_moiety_based_orb
+from horary_engine.config_snapshot import ConfigSnapshot, config_snapshot
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Aspect, Planet
+
+
+CONFIG_FILE = ROOT / "backend" / "horary_constants.yaml"
+
+
+def _legacy_max_orb(planet1, planet2, aspect, config):
+    max_orb = calculate_moiety_based_orb(planet1, planet2, aspect, config)
+    if max_orb == 0:
+        max_orb = aspect.orb
+        if Planet.SUN in [planet1, planet2]:
+            max_orb += config.orbs.sun_orb_bonus
+        if Planet.MOON in [planet1, planet2]:
+            max_orb += config.orbs.moon_orb_bonus
+    return max_orb
+
+
+def test_orb_tables_match_per_pair_calculation():
+    config = cfg()
+    snapshot = config_snapshot()
+    assert snapshot is config_snapshot() and snapshot.version == get_config().version
+
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    for planet1 in Planet:
+        for planet2 in Planet:
+            for aspect in Aspect:
+                assert snapshot.orbs.max_orbs[planet1, planet2, aspect] == _legacy_max_orb(
+                    planet1, planet2, aspect, config
+                )
+            expected = getattr(config.orbs.moieties, planet1.value, engine._get_planet_moiety(planet1))
+            expected += getattr(config.orbs.moieties, planet2.value, engine._get_planet_moiety(planet2))
+            assert snapshot.orbs.timed_orb_limits[planet1.value, planet2.value] == expected
+
+    with pytest.raises(AttributeError):
+        snapshot.orbs.sun_orb_bonus = 3.0
+
+
+def test_orb_table_without_moieties():
+    orbs = SimpleNamespace(conjunction=8.0, sextile=6.0, square=8.0, trine=8.0, opposition=8.0,
+                           sun_orb_bonus=1.0, moon_orb_bonus=8.0)
+    snapshot = ConfigSnapshot.build(SimpleNamespace(orbs=orbs))
+    assert snapshot.orbs.max_orbs[Planet.SUN, Planet.MOON, Aspect.SEXTILE] == 15.0
+    assert snapshot.orbs.max_orbs[Planet.MARS, Planet.VENUS, Aspect.TRINE] == 8.0
+    assert snapshot.orbs.timed_orb_limits["Sun", "Saturn"] == 17.0 + 9.5
+    assert snapshot.aggregator.role_importance["Moon"] == 0.7
+
+
+@pytest.fixture
+def config_copy(tmp_path, monkeypatch):
+    """Point the configuration at a writable copy; restore the original afterwards."""
+
+    original = cfg()
+    path = tmp_path / "horary_constants.yaml"
+    path.write_text(CONFIG_FILE.read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.setenv("HORARY_CONFIG", str(path))
+    monkeypatch.setattr(horary_config, "_listeners", list(horary_config._listeners))
+    monkeypatch.setattr(HoraryConfig, "_mtime_ns", path.stat().st_mtime_ns)
+    yield path
+    replaced = cfg()
+    monkeypatch.undo()
+    HoraryConfig._config = original
+    HoraryConfig.version += 1
+    horary_config._notify(replaced, original)
+
+
+def _rewrite(path, old, new):
+    text = path.read_text(encoding="utf-8")
+    assert text.count(old) == 1
+    path.write_text(text.replace(old, new), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_reload_swaps_versioned_config(config_copy):
+    before = config_snapshot()
+    calls = []
+    add_config_reload_listener(lambda: calls.append("orbs"), section="orbs")
+    add_config_reload_listener(lambda: calls.append("stations"), section="stations")
+
+    _rewrite(config_copy, "    Moon: 12.0", "    Moon: 14.0")
+    new = horary_config.reload_config()
+
+    assert cfg() is new and get_config().version == before.version + 1
+    assert calls == ["orbs"]
+    after = config_snapshot()
+    assert after.version == before.version + 1
+    assert after.orbs.max_orbs[Planet.MOON, Planet.SUN, Aspect.CONJUNCTION] == 14.5
+    assert before.orbs.max_orbs[Planet.MOON, Planet.SUN, Aspect.CONJUNCTION] == 13.5
+
+
+def test_failed_reload_keeps_current_config(config_copy):
+    current, version = cfg(), get_config().version
+
+    _rewrite(config_copy, "orbs:\n  # Traditional aspect orbs", "orbs: [\n  # Traditional aspect orbs")
+    with pytest.raises(HoraryError):
+        horary_config.reload_config()
+    assert cfg() is current and get_config().version == version
+
+    config_copy.write_text("timing:\n  max_future_days: 10\n", encoding="utf-8")
+    with pytest.raises(HoraryError, match="Missing required configuration keys"):
+        horary_config.reload_config()
+    assert cfg() is current and get_config().version == version
+
+
+def test_reload_if_changed(config_copy, monkeypatch):
+    monkeypatch.setattr(cfg().config_reload, "check_seconds", 0.0)
+    version = get_config().version
+    assert not horary_config.reload_config_if_changed()
+
+    _rewrite(config_copy, "  max_window_days: 365", "  max_window_days: 200")
+    assert horary_config.reload_config_if_changed()
+    assert get_config().version == version + 1
+    assert config_snapshot().timing.max_window_days == 200
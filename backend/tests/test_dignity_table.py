@@ -0,0 +1,74 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.dignity_table import (
+    DETRIMENT,
+    FALL,
+    PLANETS,
+    TRIPLICITY_SCHEMES,
+    DignityTable,
+    get_dignity_table,
+)
+from horary_engine.reception import TraditionalReceptionCalculator
+from models import Planet, Sign
+
+
+def _reference_dignities(planet, sign, sign_degree, is_day, triplicity_rulers):
+    """Dictionary scan of the configuration, as the calculators used to do."""
+    dignities = []
+    if sign.ruler == planet:
+        dignities.append("domicile")
+    if TraditionalReceptionCalculator().exaltations.get(planet) == sign:
+        dignities.append("exaltation")
+    if triplicity_rulers[sign]["day" if is_day else "night"] == planet:
+        dignities.append("triplicity")
+    for kind in ("terms", "faces"):
+        for entry in getattr(getattr(cfg().reception, kind), sign.sign_name):
+            if entry.start <= sign_degree < entry.end:
+                if Planet[entry.ruler.upper()] == planet:
+                    dignities.append(kind[:-1] if kind == "terms" else "face")
+                break
+    return dignities
+
+
+@pytest.mark.parametrize("scheme", sorted(TRIPLICITY_SCHEMES))
+def test_table_matches_configuration_scan(scheme):
+    table = get_dignity_table(scheme)
+    rulers = TRIPLICITY_SCHEMES[scheme]
+    for planet in PLANETS:
+        for sign in Sign:
+            for sign_degree in (0.0, 5.99, 6.0, 12.5, 19.999, 29.9999):
+                for is_day in (True, False):
+                    expected = _reference_dignities(planet, sign, sign_degree, is_day, rulers)
+                    assert table.dignities(planet, sign, sign_degree, is_day) == expected
+
+
+def test_debilities_and_chart_points():
+    table = get_dignity_table()
+    assert table.flags(Planet.SATURN, Sign.LEO, 10, True) & DETRIMENT
+    assert table.flags(Planet.SUN, Sign.LIBRA, 10, False) & FALL
+    assert table.flags(Planet.ASC, Sign.ARIES, 10, True) == 0
+
+
+def test_water_triplicity_differs_between_schemes():
+    calculator, reception = get_dignity_table("calculator"), get_dignity_table("reception")
+    assert calculator.dignities(Planet.VENUS, Sign.CANCER, 20, True) == ["triplicity"]
+    assert calculator.dignities(Planet.MARS, Sign.CANCER, 20, True) == []
+    assert reception.dignities(Planet.MARS, Sign.CANCER, 20, True) == ["triplicity"]
+    assert reception.dignities(Planet.VENUS, Sign.CANCER, 20, True) == []
+
+
+def test_fractional_term_boundaries_are_rejected():
+    class Entry:
+        ruler, start, end = "Mars", 0, 7.5
+
+    terms = type("Terms", (), {"Aries": [Entry()]})()
+    with pytest.raises(ValueError):
+        DignityTable(TRIPLICITY_SCHEMES["calculator"], terms=terms, faces=cfg().reception.faces)
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import swisseph as swe
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from models import Planet
+from horary_engine.calculation import ephemeris
+from horary_engine.calculation.ephemeris import (
+    ChebyshevEphemeris,
+    SWE_PLANET_IDS,
+    planet_positions,
+)
+from horary_engine.calculation.helpers import calculate_next_station_time
+
+
+def _swe_positions(planet_id, jds):
+    rows = [swe.calc_ut(float(jd), planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0] for jd in jds]
+    return np.array([(r[0], r[1], r[3]) for r in rows])
+
+
+def test_table_matches_swiss_ephemeris():
+    jds = np.linspace(2460000.5, 2460400.5, 97)
+    positions = planet_positions(jds, use_table=True)
+
+    for planet, planet_id in SWE_PLANET_IDS.items():
+        expected = _swe_positions(planet_id, jds)
+        got = positions[planet]
+        lon_error = np.abs((got.longitude - expected[:, 0] + 180) % 360 - 180)
+        assert lon_error.max() < 1e-3, planet
+        assert np.abs(got.latitude - expected[:, 1]).max() < 1e-3, planet
+        assert np.abs(got.speed - expected[:, 2]).max() < 1e-2, planet
+
+
+def test_outside_table_range_falls_back_to_swiss_ephemeris(monkeypatch):
+    table = ChebyshevEphemeris(2460000.5, 2460100.5)
+    monkeypatch.setattr(ephemeris, "_table", table)
+    jds = np.array([2459000.5, 2460050.5, 2461000.5])
+    assert table.covers(jds).tolist() == [False, True, False]
+
+    positions = planet_positions(jds, [swe.MARS], use_table=True)
+    expected = _swe_positions(swe.MARS, jds)
+    outside = [0, 2]
+    assert np.array_equal(positions[swe.MARS].longitude[outside], expected[outside, 0])
+    assert np.array_equal(positions[swe.MARS].speed[outside], expected[outside, 2])
+    assert abs(positions[swe.MARS].longitude[1] - expected[1, 0]) < 1e-3
+    assert table._segments[swe.MARS]  # the inside day came from the table
+
+
+def test_forced_table_is_shared_when_config_disables_it(monkeypatch):
+    monkeypatch.setattr(cfg().ephemeris, "use_table", False)
+    monkeypatch.setattr(ephemeris, "_table", None)
+    assert ephemeris.get_ephemeris_table() is None
+
+    planet_positions(2460000.5, [swe.SUN], use_table=True)
+    table = ephemeris._table
+    assert table is not None
+    planet_positions(2460001.5, [swe.SUN], use_table=True)
+    assert ephemeris._table is table
+
+
+def test_planet_keys_follow_request():
+    positions = planet_positions(2460000.5, [Planet.SUN, swe.MOON])
+    assert set(positions) == {Planet.SUN, swe.MOON}
+    assert positions[Planet.SUN].longitude.shape == (1,)
+
+
+def test_station_time_uses_vectorised_scan():
+    jd_start = 2460000.5
+    station = calculate_next_station_time(swe.MERCURY, jd_start)
+    assert station is not None
+    before = swe.calc_ut(station - 0.01, swe.MERCURY, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3]
+    after = swe.calc_ut(station + 0.01, swe.MERCURY, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3]
+    assert before * after < 0
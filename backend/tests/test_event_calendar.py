@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from models import Planet, Sign
+import horary_engine.calculation.helpers as helpers
+from horary_engine.calculation.event_calendar import EventCalendar, build_event_calendar
+from horary_engine.calculation.stations import StationFinder
+
+
+@pytest.fixture(scope="module")
+def calendar(tmp_path_factory):
+    out = build_event_calendar(2024, 2025, tmp_path_factory.mktemp("calendar"))
+    return EventCalendar(out)
+
+
+def _longitude(planet_id, jd):
+    return swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][0]
+
+
+def test_arrays_are_memory_mapped(calendar):
+    assert isinstance(calendar._stations[Planet.MERCURY], np.memmap)
+    assert isinstance(calendar._ingresses[Planet.MOON], np.memmap)
+
+
+def test_next_station_matches_station_finder(calendar):
+    jd = 2460400.5
+    event = calendar.next_station(swe.MERCURY, jd)
+    expected = StationFinder().next_station(swe.MERCURY, jd)
+    assert event.jd == pytest.approx(expected, abs=1e-3)
+    speed_after = swe.calc_ut(event.jd + 0.1, swe.MERCURY, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3]
+    assert event.direction == (1 if speed_after > 0 else -1)
+    assert calendar.next_station(Planet.SUN, jd) is None
+
+
+def test_next_ingress_crosses_sign_boundary(calendar):
+    jd = 2460400.5
+    event = calendar.next_ingress(Planet.MOON, jd)
+    assert 0 < event.jd - jd < 3
+    assert int(_longitude(swe.MOON, event.jd - 0.01) // 30) != int(_longitude(swe.MOON, event.jd + 0.01) // 30)
+    assert event.sign is list(Sign)[int(_longitude(swe.MOON, event.jd + 0.01) // 30)]
+    assert event.direction == 1
+
+    # Sun ingresses fall roughly a month apart
+    first = calendar.next_ingress(Planet.SUN, jd)
+    second = calendar.next_ingress(Planet.SUN, first.jd)
+    assert 29 < second.jd - first.jd < 32
+
+
+def test_station_helper_uses_calendar(calendar, monkeypatch):
+    monkeypatch.setattr(helpers, "get_event_calendar", lambda: calendar)
+    monkeypatch.setattr(helpers, "get_station_finder", lambda: pytest.fail("calendar should answer"))
+    jd = 2460400.5
+    assert helpers.calculate_next_station_time(swe.MERCURY, jd, max_days=200) == calendar.next_station(
+        swe.MERCURY, jd
+    ).jd
@@ -0,0 +1,68 @@
+import datetime
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+import benchmark
+from horary_config import cfg
+from horary_engine.engine import HoraryEngine
+
+
+def _corpus():
+    for name, question, date, time_str, timezone, location in benchmark.CORPUS:
+        for offset in (0, 5, 13):
+            day = datetime.date.fromisoformat(date) + datetime.timedelta(days=offset)
+            yield f"{name}+{offset}", question, {
+                "location": location[2],
+                "resolved_location": location,
+                "date": day.isoformat(),
+                "time": time_str,
+                "timezone": timezone,
+                "use_current_time": False,
+            }
+
+
+def test_fast_path_matches_full_judgment(monkeypatch):
+    monkeypatch.setattr(cfg().chart_cache, "enabled", False)
+    engine = HoraryEngine()
+    for name, question, settings in _corpus():
+        full = engine.judge(question, dict(settings))
+        fast = engine.judge_fast(question, dict(settings))
+        expected = {key: full[key] for key in HoraryEngine.FAST_RESULT_KEYS if key in full}
+        assert fast == expected, name
+
+
+def test_fast_path_result_is_compact(monkeypatch):
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    engine = HoraryEngine()
+    settings = {"location": "Testville", "date": "2024-03-01", "time": "12:00",
+                "timezone": "UTC", "use_current_time": False, "fields": "chart"}
+    result = engine.judge_fast("Will I get the job?", settings)
+    assert set(result) == {"question", "judgment", "confidence", "timing"}
+
+    traced = engine.judge_fast("Will I get the job?", {**settings, "trace": True})
+    stages = traced["_performance"]["stages"]
+    assert "apply_enhanced_judgment" in stages
+    assert not {"serialize_chart", "chart_summary", "audit"} & set(stages)
+
+
+def test_fast_endpoint(monkeypatch):
+    from app import app
+
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    client = app.test_client()
+    payload = {"question": "Will I get the job?", "location": "Testville", "useCurrentTime": False,
+               "date": "2024-03-01", "time": "12:00", "timezone": "UTC"}
+    response = client.post("/api/judge-fast", json=payload)
+    assert response.status_code == 200
+    assert set(response.get_json()) == {"question", "judgment", "confidence", "timing"}
+
+    response = client.post("/api/judge-fast", json={"location": "Testville"})
+    assert response.status_code == 400
+
+    response = client.get("/api/no-such-endpoint")
+    assert response.status_code == 404
+    assert "/api/judge-fast" in response.get_json()["available_endpoints"]
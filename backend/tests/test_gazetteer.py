@@ -0,0 +1,139 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+import horary_engine.services.geolocation as geolocation
+from horary_engine.services.gazetteer import Gazetteer, build_gazetteer, normalize_name
+from horary_engine.services.geolocation import LocationError, safe_geocode
+
+
+CITIES = [
+    # id, name, ascii, alternates, lat, lon, class, code, cc, cc2, admin1, ..., population
+    ("2643743", "London", "London", "Londres,Londra", "51.50853", "-0.12574", "GB", "ENG", "8961989"),
+    ("6058560", "London", "London", "", "42.98339", "-81.23304", "CA", "08", "346765"),
+    ("2988507", "Paris", "Paris", "Paname", "48.85341", "2.3488", "FR", "11", "2138551"),
+    ("4717560", "Paris", "Paris", "", "33.66094", "-95.55551", "US", "TX", "24782"),
+    ("2950159", "Berlin", "Berlin", "", "52.52437", "13.41053", "DE", "16", "3426354"),
+    ("3117735", "Madrid", "Madrid", "", "40.4165", "-3.70256", "ES", "29", "3255944"),
+    ("2867714", "München", "Muenchen", "Munich", "48.13743", "11.57549", "DE", "02", "1260391"),
+]
+
+ADMIN1 = [
+    ("GB.ENG", "England"),
+    ("CA.08", "Ontario"),
+    ("FR.11", "Île-de-France"),
+    ("US.TX", "Texas"),
+    ("DE.16", "Berlin"),
+    ("ES.29", "Madrid"),
+    ("DE.02", "Bavaria"),
+]
+
+
+@pytest.fixture(scope="module")
+def gazetteer_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("gazetteer")
+    cities = root / "cities.txt"
+    with open(cities, "w", encoding="utf-8") as f:
+        for gid, name, ascii_name, alt, lat, lon, cc, admin1, pop in CITIES:
+            row = [gid, name, ascii_name, alt, lat, lon, "P", "PPL", cc, "", admin1, "", "", "", pop, "", "", "", ""]
+            f.write("\t".join(row) + "\n")
+    admin = root / "admin1.txt"
+    admin.write_text("".join(f"{code}\t{name}\t{name}\t0\n" for code, name in ADMIN1), encoding="utf-8")
+    return build_gazetteer(cities, root / "out", admin)
+
+
+def test_exact_lookup_prefers_population_and_qualifiers(gazetteer_dir):
+    gazetteer = Gazetteer(gazetteer_dir)
+    lat, lon, label = gazetteer.lookup("London")
+    assert (round(lat, 2), round(lon, 2)) == (51.51, -0.13)
+    assert label.startswith("London, England")
+
+    lat, _, label = gazetteer.lookup("London, Ontario")
+    assert round(lat, 2) == 42.98
+    assert gazetteer.lookup("Paris, TX")[0] == pytest.approx(33.66094)
+    assert gazetteer.lookup("Paris, USA")[0] == pytest.approx(33.66094)
+    assert gazetteer.lookup("London, England")[0] == pytest.approx(51.50853)
+
+
+def test_alternate_names_prefix_and_fuzzy(gazetteer_dir):
+    gazetteer = Gazetteer(gazetteer_dir)
+    assert gazetteer.lookup("munich")[0] == pytest.approx(48.13743)
+    assert gazetteer.lookup("MÜNCHEN, Germany")[0] == pytest.approx(48.13743)
+    assert gazetteer.lookup("Berl")[0] == pytest.approx(52.52437)
+    assert gazetteer.lookup("Madird")[0] == pytest.approx(40.4165)
+    assert gazetteer.lookup("Madird", fuzzy=False) is None
+    assert gazetteer.lookup("Atlantis") is None
+
+
+def test_fuzzy_lookup_catches_leading_typos(gazetteer_dir):
+    gazetteer = Gazetteer(gazetteer_dir)
+    assert gazetteer.lookup("Nadrid")[0] == pytest.approx(40.4165)
+    assert gazetteer.lookup("eBrlin")[0] == pytest.approx(52.52437)
+    assert gazetteer.lookup("Xunich, Bavaria")[0] == pytest.approx(48.13743)
+
+
+@pytest.fixture(scope="module")
+def large_gazetteer_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("large_gazetteer")
+    rng = random.Random(6)
+    cities = root / "cities.txt"
+    with open(cities, "w", encoding="utf-8") as f:
+        for gid in range(30000):
+            # Many names sharing their first letters, as in a real dump
+            name = "Sa" + "".join(rng.choice("aeiourstnlmkd") for _ in range(rng.randint(3, 10)))
+            row = [str(gid), name, name, "", "10.0", "20.0", "P", "PPL", "US", "", "TX", "", "", "", "1000", "", "", "", ""]
+            f.write("\t".join(row) + "\n")
+        row = ["99999", "Santander", "Santander", "", "43.46", "-3.80", "P", "PPL", "ES", "", "39", "", "", "", "172000", "", "", "", ""]
+        f.write("\t".join(row) + "\n")
+    return build_gazetteer(cities, root / "out")
+
+
+def test_fuzzy_lookup_is_fast(large_gazetteer_dir):
+    gazetteer = Gazetteer(large_gazetteer_dir)
+    assert gazetteer.lookup("Xantander")[0] == pytest.approx(43.46)
+    assert gazetteer.lookup("Sanatnder")[0] == pytest.approx(43.46)
+
+    start = time.perf_counter()
+    for _ in range(200):
+        gazetteer.lookup("Xantander")
+        gazetteer.lookup("Santanedr")
+    assert (time.perf_counter() - start) / 400 < 1e-3
+
+
+def test_lookup_is_fast(gazetteer_dir):
+    gazetteer = Gazetteer(gazetteer_dir)
+    start = time.perf_counter()
+    for _ in range(1000):
+        gazetteer.lookup("Paris, France")
+    assert (time.perf_counter() - start) / 1000 < 1e-3
+
+
+def test_safe_geocode_uses_local_provider(gazetteer_dir, monkeypatch):
+    geocoding = cfg().geocoding
+    monkeypatch.setattr(cfg().location_cache, "enabled", False)
+    monkeypatch.setattr(geocoding, "provider", "local")
+    monkeypatch.setattr(geocoding, "gazetteer_path", str(gazetteer_dir))
+    monkeypatch.setattr(geocoding, "fallback_to_nominatim", False)
+    monkeypatch.setattr(geolocation, "_geocode_nominatim", lambda *a: pytest.fail("should stay offline"))
+
+    lat, lon, label = safe_geocode("Paris, France")
+    assert lat == pytest.approx(48.85341)
+    with pytest.raises(LocationError):
+        safe_geocode("Atlantis")
+
+    monkeypatch.setattr(geocoding, "fallback_to_nominatim", True)
+    monkeypatch.setattr(geolocation, "_geocode_nominatim", lambda loc, timeout: (1.0, 2.0, loc))
+    assert safe_geocode("Atlantis") == (1.0, 2.0, "Atlantis")
+
+
+def test_normalize_name():
+    assert normalize_name("  Saint-Étienne ") == "saint etienne"
+    assert normalize_name("St. John's") == "st johns"
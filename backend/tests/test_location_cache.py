@@ -0,0 +1,144 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+import horary_engine.services.geolocation as geolocation
+import horary_engine.services.location_cache as location_cache
+from horary_engine.services.geolocation import (
+    LocationError, LocationNotFoundError, TimezoneManager, geocode_cache_key, safe_geocode,
+)
+from horary_engine.services.location_cache import MISSING, LocationCache, warm_location_caches
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def caches(monkeypatch, tmp_path):
+    config = cfg().location_cache
+    monkeypatch.setattr(config, "enabled", True)
+    monkeypatch.setattr(config, "db_path", str(tmp_path / "locations.sqlite"))
+    location_cache.reset_location_caches()
+    yield
+    location_cache.reset_location_caches()
+
+
+def test_lru_ttl_and_negative_entries():
+    clock = FakeClock()
+    cache = LocationCache("geocode", max_entries=2, ttl_seconds=100, negative_ttl_seconds=10, clock=clock)
+    cache.put("london", (51.5, -0.1, "London"))
+    cache.put("atlantis", None)
+    assert cache.get("atlantis") is None
+    assert cache.get("nowhere") is MISSING
+
+    clock.now += 11
+    assert cache.get("atlantis") is MISSING
+    assert cache.get("london") == (51.5, -0.1, "London")
+
+    cache.put("paris", (48.9, 2.3, "Paris"))
+    cache.put("rome", (41.9, 12.5, "Rome"))
+    assert cache.get("london") is MISSING
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["negative_hits"] == 1
+
+
+def test_sqlite_level_survives_restart(tmp_path):
+    clock = FakeClock()
+    db = tmp_path / "cache.sqlite"
+    first = LocationCache("geocode", db_path=db, clock=clock)
+    first.put("london", (51.5, -0.1, "London"))
+    first.put((51.5, -0.1), "Europe/London")
+
+    second = LocationCache("geocode", db_path=db, clock=clock)
+    assert second.get("london") == (51.5, -0.1, "London")
+    assert second.get((51.5, -0.1)) == "Europe/London"
+    assert second.get("london") == (51.5, -0.1, "London")
+    assert second.stats()["disk_hits"] == 2 and second.stats()["hits"] == 1
+    assert LocationCache("timezone", db_path=db, clock=clock).get("london") is MISSING
+
+
+def test_safe_geocode_caches_results_and_not_found(caches, monkeypatch):
+    calls = []
+
+    def fake_resolve(location, timeout):
+        calls.append(location)
+        if location.startswith("Atlantis"):
+            raise LocationNotFoundError("Location not found")
+        return 51.5, -0.1, "London, England"
+
+    monkeypatch.setattr(geolocation, "_resolve_location", fake_resolve)
+    assert safe_geocode("London") == (51.5, -0.1, "London, England")
+    assert safe_geocode("  london ") == (51.5, -0.1, "London, England")
+    for _ in range(2):
+        with pytest.raises(LocationNotFoundError):
+            safe_geocode("Atlantis")
+    assert calls == ["London", "Atlantis"]
+
+    def unavailable(location, timeout):
+        raise LocationError("Geocoding service unavailable")
+
+    monkeypatch.setattr(geolocation, "_resolve_location", unavailable)
+    for _ in range(2):
+        with pytest.raises(LocationError):
+            safe_geocode("Paris")
+    assert location_cache.get_geocode_cache().get(geocode_cache_key("Paris")) is MISSING
+
+
+def test_geocode_cache_is_keyed_by_provider(caches, monkeypatch):
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    stub = safe_geocode("Springfield")
+    monkeypatch.setattr(cfg().geocoding, "provider", "nominatim")
+    monkeypatch.setattr(geolocation, "_resolve_location", lambda loc, timeout: (39.8, -89.6, "Springfield, IL"))
+    assert safe_geocode("Springfield") == (39.8, -89.6, "Springfield, IL")
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    assert safe_geocode("Springfield") == stub
+
+
+def test_timezone_lookup_is_cached(caches, monkeypatch):
+    calls = []
+    manager = TimezoneManager()
+    monkeypatch.setattr(manager, "_lookup_timezone", lambda lat, lon: calls.append((lat, lon)) or "Europe/London")
+    assert manager.get_timezone_for_location(51.50001, -0.12001) == "Europe/London"
+    assert manager.get_timezone_for_location(51.50002, -0.12002) == "Europe/London"
+    assert len(calls) == 1
+    assert location_cache.location_cache_stats()["timezone"]["hit_rate"] == 0.5
+
+
+def test_timezone_lookup_errors_are_not_cached(caches, monkeypatch):
+    class BrokenFinder:
+        calls = 0
+
+        def timezone_at(self, lat, lng):
+            BrokenFinder.calls += 1
+            raise RuntimeError("polygon data unavailable")
+
+    manager = TimezoneManager()
+    monkeypatch.setattr(manager, "tf", BrokenFinder())
+    for _ in range(2):
+        manager.get_timezone_for_location(51.5, -0.12)
+    assert BrokenFinder.calls == 2
+    assert location_cache.get_timezone_cache().get((51.5, -0.12)) is MISSING
+
+    monkeypatch.setattr(manager, "_lookup_timezone", lambda lat, lon: None)
+    assert manager.get_timezone_for_location(51.5, -0.12) is None
+    assert location_cache.get_timezone_cache().get((51.5, -0.12)) is None
+
+
+def test_warm_up_seeds_both_caches(caches, monkeypatch):
+    monkeypatch.setattr(geolocation, "_resolve_location", lambda loc, timeout: (48.85, 2.35, loc))
+    monkeypatch.setattr(TimezoneManager, "_lookup_timezone", lambda self, lat, lon: "Europe/Paris")
+    assert warm_location_caches(["Paris"]) == 1
+    assert location_cache.get_geocode_cache().get(geocode_cache_key("Paris")) == (48.85, 2.35, "Paris")
+    assert location_cache.get_timezone_cache().get((48.85, 2.35)) == "Europe/Paris"
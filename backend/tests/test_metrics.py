@@ -0,0 +1,84 @@
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.metrics import MetricsRegistry
+
+
+def test_percentiles_come_from_histogram_buckets():
+    registry = MetricsRegistry()
+    for ms in range(1, 101):
+        registry.observe("horary_http_request_duration_seconds", ms / 1000.0, endpoint="chart")
+    latency = registry.endpoint_stats()["chart"]["latency"]
+    assert latency["count"] == 100
+    assert latency["max_ms"] == pytest.approx(100.0)
+    assert latency["mean_ms"] == pytest.approx(50.5)
+    # Buckets are 2**(1/4) apart, so percentiles are within ~19%
+    assert 50 <= latency["p50_ms"] <= 50 * 1.19
+    assert 90 <= latency["p90_ms"] <= 90 * 1.19
+    assert 99 <= latency["p99_ms"] <= 100
+
+
+def test_track_request_counts_errors_and_in_flight():
+    registry = MetricsRegistry()
+    with registry.track_request("chart") as outcome:
+        assert registry.endpoint_stats()["chart"]["in_flight"] == 1
+        outcome["status"] = 404
+    with pytest.raises(ValueError):
+        with registry.track_request("chart"):
+            raise ValueError("boom")
+    with registry.track_request("chart"):
+        pass
+
+    stats = registry.endpoint_stats()["chart"]
+    assert stats["requests"] == 3 and stats["in_flight"] == 0
+    assert stats["error_types"] == {"HTTP404": 1, "ValueError": 1}
+    assert stats["error_rate"] == pytest.approx(2 / 3)
+    assert stats["latency"]["count"] == 3
+
+
+def test_threads_record_into_shards_that_survive_thread_exit():
+    registry = MetricsRegistry()
+
+    def work():
+        for _ in range(1000):
+            registry.inc("horary_http_requests_total", endpoint="chart")
+            registry.observe("horary_http_request_duration_seconds", 0.002, endpoint="chart")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    del threads, thread
+
+    stats = registry.endpoint_stats()["chart"]
+    assert stats["requests"] == 8000
+    assert stats["latency"]["count"] == 8000
+    assert len(registry._shards) <= 1
+
+
+def test_stage_traces_and_prometheus_exposition():
+    registry = MetricsRegistry()
+    registry.record_trace({"total_ms": 40.0, "stages": {"calculate_chart": {"count": 1, "total_ms": 30.0}}})
+    registry.record_trace(None)
+    with registry.track_request("chart"):
+        pass
+
+    assert registry.stage_stats()["calculate_chart"]["count"] == 1
+    text = registry.prometheus_text()
+    assert "# TYPE horary_judgment_stage_duration_seconds histogram" in text
+    assert 'horary_judgment_stage_duration_seconds_bucket{stage="total",le="+Inf"} 1' in text
+    assert 'horary_judgment_stage_duration_seconds_count{stage="calculate_chart"} 1' in text
+    assert 'horary_http_requests_total{endpoint="chart"} 1' in text
+    assert 'horary_http_requests_in_flight{endpoint="chart"} 0' in text
+    buckets = [line for line in text.splitlines()
+               if line.startswith('horary_judgment_stage_duration_seconds_bucket{stage="total"')]
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert counts == sorted(counts)
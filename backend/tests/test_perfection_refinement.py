@@ -0,0 +1,153 @@
+from pathlib import Path
+import sys
+
+import pytest
+import swisseph as swe
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.aspects import calculate_enhanced_degrees_to_exact
+from horary_engine.calculation.ephemeris import planet_positions
+from horary_engine.calculation.refinement import PerfectionRefiner
+from horary_engine.calculation.stations import get_station_finder
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Aspect, Planet, PlanetPosition, Sign
+
+
+JD = swe.julday(2024, 3, 1, 12.0)
+
+
+def _position(planet: Planet, jd: float) -> PlanetPosition:
+    data = planet_positions(jd, [planet], use_table=False)[planet]
+    longitude = float(data.longitude[0])
+    return PlanetPosition(
+        planet=planet,
+        longitude=longitude,
+        latitude=0.0,
+        house=1,
+        sign=list(Sign)[int(longitude // 30)],
+        dignity_score=0,
+        speed=float(data.speed[0]),
+    )
+
+
+def _separation(planet1: Planet, planet2: Planet, jd: float) -> float:
+    positions = planet_positions(jd, [planet1, planet2], use_table=False)
+    return float((positions[planet1].longitude[0] - positions[planet2].longitude[0]) % 360.0)
+
+
+def test_refined_time_is_exact_against_ephemeris():
+    refined = PerfectionRefiner().first_perfection(Planet.MOON, Planet.SUN, (0.0,), JD, 30)
+    assert 0 < refined.days < 30
+    assert refined.jd == JD + refined.days
+    assert 0 < refined.evaluations <= 40
+    separation = _separation(Planet.MOON, Planet.SUN, refined.jd)
+    assert min(separation, 360.0 - separation) < 0.01
+
+
+def test_engine_uses_refined_mode(monkeypatch):
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    moon, sun = _position(Planet.MOON, JD), _position(Planet.SUN, JD)
+    linear = engine._calculate_future_aspect_time(moon, sun, Aspect.CONJUNCTION, JD, 30)
+
+    monkeypatch.setattr(cfg().timing, "perfection_mode", "refined")
+    refined = engine._calculate_future_aspect_time(moon, sun, Aspect.CONJUNCTION, JD, 30)
+    assert refined != linear
+    assert abs(refined - linear) < 2.0  # the Moon speeds up over the nine days
+    separation = _separation(Planet.MOON, Planet.SUN, JD + refined)
+    assert min(separation, 360.0 - separation) < 0.01
+
+    # The orb itself is still today's, only the timing is refined
+    degrees, _ = calculate_enhanced_degrees_to_exact(moon, sun, Aspect.CONJUNCTION, JD)
+    monkeypatch.setattr(cfg().timing, "perfection_mode", "linear")
+    assert calculate_enhanced_degrees_to_exact(moon, sun, Aspect.CONJUNCTION, JD)[0] == degrees
+
+
+def test_perfection_lost_to_station():
+    station = get_station_finder().next_station(swe.MERCURY, swe.julday(2024, 3, 20, 0.0))
+    jd = station - 3.0
+    mercury, saturn = _position(Planet.MERCURY, jd), _position(Planet.SATURN, jd)
+    # One degree ahead of Mercury: linear motion reaches it in about 4 days,
+    # but Mercury turns retrograde first
+    angle = (mercury.longitude - saturn.longitude + 1.0) % 360.0
+    seed = 1.0 / (mercury.speed - saturn.speed)
+    assert seed > 3.0
+
+    refined = PerfectionRefiner().first_perfection(
+        Planet.MERCURY, Planet.SATURN, (angle,), jd, 20, seed_days=seed
+    )
+    assert refined.days is None
+    assert refined.lost_to_station
+
+
+def test_sign_check_and_result_cache(monkeypatch):
+    refiner = PerfectionRefiner()
+    moon = _position(Planet.MOON, JD)
+    days_to_exit = (30.0 - moon.longitude % 30.0) / moon.speed
+    assert refiner.stays_in_sign(Planet.MOON, JD, days_to_exit * 0.5)
+    assert not refiner.stays_in_sign(Planet.MOON, JD, days_to_exit + 1.0)
+
+    calls = []
+    search = refiner._first_perfection
+    monkeypatch.setattr(refiner, "_first_perfection", lambda *args: calls.append(args) or search(*args))
+    first = refiner.first_perfection(Planet.VENUS, Planet.MARS, (0.0, 180.0), JD, 365)
+    again = refiner.first_perfection(Planet.VENUS, Planet.MARS, (0.0, 180.0), JD, 365)
+    assert first is again and len(calls) == 1
+
+
+@pytest.mark.parametrize("mode", ["linear", "refined"])
+def test_direct_timed_perfection_runs_in_both_modes(monkeypatch, mode):
+    monkeypatch.setattr(cfg().timing, "perfection_mode", mode)
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    moon, sun = _position(Planet.MOON, JD), _position(Planet.SUN, JD)
+    assert engine._calculate_future_aspect_time(moon, sun, Aspect.CONJUNCTION, JD, 30) > 0
+
+
+def test_unblocked_direct_timed_perfection_reports_reception(monkeypatch):
+    import datetime
+
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2024, 3, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5074, -0.1278, "London", use_cache=False)
+    chart.planets[Planet.VENUS] = PlanetPosition(Planet.VENUS, 0.0, 0.0, 1, Sign.ARIES, 0, speed=1.0)
+    chart.planets[Planet.JUPITER] = PlanetPosition(Planet.JUPITER, 3.0, 0.0, 1, Sign.ARIES, 0, speed=0.5)
+    chart.aspects = []
+    monkeypatch.setattr(engine, "_calculate_future_aspect_time", lambda *args: 5)
+    monkeypatch.setattr(engine, "_check_future_prohibitions", lambda *args: {"prohibited": False})
+
+    result = engine._check_direct_timed_perfection(chart, Planet.VENUS, Planet.JUPITER, 10)
+    reception = engine.reception_calculator.calculate_comprehensive_reception(chart, Planet.VENUS, Planet.JUPITER)
+    assert result["perfects"] is True and result["type"] == "direct_timed"
+    assert result["reception"] == reception["type"]
+
+
+def test_testimony_prohibitions_use_refined_times(monkeypatch):
+    import datetime
+    import horary_engine.engine as engine_module
+
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2024, 3, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5074, -0.1278, "London", use_cache=False)
+    calls = []
+    monkeypatch.setattr(
+        engine_module, "check_future_prohibitions",
+        lambda chart, sig1, sig2, days_ahead, solver=None: calls.append((days_ahead, solver)) or {},
+    )
+    contract = {"querent": Planet.MOON, "quesited": Planet.SUN}
+
+    engine_module.extract_testimonies(chart, contract)
+    monkeypatch.setattr(cfg().timing, "perfection_mode", "refined")
+    engine_module.extract_testimonies(chart, contract)
+
+    (linear_days, linear_solver), (refined_days, refined_solver) = calls
+    assert linear_solver is None
+    assert refined_solver is EnhancedTraditionalHoraryJudgmentEngine._calculate_future_aspect_time
+    moon, sun = chart.planets[Planet.MOON], chart.planets[Planet.SUN]
+    assert refined_days == min(
+        t for aspect in (Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.SQUARE, Aspect.TRINE, Aspect.OPPOSITION)
+        if (t := refined_solver(moon, sun, aspect, chart.julian_day, cfg().timing.max_window_days))
+    )
+    assert refined_days != linear_days
@@ -1,3 +1,5 @@
+import random
+import re
 import sys
 from pathlib import Path
 
@@ -5,7 +7,7 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 sys.path.append(str(ROOT / "backend"))
 
-from question_analyzer import TraditionalHoraryQuestionAnalyzer
+from question_analyzer import KeywordIndex, TraditionalHoraryQuestionAnalyzer
 from taxonomy import Category, resolve
 from models import Planet
 
@@ -67,3 +69,32 @@ def test_partner_healing_question():
     houses, _ = analyzer._determine_houses(question_lower, q_type, None)
     assert houses == [7, 12]
 
+
+
+def test_keyword_index_matches_substring_and_word_tests():
+    keywords = ["ex", "exam", "next", "he", "the", "will he", "will i", "go to", "go out with",
+                "long-distance", "king's money", "fund", "funding", "funding round", "in"]
+    index = KeywordIndex(keywords)
+    pieces = keywords + ["x", "a", " ", "-", "'", "?", "_", "9", "é", "ſ"]
+    rng = random.Random(25)
+    for _ in range(3000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        found, words = index.scan(text)
+        assert found == {k for k in keywords if k in text}, text
+        assert words == {k for k in keywords if re.search(r"\b" + re.escape(k) + r"\b", text)}, text
+
+
+def test_classification_is_case_and_accent_safe():
+    analyzer = TraditionalHoraryQuestionAnalyzer()
+    # Short category keywords ignore case, longer ones match as substrings
+    assert analyzer._determine_question_type("Will my SON visit?") == (Category.CHILDREN, ["son"])
+    assert analyzer._determine_question_type("will i pass the exam?") == (
+        Category.EDUCATION, ["exam", "pass"]
+    )
+    # "ſ" (long s) matches "s" when case is ignored, as with re.IGNORECASE
+    assert analyzer._determine_question_type("will my ſon call?") == (Category.CHILDREN, ["son"])
+
+    result = analyzer.analyze_question("Will José hear back in 3 days? He just submitted it.")
+    assert result["timeframe_analysis"]["type"] == "within_days"
+    assert result["timeframe_analysis"]["window_days"] == 3
+    assert result["post_event"]
@@ -0,0 +1,82 @@
+import dataclasses
+import datetime
+from pathlib import Path
+import sys
+
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.reception import ReceptionMatrix, TraditionalReceptionCalculator
+from models import Planet, PlanetPosition, HoraryChart, Sign
+
+
+def _make_pos(planet: Planet, sign: Sign) -> PlanetPosition:
+    return PlanetPosition(
+        planet=planet,
+        longitude=sign.start_degree + 15,
+        latitude=0.0,
+        house=1,
+        sign=sign,
+        dignity_score=0,
+        retrograde=False,
+        speed=1.0,
+    )
+
+
+def _make_chart() -> HoraryChart:
+    planets = {
+        Planet.MARS: _make_pos(Planet.MARS, Sign.TAURUS),
+        Planet.VENUS: _make_pos(Planet.VENUS, Sign.ARIES),
+        Planet.SUN: _make_pos(Planet.SUN, Sign.CANCER),
+    }
+    dt = datetime.datetime(2024, 1, 1)
+    return HoraryChart(
+        date_time=dt,
+        date_time_utc=dt,
+        timezone_info="UTC",
+        location=(0.0, 0.0),
+        location_name="Test",
+        planets=planets,
+        aspects=[],
+        houses=[i * 30.0 for i in range(12)],
+        house_rulers={},
+        ascendant=0.0,
+        midheaven=0.0,
+    )
+
+
+def test_each_ordered_pair_is_computed_once(monkeypatch):
+    chart = _make_chart()
+    calculator = TraditionalReceptionCalculator()
+    computed = []
+    compute = calculator._compute_reception
+
+    def counting(chart, planet1, planet2, is_day):
+        computed.append((planet1, planet2))
+        return compute(chart, planet1, planet2, is_day)
+
+    monkeypatch.setattr(calculator, "_compute_reception", counting)
+    sect_checks = []
+    is_day_chart = calculator.is_day_chart
+    monkeypatch.setattr(calculator, "is_day_chart", lambda c: sect_checks.append(c) or is_day_chart(c))
+
+    first = calculator.calculate_comprehensive_reception(chart, Planet.MARS, Planet.VENUS)
+    again = TraditionalReceptionCalculator().calculate_comprehensive_reception(chart, Planet.MARS, Planet.VENUS)
+    reverse = calculator.calculate_comprehensive_reception(chart, Planet.VENUS, Planet.MARS)
+
+    assert again is first
+    assert first["type"] == "mutual_rulership"
+    assert reverse["planet1_receives_planet2"] == first["planet2_receives_planet1"]
+    assert computed == [(Planet.MARS, Planet.VENUS), (Planet.VENUS, Planet.MARS)]
+    assert len(sect_checks) == 1
+    assert isinstance(chart.reception_matrix, ReceptionMatrix)
+    assert len(chart.reception_matrix) == 2
+
+
+def test_matrix_is_not_part_of_chart_equality():
+    chart = _make_chart()
+    TraditionalReceptionCalculator().calculate_comprehensive_reception(chart, Planet.MARS, Planet.SUN)
+    assert chart == _make_chart()
+    assert dataclasses.replace(chart).reception_matrix is chart.reception_matrix
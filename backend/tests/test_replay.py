@@ -0,0 +1,88 @@
+import datetime
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.replay import get_request_recorder, load_corpus, sanitize_payload
+from horary_engine.services.geolocation import safe_geocode
+import load_test
+
+
+def test_sanitize_keeps_request_fields_and_pins_current_time():
+    received = datetime.datetime(2024, 3, 1, 12, 30, tzinfo=datetime.timezone.utc)
+    payload = sanitize_payload(
+        {
+            "question": "Will jo@example.com call me on +44 7700 900123? see https://x.y/z",
+            "location": "Leeds, UK",
+            "useCurrentTime": True,
+            "sessionToken": "secret",
+        },
+        received_at=received,
+    )
+    assert payload == {
+        "question": "Will [email] call me on [number]? see [url]",
+        "location": "Leeds, UK",
+        "useCurrentTime": False,
+        "date": "2024-03-01",
+        "time": "12:30",
+        "timezone": "UTC",
+    }
+
+
+def test_recorder_appends_loadable_corpus(tmp_path, monkeypatch):
+    path = tmp_path / "corpus.jsonl"
+    monkeypatch.setattr(cfg().replay, "record_path", str(path))
+    recorder = get_request_recorder()
+    recorder.record({"question": "Will I move?", "location": "York", "useCurrentTime": False,
+                     "date": "2024-01-01", "time": "09:00"})
+    path.open("a").write(json.dumps({"request_id": "r2", "payload": {"question": "Is it lost?"}}) + "\n")
+    corpus = load_corpus(path)
+    assert [p["question"] for p in corpus] == ["Will I move?", "Is it lost?"]
+    assert corpus[0]["date"] == "2024-01-01"
+
+
+def test_stub_geocoder_is_deterministic_and_offline(monkeypatch):
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    monkeypatch.setattr(cfg().location_cache, "enabled", False)
+    first = safe_geocode("Springfield")
+    assert first == safe_geocode("  springfield ")[:2] + ("Springfield",)
+    assert -55 <= first[0] <= 70 and -180 <= first[1] <= 180
+    assert safe_geocode("Shelbyville")[:2] != first[:2]
+
+
+def test_replay_reports_latency_and_errors(monkeypatch):
+    from werkzeug.serving import make_server
+    from app import app
+
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        payloads = [
+            {"question": "Will I get the job?", "location": "Testville", "useCurrentTime": False,
+             "date": "2024-03-01", "time": "12:00", "timezone": "UTC"},
+            {"question": "", "location": "Testville"},
+        ]
+        report = load_test.replay(payloads, f"http://127.0.0.1:{server.server_port}",
+                                  rps=50, concurrency=2, requests=4)
+    finally:
+        server.shutdown()
+    assert report["requests"] == 4
+    assert report["succeeded"] == 2
+    assert report["errors"] == {"HTTP400": 2}
+    assert report["latency_ms"]["p50"] >= report["service_ms"]["p50"] > 0
+    assert sum(report["judgments"].values()) == 2
+
+
+def test_replay_rejects_empty_corpus():
+    with pytest.raises(ValueError):
+        load_test.replay([], "http://127.0.0.1:1")
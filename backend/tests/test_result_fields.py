@@ -0,0 +1,90 @@
+import copy
+import datetime
+from pathlib import Path
+import sys
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from horary_engine.result_fields import parse_fields
+from models import HoraryChart, LazyField
+
+
+SETTINGS = {
+    "location": "Testville",
+    "date_str": "2024-03-01",
+    "time_str": "12:00",
+    "timezone_str": "UTC",
+    "use_current_time": False,
+}
+
+
+@pytest.fixture
+def stub_geocoder(monkeypatch):
+    monkeypatch.setattr(cfg().geocoding, "provider", "stub")
+
+
+def test_parse_fields():
+    assert parse_fields(None) is None
+    assert parse_fields(" ") is None
+    assert parse_fields("Timing, chart") == {"verdict", "timing", "chart"}
+    assert parse_fields(["moon"]) == {"verdict", "moon"}
+    with pytest.raises(ValueError, match="planets"):
+        parse_fields("timing,planets")
+
+
+def test_moon_aspects_are_computed_on_first_read(monkeypatch):
+    import horary_engine.engine as engine_module
+
+    calls = []
+    calculate = engine_module.calculate_moon_next_aspect
+    monkeypatch.setattr(engine_module, "calculate_moon_next_aspect",
+                        lambda *args: calls.append(args) or calculate(*args))
+    calculator = EnhancedTraditionalHoraryJudgmentEngine().calculator
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+    chart = calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London", use_cache=False)
+
+    field = HoraryChart.__dict__["moon_next_aspect"]
+    assert isinstance(field, LazyField) and field.is_pending(chart)
+    copied = copy.copy(chart)
+    assert calls == []
+
+    next_aspect = chart.moon_next_aspect
+    assert next_aspect is chart.moon_next_aspect and len(calls) == 1
+    assert not field.is_pending(chart)
+    # Copies share the pending value, so it is computed once for both
+    assert copied.moon_next_aspect is next_aspect and len(calls) == 1
+
+
+def test_selected_fields_match_full_result(stub_geocoder):
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    full = engine.judge_question("Will I get the job?", **SETTINGS)
+    light = engine.judge_question("Will I get the job?", **SETTINGS, fields=["timing"])
+
+    assert set(light) == {"question", "judgment", "confidence", "reasoning", "scoring_trace", "timing"}
+    for key in light:
+        assert light[key] == full[key]
+    assert "chart_data" in full and "moon_aspects" in full
+
+
+def test_api_fields_option(stub_geocoder):
+    from app import app
+
+    client = app.test_client()
+    payload = {"question": "Will I get the job?", "location": "Testville", "useCurrentTime": False,
+               "date": "2024-03-01", "time": "12:00", "timezone": "UTC"}
+
+    response = client.post("/api/calculate-chart", json={**payload, "fields": "verdict,timing"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert "timing" in body and "chart_data" not in body and "moon_aspects" not in body
+    assert body["rationale"] == body["reasoning"]
+
+    response = client.post("/api/calculate-chart?fields=bogus", json=payload)
+    assert response.status_code == 400
+    assert "bogus" in response.get_json()["error"]
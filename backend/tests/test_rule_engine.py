@@ -1,3 +1,5 @@
+import os
+import random
 import sys
 from pathlib import Path
 
@@ -5,6 +7,12 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.append(str(ROOT))
 sys.path.append(str(ROOT / "backend"))
 
+import pytest
+import yaml
+
+import rule_engine
+from horary_config import cfg
+from horary_engine.polarity_weights import WEIGHT_TABLE, TestimonyKey
 from rule_engine import evaluate_rules, get_rule_weight, apply_rule
 
 
@@ -16,3 +24,105 @@ def test_rule_sequencing():
 def test_weight_application():
     assert get_rule_weight("H1") == -3.0
     assert apply_rule("P1", 5.0) == 10.0
+
+
+def _reference_evaluate(rules, candidates, void_gating):
+    selected = []
+    for tier in rule_engine.PRIORITY_TIERS:
+        for rule in sorted((r for r in rules if r.get("tier") == tier), key=lambda r: r["id"]):
+            if rule["id"] in candidates:
+                if rule["id"] == "H2" and not void_gating:
+                    continue
+                selected.append(rule["id"])
+                break
+    return selected
+
+
+def test_compiled_pack_matches_tier_scan(monkeypatch):
+    pack = rule_engine.get_rule_pack()
+    ids = [rule["id"] for rule in pack.rules] + ["UNKNOWN"]
+    rng = random.Random(5)
+    for gating in (False, True):
+        monkeypatch.setattr(cfg().moon, "void_gating", gating)
+        for _ in range(300):
+            candidates = set(rng.sample(ids, rng.randint(0, len(ids))))
+            assert evaluate_rules(candidates) == _reference_evaluate(pack.rules, candidates, gating)
+    for rule in pack.rules:
+        assert get_rule_weight(rule["id"]) == float(rule["weight"])
+
+
+def _write_pack(directory, name, weight, extra=""):
+    path = directory / f"rules_{name}.yaml"
+    path.write_text(
+        "rules:\n"
+        f"  - {{id: P1, tier: perfection, weight: {weight}}}\n"
+        "  - {id: P0, tier: perfection, weight: 1.0}\n" + extra
+    )
+    return path
+
+
+@pytest.fixture
+def isolated_packs(monkeypatch):
+    for name in ("_packs", "_checked", "_listeners"):
+        monkeypatch.setattr(rule_engine, name, dict(getattr(rule_engine, name)))
+    yield
+    monkeypatch.undo()
+    rule_engine.reload_rule_pack()
+
+
+def test_packs_side_by_side_and_hot_reload(tmp_path, monkeypatch, isolated_packs):
+    monkeypatch.setattr(rule_engine, "RULES_DIR", tmp_path)
+    monkeypatch.setattr(rule_engine, "RELOAD_CHECK_SECONDS", 0.0)
+    path = _write_pack(tmp_path, "alpha", 4.0)
+    _write_pack(tmp_path, "beta", 6.0)
+    assert rule_engine.available_rule_packs() == ["alpha", "beta"]
+
+    reloaded = []
+    rule_engine.add_reload_listener(reloaded.append, pack="alpha")
+    assert get_rule_weight("P1", pack="alpha") == 4.0
+    assert get_rule_weight("P1", pack="beta") == 6.0
+    assert evaluate_rules(["P1", "P0"], pack="alpha") == ["P0"]
+    assert rule_engine.get_rule_pack().weight("P1") == 2.0  # default pack is untouched
+
+    _write_pack(tmp_path, "alpha", 5.0, "  - {id: V9, tier: validity_gates, weight: -1.0}\n")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+    assert get_rule_weight("P1", pack="alpha") == 5.0
+    assert evaluate_rules(["P1", "V9"], pack="alpha") == ["V9", "P1"]
+    assert [pack.name for pack in reloaded] == ["alpha"]
+
+    # A broken edit keeps the last good rules
+    path.write_text("rules: [")
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 2_000_000))
+    assert get_rule_weight("P1", pack="alpha") == 5.0
+
+
+def test_default_pack_reload_refreshes_weight_table(tmp_path, monkeypatch, isolated_packs):
+    source = rule_engine.rule_pack_path(rule_engine.RULE_PACK).read_text()
+    monkeypatch.setattr(rule_engine, "RULES_DIR", tmp_path)
+    (tmp_path / f"rules_{rule_engine.RULE_PACK}.yaml").write_text(
+        source.replace("description: Direct perfection\n    weight: 2.0", "description: Direct perfection\n    weight: 3.5")
+    )
+    assert WEIGHT_TABLE[TestimonyKey.PERFECTION_DIRECT] == 2.0
+    rule_engine.reload_rule_pack()
+    assert WEIGHT_TABLE[TestimonyKey.PERFECTION_DIRECT] == 3.5
+    assert get_rule_weight("P1") == 3.5
+    assert next(rule for rule in rule_engine.RULES if rule["id"] == "P1")["weight"] == 3.5
+    monkeypatch.undo()
+    rule_engine.reload_rule_pack()
+    assert WEIGHT_TABLE[TestimonyKey.PERFECTION_DIRECT] == 2.0
+
+
+def test_failed_forced_reload_keeps_last_good_pack(tmp_path, monkeypatch, isolated_packs):
+    monkeypatch.setattr(rule_engine, "RULES_DIR", tmp_path)
+    path = _write_pack(tmp_path, "alpha", 4.0)
+    assert get_rule_weight("P1", pack="alpha") == 4.0
+
+    path.write_text("rules: [")
+    with pytest.raises(yaml.YAMLError):
+        rule_engine.reload_rule_pack("alpha")
+    assert get_rule_weight("P1", pack="alpha") == 4.0
+
+    path.unlink()
+    with pytest.raises(OSError):
+        rule_engine.reload_rule_pack("alpha")
+    assert get_rule_weight("P1", pack="alpha") == 4.0
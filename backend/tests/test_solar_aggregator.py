@@ -1,6 +1,9 @@
+import random
+import re
+
 import horary_engine.polarity_weights as polarity_weights
 import horary_engine.dsl as dsl
-from horary_engine.solar_aggregator import aggregate as solar_aggregate
+from horary_engine.solar_aggregator import aggregate as solar_aggregate, scoring_plan
 from horary_engine.aggregator import aggregate as legacy_aggregate
 from models import Planet, Aspect as AspectType
 from rule_engine import get_rule_weight
@@ -116,3 +119,95 @@ def test_generated_aspect_token_with_role_weights():
     assert score == 0.0
     assert ledger[0]["key"] == "ASPECT_L1_TRINE_L7"
     assert ledger[0]["role_factor"] == 0.25
+
+
+def _reference_aggregate(testimonies, contract=None):
+    """The per-token implementation the scoring plan replaced."""
+    from horary_engine.dsl_to_testimony import dispatch
+    from horary_engine.polarity import Polarity
+    from horary_engine.utils import token_to_string
+
+    raw_items, extra_info, unscored = [], {}, []
+    for raw in testimonies:
+        dispatched = dispatch(raw, contract)
+        if dispatched:
+            for entry in dispatched:
+                raw_items.append(entry.get("key"))
+                extra_info[entry.get("key")] = {k: v for k, v in entry.items() if k != "key"}
+        else:
+            raw_items.append(raw)
+            unscored.append(raw)
+    tokens, role_weights = [], {}
+    for raw in raw_items:
+        if isinstance(raw, dsl.RoleImportance):
+            role_weights[raw.role.name.lower()] = raw.importance
+            if raw.role.name.lower() == "lq":
+                role_weights["l7"] = raw.importance
+            continue
+        try:
+            tokens.append(TestimonyKey(raw))
+        except ValueError:
+            if isinstance(raw, str):
+                tokens.append(raw)
+
+    total_yes, total_no, ledger, seen, families = 0.0, 0.0, [], set(), set()
+    for token in sorted(tokens, key=token_to_string):
+        if token in seen:
+            continue
+        seen.add(token)
+        is_key = isinstance(token, TestimonyKey)
+        polarity = polarity_weights.POLARITY_TABLE.get(token, Polarity.NEUTRAL) if is_key else Polarity.NEUTRAL
+        if polarity is Polarity.NEUTRAL and not isinstance(token, str):
+            continue
+        family = polarity_weights.FAMILY_TABLE.get(token) if is_key else None
+        context = family is not None and family in families
+        if family is not None and not context:
+            families.add(family)
+        weight = polarity_weights.WEIGHT_TABLE.get(token, 0.0) if is_key else 0.0
+        factor = 1.0
+        for role_name, importance in role_weights.items():
+            if re.search(rf"(^|_){re.escape(role_name)}(_|$)", token_to_string(token).lower()):
+                factor *= importance
+        weight *= factor
+        yes = weight if not context and polarity is Polarity.POSITIVE else 0.0
+        no = weight if not context and polarity is Polarity.NEGATIVE else 0.0
+        total_yes += yes
+        total_no += no
+        entry = {"key": token, "polarity": polarity, "weight": weight, "delta_yes": yes, "delta_no": no,
+                 "family": family, "kind": polarity_weights.KIND_TABLE.get(token) if is_key else None,
+                 "context": context, "role_factor": factor}
+        entry.update(extra_info.get(token, {}))
+        ledger.append(entry)
+    for obj in unscored:
+        ledger.append({"key": obj, "polarity": Polarity.NEUTRAL, "weight": 0.0,
+                       "delta_yes": 0.0, "delta_no": 0.0, "primitive": obj})
+    return total_yes - total_no, ledger
+
+
+def test_scoring_plan_matches_reference_ledgers():
+    import benchmark
+    from horary_engine.engine import HoraryEngine
+
+    engine = HoraryEngine()
+    cases = [benchmark.Case(engine, *entry) for entry in benchmark.CORPUS]
+    rng = random.Random(3)
+    roles = [Moon, L1, L10, LQ]
+    keys = list(TestimonyKey)
+    for case in cases:
+        for _ in range(10):
+            testimonies = list(case.testimonies)
+            testimonies += rng.sample(keys, 6) + [k.value for k in rng.sample(keys, 2)]
+            testimonies += ["ASPECT_L1_TRINE_L7", "l10_custom_note"]
+            testimonies += [role_importance(role, rng.uniform(0.2, 2.0)) for role in rng.sample(roles, 2)]
+            rng.shuffle(testimonies)
+            expected = _reference_aggregate(testimonies, case.contract)
+            assert solar_aggregate(testimonies, case.contract) == expected, case.name
+
+
+def test_scoring_plan_is_shared_per_role_set():
+    plan = scoring_plan({"l10": 0.5})
+    assert scoring_plan({"l10": 0.5}) is plan
+    assert scoring_plan({"l10": 0.5, "moon": 2.0}) is not plan
+    record = plan.record(TestimonyKey.L10_FORTUNATE)
+    assert record.role_factor == 0.5
+    assert record.weight == abs(get_rule_weight(TOKEN_RULE_MAP[TestimonyKey.L10_FORTUNATE])) * 0.5
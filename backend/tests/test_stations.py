@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+import pytest
+import swisseph as swe
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.calculation.stations import StationFinder
+
+
+def _speed(planet_id, jd):
+    return swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0][3]
+
+
+def _scan_station(planet_id, jd_start, max_days=365, step=0.1):
+    """Reference search: fixed small steps, then bisection."""
+    previous = _speed(planet_id, jd_start)
+    steps = int(max_days / step)
+    for i in range(1, steps):
+        jd = jd_start + i * step
+        current = _speed(planet_id, jd)
+        if previous * current < 0:
+            lo, hi = jd - step, jd
+            while hi - lo > 1e-5:
+                mid = (lo + hi) / 2
+                if _speed(planet_id, mid) * _speed(planet_id, lo) > 0:
+                    lo = mid
+                else:
+                    hi = mid
+            return (lo + hi) / 2
+        previous = current
+    return None
+
+
+@pytest.mark.parametrize("planet_id", [swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN])
+@pytest.mark.parametrize("jd_start", [2451545.0, 2460000.5])
+def test_matches_fixed_step_scan(planet_id, jd_start):
+    finder = StationFinder()
+    expected = _scan_station(planet_id, jd_start)
+    found = finder.next_station(planet_id, jd_start)
+    if expected is None:
+        assert found is None
+    else:
+        assert found == pytest.approx(expected, abs=1e-3)
+
+
+def test_few_ephemeris_calls_and_bucket_cache():
+    finder = StationFinder()
+    first = finder.next_station(swe.MERCURY, 2460000.5)
+    calls = finder.ephemeris_calls
+    assert 0 < calls < 60
+
+    # Same bucket: answered from cache
+    assert finder.next_station(swe.MERCURY, 2460001.5) == first
+    assert finder.ephemeris_calls == calls
+
+
+def test_lights_never_station_and_window_is_respected():
+    finder = StationFinder()
+    assert finder.next_station(swe.SUN, 2460000.5) is None
+    assert finder.next_station(swe.MOON, 2460000.5) is None
+    assert finder.ephemeris_calls == 0
+
+    station = finder.next_station(swe.MARS, 2460000.5, max_days=800)
+    assert station is not None
+    assert finder.next_station(swe.MARS, 2460000.5, max_days=station - 2460000.5 - 1) is None
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.engine import HoraryEngine
+from horary_engine.tracing import collect_trace, current_trace, span
+
+
+SETTINGS = {
+    "location": "London",
+    "resolved_location": (51.5074, -0.1278, "London, England"),
+    "date": "2024-03-01",
+    "time": "12:00",
+    "timezone": "Europe/London",
+    "use_current_time": False,
+}
+
+
+def test_span_is_noop_without_trace():
+    assert current_trace() is None
+    first, second = span("a"), span("b")
+    assert first is second
+    with first:
+        pass
+
+
+def test_trace_counts_and_nests():
+    with collect_trace() as trace:
+        for _ in range(3):
+            with span("stage"):
+                pass
+        with collect_trace() as inner:
+            assert inner is trace
+    assert current_trace() is None
+    stage = trace.to_dict()["stages"]["stage"]
+    assert stage["count"] == 3
+    assert stage["max_ms"] <= stage["total_ms"]
+
+    with collect_trace(enabled=False) as disabled:
+        assert disabled is None and current_trace() is None
+
+
+def test_judge_reports_stage_timings(monkeypatch):
+    monkeypatch.setattr(cfg().chart_cache, "enabled", False)
+    engine = HoraryEngine()
+    result = engine.judge("Will I get the job?", dict(SETTINGS, trace=True))
+    performance = result["_performance"]
+    for stage in ("geocode", "resolve_time", "calculate_chart", "calculate_chart.aspects",
+                  "calculate_chart.moon_aspects", "apply_enhanced_judgment", "evaluate_enhanced",
+                  "serialize_chart", "audit"):
+        assert performance["stages"][stage]["count"] >= 1
+    assert performance["total_ms"] >= performance["stages"]["calculate_chart"]["total_ms"]
+
+    assert "_performance" not in engine.judge("Will I get the job?", dict(SETTINGS))
+
@@ -0,0 +1,79 @@
+import os
+import sys
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.engine import HoraryEngine
+from horary_engine.worker_pool import JudgmentPool
+
+
+SETTINGS = {
+    "location": "London",
+    "resolved_location": (51.5074, -0.1278, "London, England"),
+    "date": "2024-03-01",
+    "time": "12:00",
+    "timezone": "Europe/London",
+    "use_current_time": False,
+}
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = JudgmentPool(workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_results_match_in_process_engine(pool):
+    assert len(pool.warm()) >= 1
+    question = "Will I get the job?"
+    local = HoraryEngine().judge(question, dict(SETTINGS))
+    remote = pool.judge(question, dict(SETTINGS))
+    assert remote["judgment"] == local["judgment"]
+    assert remote["confidence"] == local["confidence"]
+    assert remote["chart_data"]["ascendant"] == pytest.approx(local["chart_data"]["ascendant"])
+    assert pool.judge_fast(question, dict(SETTINGS)) == HoraryEngine().judge_fast(question, dict(SETTINGS))
+
+
+def test_batch_is_split_across_workers_in_order(pool):
+    questions = ["Will I get the job?", "Will he return?", "Will I sell the house?"]
+    records = [{"question": q, "settings": dict(SETTINGS)} for q in questions]
+    results = pool.judge_batch(records)
+    assert [r["question"] for r in results] == questions
+
+
+def test_pool_restarts_after_worker_crash(pool):
+    with pytest.raises(BrokenProcessPool):
+        pool._executor.submit(os._exit, 1).result()
+    restarts = pool.restarts
+    result = pool.judge("Will I get the job?", dict(SETTINGS))
+    assert result["judgment"]
+    assert pool.restarts == restarts + 1
+
+
+def test_batch_groups_records_sharing_a_chart(pool, monkeypatch):
+    chunks = []
+
+    def fake_run_all(fn, argument_lists, timeout=None):
+        chunks.extend(records for (records,) in argument_lists)
+        return [[{"question": r["question"]} for r in records] for (records,) in argument_lists]
+
+    monkeypatch.setattr(pool, "_run_all", fake_run_all)
+    noon, later = dict(SETTINGS), {**SETTINGS, "time": "18:00"}
+    records = [
+        {"question": "a", "settings": noon},
+        {"question": "b", "settings": later},
+        {"question": "c", "settings": noon},
+        {"question": "d", "settings": later},
+        {"question": "e", "settings": noon},
+    ]
+    results = pool.judge_batch(records)
+
+    assert [r["question"] for r in results] == ["a", "b", "c", "d", "e"]
+    assert sorted(sorted(r["question"] for r in chunk) for chunk in chunks) == [["a", "c", "e"], ["b", "d"]]